@@ -0,0 +1,486 @@
+"""
+Measures the payment flows end to end against ``FakeSolanaRpc`` with configurable latency.
+
+Each scenario runs a service entry point for ``--iterations`` payments and reports
+operations per second, JSON-RPC calls, HTTP requests and DB queries per payment. The RPC
+and DB counts do not depend on the machine, so they are compared against the baseline
+file and a higher count than the baseline (plus ``--tolerance``) fails the run. Throughput
+is only compared when ``--max-slowdown`` is passed.
+
+Usage::
+
+    python benchmarks/bench_payment_flows.py --iterations 20 --latency 0.005
+    python benchmarks/bench_payment_flows.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import django
+from django.conf import settings
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+FEE_PAYER = Keypair()
+MINT = Pubkey.from_bytes(bytes([9] * 32))
+DEFAULT_BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+settings.configure(
+    INSTALLED_APPS=[
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django_solana_payments",
+    ],
+    DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    USE_TZ=True,
+    LOGGING={"version": 1, "root": {"level": "ERROR"}},
+    SOLANA_PAYMENTS={
+        "RPC_URL": "http://fake-solana-rpc",
+        "RECEIVER_ADDRESS": str(Keypair().pubkey()),
+        "FEE_PAYER_ADDRESS": str(FEE_PAYER.pubkey()),
+        "FEE_PAYER_KEYPAIR": json.dumps(list(bytes(FEE_PAYER))),
+        "ONE_TIME_WALLETS_ENCRYPTION_ENABLED": False,
+    },
+)
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from django_solana_payments.choices import (  # noqa: E402
+    OneTimeWalletStateTypes,
+    TokenTypes,
+)
+from django_solana_payments.helpers import (  # noqa: E402
+    get_payment_crypto_token_model,
+    get_solana_payment_model,
+)
+from django_solana_payments.models import (  # noqa: E402
+    OneTimePaymentWallet,
+    SolanaPayPaymentCryptoPrice,
+    SweepJob,
+)
+from django_solana_payments.services.one_time_wallet_service import (  # noqa: E402
+    one_time_wallet_service,
+)
+from django_solana_payments.services.solana_payments_service import (  # noqa: E402
+    SolanaPaymentsService,
+)
+from django_solana_payments.services.sweep_job_service import (  # noqa: E402
+    process_pending_sweep_jobs,
+)
+from django_solana_payments.services.verify_transaction_service import (  # noqa: E402
+    VerifyTransactionService,
+)
+from django_solana_payments.solana.base_solana_client import (  # noqa: E402
+    base_solana_client,
+)
+from django_solana_payments.solana.solana_token_client import (  # noqa: E402
+    SolanaTokenClient,
+)
+from django_solana_payments.solana.solana_transaction_builder import (  # noqa: E402
+    SolanaTransactionBuilder,
+)
+from django_solana_payments.testing import FakeSolanaRpc  # noqa: E402
+
+PaymentCryptoToken = get_payment_crypto_token_model()
+SolanaPayment = get_solana_payment_model()
+
+METRICS = ("rpc_calls_per_op", "http_requests_per_op", "db_queries_per_op")
+
+
+class PaymentFlows:
+    """Creates payments on the fake ledger and pays them like a customer would."""
+
+    def __init__(self, fake_rpc: FakeSolanaRpc):
+        self.fake_rpc = fake_rpc
+        self.payments_service = SolanaPaymentsService()
+        self.builder = SolanaTransactionBuilder(
+            base_solana_client=base_solana_client,
+            solana_token_client=SolanaTokenClient(
+                base_solana_client=base_solana_client
+            ),
+        )
+        self.customer = Keypair()
+        fake_rpc.airdrop(self.customer.pubkey(), 10**15)
+        fake_rpc.create_mint(MINT, decimals=6)
+        fake_rpc.mint_to(self.customer.pubkey(), MINT, 10**15)
+        self.native_token = PaymentCryptoToken.objects.create(
+            name="Solana",
+            symbol="SOL",
+            token_type=TokenTypes.NATIVE,
+            is_active=True,
+            payment_crypto_price=Decimal("0.1"),
+        )
+        self.spl_token = PaymentCryptoToken.objects.create(
+            name="USD Coin",
+            symbol="USDC",
+            mint_address=str(MINT),
+            token_type=TokenTypes.SPL,
+            is_active=True,
+            payment_crypto_price=Decimal("12.5"),
+        )
+
+    def reset(self):
+        SweepJob.objects.all().delete()
+        SolanaPayment.objects.all().delete()
+        SolanaPayPaymentCryptoPrice.objects.all().delete()
+        OneTimePaymentWallet.objects.all().delete()
+
+    def create_payment(self):
+        return self.payments_service.create_payment({"user": None, "meta_data": {}})
+
+    def pay(self, payment, token) -> None:
+        recipient = Pubkey.from_string(payment.payment_address)
+        if token.token_type == TokenTypes.SPL:
+            transaction = self.builder.create_spl_token_transaction(
+                recipient, token.payment_crypto_price, self.customer, MINT
+            )
+        else:
+            transaction = self.builder.create_native_transaction(
+                recipient, token.payment_crypto_price, sender_keypair=self.customer
+            )
+        self.fake_rpc.send_transaction(transaction)
+
+    def create_paid_payments(self, count: int, token) -> list:
+        payments = [self.create_payment() for _ in range(count)]
+        for payment in payments:
+            self.pay(payment, token)
+        return payments
+
+
+def bench_create_payment(flows: PaymentFlows, iterations: int):
+    yield iterations
+    for _ in range(iterations):
+        flows.create_payment()
+
+
+def bench_create_payment_pooled(flows: PaymentFlows, iterations: int):
+    solana_payments = settings.SOLANA_PAYMENTS
+    settings.SOLANA_PAYMENTS = {
+        **solana_payments,
+        "WALLET_POOL_HIGH_WATERMARK": iterations,
+    }
+    try:
+        one_time_wallet_service.refill_one_time_wallet_pool()
+        yield iterations
+        for _ in range(iterations):
+            flows.create_payment()
+    finally:
+        settings.SOLANA_PAYMENTS = solana_payments
+
+
+def bench_refill_wallet_pool(flows: PaymentFlows, iterations: int):
+    yield iterations
+    one_time_wallet_service.refill_one_time_wallet_pool(
+        low_watermark=0, high_watermark=iterations
+    )
+
+
+def _bench_verify(flows: PaymentFlows, iterations: int, token):
+    payments = flows.create_paid_payments(iterations, token)
+    verify_service = VerifyTransactionService()
+    yield iterations
+    for payment in payments:
+        verify_service.verify_transaction_and_process_payment(
+            payment.payment_address, token, send_payment_accepted_signal=False
+        )
+
+
+def bench_verify_native(flows: PaymentFlows, iterations: int):
+    yield from _bench_verify(flows, iterations, flows.native_token)
+
+
+def bench_verify_spl(flows: PaymentFlows, iterations: int):
+    yield from _bench_verify(flows, iterations, flows.spl_token)
+
+
+def _bench_poll_unpaid(flows: PaymentFlows, iterations: int, token):
+    payments = [flows.create_payment() for _ in range(iterations)]
+    verify_service = VerifyTransactionService()
+
+    def poll():
+        for payment in payments:
+            verify_service.verify_transaction_and_process_payment(
+                payment.payment_address,
+                token,
+                send_payment_accepted_signal=False,
+            )
+
+    poll()
+    yield iterations
+    poll()
+
+
+def bench_poll_unpaid(flows: PaymentFlows, iterations: int):
+    yield from _bench_poll_unpaid(flows, iterations, flows.native_token)
+
+
+def bench_poll_unpaid_spl(flows: PaymentFlows, iterations: int):
+    yield from _bench_poll_unpaid(flows, iterations, flows.spl_token)
+
+
+def bench_send_from_one_time_wallets(flows: PaymentFlows, iterations: int):
+    payments = flows.create_paid_payments(iterations, flows.native_token)
+    SolanaPayment.objects.filter(id__in=[payment.id for payment in payments]).update(
+        paid_token=flows.native_token
+    )
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    yield iterations
+    flows.payments_service.send_solana_payments_from_one_time_wallets(batch_size=1)
+
+
+def bench_send_from_one_time_wallets_batched(flows: PaymentFlows, iterations: int):
+    payments = flows.create_paid_payments(iterations, flows.native_token)
+    SolanaPayment.objects.filter(id__in=[payment.id for payment in payments]).update(
+        paid_token=flows.native_token
+    )
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    yield iterations
+    flows.payments_service.send_solana_payments_from_one_time_wallets(batch_size=10)
+
+
+def bench_send_from_one_time_wallets_concurrent(flows: PaymentFlows, iterations: int):
+    payments = flows.create_paid_payments(iterations, flows.native_token)
+    SolanaPayment.objects.filter(id__in=[payment.id for payment in payments]).update(
+        paid_token=flows.native_token
+    )
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    yield iterations
+    flows.payments_service.send_solana_payments_from_one_time_wallets(
+        batch_size=1, concurrency=8
+    )
+
+
+def bench_sweep_wallets_without_balance(flows: PaymentFlows, iterations: int):
+    for _ in range(iterations):
+        flows.create_payment()
+    SolanaPayment.objects.update(paid_token=flows.native_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    yield iterations
+    flows.payments_service.send_solana_payments_from_one_time_wallets(batch_size=1)
+
+
+def bench_process_sweep_jobs(flows: PaymentFlows, iterations: int):
+    payments = flows.create_paid_payments(iterations, flows.native_token)
+    verify_service = VerifyTransactionService()
+    for payment in payments:
+        verify_service.verify_transaction_and_process_payment(
+            payment.payment_address,
+            flows.native_token,
+            send_payment_accepted_signal=False,
+        )
+    yield iterations
+    process_pending_sweep_jobs()
+
+
+def bench_close_expired_wallets(flows: PaymentFlows, iterations: int):
+    for _ in range(iterations):
+        flows.create_payment()
+    OneTimePaymentWallet.objects.update(state=OneTimeWalletStateTypes.PAYMENT_EXPIRED)
+    yield iterations
+    with contextlib.redirect_stdout(io.StringIO()):
+        one_time_wallet_service.close_expired_one_time_wallets()
+
+
+def bench_recheck_initiated_payments(flows: PaymentFlows, iterations: int):
+    flows.create_paid_payments(iterations, flows.native_token)
+    yield iterations
+    flows.payments_service.recheck_initiated_payments_and_process(
+        send_payment_accepted_signal=False
+    )
+
+
+SCENARIOS = {
+    "create_payment": bench_create_payment,
+    "create_payment_pooled": bench_create_payment_pooled,
+    "refill_wallet_pool": bench_refill_wallet_pool,
+    "verify_native": bench_verify_native,
+    "verify_spl": bench_verify_spl,
+    "poll_unpaid": bench_poll_unpaid,
+    "poll_unpaid_spl": bench_poll_unpaid_spl,
+    "send_from_one_time_wallets": bench_send_from_one_time_wallets,
+    "send_from_one_time_wallets_batched": bench_send_from_one_time_wallets_batched,
+    "send_from_one_time_wallets_concurrent": bench_send_from_one_time_wallets_concurrent,
+    "sweep_wallets_without_balance": bench_sweep_wallets_without_balance,
+    "process_sweep_jobs": bench_process_sweep_jobs,
+    "close_expired_wallets": bench_close_expired_wallets,
+    "recheck_initiated_payments": bench_recheck_initiated_payments,
+}
+
+
+def run_scenario(
+    flows: PaymentFlows, name: str, iterations: int, warmup: bool = True
+) -> dict:
+    """
+    Runs a scenario generator: its setup runs until the first ``yield`` (which yields the
+    number of operations), the code after it is measured.
+    """
+    if warmup:
+        # Fills the mint info and blockhash caches and the pooled RPC client
+        run_scenario(flows, name, iterations=1, warmup=False)
+
+    flows.reset()
+    scenario = SCENARIOS[name](flows, iterations)
+    operations = next(scenario)
+
+    fake_rpc = flows.fake_rpc
+    fake_rpc.http_requests = 0
+    fake_rpc.method_calls.clear()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in scenario:
+            pass
+        elapsed = time.perf_counter() - started
+
+    return {
+        "scenario": name,
+        "operations": operations,
+        "ops_per_sec": operations / elapsed,
+        "rpc_calls_per_op": sum(fake_rpc.method_calls.values()) / operations,
+        "http_requests_per_op": fake_rpc.http_requests / operations,
+        "db_queries_per_op": len(queries) / operations,
+    }
+
+
+def find_regressions(
+    results: list[dict],
+    baseline: dict,
+    tolerance: float,
+    max_slowdown: float | None = None,
+) -> list[str]:
+    regressions = []
+    for result in results:
+        expected = baseline.get("scenarios", {}).get(result["scenario"])
+        if not expected:
+            continue
+        for metric in METRICS:
+            if result[metric] > expected[metric] * (1 + tolerance) + 1e-9:
+                regressions.append(
+                    f"{result['scenario']}: {metric} {result[metric]:.2f} > "
+                    f"baseline {expected[metric]:.2f}"
+                )
+        if max_slowdown is not None and result["ops_per_sec"] < expected[
+            "ops_per_sec"
+        ] * (1 - max_slowdown):
+            regressions.append(
+                f"{result['scenario']}: ops_per_sec {result['ops_per_sec']:.1f} < "
+                f"baseline {expected['ops_per_sec']:.1f}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.005,
+        help="Seconds the fake RPC waits before answering each HTTP request.",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run, can be repeated. Runs all scenarios by default.",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline file instead of comparing them.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.05,
+        help="Allowed relative increase of RPC calls and DB queries per operation.",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help="Allowed relative ops/sec drop, e.g. 0.2. Not checked by default.",
+    )
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    fake_rpc = FakeSolanaRpc(latency=args.latency)
+    fake_rpc.airdrop(FEE_PAYER.pubkey(), 10**15)
+
+    with fake_rpc.mount(base_solana_client):
+        flows = PaymentFlows(fake_rpc)
+        print(
+            f"{'scenario':<40}{'ops':>6}{'ops/sec':>10}{'rpc/op':>9}"
+            f"{'http/op':>9}{'db/op':>8}"
+        )
+        results = []
+        for name in args.scenario or SCENARIOS:
+            result = run_scenario(flows, name, args.iterations)
+            results.append(result)
+            print(
+                f"{name:<40}{result['operations']:>6}{result['ops_per_sec']:>10.1f}"
+                f"{result['rpc_calls_per_op']:>9.2f}"
+                f"{result['http_requests_per_op']:>9.2f}"
+                f"{result['db_queries_per_op']:>8.2f}"
+            )
+
+    if args.update_baseline:
+        baseline = {
+            "latency": args.latency,
+            "iterations": args.iterations,
+            "scenarios": {
+                result["scenario"]: {
+                    key: round(result[key], 2) for key in ("ops_per_sec", *METRICS)
+                }
+                for result in results
+            },
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline.")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("iterations") != args.iterations:
+        # Per-scenario setup calls are spread over the operations, so counts per
+        # operation are only comparable for the same number of iterations
+        print(
+            f"Baseline was recorded with --iterations {baseline.get('iterations')}; "
+            "skipping the comparison."
+        )
+        return
+    if baseline.get("latency") != args.latency:
+        print(
+            f"Baseline was recorded with --latency {baseline.get('latency')}; "
+            "ops/sec is not comparable."
+        )
+    regressions = find_regressions(results, baseline, args.tolerance, args.max_slowdown)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares the sync-to-async bridges used by ``BaseSolanaClient.run_sync_from_async``.
+
+Each iteration performs one sync RPC-style call through the selected ``RPC_SYNC_RUNNER``
+against a stub client, so the numbers show the bridge overhead per call (event loop and
+thread setup, client creation), not RPC latency.
+
+Usage::
+
+    python benchmarks/bench_sync_runner.py --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+import django
+from django.conf import settings
+
+settings.configure(
+    SOLANA_PAYMENTS={
+        "RPC_URL": "http://localhost:8899",
+        "RECEIVER_ADDRESS": "11111111111111111111111111111111",
+        "FEE_PAYER_KEYPAIR": "[" + ",".join(str(i) for i in range(1, 65)) + "]",
+        "ONE_TIME_WALLETS_ENCRYPTION_ENABLED": False,
+    },
+)
+django.setup()
+
+from django_solana_payments.solana.base_solana_client import (  # noqa: E402
+    BaseSolanaClient,
+)
+from django_solana_payments.solana.enums import SyncRunnerTypeEnum  # noqa: E402
+
+
+class StubAsyncClient:
+    created = 0
+
+    def __init__(self):
+        StubAsyncClient.created += 1
+
+    async def get_balance(self, address, commitment=None):
+        await asyncio.sleep(0)
+        return 0
+
+    async def close(self):
+        return None
+
+
+def run_benchmark(sync_runner: SyncRunnerTypeEnum, iterations: int) -> dict:
+    settings.SOLANA_PAYMENTS = {
+        **settings.SOLANA_PAYMENTS,
+        "RPC_SYNC_RUNNER": sync_runner.value,
+    }
+    StubAsyncClient.created = 0
+    base_client = BaseSolanaClient(client_factory=StubAsyncClient)
+
+    async def aget_balance():
+        async with base_client.http_client() as client:
+            return await client.get_balance("address")
+
+    # Warm up (starts the background loop thread once)
+    base_client.run_sync_from_async(aget_balance)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        base_client.run_sync_from_async(aget_balance)
+    elapsed = time.perf_counter() - started
+
+    base_client.close()
+    return {
+        "runner": sync_runner.value,
+        "ops_per_sec": iterations / elapsed,
+        "us_per_call": elapsed / iterations * 1_000_000,
+        "clients_created": StubAsyncClient.created,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'runner':<18}{'ops/sec':>12}{'us/call':>12}{'clients':>10}")
+    for sync_runner in SyncRunnerTypeEnum:
+        result = run_benchmark(sync_runner, args.iterations)
+        print(
+            f"{result['runner']:<18}{result['ops_per_sec']:>12.0f}"
+            f"{result['us_per_call']:>12.1f}{result['clients_created']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,7 @@ def verify_transaction_and_process_payment(
     meta_data=None,
     send_payment_accepted_signal: bool = True,
     on_success=None,
+    use_result_cache: bool = False,
 ):
     from django_solana_payments.services import (
         verify_transaction_and_process_payment as _verify_transaction_and_process_payment,
@@ -49,6 +50,7 @@ def verify_transaction_and_process_payment(
         meta_data=meta_data,
         send_payment_accepted_signal=send_payment_accepted_signal,
         on_success=on_success,
+        use_result_cache=use_result_cache,
     )
 
 
@@ -7,6 +7,7 @@ from django_solana_payments.helpers import (
 from django_solana_payments.models import (
     OneTimePaymentWallet,
     SolanaPayPaymentCryptoPrice,
+    SweepJob,
 )
 from django_solana_payments.services.one_time_wallet_service import (
     one_time_wallet_service,
@@ -108,3 +109,20 @@ class OneTimePaymentWalletAdmin(admin.ModelAdmin):
             obj.receiver_address = str(keypair.pubkey())
 
         super().save_model(request, obj, form, change)
+
+
+@admin.register(SweepJob)
+class SweepJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "one_time_payment_wallet",
+        "status",
+        "amount",
+        "transaction_type",
+        "attempts",
+        "created",
+        "updated",
+    )
+    readonly_fields = ("attempts", "last_error", "created", "updated")
+    list_filter = ("status", "transaction_type")
+    search_fields = ("recipient_address", "token_mint_address")
@@ -91,6 +91,7 @@ def test_verify_transfer_success_returns_status_and_payment_address(
     }
     mock_verify_transaction.assert_called_once()
     assert mock_verify_transaction.call_args.kwargs["meta_data"] is None
+    assert mock_verify_transaction.call_args.kwargs["use_result_cache"] is True
 
 
 def test_verify_transfer_payment_expired_returns_404_and_marks_payment_expired(
@@ -64,6 +64,7 @@ class VerifySolanaPayTransferView(generics.RetrieveAPIView):
                     payment_address=payment_address,
                     payment_crypto_token=payment_crypto_token,
                     meta_data=query_serializer.validated_data.get("meta_data"),
+                    use_result_cache=True,
                 )
             )
             serializer = self.serializer_class(
@@ -10,6 +10,8 @@ class SolanaPaymentStatusTypes(models.TextChoices):
 
 
 class OneTimeWalletStateTypes(models.TextChoices):
+    POOL_PENDING = "pool_pending"  # waiting for its ATAs to be confirmed, not claimable
+    POOLED = "pooled"  # ready in the wallet pool, not assigned to a payment yet
     CREATED = "created"
     RECEIVED_FUNDS = "received_funds"
     SENT_FUNDS = "sent_funds"
@@ -20,6 +22,13 @@ class OneTimeWalletStateTypes(models.TextChoices):
     PAYMENT_EXPIRED_AND_WALLET_CLOSED = "payment_expired_and_wallet_closed"
 
 
+class SweepJobStatusTypes(models.TextChoices):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class TokenTypes(models.TextChoices):
     NATIVE = "NATIVE", "Native"
     SPL = "SPL", "SPL Token"
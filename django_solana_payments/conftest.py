@@ -1,9 +1,13 @@
+import json
 from datetime import timedelta
 from decimal import Decimal
+from unittest.mock import AsyncMock
 
 import pytest
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from solana.rpc.async_api import AsyncClient
+from solders.keypair import Keypair
 
 from django_solana_payments.choices import (
     OneTimeWalletStateTypes,
@@ -21,6 +25,11 @@ from django_solana_payments.models import (
 from django_solana_payments.services.one_time_wallet_service import (
     reset_one_time_wallet_service,
 )
+from django_solana_payments.solana.base_solana_client import (
+    BaseSolanaClient,
+    base_solana_client,
+)
+from django_solana_payments.testing import FakeSolanaRpc
 
 SolanaPayment = get_solana_payment_model()
 PaymentCryptoToken = get_payment_crypto_token_model()
@@ -56,6 +65,54 @@ def reset_service_singletons():
     reset_one_time_wallet_service()
 
 
+@pytest.fixture
+def fake_solana_rpc(settings, test_settings):
+    """
+    A ``FakeSolanaRpc`` mounted on the shared ``base_solana_client``, with a funded fee payer.
+    """
+    fee_payer = Keypair()
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URL": "http://fake-solana-rpc",
+        "FEE_PAYER_ADDRESS": str(fee_payer.pubkey()),
+        "FEE_PAYER_KEYPAIR": json.dumps(list(bytes(fee_payer))),
+    }
+    fake_rpc = FakeSolanaRpc()
+    fake_rpc.airdrop(fee_payer.pubkey(), 10**10)
+    base_solana_client.mint_info_cache.clear()
+    base_solana_client.blockhash_cache.invalidate()
+    with fake_rpc.mount(base_solana_client):
+        yield fake_rpc
+    base_solana_client.mint_info_cache.clear()
+    base_solana_client.blockhash_cache.invalidate()
+
+
+@pytest.fixture
+def json_rpc_base_client():
+    """
+    Factory for a BaseSolanaClient whose HTTP POSTs are answered by ``responder``.
+
+    ``responder(payload)`` receives the decoded JSON-RPC payload (a dict, or a list for batches)
+    and returns the decoded response. The returned AsyncMock records every POSTed payload.
+    """
+
+    def build(responder):
+        async_client = AsyncClient("https://rpc.example.com")
+
+        async def make_request_unparsed(body):
+            return json.dumps(responder(json.loads(body.to_json())))
+
+        async_client._provider.make_request_unparsed = AsyncMock(
+            side_effect=make_request_unparsed
+        )
+        base_client = BaseSolanaClient(
+            rpc_url="https://rpc.example.com", client_factory=lambda: async_client
+        )
+        return base_client, async_client._provider.make_request_unparsed
+
+    return build
+
+
 @pytest.fixture
 def user(db):
     """
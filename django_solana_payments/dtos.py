@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
 from django.contrib.auth import get_user_model
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from django_solana_payments.models import OneTimePaymentWallet
 
 User = get_user_model()
 
@@ -12,3 +16,17 @@ class CreateSolanaPaymentDTO:
     message: str | None
     meta_data: dict | None
     email: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OneTimeWalletSweepDTO:
+    """
+    A one-time wallet to sweep, with the token accounts its balances are read from.
+    """
+
+    wallet: OneTimePaymentWallet
+    keypair: Keypair
+    token_accounts: list[Pubkey]
+    paid_mint: Pubkey | None = None
+    paid_mint_decimals: int | None = None
+    paid_token_account: Pubkey | None = None
@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 
 from django_solana_payments.services.one_time_wallet_service import OneTimeWalletService
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
 
 
 class Command(BaseCommand):
@@ -20,9 +22,10 @@ class Command(BaseCommand):
 
         self.stdout.write("Starting to close expired one-time wallets...")
 
-        one_time_wallet_service.close_expired_one_time_wallets(
-            sleep_interval_seconds=sleep_interval
-        )
+        with rpc_priority(RpcPriorityEnum.BACKGROUND):
+            one_time_wallet_service.close_expired_one_time_wallets(
+                sleep_interval_seconds=sleep_interval
+            )
 
         self.stdout.write(
             self.style.SUCCESS("Finished closing expired one-time wallets.")
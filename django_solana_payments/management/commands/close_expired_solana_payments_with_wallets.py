@@ -3,6 +3,8 @@ from django.core.management import BaseCommand
 from django_solana_payments.services.solana_payments_service import (
     SolanaPaymentsService,
 )
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
 
 
 class Command(BaseCommand):
@@ -18,6 +20,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         sleep_interval = options["sleep"]
-        SolanaPaymentsService().mark_not_finished_solana_payments_as_expired_and_close_wallets_accounts(
-            sleep_interval
-        )
+        with rpc_priority(RpcPriorityEnum.BACKGROUND):
+            SolanaPaymentsService().mark_not_finished_solana_payments_as_expired_and_close_wallets_accounts(
+                sleep_interval
+            )
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management import BaseCommand
+
+from django_solana_payments.services.one_time_wallet_service import OneTimeWalletService
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the associated token accounts of the tokens customers selected "
+        "in the on_select ATA_CREATION_MODE."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of pending token accounts to create per run.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and look for new token accounts every INTERVAL seconds.",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        one_time_wallet_service = OneTimeWalletService()
+        while True:
+            with rpc_priority(RpcPriorityEnum.BACKGROUND):
+                summary = one_time_wallet_service.create_pending_one_time_wallet_token_accounts(
+                    limit=options["limit"]
+                )
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Token accounts created: "
+                    f"created={summary['created']}, pending={summary['pending']}"
+                )
+            )
+            if not interval:
+                return
+            time.sleep(interval)
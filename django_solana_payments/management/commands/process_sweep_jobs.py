@@ -0,0 +1,47 @@
+import time
+
+from django.core.management import BaseCommand
+
+from django_solana_payments.services.sweep_job_service import (
+    process_pending_sweep_jobs,
+)
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
+
+
+class Command(BaseCommand):
+    help = "Sends funds of queued sweep jobs from one-time wallets to the main wallet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of pending sweep jobs to process per run.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and look for new sweep jobs every INTERVAL seconds.",
+        )
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        interval = options["interval"]
+        while True:
+            with rpc_priority(RpcPriorityEnum.BACKGROUND):
+                summary = process_pending_sweep_jobs(limit=limit)
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Sweep jobs processed: "
+                    f"processed={summary['processed']}, "
+                    f"succeeded={summary['succeeded']}, "
+                    f"failed={summary['failed']}, "
+                    f"requeued={summary['requeued']}"
+                )
+            )
+            if not interval:
+                return
+            time.sleep(interval)
@@ -3,6 +3,8 @@ from django.core.management import BaseCommand
 from django_solana_payments.services.solana_payments_service import (
     SolanaPaymentsService,
 )
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
 
 
 class Command(BaseCommand):
@@ -28,11 +30,12 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         limit = options["limit"]
         sleep_interval = options["sleep"]
-        summary = SolanaPaymentsService().recheck_initiated_payments_and_process(
-            limit=limit,
-            sleep_interval_seconds=sleep_interval,
-            send_payment_accepted_signal=True,
-        )
+        with rpc_priority(RpcPriorityEnum.BACKGROUND):
+            summary = SolanaPaymentsService().recheck_initiated_payments_and_process(
+                limit=limit,
+                sleep_interval_seconds=sleep_interval,
+                send_payment_accepted_signal=True,
+            )
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management import BaseCommand
+
+from django_solana_payments.services.one_time_wallet_service import OneTimeWalletService
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
+
+
+class Command(BaseCommand):
+    help = "Creates one-time wallets with their ATAs ahead of time for new payments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--low-watermark",
+            type=int,
+            default=None,
+            help="Refill once the pool holds this many wallets or fewer. "
+            "Defaults to WALLET_POOL_LOW_WATERMARK.",
+        )
+        parser.add_argument(
+            "--high-watermark",
+            type=int,
+            default=None,
+            help="Number of wallets the pool is refilled to. "
+            "Defaults to WALLET_POOL_HIGH_WATERMARK.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Keep running and check the pool every INTERVAL seconds.",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["interval"]
+        one_time_wallet_service = OneTimeWalletService()
+        while True:
+            with rpc_priority(RpcPriorityEnum.BACKGROUND):
+                summary = one_time_wallet_service.refill_one_time_wallet_pool(
+                    low_watermark=options["low_watermark"],
+                    high_watermark=options["high_watermark"],
+                )
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Wallet pool refilled: "
+                    f"added={summary['added']}, pooled={summary['pooled']}"
+                )
+            )
+            if not interval:
+                return
+            time.sleep(interval)
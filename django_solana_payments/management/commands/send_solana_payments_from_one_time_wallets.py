@@ -3,6 +3,8 @@ from django.core.management import BaseCommand
 from django_solana_payments.services.solana_payments_service import (
     SolanaPaymentsService,
 )
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
 
 
 class Command(BaseCommand):
@@ -15,13 +17,28 @@ class Command(BaseCommand):
             default=0,
             help="Sleep interval in seconds between sending funds from each wallet to prevent rate limiting.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Maximum number of wallets swept per transaction (defaults to SWEEP_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Number of wallets swept at the same time (defaults to SWEEP_CONCURRENCY).",
+        )
 
     def handle(self, *args, **options):
         sleep_interval = options["sleep"]
         self.stdout.write("Starting to send funds from one-time wallets...")
-        SolanaPaymentsService().send_solana_payments_from_one_time_wallets(
-            sleep_interval_seconds=sleep_interval
-        )
+        with rpc_priority(RpcPriorityEnum.BACKGROUND):
+            SolanaPaymentsService().send_solana_payments_from_one_time_wallets(
+                sleep_interval_seconds=sleep_interval,
+                batch_size=options["batch_size"],
+                concurrency=options["concurrency"],
+            )
         self.stdout.write(
             self.style.SUCCESS("Finished sending funds from one-time wallets.")
         )
@@ -0,0 +1,79 @@
+import argparse
+import json
+from dataclasses import asdict
+
+from django.core.management import BaseCommand, call_command
+
+from django_solana_payments.solana.enums import RpcCallOutcomeEnum
+from django_solana_payments.solana.solana_rpc_instrumentation import rpc_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        "Dump per-method RPC metrics (calls, outcomes, retries, payload sizes and "
+        "p50/p95/p99 latency) of this process. Pass a management command to run it "
+        "first and dump the RPC metrics it produced."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "command_name",
+            nargs="?",
+            help="Management command to run before dumping metrics.",
+        )
+        parser.add_argument(
+            "command_args",
+            nargs=argparse.REMAINDER,
+            help="Arguments passed to the management command.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print metrics as JSON instead of a table.",
+        )
+
+    def handle(self, *args, **options):
+        command_name = options["command_name"]
+        if command_name:
+            rpc_metrics.reset()
+            call_command(command_name, *options["command_args"])
+
+        stats = rpc_metrics.get_stats()
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        method: asdict(method_stats)
+                        for method, method_stats in stats.items()
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        if not stats:
+            self.stdout.write("No RPC calls recorded.")
+            return
+
+        outcomes = [outcome.value for outcome in RpcCallOutcomeEnum]
+        header = (
+            f"{'method':<34}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+            + "".join(f"{outcome:>9}" for outcome in outcomes)
+            + f"{'retries':>9}{'sent B':>12}{'recv B':>12}"
+        )
+        self.stdout.write(header)
+        for method, method_stats in stats.items():
+            self.stdout.write(
+                f"{method:<34}{method_stats.calls:>8}"
+                f"{method_stats.p50 * 1000:>10.1f}"
+                f"{method_stats.p95 * 1000:>10.1f}"
+                f"{method_stats.p99 * 1000:>10.1f}"
+                + "".join(
+                    f"{method_stats.outcomes.get(outcome, 0):>9}"
+                    for outcome in outcomes
+                )
+                + f"{method_stats.retries:>9}"
+                f"{method_stats.request_bytes:>12}{method_stats.response_bytes:>12}"
+            )
+            for batch_method, calls in sorted(method_stats.batch_methods.items()):
+                self.stdout.write(f"  {batch_method:<32}{calls:>8}")
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "django_solana_payments",
+            "0002_alter_paymentcryptotoken_payment_crypto_price",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AddressSignatureCursor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("address", models.CharField(max_length=60, unique=True)),
+                ("last_signature", models.CharField(max_length=100)),
+                ("last_slot", models.BigIntegerField()),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_solana_payments", "0003_addresssignaturecursor"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OneTimeWalletTokenAccount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("mint_address", models.CharField(max_length=64)),
+                ("address", models.CharField(max_length=60)),
+                ("decimals", models.PositiveSmallIntegerField()),
+                ("pending_creation", models.BooleanField(default=False)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                (
+                    "one_time_payment_wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="token_accounts",
+                        to="django_solana_payments.onetimepaymentwallet",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("one_time_payment_wallet", "mint_address"),
+                        name="unique_one_time_wallet_token_account",
+                    )
+                ],
+            },
+        ),
+    ]
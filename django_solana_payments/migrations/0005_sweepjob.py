@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_solana_payments", "0004_onetimewallettokenaccount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SweepJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("recipient_address", models.CharField(max_length=60)),
+                ("amount", models.DecimalField(decimal_places=18, max_digits=30)),
+                ("transaction_type", models.CharField(max_length=10)),
+                (
+                    "token_mint_address",
+                    models.CharField(blank=True, max_length=64, null=True),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("succeeded", "Succeeded"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("next_attempt_at", models.DateTimeField(blank=True, null=True)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "one_time_payment_wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sweep_jobs",
+                        to="django_solana_payments.onetimepaymentwallet",
+                    ),
+                ),
+            ],
+        ),
+    ]
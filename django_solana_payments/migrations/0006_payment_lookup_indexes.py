@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_solana_payments", "0005_sweepjob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="onetimepaymentwallet",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("created", "Created"),
+                    ("received_funds", "Received Funds"),
+                    ("sent_funds", "Sent Funds"),
+                    ("processing_payment", "Processing Payment"),
+                    ("processing_funds", "Processing Funds"),
+                    ("failed_to_send_funds", "Failed To Send Funds"),
+                    ("payment_expired", "Payment Expired"),
+                    (
+                        "payment_expired_and_wallet_closed",
+                        "Payment Expired And Wallet Closed",
+                    ),
+                ],
+                db_index=True,
+                default="created",
+                max_length=50,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="solanapayment",
+            name="payment_address",
+            field=models.CharField(db_index=True, max_length=60),
+        ),
+        migrations.AlterField(
+            model_name="solanapayment",
+            name="signature",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=255, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="solanapayment",
+            index=models.Index(
+                fields=["status", "expiration_date"],
+                name="django_sola_status_a4560c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="solanapayment",
+            index=models.Index(
+                condition=models.Q(("status", "initiated")),
+                fields=["-updated"],
+                name="solana_payment_initiated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_solana_payments", "0006_payment_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="onetimepaymentwallet",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("pool_pending", "Pool Pending"),
+                    ("pooled", "Pooled"),
+                    ("created", "Created"),
+                    ("received_funds", "Received Funds"),
+                    ("sent_funds", "Sent Funds"),
+                    ("processing_payment", "Processing Payment"),
+                    ("processing_funds", "Processing Funds"),
+                    ("failed_to_send_funds", "Failed To Send Funds"),
+                    ("payment_expired", "Payment Expired"),
+                    (
+                        "payment_expired_and_wallet_closed",
+                        "Payment Expired And Wallet Closed",
+                    ),
+                ],
+                db_index=True,
+                default="created",
+                max_length=50,
+            ),
+        ),
+    ]
@@ -8,6 +8,7 @@ from solders.solders import Keypair
 from django_solana_payments.choices import (
     OneTimeWalletStateTypes,
     SolanaPaymentStatusTypes,
+    SweepJobStatusTypes,
     TokenTypes,
 )
 from django_solana_payments.services.wallet_encryption_service import (
@@ -71,7 +72,7 @@ class AbstractPaymentToken(models.Model):
 
 
 class AbstractSolanaPayment(models.Model):
-    payment_address = models.CharField(max_length=60)
+    payment_address = models.CharField(max_length=60, db_index=True)
 
     one_time_payment_wallet = models.OneToOneField(
         "django_solana_payments.OneTimePaymentWallet",
@@ -96,7 +97,7 @@ class AbstractSolanaPayment(models.Model):
         choices=SolanaPaymentStatusTypes.choices,
     )
 
-    signature = models.CharField(max_length=255, null=True, blank=True)
+    signature = models.CharField(max_length=255, null=True, blank=True, db_index=True)
     expiration_date = models.DateTimeField(default=set_default_expiration_date)
     meta_data = models.JSONField(default=dict, blank=True, null=True)
 
@@ -105,6 +106,10 @@ class AbstractSolanaPayment(models.Model):
 
     class Meta:
         abstract = True
+        indexes = [
+            # Expiry checks filter by status and expiration date
+            models.Index(fields=["status", "expiration_date"]),
+        ]
 
 
 class PaymentCryptoToken(AbstractPaymentToken):
@@ -149,6 +154,7 @@ class OneTimePaymentWallet(models.Model):
         max_length=50,
         choices=OneTimeWalletStateTypes.choices,
         default=OneTimeWalletStateTypes.CREATED,
+        db_index=True,
     )
     receiver_address = models.CharField(max_length=60, null=True, blank=True)
 
@@ -171,6 +177,89 @@ class OneTimePaymentWallet(models.Model):
         return keypair.pubkey()
 
 
+class OneTimeWalletTokenAccount(models.Model):
+    """
+    Associated token account of a one-time wallet for an SPL mint, derived once when the
+    wallet's token accounts are created, so verification reads it instead of deriving it.
+    """
+
+    one_time_payment_wallet = models.ForeignKey(
+        OneTimePaymentWallet,
+        on_delete=models.CASCADE,
+        related_name="token_accounts",
+    )
+    mint_address = models.CharField(max_length=64)
+    address = models.CharField(max_length=60)
+    decimals = models.PositiveSmallIntegerField()
+    # Recorded on the verification path in the on_select ATA_CREATION_MODE, until the
+    # account is created on-chain in the background
+    pending_creation = models.BooleanField(default=False)
+
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["one_time_payment_wallet", "mint_address"],
+                name="unique_one_time_wallet_token_account",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.address} ({self.mint_address})"
+
+
+class SweepJob(models.Model):
+    """
+    Transfer of the funds received by a one-time wallet to the main wallet, queued when
+    the payment is accepted and processed by a worker outside of the verify request.
+    """
+
+    one_time_payment_wallet = models.ForeignKey(
+        OneTimePaymentWallet,
+        on_delete=models.CASCADE,
+        related_name="sweep_jobs",
+    )
+    recipient_address = models.CharField(max_length=60)
+    amount = models.DecimalField(max_digits=30, decimal_places=18)
+    transaction_type = models.CharField(max_length=10)
+    token_mint_address = models.CharField(max_length=64, null=True, blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=SweepJobStatusTypes.choices,
+        default=SweepJobStatusTypes.PENDING,
+        db_index=True,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    # Set when a worker claims the job, so jobs of crashed workers can be requeued
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Failed attempts are retried with backoff once this time has passed
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Sweep {self.amount} {self.transaction_type} from wallet {self.one_time_payment_wallet_id}"
+
+
+class AddressSignatureCursor(models.Model):
+    """
+    Newest already processed signature of a polled address (one-time wallet or its ATA),
+    so verification only asks the RPC node for signatures after it.
+    """
+
+    address = models.CharField(max_length=60, unique=True)
+    last_signature = models.CharField(max_length=100)
+    last_slot = models.BigIntegerField()
+
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.address} until {self.last_signature}"
+
+
 class SolanaPayment(AbstractSolanaPayment):
     user = models.ForeignKey(
         User,
@@ -184,5 +273,15 @@ class SolanaPayment(AbstractSolanaPayment):
     label = models.CharField(max_length=255, null=True, blank=True)
     message = models.TextField(null=True, blank=True)
 
+    class Meta(AbstractSolanaPayment.Meta):
+        indexes = AbstractSolanaPayment.Meta.indexes + [
+            # Rechecks scan initiated payments, most recently updated first
+            models.Index(
+                fields=["-updated"],
+                condition=Q(status=SolanaPaymentStatusTypes.INITIATED),
+                name="solana_payment_initiated_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.payment_address
@@ -36,6 +36,7 @@ def verify_transaction_and_process_payment(
     meta_data: dict[str, Any] | None = None,
     send_payment_accepted_signal: bool = True,
     on_success: Callable | None = None,
+    use_result_cache: bool = False,
 ):
     from django_solana_payments.services.verify_transaction_service import (
         VerifyTransactionService,
@@ -47,6 +48,7 @@ def verify_transaction_and_process_payment(
         meta_data=meta_data,
         send_payment_accepted_signal=send_payment_accepted_signal,
         on_success=on_success,
+        use_result_cache=use_result_cache,
     )
 
 
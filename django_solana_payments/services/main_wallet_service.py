@@ -30,7 +30,7 @@ def send_transaction_and_update_one_time_wallet(
     transaction_type: TransactionTypeEnum,
     token_mint_address: str = None,
     should_close_spl_one_time_wallets_atas: bool = True,
-) -> None:
+) -> OneTimeWalletStateTypes:
     # Validate that token_mint_address is provided for SPL transactions
     if transaction_type == TransactionTypeEnum.SPL and not token_mint_address:
         raise ValueError("token_mint_address is required when transaction_type is SPL")
@@ -67,7 +67,7 @@ def send_transaction_and_update_one_time_wallet(
             receiver_address=recipient_address,
         )
         logger.error(f"An unexpected error occurred: {e}")
-        return
+        return OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
 
     if data.confirmation_status in (
         TransactionConfirmationStatus.Confirmed,
@@ -85,6 +85,7 @@ def send_transaction_and_update_one_time_wallet(
     OneTimePaymentWallet.objects.filter(id=one_time_wallet.id).update(
         state=state, receiver_address=recipient_address
     )
+    return state
 
 
 def send_solana_transaction_to_main_wallet(
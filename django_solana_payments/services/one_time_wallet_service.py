@@ -1,6 +1,9 @@
 import logging
 import time
+from typing import Iterable
 
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from solders.solders import Keypair, Pubkey
 
 from django_solana_payments.choices import OneTimeWalletStateTypes, TokenTypes
@@ -8,13 +11,18 @@ from django_solana_payments.helpers import (
     get_payment_crypto_token_model,
     get_solana_payment_model,
 )
-from django_solana_payments.models import OneTimePaymentWallet
+from django_solana_payments.models import (
+    OneTimePaymentWallet,
+    OneTimeWalletTokenAccount,
+)
 from django_solana_payments.services.wallet_encryption_service import (
     WalletEncryptionService,
 )
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.solana.base_solana_client import base_solana_client
+from django_solana_payments.solana.enums import AtaCreationModeEnum
 from django_solana_payments.solana.solana_token_client import SolanaTokenClient
+from django_solana_payments.solana.utils import parse_token_account_amount
 from django_solana_payments.utils import chunked
 
 solana_logger = logging.getLogger(__name__)
@@ -45,6 +53,17 @@ class OneTimeWalletService:
             "class": SolanaPayment._meta.model_name,
         }
 
+    @staticmethod
+    def get_ata_creation_mode() -> AtaCreationModeEnum:
+        ata_creation_mode = solana_payments_settings.ATA_CREATION_MODE
+        try:
+            return AtaCreationModeEnum(ata_creation_mode)
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Unsupported SOLANA_PAYMENTS['ATA_CREATION_MODE']: {ata_creation_mode!r}. "
+                f"Supported values: {[mode.value for mode in AtaCreationModeEnum]}"
+            )
+
     def generate_one_time_wallet_and_encrypt_if_needed(self) -> tuple[Keypair, str]:
         """
         Generates one-time wallet on-chain and encrypts if ONE_TIME_WALLETS_ENCRYPTION_ENABLED=True
@@ -62,8 +81,17 @@ class OneTimeWalletService:
         self, should_create_atas: bool = True
     ) -> tuple[Keypair, str, OneTimePaymentWallet]:
         """
-        Creates a record for one time wallet and associated token addresses if needed
+        Creates a record for one time wallet and associated token addresses if needed.
+        ATAs are only created here in the ``eager`` ``ATA_CREATION_MODE``.
+
+        When the wallet pool is enabled (``WALLET_POOL_HIGH_WATERMARK``), a pooled wallet
+        is claimed instead, and a new wallet is only created while the pool is empty.
         """
+        if should_create_atas and solana_payments_settings.WALLET_POOL_HIGH_WATERMARK:
+            pooled_wallet = self.claim_pooled_one_time_wallet()
+            if pooled_wallet is not None:
+                return pooled_wallet
+
         reference_keypair, keypair_json = (
             self.generate_one_time_wallet_and_encrypt_if_needed()
         )
@@ -73,7 +101,10 @@ class OneTimeWalletService:
 
         solana_logger.info(f"Generated one time wallet: {reference_pubkey_string}")
 
-        if should_create_atas:
+        if (
+            should_create_atas
+            and self.get_ata_creation_mode() == AtaCreationModeEnum.EAGER
+        ):
             self.create_atas_for_one_time_wallet_from_active_tokens(wallet)
             solana_logger.info(
                 f"Generated ATA's for active tokens for one time wallet: {reference_pubkey_string}"
@@ -81,21 +112,232 @@ class OneTimeWalletService:
 
         return reference_keypair, reference_pubkey_string, wallet
 
+    def claim_pooled_one_time_wallet(
+        self,
+    ) -> tuple[Keypair, str, OneTimePaymentWallet] | None:
+        """
+        Takes a ready wallet from the pool, or returns ``None`` when the pool is empty.
+
+        Pooled rows are locked with ``SKIP LOCKED``, so concurrent checkouts claim
+        different wallets. ATAs of SPL tokens activated after the wallet was pooled are
+        created on claim.
+        """
+        with transaction.atomic():
+            wallet = (
+                OneTimePaymentWallet.objects.select_for_update(skip_locked=True)
+                .filter(state=OneTimeWalletStateTypes.POOLED)
+                .order_by("id")
+                .first()
+            )
+            if wallet is None:
+                solana_logger.info(
+                    "One-time wallet pool is empty, creating a wallet on demand"
+                )
+                return None
+
+            wallet.state = OneTimeWalletStateTypes.CREATED
+            wallet.save(update_fields=["state", "updated"])
+
+            created_mints = set(
+                wallet.token_accounts.values_list("mint_address", flat=True)
+            )
+            missing_mints = [
+                mint
+                for mint in self.get_active_spl_mints()
+                if str(mint) not in created_mints
+            ]
+            if (
+                missing_mints
+                and self.get_ata_creation_mode() == AtaCreationModeEnum.EAGER
+            ):
+                self.create_atas_for_one_time_wallet(wallet, missing_mints)
+
+        reference_keypair = self.load_keypair(wallet.keypair_json)
+        reference_pubkey_string = str(reference_keypair.pubkey())
+        solana_logger.info(f"Claimed pooled one time wallet: {reference_pubkey_string}")
+
+        return reference_keypair, reference_pubkey_string, wallet
+
+    def create_pooled_one_time_wallets(self, count: int) -> list[OneTimePaymentWallet]:
+        """
+        Creates ``count`` wallets with ATAs for all active SPL tokens (in the ``eager``
+        ``ATA_CREATION_MODE``) and adds them to the pool. Returns the pooled wallets.
+
+        The wallets are stored as ``POOL_PENDING`` before their ATAs are created, so
+        their keys are kept whatever happens to the ATA transactions. The ATAs of all
+        wallets are created together, packed into as few transactions as the size limit
+        allows. Wallets whose ATA transaction was not confirmed stay pending and are
+        retried by the next refill.
+        """
+        keypairs = []
+        for _ in range(count):
+            keypairs.append(self.generate_one_time_wallet_and_encrypt_if_needed())
+
+        spl_mints = []
+        if self.get_ata_creation_mode() == AtaCreationModeEnum.EAGER:
+            spl_mints = self.get_active_spl_mints()
+        if spl_mints:
+            # Mints missing from the mint info cache are loaded in one batch request
+            self.solana_token_client.warm_mint_info_cache(spl_mints)
+
+        with transaction.atomic():
+            wallets = OneTimePaymentWallet.objects.bulk_create(
+                [
+                    OneTimePaymentWallet(
+                        keypair_json=keypair_json,
+                        state=(
+                            OneTimeWalletStateTypes.POOL_PENDING
+                            if spl_mints
+                            else OneTimeWalletStateTypes.POOLED
+                        ),
+                    )
+                    for _, keypair_json in keypairs
+                ]
+            )
+            OneTimeWalletTokenAccount.objects.bulk_create(
+                [
+                    token_account
+                    for wallet, (reference_keypair, _) in zip(wallets, keypairs)
+                    for token_account in self.build_one_time_wallet_token_accounts(
+                        wallet, reference_keypair.pubkey(), spl_mints
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+
+        if not spl_mints:
+            return wallets
+
+        return self.pool_pending_one_time_wallets(
+            OneTimePaymentWallet.objects.filter(
+                id__in=[wallet.id for wallet in wallets]
+            ).prefetch_related("token_accounts")
+        )
+
+    def pool_pending_one_time_wallets(
+        self, wallets: Iterable[OneTimePaymentWallet]
+    ) -> list[OneTimePaymentWallet]:
+        """
+        Creates the stored ATAs of ``POOL_PENDING`` wallets and pools the wallets whose
+        ATA transaction was confirmed. ATAs are created with the idempotent instruction,
+        so ATAs of an earlier unconfirmed transaction that landed later are skipped.
+        """
+        wallets_by_owner = {
+            self.load_keypair(wallet.keypair_json).pubkey(): wallet
+            for wallet in wallets
+        }
+        accounts = [
+            (owner, Pubkey.from_string(token_account.mint_address))
+            for owner, wallet in wallets_by_owner.items()
+            for token_account in wallet.token_accounts.all()
+        ]
+
+        failed_owners = set()
+        if accounts:
+            # Mints missing from the mint info cache are loaded in one batch request
+            self.solana_token_client.warm_mint_info_cache(
+                list({mint for _, mint in accounts})
+            )
+            failed_owners = {
+                owner
+                for created_ata in self.solana_token_client.create_associated_token_accounts(
+                    accounts
+                )
+                if not created_ata.confirmed
+                for owner, _ in created_ata.accounts
+            }
+        if failed_owners:
+            solana_logger.warning(
+                f"ATAs of {len(failed_owners)} wallets were not confirmed, "
+                "they stay pending until the next pool refill"
+            )
+
+        pooled_wallets = [
+            wallet
+            for owner, wallet in wallets_by_owner.items()
+            if owner not in failed_owners
+        ]
+        OneTimePaymentWallet.objects.filter(
+            id__in=[wallet.id for wallet in pooled_wallets],
+            state=OneTimeWalletStateTypes.POOL_PENDING,
+        ).update(state=OneTimeWalletStateTypes.POOLED)
+        return pooled_wallets
+
+    def refill_one_time_wallet_pool(
+        self,
+        low_watermark: int | None = None,
+        high_watermark: int | None = None,
+    ) -> dict[str, int]:
+        """
+        Tops the wallet pool up to ``high_watermark`` wallets once it holds
+        ``low_watermark`` wallets or fewer. Defaults to the ``WALLET_POOL_*`` settings.
+
+        The ATAs of ``POOL_PENDING`` wallets are retried first. Wallets still pending
+        count towards ``high_watermark``, so an RPC outage does not pile them up.
+        """
+        if low_watermark is None:
+            low_watermark = solana_payments_settings.WALLET_POOL_LOW_WATERMARK
+        if high_watermark is None:
+            high_watermark = solana_payments_settings.WALLET_POOL_HIGH_WATERMARK
+
+        added = 0
+        pending_wallets = list(
+            OneTimePaymentWallet.objects.filter(
+                state=OneTimeWalletStateTypes.POOL_PENDING
+            ).prefetch_related("token_accounts")
+        )
+        if pending_wallets:
+            try:
+                added += len(self.pool_pending_one_time_wallets(pending_wallets))
+            except Exception as e:
+                solana_logger.warning(f"Failed to pool pending wallets: {e}")
+
+        pooled = OneTimePaymentWallet.objects.filter(
+            state=OneTimeWalletStateTypes.POOLED
+        ).count()
+        if pooled > low_watermark:
+            return {"added": added, "pooled": pooled}
+
+        still_pending = len(pending_wallets) - added
+        missing = high_watermark - pooled - still_pending
+        if missing > 0:
+            try:
+                new_wallets = len(self.create_pooled_one_time_wallets(missing))
+            except Exception as e:
+                # Usually an RPC or fee payer problem, the new wallets stay pending
+                solana_logger.warning(f"Failed to add wallets to the pool: {e}")
+            else:
+                added += new_wallets
+                pooled += new_wallets
+
+        return {"added": added, "pooled": pooled}
+
+    def get_active_spl_mints(self) -> list[Pubkey]:
+        spl_mints = AllowedPaymentCryptoToken.objects.filter(
+            is_active=True, token_type=TokenTypes.SPL
+        ).values_list("mint_address", flat=True)
+        return [Pubkey.from_string(spl_mint) for spl_mint in spl_mints]
+
     def create_atas_for_one_time_wallet_from_active_tokens(
         self,
         wallet: OneTimePaymentWallet,
         max_atas_per_tx: int = solana_payments_settings.MAX_ATAS_PER_TX,
     ):
-
-        allowed_payment_crypto_tokens = AllowedPaymentCryptoToken.objects.filter(
-            is_active=True, token_type=TokenTypes.SPL
+        self.create_atas_for_one_time_wallet(
+            wallet, self.get_active_spl_mints(), max_atas_per_tx=max_atas_per_tx
         )
 
-        spl_mints = allowed_payment_crypto_tokens.values_list("mint_address", flat=True)
-        spl_mints = [Pubkey.from_string(spl_mint) for spl_mint in spl_mints]
-
+    def create_atas_for_one_time_wallet(
+        self,
+        wallet: OneTimePaymentWallet,
+        spl_mints: list[Pubkey],
+        max_atas_per_tx: int = solana_payments_settings.MAX_ATAS_PER_TX,
+    ):
         reference_keypair = self.load_keypair(wallet.keypair_json)
 
+        # Mints missing from the mint info cache are loaded in one batch request
+        self.solana_token_client.warm_mint_info_cache(spl_mints)
+
         for chunk in chunked(spl_mints, max_atas_per_tx):
             SolanaTokenClient(
                 base_solana_client=base_solana_client
@@ -103,12 +345,163 @@ class OneTimeWalletService:
                 recipient=reference_keypair.pubkey(), mints=chunk
             )
 
+        self.save_one_time_wallet_token_accounts(
+            wallet, reference_keypair.pubkey(), spl_mints
+        )
+
+    def create_one_time_wallet_token_account(
+        self, wallet: OneTimePaymentWallet, owner: Pubkey, mint: Pubkey
+    ) -> OneTimeWalletTokenAccount:
+        """
+        Records the associated token account of a token the customer selected, for
+        wallets without eagerly created ATAs. It runs on the verification path and never
+        sends a transaction: in the ``on_select`` ``ATA_CREATION_MODE`` the account is
+        stored as ``pending_creation`` and created by
+        ``create_pending_one_time_wallet_token_accounts()``; in the ``payer`` mode the
+        paying wallet creates it with its transfer.
+        """
+        return self.save_one_time_wallet_token_accounts(
+            wallet,
+            owner,
+            [mint],
+            pending_creation=(
+                self.get_ata_creation_mode() == AtaCreationModeEnum.ON_SELECT
+            ),
+        )[0]
+
+    def create_pending_one_time_wallet_token_accounts(
+        self, limit: int | None = None
+    ) -> dict[str, int]:
+        """
+        Creates the associated token accounts stored as ``pending_creation`` for the
+        tokens customers selected, for wallets still waiting for their payment. The
+        create instructions are packed into as few transactions as possible and use the
+        idempotent instruction, so accounts the paying wallet already created are
+        skipped. Accounts whose transaction was not confirmed stay pending for the next
+        run.
+        """
+        token_accounts = list(
+            OneTimeWalletTokenAccount.objects.filter(
+                pending_creation=True,
+                one_time_payment_wallet__state__in=[
+                    OneTimeWalletStateTypes.CREATED,
+                    OneTimeWalletStateTypes.PROCESSING_PAYMENT,
+                ],
+            )
+            .select_related("one_time_payment_wallet")
+            .order_by("created", "id")[:limit]
+        )
+        if not token_accounts:
+            return {"created": 0, "pending": 0}
+
+        token_accounts_by_account = {
+            (
+                self.load_keypair(
+                    token_account.one_time_payment_wallet.keypair_json
+                ).pubkey(),
+                Pubkey.from_string(token_account.mint_address),
+            ): token_account
+            for token_account in token_accounts
+        }
+        # Mints missing from the mint info cache are loaded in one batch request
+        self.solana_token_client.warm_mint_info_cache(
+            list({mint for _, mint in token_accounts_by_account})
+        )
+        created_ids = [
+            token_accounts_by_account[account].id
+            for created_ata in self.solana_token_client.create_associated_token_accounts(
+                list(token_accounts_by_account)
+            )
+            if created_ata.confirmed
+            for account in created_ata.accounts
+        ]
+        OneTimeWalletTokenAccount.objects.filter(id__in=created_ids).update(
+            pending_creation=False
+        )
+
+        pending = len(token_accounts) - len(created_ids)
+        if pending:
+            solana_logger.warning(
+                f"{pending} selected token ATAs were not confirmed, "
+                "they stay pending until the next run"
+            )
+        return {"created": len(created_ids), "pending": pending}
+
+    def save_one_time_wallet_token_accounts(
+        self,
+        wallet: OneTimePaymentWallet,
+        owner: Pubkey,
+        mints: list[Pubkey],
+        pending_creation: bool = False,
+    ) -> list[OneTimeWalletTokenAccount]:
+        """
+        Stores the associated token account address and decimals of each mint for the
+        wallet, so payment verification does not derive them again.
+        """
+        token_accounts = self.build_one_time_wallet_token_accounts(wallet, owner, mints)
+        for token_account in token_accounts:
+            token_account.pending_creation = pending_creation
+        OneTimeWalletTokenAccount.objects.bulk_create(
+            token_accounts, ignore_conflicts=True
+        )
+        return token_accounts
+
+    def build_one_time_wallet_token_accounts(
+        self, wallet: OneTimePaymentWallet, owner: Pubkey, mints: list[Pubkey]
+    ) -> list[OneTimeWalletTokenAccount]:
+        token_accounts = []
+        for mint in mints:
+            mint_info = self.solana_token_client.get_mint_info(mint)
+            token_accounts.append(
+                OneTimeWalletTokenAccount(
+                    one_time_payment_wallet=wallet,
+                    mint_address=str(mint),
+                    address=str(
+                        self.solana_token_client.get_associated_token_address(
+                            owner, mint
+                        )
+                    ),
+                    decimals=mint_info.decimals,
+                )
+            )
+        return token_accounts
+
     def load_keypair(self, stored_value: str) -> Keypair:
         if self.encryption_enabled:
             stored_value = self._encryption_service.decrypt(stored_value)
 
         return Keypair.from_json(stored_value)
 
+    def get_one_time_wallet_atas(
+        self, one_time_wallet: OneTimePaymentWallet, owner: Pubkey
+    ) -> list[Pubkey]:
+        """
+        Returns the associated token accounts that may exist for the wallet: the stored
+        ones, or for wallets created before token accounts were stored, the ATAs of the
+        mints of its payment.
+        """
+        atas = [
+            Pubkey.from_string(token_account.address)
+            for token_account in one_time_wallet.token_accounts.all()
+        ]
+        if not atas and self.get_ata_creation_mode() == AtaCreationModeEnum.EAGER:
+            # Wallets created before their token accounts were stored
+            filter_path = f"crypto_prices__{self._solana_payment_related_name}__one_time_payment_wallet"
+            mint_addresses = (
+                AllowedPaymentCryptoToken.objects.filter(
+                    **{filter_path: one_time_wallet}, mint_address__isnull=False
+                )
+                .values_list("mint_address", flat=True)
+                .distinct()
+            )
+            atas = [
+                self.solana_token_client.get_associated_token_address(
+                    owner, Pubkey.from_string(mint_address)
+                )
+                for mint_address in mint_addresses
+            ]
+        return atas
+
     def close_one_time_wallet_atas(
         self,
         one_time_wallet: OneTimePaymentWallet,
@@ -118,6 +511,9 @@ class OneTimeWalletService:
         """
         Closes all empty associated token accounts (ATAs) for a one-time wallet
         and recovers rent to recipient_address.
+
+        Only the ATAs stored for the wallet are checked, with one batched request, and
+        ATAs that were never created are skipped.
         """
 
         decrypted_sender_keypair = self.load_keypair(one_time_wallet.keypair_json)
@@ -128,17 +524,12 @@ class OneTimeWalletService:
             decrypted_sender_keypair.pubkey(),
         )
 
-        # 1. Get all mint addresses involved in this payment
-        filter_path = f"crypto_prices__{self._solana_payment_related_name}__one_time_payment_wallet"
-        mint_addresses = (
-            AllowedPaymentCryptoToken.objects.filter(
-                **{filter_path: one_time_wallet}, mint_address__isnull=False
-            )
-            .values_list("mint_address", flat=True)
-            .distinct()
+        # 1. Get the token accounts of the wallet, as stored when they were created
+        atas = self.get_one_time_wallet_atas(
+            one_time_wallet, decrypted_sender_keypair.pubkey()
         )
 
-        if not mint_addresses:
+        if not atas:
             solana_logger.info(
                 "No associated tokens found for wallet %s", one_time_wallet.id
             )
@@ -147,16 +538,9 @@ class OneTimeWalletService:
         atas_to_close: list[Pubkey] = []
         ata_program_id: Pubkey | None = None
 
-        # 2. Resolve ATAs and validate balances
-        for mint_address in mint_addresses:
-            mint_pubkey = Pubkey.from_string(mint_address)
-
-            ata = self.solana_token_client.get_associated_token_address(
-                decrypted_sender_keypair.pubkey(),
-                mint_pubkey,
-            )
-
-            ata_info = self.solana_token_client.get_account_info(ata).value
+        # 2. Read all ATAs in one batch request; missing ones were never created
+        ata_infos = self.solana_token_client.get_account_infos(atas)
+        for ata, ata_info in zip(atas, ata_infos):
             if not ata_info:
                 solana_logger.debug("ATA %s does not exist, skipping", ata)
                 continue
@@ -164,14 +548,12 @@ class OneTimeWalletService:
             ata_program_id = ata_info.owner  # same for all ATAs
 
             try:
-                token_balance = self.solana_token_client.get_token_account_balance(
-                    ata
-                ).value.amount
+                token_balance = parse_token_account_amount(bytes(ata_info.data))
             except Exception as e:
                 solana_logger.warning("Failed to read token balance for %s: %s", ata, e)
                 continue
 
-            if int(token_balance) > 0:
+            if token_balance > 0:
                 solana_logger.info(
                     "ATA %s has non-zero balance (%s); skipping close",
                     ata,
@@ -206,6 +588,74 @@ class OneTimeWalletService:
 
         return bool(results)
 
+    def close_one_time_wallets_atas(
+        self,
+        one_time_wallets: list[OneTimePaymentWallet],
+        rent_receiver_address: Pubkey,
+    ) -> list[int]:
+        """
+        Closes the empty ATAs of several one-time wallets in one pass: the ATAs of all
+        wallets are read with one batched request and closed with as few transactions as
+        the size limit allows. Returns the ids of the wallets whose ATAs were closed,
+        including wallets without ATAs to close.
+        """
+        if not one_time_wallets:
+            return []
+
+        wallets_to_read = []
+        for one_time_wallet in one_time_wallets:
+            try:
+                keypair = self.load_keypair(one_time_wallet.keypair_json)
+                atas = self.get_one_time_wallet_atas(one_time_wallet, keypair.pubkey())
+            except Exception as e:
+                solana_logger.warning(
+                    "Failed to load ATAs for wallet %s, skipping: %s",
+                    one_time_wallet.id,
+                    e,
+                )
+                continue
+            wallets_to_read.append((one_time_wallet, keypair, atas))
+
+        ata_infos = iter(
+            self.solana_token_client.get_account_infos(
+                [ata for _, _, atas in wallets_to_read for ata in atas]
+            )
+        )
+
+        wallets_to_close = []
+        owner_token_accounts = []
+        for one_time_wallet, keypair, atas in wallets_to_read:
+            wallet_ata_infos = [next(ata_infos) for _ in atas]
+            try:
+                # Missing ATAs were never created, non-empty ones are kept
+                atas_to_close = [
+                    (ata, ata_info.owner)
+                    for ata, ata_info in zip(atas, wallet_ata_infos)
+                    if ata_info
+                    and parse_token_account_amount(bytes(ata_info.data)) == 0
+                ]
+            except Exception as e:
+                solana_logger.warning(
+                    "Failed to read token balances of wallet %s, skipping: %s",
+                    one_time_wallet.id,
+                    e,
+                )
+                continue
+            solana_logger.info(
+                "Closing %d ATAs for wallet %s", len(atas_to_close), one_time_wallet.id
+            )
+            wallets_to_close.append(one_time_wallet)
+            owner_token_accounts.append((keypair, atas_to_close))
+
+        closed = self.solana_token_client.close_token_accounts_of_owners(
+            owner_token_accounts, destination_pubkey=rent_receiver_address
+        )
+        return [
+            one_time_wallet.id
+            for one_time_wallet, is_closed in zip(wallets_to_close, closed)
+            if is_closed
+        ]
+
     def close_expired_one_time_wallets(
         self, sleep_interval_seconds: float | int | None = None
     ):
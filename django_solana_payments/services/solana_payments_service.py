@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import time
 
+from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
@@ -9,7 +11,9 @@ from solders.solders import Pubkey
 from django_solana_payments.choices import (
     OneTimeWalletStateTypes,
     SolanaPaymentStatusTypes,
+    SweepJobStatusTypes,
 )
+from django_solana_payments.dtos import OneTimeWalletSweepDTO
 from django_solana_payments.exceptions import PaymentConfigurationError, PaymentError
 from django_solana_payments.helpers import (
     get_payment_crypto_token_model,
@@ -26,6 +30,9 @@ from django_solana_payments.services.main_wallet_service import (
 from django_solana_payments.services.one_time_wallet_service import (
     one_time_wallet_service,
 )
+from django_solana_payments.services.verification_result_cache import (
+    verification_result_cache,
+)
 from django_solana_payments.services.verify_transaction_service import (
     VerifyTransactionService,
 )
@@ -35,8 +42,17 @@ from django_solana_payments.signals import (
     solana_payment_initiated,
 )
 from django_solana_payments.solana.base_solana_client import base_solana_client
+from django_solana_payments.solana.dtos import TransferDTO, TransferTransactionDTO
 from django_solana_payments.solana.enums import TransactionTypeEnum
 from django_solana_payments.solana.solana_balance_client import SolanaBalanceClient
+from django_solana_payments.solana.solana_token_client import SolanaTokenClient
+from django_solana_payments.solana.solana_transaction_builder import (
+    SolanaTransactionBuilder,
+)
+from django_solana_payments.solana.solana_transaction_sender_client import (
+    SolanaTransactionSenderClient,
+)
+from django_solana_payments.solana.utils import parse_token_account_amount
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +209,9 @@ class SolanaPaymentsService:
             expiration_date__lte=timezone.now(),
         )
         expired_payment_ids = list(expired_payments.values_list("id", flat=True))
+        expired_payment_addresses = list(
+            expired_payments.values_list("payment_address", flat=True)
+        )
         total_not_finished_payments = expired_payments.count()
         logger.info(
             "Total not finished solana payments: %s", total_not_finished_payments
@@ -202,6 +221,7 @@ class SolanaPaymentsService:
             return
 
         expired_payments.update(status=SolanaPaymentStatusTypes.EXPIRED)
+        verification_result_cache.invalidate(*expired_payment_addresses)
 
         wallet_ids = expired_payments.filter(
             one_time_payment_wallet__isnull=False
@@ -245,19 +265,46 @@ class SolanaPaymentsService:
         logger.info("Solana cleanup task finished.")
 
     def send_solana_payments_from_one_time_wallets(
-        self, sleep_interval_seconds: float | int | None = None
+        self,
+        sleep_interval_seconds: float | int | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
     ):
+        """
+        Sends the funds of paid one-time wallets to ``RECEIVER_ADDRESS``.
+
+        With a ``batch_size`` above 1 (defaults to ``SWEEP_BATCH_SIZE``), the balances of
+        all wallets are read with one batched request and up to ``batch_size`` wallets
+        are swept per transaction. Otherwise each wallet is swept in its own transaction,
+        up to ``concurrency`` wallets at a time (defaults to ``SWEEP_CONCURRENCY``).
+        Wallets without balance are marked as payment expired and only their ATAs are
+        closed, in one batched pass at the end of the sweep.
+        """
+        if batch_size is None:
+            batch_size = solana_payments_settings.SWEEP_BATCH_SIZE
+        if concurrency is None:
+            concurrency = solana_payments_settings.SWEEP_CONCURRENCY
+
         payment_wallet_related_name = get_solana_payment_related_name(
             "one_time_payment_wallet"
         )
         paid_token_related_path = f"{payment_wallet_related_name}__paid_token"
 
-        one_time_wallets_with_balance = OneTimePaymentWallet.objects.select_related(
-            payment_wallet_related_name, paid_token_related_path
-        ).filter(
-            Q(state=OneTimeWalletStateTypes.PROCESSING_PAYMENT)
-            | Q(state=OneTimeWalletStateTypes.PROCESSING_FUNDS)
-            | Q(state=OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS)
+        one_time_wallets_with_balance = (
+            OneTimePaymentWallet.objects.select_related(
+                payment_wallet_related_name, paid_token_related_path
+            ).filter(
+                Q(state=OneTimeWalletStateTypes.PROCESSING_PAYMENT)
+                | Q(state=OneTimeWalletStateTypes.PROCESSING_FUNDS)
+                | Q(state=OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS)
+            )
+            # Wallets with a queued sweep job are sent by the sweep job worker
+            .exclude(
+                sweep_jobs__status__in=[
+                    SweepJobStatusTypes.PENDING,
+                    SweepJobStatusTypes.RUNNING,
+                ]
+            )
         )
 
         count = one_time_wallets_with_balance.count()
@@ -266,14 +313,30 @@ class SolanaPaymentsService:
         if count == 0:
             return
 
+        if batch_size > 1:
+            self._send_batched_solana_payments_from_one_time_wallets(
+                list(one_time_wallets_with_balance.prefetch_related("token_accounts")),
+                batch_size,
+            )
+            return
+
+        if concurrency > 1:
+            self._send_concurrent_solana_payments_from_one_time_wallets(
+                list(one_time_wallets_with_balance.prefetch_related("token_accounts")),
+                concurrency,
+                sleep_interval_seconds=sleep_interval_seconds,
+            )
+            return
+
         solana_balance_client = SolanaBalanceClient(
             base_solana_client=base_solana_client
         )
+        recipient_address = solana_payments_settings.RECEIVER_ADDRESS
+        wallets_without_balance = []
 
         for wallet in one_time_wallets_with_balance:
             wallet_keypair = one_time_wallet_service.load_keypair(wallet.keypair_json)
             wallet_address = wallet_keypair.pubkey()
-            recipient_address = solana_payments_settings.RECEIVER_ADDRESS
             logger.info(
                 "Processing one-time wallet id=%s address=%s recipient=%s",
                 wallet.id,
@@ -328,19 +391,7 @@ class SolanaPaymentsService:
                     paid_token.mint_address if paid_token else None,
                 )
             else:
-                OneTimePaymentWallet.objects.filter(id=wallet.id).update(
-                    state=OneTimeWalletStateTypes.PAYMENT_EXPIRED,
-                    receiver_address=recipient_address,
-                )
-                logger.info(
-                    f"One time wallet with id: {wallet.id} does not have any balance, mark it as payment expired"
-                )
-                one_time_wallet_service.close_expired_one_time_wallets(
-                    sleep_interval_seconds=0.2
-                )
-                OneTimePaymentWallet.objects.filter(id=wallet.id).update(
-                    state=OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED
-                )
+                wallets_without_balance.append(wallet)
                 continue
 
             logger.info(
@@ -358,6 +409,366 @@ class SolanaPaymentsService:
                 token_mint_address=paid_token.mint_address if paid_token else None,
             )
 
+        self._close_one_time_wallets_without_balance(
+            wallets_without_balance, recipient_address
+        )
+
+    def _close_one_time_wallets_without_balance(
+        self, wallets: list[OneTimePaymentWallet], recipient_address: str
+    ):
+        """
+        Marks swept wallets without balance as payment expired and closes only their
+        ATAs, all in one batched pass.
+        """
+        if not wallets:
+            return
+
+        wallet_ids = [wallet.id for wallet in wallets]
+        OneTimePaymentWallet.objects.filter(id__in=wallet_ids).update(
+            state=OneTimeWalletStateTypes.PAYMENT_EXPIRED,
+            receiver_address=recipient_address,
+        )
+        logger.info(
+            f"One time wallets with ids: {wallet_ids} do not have any balance, mark them as payment expired"
+        )
+        try:
+            closed_wallet_ids = one_time_wallet_service.close_one_time_wallets_atas(
+                wallets, Pubkey.from_string(solana_payments_settings.FEE_PAYER_ADDRESS)
+            )
+        except Exception as e:
+            # The wallets stay payment expired for close_expired_one_time_wallets
+            logger.warning(f"Failed to close one-time wallets {wallet_ids}: {e}")
+            return
+        OneTimePaymentWallet.objects.filter(id__in=closed_wallet_ids).update(
+            state=OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED
+        )
+
+    def _prepare_one_time_wallet_sweeps(
+        self, wallets: list[OneTimePaymentWallet]
+    ) -> list[OneTimeWalletSweepDTO]:
+        payment_wallet_related_name = get_solana_payment_related_name(
+            "one_time_payment_wallet"
+        )
+        solana_token_client = SolanaTokenClient(base_solana_client=base_solana_client)
+
+        paid_mints = {}
+        for wallet in wallets:
+            paid_token = getattr(wallet, payment_wallet_related_name).paid_token
+            if paid_token and paid_token.mint_address:
+                paid_mints[wallet.id] = Pubkey.from_string(paid_token.mint_address)
+        # Mints missing from the mint info cache are loaded in one batch request
+        solana_token_client.warm_mint_info_cache(list(set(paid_mints.values())))
+
+        sweeps = []
+        for wallet in wallets:
+            wallet_keypair = one_time_wallet_service.load_keypair(wallet.keypair_json)
+            token_accounts = one_time_wallet_service.get_one_time_wallet_atas(
+                wallet, wallet_keypair.pubkey()
+            )
+            paid_mint = paid_mints.get(wallet.id)
+            paid_mint_decimals = None
+            paid_token_account = None
+            if paid_mint:
+                paid_mint_decimals = solana_token_client.get_mint_info(
+                    paid_mint
+                ).decimals
+                paid_token_account = solana_token_client.get_associated_token_address(
+                    wallet_keypair.pubkey(), paid_mint
+                )
+                if paid_token_account not in token_accounts:
+                    token_accounts.append(paid_token_account)
+            sweeps.append(
+                OneTimeWalletSweepDTO(
+                    wallet=wallet,
+                    keypair=wallet_keypair,
+                    token_accounts=token_accounts,
+                    paid_mint=paid_mint,
+                    paid_mint_decimals=paid_mint_decimals,
+                    paid_token_account=paid_token_account,
+                )
+            )
+        return sweeps
+
+    def _build_sweep_transfer(
+        self, sweep: OneTimeWalletSweepDTO, lamports: int, token_account_infos: list
+    ) -> TransferDTO | None:
+        """
+        Picks the transfer of a wallet from its balances like the per-wallet sweep: SOL
+        first, then the paid SPL token. Returns ``None`` for a wallet without balance.
+        """
+        solana_balance_client = SolanaBalanceClient(
+            base_solana_client=base_solana_client
+        )
+        balance_sol = solana_balance_client.lamports_to_sol(lamports)
+
+        balance_spl = None
+        paid_token_program_id = None
+        empty_token_accounts = []
+        for token_account, token_account_info in zip(
+            sweep.token_accounts, token_account_infos
+        ):
+            if token_account_info is None:
+                continue
+            if token_account == sweep.paid_token_account:
+                paid_token_program_id = token_account_info.owner
+                balance_spl = solana_balance_client.get_token_account_data_balance(
+                    token_account_info, sweep.paid_mint_decimals
+                )
+            if parse_token_account_amount(bytes(token_account_info.data)) == 0:
+                empty_token_accounts.append((token_account, token_account_info.owner))
+        logger.info(
+            "Wallet id=%s SOL balance=%s SPL balance=%s mint=%s",
+            sweep.wallet.id,
+            balance_sol,
+            balance_spl,
+            sweep.paid_mint,
+        )
+
+        if balance_sol > 0:
+            return TransferDTO(
+                sender_keypair=sweep.keypair,
+                amount=balance_sol,
+                transaction_type=TransactionTypeEnum.NATIVE,
+                token_accounts_to_close=empty_token_accounts,
+            )
+        if balance_spl and balance_spl > 0:
+            # The paid token account is empty after the transfer
+            return TransferDTO(
+                sender_keypair=sweep.keypair,
+                amount=balance_spl,
+                transaction_type=TransactionTypeEnum.SPL,
+                token_mint_address=sweep.paid_mint,
+                token_accounts_to_close=empty_token_accounts
+                + [(sweep.paid_token_account, paid_token_program_id)],
+            )
+        return None
+
+    def _get_sweep_transaction_sender_client(self) -> SolanaTransactionSenderClient:
+        solana_token_client = SolanaTokenClient(base_solana_client=base_solana_client)
+        return SolanaTransactionSenderClient(
+            base_solana_client=base_solana_client,
+            solana_transaction_builder=SolanaTransactionBuilder(
+                base_solana_client=base_solana_client,
+                solana_token_client=solana_token_client,
+            ),
+        )
+
+    def _send_batched_solana_payments_from_one_time_wallets(
+        self, wallets: list[OneTimePaymentWallet], batch_size: int
+    ):
+        """
+        Sweeps many one-time wallets together. The SOL balance and token accounts of all
+        wallets are read with one batched request, then the transfers are packed into as
+        few transactions as the size limit allows (native and each SPL mint separately,
+        at most ``batch_size`` wallets each), signed by the wallets and the shared fee
+        payer. Empty token accounts of a wallet are closed in its sweep transaction.
+
+        Like the concurrent sweep, each wallet is claimed first by moving it to
+        ``PROCESSING_FUNDS`` only if its state did not change since it was loaded.
+        """
+        recipient_address = solana_payments_settings.RECEIVER_ADDRESS
+        claimed_wallets = []
+        for wallet in wallets:
+            if OneTimePaymentWallet.objects.filter(
+                id=wallet.id, state=wallet.state
+            ).update(state=OneTimeWalletStateTypes.PROCESSING_FUNDS):
+                claimed_wallets.append(wallet)
+            else:
+                logger.info("One-time wallet id=%s changed state, skipping", wallet.id)
+        if not claimed_wallets:
+            return
+
+        sweeps = self._prepare_one_time_wallet_sweeps(claimed_wallets)
+
+        with base_solana_client.batch() as batch:
+            balance_requests = [
+                batch.get_balance(sweep.keypair.pubkey()) for sweep in sweeps
+            ]
+            token_account_requests = [
+                [
+                    batch.get_account_info(token_account)
+                    for token_account in sweep.token_accounts
+                ]
+                for sweep in sweeps
+            ]
+
+        transfers = []
+        wallets_by_sender = {}
+        wallets_without_balance = []
+        for sweep, balance_request, account_requests in zip(
+            sweeps, balance_requests, token_account_requests
+        ):
+            transfer = self._build_sweep_transfer(
+                sweep,
+                balance_request.result().value,
+                [
+                    account_request.result().value
+                    for account_request in account_requests
+                ],
+            )
+            if transfer is None:
+                wallets_without_balance.append(sweep.wallet)
+                continue
+
+            transfers.append(transfer)
+            wallets_by_sender[sweep.keypair.pubkey()] = sweep.wallet
+
+        self._close_one_time_wallets_without_balance(
+            wallets_without_balance, recipient_address
+        )
+        if not transfers:
+            return
+
+        logger.info(
+            "Sending funds from %s wallets to recipient=%s",
+            len(transfers),
+            recipient_address,
+        )
+        try:
+            transfer_transactions = self._get_sweep_transaction_sender_client().send_batched_transfer_transactions(
+                Pubkey.from_string(recipient_address),
+                transfers,
+                max_transfers_per_transaction=batch_size,
+            )
+        except Exception as e:
+            # Errors of single transactions are reported in their results, so this is
+            # raised before any transaction was sent (e.g. no recent blockhash)
+            logger.error(f"An unexpected error occurred: {e}")
+            transfer_transactions = [TransferTransactionDTO(transfers=transfers)]
+
+        for transfer_transaction in transfer_transactions:
+            state = (
+                OneTimeWalletStateTypes.SENT_FUNDS
+                if transfer_transaction.confirmed
+                else OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
+            )
+            OneTimePaymentWallet.objects.filter(
+                id__in=[
+                    wallets_by_sender[transfer.sender_keypair.pubkey()].id
+                    for transfer in transfer_transaction.transfers
+                ]
+            ).update(state=state, receiver_address=recipient_address)
+
+    def _send_concurrent_solana_payments_from_one_time_wallets(
+        self,
+        wallets: list[OneTimePaymentWallet],
+        concurrency: int,
+        sleep_interval_seconds: float | int | None = None,
+    ):
+        """
+        Sweeps each one-time wallet in its own transaction, ``concurrency`` wallets at a
+        time on one event loop. All RPC calls still go through the client's shared rate
+        limiter. Wallets without balance are closed after the concurrent sweep.
+        """
+        recipient_address = solana_payments_settings.RECEIVER_ADDRESS
+        sweeps = self._prepare_one_time_wallet_sweeps(wallets)
+
+        # The sweep updates wallets with sync_to_async, which must run on this thread
+        wallets_without_balance = base_solana_client.run_sync_in_caller_thread(
+            self._asweep_one_time_wallets,
+            sweeps,
+            concurrency,
+            sleep_interval_seconds=sleep_interval_seconds,
+        )
+
+        self._close_one_time_wallets_without_balance(
+            wallets_without_balance, recipient_address
+        )
+
+    async def _asweep_one_time_wallets(
+        self,
+        sweeps: list[OneTimeWalletSweepDTO],
+        concurrency: int,
+        sleep_interval_seconds: float | int | None = None,
+    ) -> list[OneTimePaymentWallet]:
+        semaphore = asyncio.Semaphore(concurrency)
+        solana_transaction_sender_client = self._get_sweep_transaction_sender_client()
+
+        async def sweep_one_time_wallet(sweep: OneTimeWalletSweepDTO):
+            async with semaphore:
+                if sleep_interval_seconds:
+                    await asyncio.sleep(sleep_interval_seconds)
+                return await self._asweep_one_time_wallet(
+                    sweep, solana_transaction_sender_client
+                )
+
+        results = await asyncio.gather(
+            *(sweep_one_time_wallet(sweep) for sweep in sweeps)
+        )
+        return [
+            sweep.wallet
+            for sweep, has_balance in zip(sweeps, results)
+            if not has_balance
+        ]
+
+    async def _asweep_one_time_wallet(
+        self,
+        sweep: OneTimeWalletSweepDTO,
+        solana_transaction_sender_client: SolanaTransactionSenderClient,
+    ) -> bool:
+        """
+        Sends the funds of one wallet and stores its new state. Returns whether the
+        wallet had a balance.
+
+        The wallet is claimed first by moving it to ``PROCESSING_FUNDS`` only if its
+        state did not change since it was loaded, and its final state and receiver are
+        stored with one update, so each wallet's transitions stay atomic while other
+        wallets are in flight.
+        """
+        recipient_address = solana_payments_settings.RECEIVER_ADDRESS
+        wallet = sweep.wallet
+
+        claimed = await sync_to_async(
+            OneTimePaymentWallet.objects.filter(id=wallet.id, state=wallet.state).update
+        )(state=OneTimeWalletStateTypes.PROCESSING_FUNDS)
+        if not claimed:
+            logger.info("One-time wallet id=%s changed state, skipping", wallet.id)
+            return True
+
+        try:
+            async with base_solana_client.batch() as batch:
+                balance_request = batch.get_balance(sweep.keypair.pubkey())
+                account_requests = [
+                    batch.get_account_info(token_account)
+                    for token_account in sweep.token_accounts
+                ]
+            transfer = self._build_sweep_transfer(
+                sweep,
+                balance_request.result().value,
+                [
+                    account_request.result().value
+                    for account_request in account_requests
+                ],
+            )
+            if transfer is None:
+                return False
+
+            logger.info(
+                "Sending funds from wallet id=%s type=%s amount=%s to recipient=%s",
+                wallet.id,
+                transfer.transaction_type.value,
+                transfer.amount,
+                recipient_address,
+            )
+            (transfer_transaction,) = (
+                await solana_transaction_sender_client.asend_batched_transfer_transactions(
+                    Pubkey.from_string(recipient_address), [transfer]
+                )
+            )
+            state = (
+                OneTimeWalletStateTypes.SENT_FUNDS
+                if transfer_transaction.confirmed
+                else OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
+            )
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            state = OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
+
+        await sync_to_async(OneTimePaymentWallet.objects.filter(id=wallet.id).update)(
+            state=state, receiver_address=recipient_address
+        )
+        return True
+
     def create_payment_crypto_prices_from_allowed_payment_crypto_tokens(self):
         created_crypto_prices = []
 
@@ -397,7 +808,8 @@ class SolanaPaymentsService:
         together or rolled back together on failure.
 
         Flow:
-        1. Create one-time wallet (and optional ATAs depending on active SPL tokens).
+        1. Claim a pooled one-time wallet, or create one (and optional ATAs depending
+           on active SPL tokens) when the wallet pool is disabled or empty.
         2. Create payment in ``INITIATED`` status and bind wallet/address.
         3. Build ``SolanaPayPaymentCryptoPrice`` records from active payment tokens.
         4. Attach created price rows to the payment via M2M.
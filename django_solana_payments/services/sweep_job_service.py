@@ -0,0 +1,268 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from django_solana_payments.choices import (
+    OneTimeWalletStateTypes,
+    SweepJobStatusTypes,
+)
+from django_solana_payments.models import OneTimePaymentWallet, SweepJob
+from django_solana_payments.services.main_wallet_service import (
+    send_transaction_and_update_one_time_wallet,
+)
+from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.enums import TransactionTypeEnum
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseSweepJobBackend:
+    """
+    Leaves queued jobs in the ``SweepJob`` table, where the ``process_sweep_jobs``
+    management command picks them up.
+    """
+
+    def enqueue(self, sweep_job: SweepJob):
+        logger.debug("Sweep job %s queued in the database", sweep_job.id)
+
+
+class ImmediateSweepJobBackend:
+    """
+    Processes each job in the current process as soon as the transaction that queued it
+    commits, i.e. inside the verify request.
+    """
+
+    def enqueue(self, sweep_job: SweepJob):
+        process_sweep_job(sweep_job.id)
+
+
+class DjangoTasksSweepJobBackend:
+    """
+    Enqueues a Django task (``django.tasks`` or the ``django-tasks`` backport) for each
+    job, so it runs on the configured task backend's workers.
+    """
+
+    def enqueue(self, sweep_job: SweepJob):
+        from django_solana_payments.tasks import process_sweep_job_task
+
+        if process_sweep_job_task is None:
+            raise ImproperlyConfigured(
+                "DjangoTasksSweepJobBackend requires Django 6.0+ or the django-tasks package"
+            )
+        process_sweep_job_task.enqueue(sweep_job.id)
+
+
+def get_sweep_job_backend():
+    return import_string(solana_payments_settings.SWEEP_JOB_BACKEND)()
+
+
+def enqueue_sweep_job(
+    recipient_address: str,
+    one_time_wallet: OneTimePaymentWallet,
+    amount: Decimal,
+    transaction_type: TransactionTypeEnum | str,
+    token_mint_address: str = None,
+) -> SweepJob:
+    """
+    Queues the transfer of ``amount`` from the one-time wallet to ``recipient_address``.
+
+    The wallet is marked as ``PROCESSING_FUNDS`` and the job is handed to the
+    ``SWEEP_JOB_BACKEND`` once the surrounding transaction commits. A job already queued
+    for the wallet is returned instead of queuing a second transfer.
+    """
+    transaction_type = TransactionTypeEnum(transaction_type)
+    if transaction_type == TransactionTypeEnum.SPL and not token_mint_address:
+        raise ValueError("token_mint_address is required when transaction_type is SPL")
+
+    with transaction.atomic():
+        queued_sweep_job = SweepJob.objects.filter(
+            one_time_payment_wallet=one_time_wallet,
+            status__in=[SweepJobStatusTypes.PENDING, SweepJobStatusTypes.RUNNING],
+        ).first()
+        if queued_sweep_job:
+            logger.info(
+                "One-time wallet %s already has sweep job %s queued",
+                one_time_wallet.id,
+                queued_sweep_job.id,
+            )
+            return queued_sweep_job
+
+        OneTimePaymentWallet.objects.filter(id=one_time_wallet.id).update(
+            state=OneTimeWalletStateTypes.PROCESSING_FUNDS
+        )
+        sweep_job = SweepJob.objects.create(
+            one_time_payment_wallet=one_time_wallet,
+            recipient_address=recipient_address,
+            amount=amount,
+            transaction_type=transaction_type.value,
+            token_mint_address=token_mint_address,
+        )
+        transaction.on_commit(lambda: get_sweep_job_backend().enqueue(sweep_job))
+
+    logger.info(
+        "Queued sweep job %s for one-time wallet %s", sweep_job.id, one_time_wallet.id
+    )
+    return sweep_job
+
+
+def process_sweep_job(sweep_job_id: int) -> bool:
+    """
+    Sends the funds of a pending sweep job to its recipient.
+
+    The job is claimed by moving it from ``PENDING`` to ``RUNNING`` first, so a job
+    picked up by several workers is only processed once. A failed attempt is queued
+    again with backoff until ``SWEEP_JOB_MAX_ATTEMPTS`` is reached. Returns whether the
+    funds were sent.
+    """
+    claimed = SweepJob.objects.filter(
+        id=sweep_job_id, status=SweepJobStatusTypes.PENDING
+    ).update(
+        status=SweepJobStatusTypes.RUNNING,
+        attempts=F("attempts") + 1,
+        started_at=timezone.now(),
+    )
+    if not claimed:
+        logger.info("Sweep job %s is not pending, skipping", sweep_job_id)
+        return False
+
+    sweep_job = SweepJob.objects.select_related("one_time_payment_wallet").get(
+        id=sweep_job_id
+    )
+
+    try:
+        wallet_state = send_transaction_and_update_one_time_wallet(
+            one_time_wallet=sweep_job.one_time_payment_wallet,
+            recipient_address=sweep_job.recipient_address,
+            amount=sweep_job.amount,
+            transaction_type=TransactionTypeEnum(sweep_job.transaction_type),
+            token_mint_address=sweep_job.token_mint_address,
+        )
+    except Exception as exc:
+        logger.exception("Sweep job %s failed: %s", sweep_job_id, exc)
+        fail_sweep_job_attempt(sweep_job, str(exc))
+        return False
+
+    if wallet_state != OneTimeWalletStateTypes.SENT_FUNDS:
+        fail_sweep_job_attempt(sweep_job, f"One-time wallet state: {wallet_state}")
+        return False
+
+    if not _get_owned_sweep_job(sweep_job).update(
+        status=SweepJobStatusTypes.SUCCEEDED, last_error=""
+    ):
+        logger.warning(
+            "Sweep job %s sent its funds after attempt %d was requeued",
+            sweep_job_id,
+            sweep_job.attempts,
+        )
+    return True
+
+
+def _get_owned_sweep_job(sweep_job: SweepJob):
+    """
+    Filters the job on the attempt that was claimed, so a worker whose attempt was
+    requeued after ``SWEEP_JOB_TIMEOUT`` does not overwrite the state of the next one.
+    """
+    return SweepJob.objects.filter(
+        id=sweep_job.id,
+        status=SweepJobStatusTypes.RUNNING,
+        attempts=sweep_job.attempts,
+        started_at=sweep_job.started_at,
+    )
+
+
+def fail_sweep_job_attempt(sweep_job: SweepJob, error: str) -> bool:
+    """
+    Queues the job again, after ``SWEEP_JOB_RETRY_BACKOFF`` seconds doubled for every
+    earlier attempt, or marks it ``FAILED`` once ``SWEEP_JOB_MAX_ATTEMPTS`` is reached.
+    Returns ``False`` when the attempt no longer owns the job.
+    """
+    if sweep_job.attempts >= solana_payments_settings.SWEEP_JOB_MAX_ATTEMPTS:
+        failed = _get_owned_sweep_job(sweep_job).update(
+            status=SweepJobStatusTypes.FAILED, last_error=error
+        )
+        if failed:
+            logger.error(
+                "Sweep job %s failed after %d attempts",
+                sweep_job.id,
+                sweep_job.attempts,
+            )
+        return bool(failed)
+
+    retry_delay = solana_payments_settings.SWEEP_JOB_RETRY_BACKOFF * 2 ** (
+        sweep_job.attempts - 1
+    )
+    requeued = _get_owned_sweep_job(sweep_job).update(
+        status=SweepJobStatusTypes.PENDING,
+        last_error=error,
+        next_attempt_at=timezone.now() + timedelta(seconds=retry_delay),
+    )
+    if requeued:
+        logger.warning(
+            "Sweep job %s attempt %d failed, retrying in %s seconds",
+            sweep_job.id,
+            sweep_job.attempts,
+            retry_delay,
+        )
+    return bool(requeued)
+
+
+def requeue_stale_sweep_jobs() -> int:
+    """
+    Handles jobs left ``RUNNING`` by a crashed worker: jobs running for longer than
+    ``SWEEP_JOB_TIMEOUT`` count as a failed attempt and are queued again with backoff
+    or marked ``FAILED``. Returns the number of such jobs.
+    """
+    stale_jobs = SweepJob.objects.filter(
+        status=SweepJobStatusTypes.RUNNING,
+        started_at__lt=timezone.now()
+        - timedelta(seconds=solana_payments_settings.SWEEP_JOB_TIMEOUT),
+    )
+    requeued = 0
+    for sweep_job in stale_jobs:
+        # Skipped when the worker finished the attempt since the job was read
+        if fail_sweep_job_attempt(sweep_job, "Timed out while running"):
+            logger.warning(
+                "Sweep job %s was running since %s, requeued it",
+                sweep_job.id,
+                sweep_job.started_at,
+            )
+            requeued += 1
+    return requeued
+
+
+def process_pending_sweep_jobs(limit: int | None = None) -> dict[str, int]:
+    """
+    Processes pending sweep jobs that are due, oldest first, after requeueing the jobs
+    of crashed workers.
+    """
+    requeued = requeue_stale_sweep_jobs()
+
+    pending_job_ids = (
+        SweepJob.objects.filter(status=SweepJobStatusTypes.PENDING)
+        .filter(
+            Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now())
+        )
+        .order_by("created", "id")
+    )
+    if limit:
+        pending_job_ids = pending_job_ids[:limit]
+
+    processed = 0
+    succeeded = 0
+    for sweep_job_id in list(pending_job_ids.values_list("id", flat=True)):
+        processed += 1
+        if process_sweep_job(sweep_job_id):
+            succeeded += 1
+
+    return {
+        "processed": processed,
+        "succeeded": succeeded,
+        "failed": processed - succeeded,
+        "requeued": requeued,
+    }
@@ -0,0 +1,206 @@
+import inspect
+import time
+import uuid
+
+from django.core.cache import caches
+
+from django_solana_payments.choices import SolanaPaymentStatusTypes
+from django_solana_payments.exceptions import PaymentError
+from django_solana_payments.settings import solana_payments_settings
+
+
+class VerificationResultCache:
+    """
+    Short-lived cache of verification results per (payment address, token), so widget
+    polls for the same payment share one on-chain verification per TTL window.
+
+    Statuses are kept for VERIFICATION_CACHE_TTL seconds. ``INITIATED`` ("no transactions
+    yet") and transient verification errors are kept for VERIFICATION_CACHE_NEGATIVE_TTL
+    seconds. Each token has its own entry, and the entries of a payment address are
+    dropped as soon as its payment changes state by moving the address to a new
+    generation. Results are stored in the VERIFICATION_CACHE_ALIAS Django cache, so they
+    are shared by all workers using that cache.
+    """
+
+    KEY_PREFIX = "django-solana-payments:verification"
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+        cache_alias: str | None = None,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._cache_alias = cache_alias
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return solana_payments_settings.VERIFICATION_CACHE_TTL
+
+    @property
+    def negative_ttl_seconds(self) -> float:
+        if self._negative_ttl_seconds is not None:
+            return self._negative_ttl_seconds
+        return solana_payments_settings.VERIFICATION_CACHE_NEGATIVE_TTL
+
+    @property
+    def cache(self):
+        return caches[
+            self._cache_alias or solana_payments_settings.VERIFICATION_CACHE_ALIAS
+        ]
+
+    @property
+    def entry_timeout(self) -> float:
+        return max(self.ttl_seconds, self.negative_ttl_seconds)
+
+    def _build_generation_key(self, payment_address: str) -> str:
+        return f"{self.KEY_PREFIX}:{payment_address}:generation"
+
+    def _build_key(self, payment_address: str, generation: str, token_id) -> str:
+        return f"{self.KEY_PREFIX}:{payment_address}:{generation}:{token_id}"
+
+    def _build_claim_key(self, payment_address: str) -> str:
+        return f"{self.KEY_PREFIX}:{payment_address}:claim"
+
+    def claim(self, payment_address: str) -> str | None:
+        """
+        Marks a verification of the payment address as in flight for
+        VERIFICATION_CLAIM_TIMEOUT seconds. Returns the claim token to pass to
+        ``release``, or ``None`` while another caller verifies the payment.
+        """
+        claim_token = uuid.uuid4().hex
+        if not self.cache.add(
+            self._build_claim_key(payment_address),
+            claim_token,
+            timeout=solana_payments_settings.VERIFICATION_CLAIM_TIMEOUT,
+        ):
+            return None
+        return claim_token
+
+    def release(self, payment_address: str, claim_token: str):
+        """Ends the claim, unless it timed out and was taken by another caller."""
+        claim_key = self._build_claim_key(payment_address)
+        if self.cache.get(claim_key) == claim_token:
+            self.cache.delete(claim_key)
+
+    def get_generation(self, payment_address: str) -> str:
+        """
+        Returns the current generation of the payment address entries. Read it before
+        verifying and pass it to ``set_status``/``set_error``, so a result computed before
+        a concurrent invalidation is not stored as fresh.
+        """
+        return self.cache.get(self._build_generation_key(payment_address), "0")
+
+    def _set(
+        self,
+        payment_address: str,
+        token_id,
+        ttl_seconds: float,
+        result: tuple,
+        generation: str | None,
+    ):
+        if ttl_seconds <= 0:
+            return
+
+        if generation is None:
+            generation = self.get_generation(payment_address)
+        # Each token has its own entry, so concurrent verifiers of other tokens of the
+        # same address never overwrite each other's results
+        self.cache.set(
+            self._build_key(payment_address, generation, token_id),
+            (time.time() + ttl_seconds, result),
+            timeout=ttl_seconds,
+        )
+
+    def get(
+        self, payment_address: str, token_id, generation: str | None = None
+    ) -> SolanaPaymentStatusTypes | None:
+        """
+        Returns the cached status, or ``None`` on a miss. A cached verification error is
+        raised again.
+        """
+        if generation is None:
+            generation = self.get_generation(payment_address)
+        entry = self.cache.get(self._build_key(payment_address, generation, token_id))
+        if entry is None:
+            return None
+
+        expires_at, (status, error) = entry
+        if expires_at <= time.time():
+            return None
+        if error is not None:
+            error_class, args, kwargs = error
+            raise error_class(*args, **kwargs)
+        return SolanaPaymentStatusTypes(status)
+
+    def set_status(
+        self,
+        payment_address: str,
+        token_id,
+        status: SolanaPaymentStatusTypes,
+        generation: str | None = None,
+    ):
+        ttl_seconds = (
+            self.negative_ttl_seconds
+            if status == SolanaPaymentStatusTypes.INITIATED
+            else self.ttl_seconds
+        )
+        self._set(
+            payment_address, token_id, ttl_seconds, (str(status), None), generation
+        )
+
+    def set_error(
+        self,
+        payment_address: str,
+        token_id,
+        error: PaymentError,
+        generation: str | None = None,
+    ):
+        self._set(
+            payment_address,
+            token_id,
+            self.negative_ttl_seconds,
+            (None, (type(error), *self._get_error_arguments(error))),
+            generation,
+        )
+
+    @staticmethod
+    def _get_error_arguments(error: PaymentError) -> tuple[tuple, dict]:
+        """
+        Returns the arguments to build the error again with its constructor: the
+        attributes named like the parameters of a custom ``__init__``, otherwise its args.
+        """
+        init = type(error).__init__
+        if init is Exception.__init__:
+            return error.args, {}
+
+        parameters = [
+            parameter.name
+            for parameter in list(inspect.signature(init).parameters.values())[1:]
+            if parameter.kind
+            in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)
+        ]
+        if all(hasattr(error, name) for name in parameters):
+            return (), {name: getattr(error, name) for name in parameters}
+        return error.args, {}
+
+    def invalidate(self, *payment_addresses: str):
+        """
+        Drops the cached results of every token of the payment addresses by moving them
+        to a new generation. The generation key outlives the entries it hides.
+        """
+        if self.entry_timeout <= 0:
+            return
+        self.cache.set_many(
+            {
+                self._build_generation_key(payment_address): uuid.uuid4().hex
+                for payment_address in payment_addresses
+            },
+            timeout=2 * self.entry_timeout,
+        )
+
+
+verification_result_cache = VerificationResultCache()
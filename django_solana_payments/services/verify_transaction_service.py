@@ -27,11 +27,17 @@ from django_solana_payments.helpers import (
 )
 from django_solana_payments.models import (
     AbstractPaymentToken,
+    AddressSignatureCursor,
     OneTimePaymentWallet,
+    OneTimeWalletTokenAccount,
     SolanaPayPaymentCryptoPrice,
 )
-from django_solana_payments.services.main_wallet_service import (
-    send_solana_transaction_to_main_wallet,
+from django_solana_payments.services.one_time_wallet_service import (
+    one_time_wallet_service,
+)
+from django_solana_payments.services.sweep_job_service import enqueue_sweep_job
+from django_solana_payments.services.verification_result_cache import (
+    verification_result_cache,
 )
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.signals import (
@@ -39,7 +45,11 @@ from django_solana_payments.signals import (
     solana_payment_expired,
 )
 from django_solana_payments.solana.base_solana_client import base_solana_client
-from django_solana_payments.solana.enums import TransactionTypeEnum
+from django_solana_payments.solana.dtos import SignatureCursorDTO
+from django_solana_payments.solana.enums import (
+    AtaCreationModeEnum,
+    TransactionTypeEnum,
+)
 from django_solana_payments.solana.solana_balance_client import SolanaBalanceClient
 from django_solana_payments.solana.solana_token_client import SolanaTokenClient
 from django_solana_payments.solana.solana_transaction_query_client import (
@@ -70,18 +80,25 @@ class VerifyTransactionService:
         meta_data: dict[str, Any] = None,
         send_payment_accepted_signal: bool = True,
         on_success: Callable | None = None,
+        use_result_cache: bool = False,
     ) -> SolanaPaymentStatusTypes:
         """
         Verify a payment transaction for a one-time wallet and process the payment lifecycle.
 
-        1. Load payment by ``payment_address`` and mark its one-time wallet as
+        1. Load the payment by ``payment_address`` and validate its state (already
+           confirmed/finalized, expired, etc.).
+        2. Claim the verification of the payment, so concurrent callers return its current
+           status instead of repeating the RPC reads, and mark its one-time wallet as
            ``PROCESSING_PAYMENT``.
-        2. Validate payment state (already confirmed/finalized, expired, etc.).
         3. Validate on-chain balance and related transfer transactions for the selected token.
-        4. If a valid recipient transaction is found, accept it, update payment status/signature,
-           and optionally forward funds to the main wallet.
+        4. If a valid recipient transaction is found, lock the payment row, re-check its
+           status, accept the transaction, update payment status/signature, and optionally
+           queue the transfer of the funds to the main wallet.
         5. Optionally emit ``solana_payment_accepted`` signal and execute ``on_success`` callback.
 
+        The RPC reads of steps 3 and 4 run outside of a database transaction, the payment
+        row is only locked while its status is re-checked and written.
+
         Args:
             payment_address: One-time payment wallet address created for this payment.
             payment_crypto_token: Active token model instance used for verification
@@ -91,6 +108,9 @@ class VerifyTransactionService:
             on_success: Optional callback called as
                 ``on_success(solana_payment, transaction_status)``
                 after successful payment processing.
+            use_result_cache: Whether to reuse a recent result for the same payment address
+                and token from the verification result cache (see ``VERIFICATION_CACHE_TTL``),
+                e.g. for frequent polling from the frontend widget.
 
         Returns:
             A value from ``SolanaPaymentStatusTypes`` representing the current or updated payment status.
@@ -103,6 +123,15 @@ class VerifyTransactionService:
             InvalidPaymentAmountError: If a transfer exists but amount is below expected value.
             PaymentNotConfirmedError: If the transfer did not reach configured commitment level.
         """
+        if use_result_cache:
+            return self._verify_with_result_cache(
+                payment_address,
+                payment_crypto_token,
+                meta_data=meta_data,
+                send_payment_accepted_signal=send_payment_accepted_signal,
+                on_success=on_success,
+            )
+
         logger.info(
             f"Starting verification for payment_address={payment_address}, and token: {payment_crypto_token.mint_address}"
         )
@@ -112,20 +141,52 @@ class VerifyTransactionService:
             .filter(payment_address=payment_address)
             .first()
         )
-
         if not solana_payment:
             raise PaymentNotFoundError(payment_address)
 
-        OneTimePaymentWallet.objects.filter(
-            id=solana_payment.one_time_payment_wallet.id
-        ).update(state=OneTimeWalletStateTypes.PROCESSING_PAYMENT)
-        receiver_address = Pubkey.from_string(payment_address)
-
         status = self.validate_solana_payment(solana_payment)
 
         if status:
             return status
 
+        claim_token = verification_result_cache.claim(payment_address)
+        if claim_token is None:
+            logger.info(
+                "Payment payment_address=%s is being verified by another caller, returning status=%s",
+                payment_address,
+                solana_payment.status,
+            )
+            return SolanaPaymentStatusTypes(solana_payment.status)
+
+        try:
+            return self._verify_claimed_solana_payment(
+                solana_payment,
+                payment_crypto_token,
+                meta_data=meta_data,
+                send_payment_accepted_signal=send_payment_accepted_signal,
+                on_success=on_success,
+            )
+        finally:
+            verification_result_cache.release(payment_address, claim_token)
+
+    def _verify_claimed_solana_payment(
+        self,
+        solana_payment: SolanaPayment,
+        payment_crypto_token: Type[AbstractPaymentToken],
+        meta_data: dict[str, Any] = None,
+        send_payment_accepted_signal: bool = True,
+        on_success: Callable | None = None,
+    ) -> SolanaPaymentStatusTypes:
+        payment_address = solana_payment.payment_address
+
+        # Only a wallet still waiting for its payment is moved, so a late poll never
+        # resets a wallet whose funds are already being swept
+        OneTimePaymentWallet.objects.filter(
+            id=solana_payment.one_time_payment_wallet.id,
+            state=OneTimeWalletStateTypes.CREATED,
+        ).update(state=OneTimeWalletStateTypes.PROCESSING_PAYMENT)
+        receiver_address = Pubkey.from_string(payment_address)
+
         recipient_wallet_transactions, payment_balance = self.validate_transfer_amount(
             solana_payment,
             receiver_address,
@@ -136,38 +197,104 @@ class VerifyTransactionService:
             f"Found {len(recipient_wallet_transactions)} recipient transactions, balance={payment_balance}"
         )
 
-        if recipient_wallet_transactions:
-            with transaction.atomic():
-                paid_transaction = recipient_wallet_transactions[0]
-
-                transaction_status = (
-                    self.accept_verified_transaction_and_process_payment(
-                        paid_transaction,
-                        payment_balance,
-                        payment_crypto_token,
-                        solana_payment,
-                        meta_data,
-                    )
+        if not recipient_wallet_transactions:
+            logger.warning(
+                f"No recipient transactions found for payment_address={payment_address}"
+            )
+            return SolanaPaymentStatusTypes.INITIATED
+
+        paid_transaction = recipient_wallet_transactions[0]
+        if not self._is_transaction_confirmed(paid_transaction):
+            raise PaymentNotConfirmedError()
+
+        with transaction.atomic():
+            locked_solana_payment = self.claim_solana_payment(payment_address)
+
+            if locked_solana_payment is None or locked_solana_payment.status in [
+                SolanaPaymentStatusTypes.CONFIRMED,
+                SolanaPaymentStatusTypes.FINALIZED,
+            ]:
+                current_status = (
+                    SolanaPayment.objects.filter(id=solana_payment.id)
+                    .values_list("status", flat=True)
+                    .get()
+                )
+                logger.info(
+                    "Payment payment_address=%s is accepted by another caller, returning status=%s",
+                    payment_address,
+                    current_status,
                 )
+                return SolanaPaymentStatusTypes(current_status)
 
-                if send_payment_accepted_signal or on_success:
-                    transaction.on_commit(
-                        lambda: self._run_post_payment_success_hooks(
-                            payment_id=solana_payment.id,
-                            transaction_status=transaction_status,
-                            payment_amount=payment_balance,
-                            send_payment_accepted_signal=send_payment_accepted_signal,
-                            on_success=on_success,
-                        )
+            transaction_status = self.accept_verified_transaction_and_process_payment(
+                paid_transaction,
+                payment_balance,
+                payment_crypto_token,
+                locked_solana_payment,
+                meta_data,
+            )
+
+            if send_payment_accepted_signal or on_success:
+                transaction.on_commit(
+                    lambda: self._run_post_payment_success_hooks(
+                        payment_id=solana_payment.id,
+                        transaction_status=transaction_status,
+                        payment_amount=payment_balance,
+                        send_payment_accepted_signal=send_payment_accepted_signal,
+                        on_success=on_success,
                     )
+                )
 
-            return transaction_status
+        return transaction_status
 
-        else:
-            logger.warning(
-                f"No recipient transactions found for payment_address={payment_address}"
+    def claim_solana_payment(self, payment_address: str) -> SolanaPayment | None:
+        """
+        Loads the payment and locks its row until the surrounding transaction ends, so
+        concurrent verifications of the same payment do not accept it twice. The lock is
+        taken after the RPC reads and only held while the payment status is re-checked and
+        written. Returns ``None`` while another caller holds the lock (on backends without
+        ``SELECT ... FOR UPDATE``, such as SQLite, the row is not locked).
+        """
+        return (
+            SolanaPayment.objects.select_for_update(skip_locked=True)
+            .select_related("one_time_payment_wallet")
+            .filter(payment_address=payment_address)
+            .first()
+        )
+
+    def _verify_with_result_cache(
+        self,
+        payment_address: str,
+        payment_crypto_token: Type[AbstractPaymentToken],
+        **kwargs,
+    ) -> SolanaPaymentStatusTypes:
+        # Results are stored under the generation read before verifying, so a
+        # concurrent invalidation is not overwritten by a stale result
+        generation = verification_result_cache.get_generation(payment_address)
+        cached_status = verification_result_cache.get(
+            payment_address, payment_crypto_token.pk, generation=generation
+        )
+        if cached_status is not None:
+            logger.debug(
+                "Using cached verification result for payment_address=%s",
+                payment_address,
             )
-            return SolanaPaymentStatusTypes.INITIATED
+            return cached_status
+
+        try:
+            status = self.verify_transaction_and_process_payment(
+                payment_address, payment_crypto_token, **kwargs
+            )
+        except (InvalidPaymentAmountError, PaymentNotConfirmedError) as exc:
+            verification_result_cache.set_error(
+                payment_address, payment_crypto_token.pk, exc, generation=generation
+            )
+            raise
+
+        verification_result_cache.set_status(
+            payment_address, payment_crypto_token.pk, status, generation=generation
+        )
+        return status
 
     def _run_post_payment_success_hooks(
         self,
@@ -286,9 +413,10 @@ class VerifyTransactionService:
         meta_data: dict[str, Any] = None,
         send_funds_to_main_wallet_immediately: bool = True,
     ):
-        if not self._is_transaction_confirmed(paid_transaction):
-            raise PaymentNotConfirmedError()
-
+        """
+        Accepts a transaction already checked with ``_is_transaction_confirmed()``, so no
+        RPC calls are made while the payment row is locked.
+        """
         paid_transaction_signatures = (
             paid_transaction.value.transaction.transaction.signatures
         )
@@ -310,7 +438,8 @@ class VerifyTransactionService:
         )
 
         if send_funds_to_main_wallet_immediately:
-            send_solana_transaction_to_main_wallet(
+            # The transfer runs in a sweep job, so the caller does not wait for it
+            enqueue_sweep_job(
                 solana_payments_settings.RECEIVER_ADDRESS,
                 solana_payment.one_time_payment_wallet,
                 payment_balance,
@@ -355,17 +484,19 @@ class VerifyTransactionService:
             return solana_payment.status
 
         if timezone.now() > solana_payment.expiration_date:
-            SolanaPayment.objects.filter(id=solana_payment.id).update(
-                status=SolanaPaymentStatusTypes.EXPIRED
-            )
-            OneTimePaymentWallet.objects.filter(
-                id=solana_payment.one_time_payment_wallet.id
-            ).update(state=OneTimeWalletStateTypes.PAYMENT_EXPIRED)
-            transaction.on_commit(
-                lambda payment_id=solana_payment.id: self._emit_payment_expired_signal(
-                    payment_id
+            with transaction.atomic():
+                SolanaPayment.objects.filter(id=solana_payment.id).update(
+                    status=SolanaPaymentStatusTypes.EXPIRED
                 )
-            )
+                OneTimePaymentWallet.objects.filter(
+                    id=solana_payment.one_time_payment_wallet.id
+                ).update(state=OneTimeWalletStateTypes.PAYMENT_EXPIRED)
+                transaction.on_commit(
+                    lambda payment_id=solana_payment.id: self._emit_payment_expired_signal(
+                        payment_id
+                    )
+                )
+            verification_result_cache.invalidate(solana_payment.payment_address)
             logger.warning(
                 f"Payment expired: payment_address={solana_payment.payment_address}"
             )
@@ -386,27 +517,13 @@ class VerifyTransactionService:
         For SPL token payments, it checks the spl token balance on the associated token account.
         For SOL payments, it checks the native SOL balance.
 
+        The balance and the new signatures of the wallet are read in one JSON-RPC batch. While
+        the balance is below the expected amount and the wallet has no new signatures, nothing
+        was paid yet and no transactions are fetched.
+
         If there are previous transactions (excluding those sent by the configured sender)
         and the expected payment amount exceeds the current balance, a InvalidPaymentAmountError is raised.
         """
-        if token_type == TokenTypes.SPL:
-            balance = self.solana_balance_client.get_spl_token_balance_by_address(
-                receiver_address, Pubkey.from_string(payment_crypto_token.mint_address)
-            )
-            logger.info(f"SPL token balance for {receiver_address} = {balance}")
-            target_address = (
-                self.solana_token_client.get_or_create_associated_token_address(
-                    receiver_address,
-                    Pubkey.from_string(payment_crypto_token.mint_address),
-                )
-            )
-        else:
-            balance = self.solana_balance_client.get_balance_by_address(
-                receiver_address
-            )
-            logger.info(f"Native SOL balance for {receiver_address} = {balance}")
-            target_address = receiver_address
-
         crypto_prices_related_name = get_solana_payment_related_name("crypto_prices")
         payment_token_price = SolanaPayPaymentCryptoPrice.objects.filter(
             **{f"{crypto_prices_related_name}__in": [solana_payment]},
@@ -418,11 +535,46 @@ class VerifyTransactionService:
 
         expected_amount = payment_token_price.amount_in_crypto
 
-        all_transactions = (
-            self.solana_transaction_query_client.get_transactions_for_address(
-                address=target_address
+        # The balance is read in the same JSON-RPC batch as the wallet signatures
+        rpc_batch = self.solana_transaction_query_client.base_solana_client.batch()
+
+        if token_type == TokenTypes.SPL:
+            target_address, decimals = self.get_associated_token_account(
+                solana_payment.one_time_payment_wallet,
+                receiver_address,
+                payment_crypto_token.mint_address,
+            )
+            balance_request = rpc_batch.get_account_info(target_address)
+        else:
+            target_address = receiver_address
+            balance_request = rpc_batch.get_balance(receiver_address)
+
+        # Only signatures after the last processed one are fetched
+        signature_cursor = self.get_signature_cursor(target_address)
+        all_transactions, next_signature_cursor = (
+            self.solana_transaction_query_client.get_new_transactions_for_address(
+                address=target_address, cursor=signature_cursor, batch=rpc_batch
             )
         )
+
+        if token_type == TokenTypes.SPL:
+            balance = self.solana_balance_client.get_token_account_data_balance(
+                balance_request.result().value, decimals
+            )
+            logger.info(f"SPL token balance for {receiver_address} = {balance}")
+        else:
+            balance = self.solana_balance_client.lamports_to_sol(
+                balance_request.result().value
+            )
+            logger.info(f"Native SOL balance for {receiver_address} = {balance}")
+
+        if not all_transactions and balance < expected_amount:
+            logger.debug(
+                "No new transactions and balance below expected amount for %s",
+                target_address,
+            )
+            return [], balance
+
         # Ignore one-time wallet setup transactions so they cannot be mistaken for payments.
         recipient_wallet_transactions: list[GetTransactionResp] = []
         for tx in all_transactions:
@@ -437,6 +589,13 @@ class VerifyTransactionService:
 
             recipient_wallet_transactions.append(tx)
 
+        if not recipient_wallet_transactions:
+            # Wallet setup transactions never need to be fetched again. Payment candidates
+            # keep the cursor in place until the payment is accepted.
+            self.save_signature_cursor(
+                target_address, next_signature_cursor, signature_cursor
+            )
+
         if recipient_wallet_transactions and expected_amount > balance:
             logger.error(
                 f"Invalid transfer amount: expected={expected_amount}, actual={balance}"
@@ -448,6 +607,72 @@ class VerifyTransactionService:
 
         return recipient_wallet_transactions, balance
 
+    def get_associated_token_account(
+        self,
+        one_time_wallet: OneTimePaymentWallet,
+        owner: Pubkey,
+        mint_address: str,
+    ) -> tuple[Pubkey, int]:
+        """
+        Returns the associated token account address of the one-time wallet for the mint
+        and the mint decimals, as stored when the wallet's token accounts were created.
+
+        Without eagerly created ATAs (``ATA_CREATION_MODE``), the first verification of a
+        token records its account without sending a transaction. Until the account exists
+        on-chain its balance reads as zero, so the payment stays ``INITIATED``. Wallets
+        created before token accounts were stored fall back to deriving the address.
+        """
+        token_account = (
+            OneTimeWalletTokenAccount.objects.filter(
+                one_time_payment_wallet=one_time_wallet, mint_address=mint_address
+            )
+            .values_list("address", "decimals")
+            .first()
+        )
+        if token_account:
+            address, decimals = token_account
+            return Pubkey.from_string(address), decimals
+
+        mint = Pubkey.from_string(mint_address)
+        if one_time_wallet_service.get_ata_creation_mode() != AtaCreationModeEnum.EAGER:
+            token_account = (
+                one_time_wallet_service.create_one_time_wallet_token_account(
+                    one_time_wallet, owner, mint
+                )
+            )
+            return Pubkey.from_string(token_account.address), token_account.decimals
+
+        return (
+            self.solana_token_client.get_associated_token_address(owner, mint),
+            self.solana_token_client.get_mint_info(mint).decimals,
+        )
+
+    def get_signature_cursor(self, address: Pubkey) -> SignatureCursorDTO | None:
+        cursor = AddressSignatureCursor.objects.filter(address=str(address)).first()
+        if not cursor:
+            return None
+        return SignatureCursorDTO(
+            signature=Signature.from_string(cursor.last_signature),
+            slot=cursor.last_slot,
+        )
+
+    def save_signature_cursor(
+        self,
+        address: Pubkey,
+        cursor: SignatureCursorDTO | None,
+        previous_cursor: SignatureCursorDTO | None = None,
+    ):
+        if cursor is None or cursor == previous_cursor:
+            return
+
+        AddressSignatureCursor.objects.update_or_create(
+            address=str(address),
+            defaults={
+                "last_signature": str(cursor.signature),
+                "last_slot": cursor.slot,
+            },
+        )
+
     def update_solana_payment(
         self,
         solana_payment: SolanaPayment,
@@ -471,6 +696,7 @@ class VerifyTransactionService:
             update_fields["meta_data"] = meta_data
 
         SolanaPayment.objects.filter(id=solana_payment.id).update(**update_fields)
+        verification_result_cache.invalidate(solana_payment.payment_address)
 
         if transaction_status not in {
             SolanaPaymentStatusTypes.CONFIRMED,
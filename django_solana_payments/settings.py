@@ -22,7 +22,30 @@ class SolanaPaymentsSettings:
 
     @property
     def RPC_URL(self) -> str:
-        return self._get_setting("RPC_URL", required=True)
+        rpc_urls = self.RPC_URLS
+        default_url = None
+        if rpc_urls:
+            # RPC_URL may be omitted when RPC_URLS is configured
+            default_url = (
+                rpc_urls[0] if isinstance(rpc_urls[0], str) else rpc_urls[0]["url"]
+            )
+        return self._get_setting("RPC_URL", default=default_url, required=True)
+
+    @property
+    def RPC_URLS(self) -> list[str | dict] | None:
+        return self._get_setting("RPC_URLS", default=None)
+
+    @property
+    def RPC_WRITE_URLS(self) -> list[str | dict] | None:
+        return self._get_setting("RPC_WRITE_URLS", default=None)
+
+    @property
+    def RPC_ENDPOINT_FAILURE_THRESHOLD(self) -> int:
+        return self._get_setting("RPC_ENDPOINT_FAILURE_THRESHOLD", default=3)
+
+    @property
+    def RPC_ENDPOINT_COOLDOWN_SECONDS(self) -> float:
+        return self._get_setting("RPC_ENDPOINT_COOLDOWN_SECONDS", default=30)
 
     @property
     def RECEIVER_ADDRESS(self) -> str:
@@ -48,6 +71,65 @@ class SolanaPaymentsSettings:
     def RPC_RATE_LIMIT(self) -> float:
         return self._get_setting("RPC_RATE_LIMIT", default=0)
 
+    @property
+    def RPC_SHARED_RATE_LIMIT(self) -> float:
+        return self._get_setting("RPC_SHARED_RATE_LIMIT", default=0)
+
+    @property
+    def RPC_SHARED_RATE_LIMIT_CACHE_ALIAS(self) -> str:
+        return self._get_setting("RPC_SHARED_RATE_LIMIT_CACHE_ALIAS", default="default")
+
+    @property
+    def RPC_SHARED_RATE_LIMIT_BACKGROUND_SHARE(self) -> float:
+        return self._get_setting("RPC_SHARED_RATE_LIMIT_BACKGROUND_SHARE", default=0.5)
+
+    @property
+    def RPC_REQUEST_COALESCING(self) -> bool:
+        return self._get_setting("RPC_REQUEST_COALESCING", default=True)
+
+    @property
+    def RPC_METRICS_ENABLED(self) -> bool:
+        return self._get_setting("RPC_METRICS_ENABLED", default=True)
+
+    @property
+    def RPC_METRICS_MAX_SAMPLES(self) -> int:
+        # Latest call durations kept per RPC method for percentiles
+        return self._get_setting("RPC_METRICS_MAX_SAMPLES", default=1000)
+
+    @property
+    def RPC_CALL_HOOKS(self) -> list[str]:
+        return self._get_setting("RPC_CALL_HOOKS", default=[])
+
+    @property
+    def RPC_BATCH_MAX_SIZE(self) -> int:
+        return self._get_setting("RPC_BATCH_MAX_SIZE", default=100)
+
+    @property
+    def RPC_BATCH_CONCURRENCY(self) -> int:
+        return self._get_setting("RPC_BATCH_CONCURRENCY", default=4)
+
+    @property
+    def RPC_CONNECTION_POOLING(self) -> bool:
+        # Sync callers keep the pooled client between calls with the default
+        # "background_loop" RPC_SYNC_RUNNER, async_to_sync closes it after each call
+        return self._get_setting("RPC_CONNECTION_POOLING", default=True)
+
+    @property
+    def RPC_MAX_CONNECTIONS(self) -> int | None:
+        return self._get_setting("RPC_MAX_CONNECTIONS", default=None)
+
+    @property
+    def RPC_MAX_KEEPALIVE_CONNECTIONS(self) -> int | None:
+        return self._get_setting("RPC_MAX_KEEPALIVE_CONNECTIONS", default=None)
+
+    @property
+    def RPC_KEEPALIVE_EXPIRY(self) -> float | None:
+        return self._get_setting("RPC_KEEPALIVE_EXPIRY", default=None)
+
+    @property
+    def RPC_SYNC_RUNNER(self) -> str:
+        return self._get_setting("RPC_SYNC_RUNNER", default="background_loop")
+
     @property
     def PAYMENT_ACCEPTANCE_COMMITMENT(self) -> Commitment:
         return self._get_setting("PAYMENT_ACCEPTANCE_COMMITMENT", default=Confirmed)
@@ -116,6 +198,96 @@ class SolanaPaymentsSettings:
     def MAX_ATAS_PER_TX(self) -> int:
         return self._get_setting("MAX_ATAS_PER_TX", default=8)
 
+    @property
+    def MINT_INFO_CACHE_MAX_SIZE(self) -> int:
+        return self._get_setting("MINT_INFO_CACHE_MAX_SIZE", default=1024)
+
+    @property
+    def MINT_INFO_CACHE_TTL(self) -> int:
+        # Default to 24 hours expressed in seconds
+        return self._get_setting("MINT_INFO_CACHE_TTL", default=24 * 60 * 60)
+
+    @property
+    def MINT_INFO_CACHE_ALIAS(self) -> str | None:
+        return self._get_setting("MINT_INFO_CACHE_ALIAS", default=None)
+
+    @property
+    def BLOCKHASH_CACHE_TTL(self) -> float:
+        # A blockhash is valid for ~150 blocks (~60 seconds); 0 disables the cache
+        return self._get_setting("BLOCKHASH_CACHE_TTL", default=30)
+
+    @property
+    def BLOCKHASH_REFRESH_AFTER(self) -> float:
+        return self._get_setting("BLOCKHASH_REFRESH_AFTER", default=10)
+
+    @property
+    def SIGNATURES_PAGE_SIZE(self) -> int:
+        # getSignaturesForAddress returns at most 1000 signatures per call
+        return self._get_setting("SIGNATURES_PAGE_SIZE", default=1000)
+
+    @property
+    def VERIFICATION_CACHE_TTL(self) -> float:
+        # 0 disables caching of verification results
+        return self._get_setting("VERIFICATION_CACHE_TTL", default=10)
+
+    @property
+    def VERIFICATION_CACHE_NEGATIVE_TTL(self) -> float:
+        # TTL of "no transactions yet" and not yet confirmed results
+        return self._get_setting("VERIFICATION_CACHE_NEGATIVE_TTL", default=3)
+
+    @property
+    def VERIFICATION_CACHE_ALIAS(self) -> str:
+        return self._get_setting("VERIFICATION_CACHE_ALIAS", default="default")
+
+    @property
+    def VERIFICATION_CLAIM_TIMEOUT(self) -> float:
+        # Seconds a verification in flight keeps concurrent callers of its payment away
+        return self._get_setting("VERIFICATION_CLAIM_TIMEOUT", default=30)
+
+    @property
+    def SWEEP_JOB_BACKEND(self) -> str:
+        return self._get_setting(
+            "SWEEP_JOB_BACKEND",
+            default="django_solana_payments.services.sweep_job_service.DatabaseSweepJobBackend",
+        )
+
+    @property
+    def SWEEP_JOB_TIMEOUT(self) -> float:
+        # Running jobs not finished after this many seconds are requeued (crashed worker)
+        return self._get_setting("SWEEP_JOB_TIMEOUT", default=10 * 60)
+
+    @property
+    def SWEEP_JOB_MAX_ATTEMPTS(self) -> int:
+        return self._get_setting("SWEEP_JOB_MAX_ATTEMPTS", default=5)
+
+    @property
+    def SWEEP_JOB_RETRY_BACKOFF(self) -> float:
+        # Delay before the first retry in seconds, doubled after every failed attempt
+        return self._get_setting("SWEEP_JOB_RETRY_BACKOFF", default=60)
+
+    @property
+    def WALLET_POOL_HIGH_WATERMARK(self) -> int:
+        # 0 disables the one-time wallet pool
+        return self._get_setting("WALLET_POOL_HIGH_WATERMARK", default=0)
+
+    @property
+    def WALLET_POOL_LOW_WATERMARK(self) -> int:
+        return self._get_setting("WALLET_POOL_LOW_WATERMARK", default=0)
+
+    @property
+    def ATA_CREATION_MODE(self) -> str:
+        return self._get_setting("ATA_CREATION_MODE", default="eager")
+
+    @property
+    def SWEEP_BATCH_SIZE(self) -> int:
+        # 1 sends the funds of each one-time wallet in its own transaction
+        return self._get_setting("SWEEP_BATCH_SIZE", default=1)
+
+    @property
+    def SWEEP_CONCURRENCY(self) -> int:
+        # 1 sweeps one-time wallets one after another
+        return self._get_setting("SWEEP_CONCURRENCY", default=1)
+
 
 # Global instance - settings are read dynamically from django.conf.settings on each access
 solana_payments_settings = SolanaPaymentsSettings()
@@ -1,12 +1,36 @@
+import asyncio
+import atexit
 import logging
+import threading
+import weakref
 from contextlib import asynccontextmanager
 
 from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
 from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair
 from spl.token.constants import NATIVE_DECIMALS
 
 from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.enums import SyncRunnerTypeEnum
+from django_solana_payments.solana.event_loop_runner import (
+    background_event_loop_runner,
+)
+from django_solana_payments.solana.solana_blockhash_cache import BlockhashCache
+from django_solana_payments.solana.solana_mint_info_cache import MintInfoCache
+from django_solana_payments.solana.solana_rpc_batch import SolanaRpcBatch
+from django_solana_payments.solana.solana_rpc_endpoint_pool import (
+    RpcEndpointPool,
+    parse_rpc_endpoints,
+)
+from django_solana_payments.solana.solana_rpc_provider import (
+    SolanaRpcAsyncClient,
+    SolanaRpcProvider,
+)
+from django_solana_payments.solana.solana_rpc_rate_limiter import (
+    SharedRpcRateLimiter,
+)
+from django_solana_payments.solana.solana_rpc_single_flight import RpcSingleFlight
 from django_solana_payments.solana.utils import parse_keypair
 
 solana_client_logger = logging.getLogger(__name__)
@@ -16,8 +40,24 @@ class BaseSolanaClient:
 
     def __init__(self, rpc_url: str = None, client_factory=None):
         self._rpc_url = self._build_rpc_url(rpc_url)
+        # An explicit rpc_url pins the client to that endpoint instead of RPC_URLS
+        self._use_rpc_urls_setting = rpc_url is None
         self._client_factory = client_factory or self._default_client_factory
         self.LAMPORTS_PER_SOL = 10**NATIVE_DECIMALS
+        # One pooled AsyncClient per event loop: httpx connections are bound to the
+        # loop that opened them, so a client can't be shared across loops.
+        self._pooled_clients = weakref.WeakKeyDictionary()
+        # Number of async_to_sync calls in flight per event loop
+        self._loop_client_users = weakref.WeakKeyDictionary()
+        self._pooled_clients_lock = threading.Lock()
+        self._endpoint_pool: RpcEndpointPool | None = None
+        self._endpoint_pool_config = None
+        self._endpoint_pool_lock = threading.Lock()
+        self._rate_limiter: SharedRpcRateLimiter | None = None
+        # Shared by the clients of all event loops, so concurrent sync calls are coalesced too
+        self.single_flight = RpcSingleFlight()
+        self.mint_info_cache = MintInfoCache()
+        self.blockhash_cache = BlockhashCache()
 
     @staticmethod
     def _build_rpc_url(rpc_url: str | None) -> str:
@@ -46,32 +86,211 @@ class BaseSolanaClient:
                 f"Error: {e}"
             )
 
+    def _get_endpoint_pool(self) -> RpcEndpointPool:
+        """Returns the endpoint pool built from RPC_URLS, or a pool of the client's single RPC URL."""
+        rpc_urls = (
+            solana_payments_settings.RPC_URLS if self._use_rpc_urls_setting else None
+        )
+        config = (
+            rpc_urls or [self._rpc_url],
+            solana_payments_settings.RPC_WRITE_URLS if rpc_urls else None,
+            solana_payments_settings.RPC_ENDPOINT_FAILURE_THRESHOLD,
+            solana_payments_settings.RPC_ENDPOINT_COOLDOWN_SECONDS,
+        )
+        # The pool is shared by the clients of all event loops, so endpoint stats are per process
+        with self._endpoint_pool_lock:
+            if self._endpoint_pool is None or self._endpoint_pool_config != config:
+                rpc_urls, rpc_write_urls, failure_threshold, cooldown_seconds = config
+                self._endpoint_pool = RpcEndpointPool(
+                    endpoints=parse_rpc_endpoints(rpc_urls),
+                    write_endpoints=parse_rpc_endpoints(rpc_write_urls),
+                    failure_threshold=failure_threshold,
+                    cooldown_seconds=cooldown_seconds,
+                )
+                self._endpoint_pool_config = config
+            return self._endpoint_pool
+
+    def _get_rate_limiter(self) -> SharedRpcRateLimiter | None:
+        rate_limit = solana_payments_settings.RPC_SHARED_RATE_LIMIT
+        if not rate_limit:
+            return None
+
+        cache_alias = solana_payments_settings.RPC_SHARED_RATE_LIMIT_CACHE_ALIAS
+        background_share = (
+            solana_payments_settings.RPC_SHARED_RATE_LIMIT_BACKGROUND_SHARE
+        )
+        rate_limiter = self._rate_limiter
+        if (
+            rate_limiter is None
+            or rate_limiter.rate_limit != rate_limit
+            or rate_limiter.cache_alias != cache_alias
+            or rate_limiter.background_share != background_share
+        ):
+            rate_limiter = SharedRpcRateLimiter(
+                rate_limit=rate_limit,
+                cache_alias=cache_alias,
+                background_share=background_share,
+            )
+            self._rate_limiter = rate_limiter
+        return rate_limiter
+
+    @staticmethod
+    def _build_provider_kwargs() -> dict:
+        provider_kwargs = {
+            "timeout": solana_payments_settings.RPC_TIMEOUT,
+            "extra_headers": solana_payments_settings.RPC_EXTRA_HEADERS,
+            "proxy": solana_payments_settings.RPC_PROXY,
+            "rate_limit": solana_payments_settings.RPC_RATE_LIMIT,
+        }
+
+        # Pool limits are only passed when configured, so the AsyncClient defaults apply otherwise
+        pool_limits = {
+            "max_connections": solana_payments_settings.RPC_MAX_CONNECTIONS,
+            "max_keepalive_connections": solana_payments_settings.RPC_MAX_KEEPALIVE_CONNECTIONS,
+            "keepalive_expiry": solana_payments_settings.RPC_KEEPALIVE_EXPIRY,
+        }
+        provider_kwargs.update(
+            {key: value for key, value in pool_limits.items() if value is not None}
+        )
+        return provider_kwargs
+
     def _default_client_factory(self) -> AsyncClient:
-        return AsyncClient(
-            endpoint=self._rpc_url,
+        return SolanaRpcAsyncClient(
+            provider=SolanaRpcProvider(
+                endpoint_pool=self._get_endpoint_pool(),
+                rate_limiter=self._get_rate_limiter(),
+                single_flight=(
+                    self.single_flight
+                    if solana_payments_settings.RPC_REQUEST_COALESCING
+                    else None
+                ),
+                **self._build_provider_kwargs(),
+            ),
             commitment=solana_payments_settings.RPC_COMMITMENT,
-            timeout=solana_payments_settings.RPC_TIMEOUT,
-            extra_headers=solana_payments_settings.RPC_EXTRA_HEADERS,
-            proxy=solana_payments_settings.RPC_PROXY,
-            rate_limit=solana_payments_settings.RPC_RATE_LIMIT,
         )
 
+    def _get_pooled_client(self, loop: asyncio.AbstractEventLoop) -> AsyncClient:
+        with self._pooled_clients_lock:
+            client = self._pooled_clients.get(loop)
+            if client is None:
+                client = self._client_factory()
+                self._pooled_clients[loop] = client
+            return client
+
+    def _pop_pooled_client(self, loop: asyncio.AbstractEventLoop) -> AsyncClient | None:
+        with self._pooled_clients_lock:
+            return self._pooled_clients.pop(loop, None)
+
     @asynccontextmanager
     async def http_client(self):
-        client = self._client_factory()
+        """
+        Yields an AsyncClient for the running event loop.
+
+        With RPC_CONNECTION_POOLING enabled (default) the client is kept alive and reused by
+        every RPC call made on the same event loop, so keep-alive connections survive between
+        calls. Call ``aclose()``/``close()`` to release it.
+        Otherwise a new client is created and closed for each call.
+        """
+        if not solana_payments_settings.RPC_CONNECTION_POOLING:
+            client = self._client_factory()
+            try:
+                yield client
+            finally:
+                await client.close()
+            return
+
+        yield self._get_pooled_client(asyncio.get_running_loop())
+
+    def batch(self) -> SolanaRpcBatch:
+        """Returns a new JSON-RPC batch that sends all queued calls in one HTTP request."""
+        return SolanaRpcBatch(base_solana_client=self)
+
+    async def _run_and_release_loop_client(self, async_callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        with self._pooled_clients_lock:
+            self._loop_client_users[loop] = self._loop_client_users.get(loop, 0) + 1
         try:
-            yield client
+            return await async_callable(*args, **kwargs)
         finally:
-            await client.close()
+            # async_to_sync may run the call on a short-lived event loop, or on an outer
+            # loop shared with concurrent calls (e.g. the ASGI server loop). The client is
+            # closed once the last call on the loop ends, before a short-lived loop goes away.
+            with self._pooled_clients_lock:
+                users = self._loop_client_users.pop(loop) - 1
+                if users:
+                    self._loop_client_users[loop] = users
+                    client = None
+                else:
+                    client = self._pooled_clients.pop(loop, None)
+            if client is not None:
+                await client.close()
+
+    @staticmethod
+    def _get_sync_runner_type() -> SyncRunnerTypeEnum:
+        sync_runner = solana_payments_settings.RPC_SYNC_RUNNER
+        try:
+            return SyncRunnerTypeEnum(sync_runner)
+        except ValueError:
+            raise ImproperlyConfigured(
+                f"Unsupported SOLANA_PAYMENTS['RPC_SYNC_RUNNER']: {sync_runner!r}. "
+                f"Supported values: {[runner.value for runner in SyncRunnerTypeEnum]}"
+            )
 
     def run_sync_from_async(self, async_callable, *args, **kwargs):
-        return async_to_sync(async_callable)(*args, **kwargs)
+        if self._get_sync_runner_type() == SyncRunnerTypeEnum.BACKGROUND_LOOP:
+            # The loop outlives the call, so its pooled client is kept for the next one
+            return background_event_loop_runner.run(async_callable, *args, **kwargs)
+
+        return self.run_sync_in_caller_thread(async_callable, *args, **kwargs)
+
+    def run_sync_in_caller_thread(self, async_callable, *args, **kwargs):
+        """
+        Runs ``async_callable`` with ``async_to_sync`` whatever the ``RPC_SYNC_RUNNER``, so
+        thread-sensitive ``sync_to_async`` calls inside it (e.g. Django ORM queries) run
+        on the calling thread, in its database transaction.
+        """
+        return async_to_sync(self._run_and_release_loop_client)(
+            async_callable, *args, **kwargs
+        )
 
     def generate_keypair(self) -> Keypair:
         return Keypair()
 
     async def aclose(self):
-        return None
+        """Closes the pooled client bound to the running event loop."""
+        client = self._pop_pooled_client(asyncio.get_running_loop())
+        if client is not None:
+            await client.close()
+
+    def close(self):
+        """
+        Closes pooled clients from sync code, e.g. on process shutdown.
+        Clients bound to already closed event loops are dropped.
+        """
+        with self._pooled_clients_lock:
+            pooled_clients = list(self._pooled_clients.items())
+            self._pooled_clients.clear()
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for loop, client in pooled_clients:
+            if loop.is_closed():
+                continue
+            try:
+                if loop is running_loop:
+                    loop.create_task(client.close())
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.close(), loop).result(
+                        timeout=solana_payments_settings.RPC_TIMEOUT
+                    )
+                else:
+                    loop.run_until_complete(client.close())
+            except Exception as e:
+                solana_client_logger.warning(f"Failed to close pooled RPC client: {e}")
 
 
 base_solana_client = BaseSolanaClient()
+atexit.register(base_solana_client.close)
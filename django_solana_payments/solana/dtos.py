@@ -1,10 +1,117 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from decimal import Decimal
 
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
 from solders.signature import Signature
 from solders.transaction_status import TransactionConfirmationStatus
 
+from django_solana_payments.solana.enums import (
+    RpcCallOutcomeEnum,
+    TransactionTypeEnum,
+)
+
 
 @dataclass(frozen=True, slots=True)
 class ConfirmTransactionDTO:
     tx_signature: Signature
     confirmation_status: TransactionConfirmationStatus | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CreateAssociatedTokenAccountsDTO:
+    """(owner, mint) pairs whose associated token accounts one transaction creates."""
+
+    accounts: list[tuple[Pubkey, Pubkey]]
+    tx_signature: Signature | None = None
+    confirmation_status: TransactionConfirmationStatus | None = None
+
+    @property
+    def confirmed(self) -> bool:
+        return self.confirmation_status is not None
+
+
+@dataclass(frozen=True, slots=True)
+class TransferDTO:
+    """
+    A transfer of one sender's funds, sent together with other senders' transfers.
+    ``token_accounts_to_close`` are (address, token program) pairs of the sender's
+    token accounts that are empty once the transfer is done.
+    """
+
+    sender_keypair: Keypair
+    amount: Decimal
+    transaction_type: TransactionTypeEnum
+    token_mint_address: Pubkey | None = None
+    token_accounts_to_close: list[tuple[Pubkey, Pubkey]] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class TransferTransactionDTO:
+    """Transfers sent in one transaction."""
+
+    transfers: list[TransferDTO]
+    tx_signature: Signature | None = None
+    confirmation_status: TransactionConfirmationStatus | None = None
+
+    @property
+    def confirmed(self) -> bool:
+        return self.confirmation_status is not None
+
+
+@dataclass(frozen=True, slots=True)
+class RpcCoalescingStatsDTO:
+    requests: int
+    coalesced: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MintInfoDTO:
+    mint_address: Pubkey
+    token_program_id: Pubkey
+    decimals: int
+
+
+@dataclass(frozen=True, slots=True)
+class BlockhashDTO:
+    blockhash: Hash
+    last_valid_block_height: int
+
+
+@dataclass(frozen=True, slots=True)
+class SignatureCursorDTO:
+    """Newest signature of an address that has already been processed."""
+
+    signature: Signature
+    slot: int
+
+
+@dataclass(frozen=True, slots=True)
+class RpcCallDTO:
+    method: str
+    endpoint: str
+    duration: float
+    request_size: int
+    response_size: int
+    outcome: RpcCallOutcomeEnum
+    retries: int = 0
+    # Calls per JSON-RPC method contained in a batch request
+    batch_methods: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class RpcMethodStatsDTO:
+    calls: int
+    retries: int
+    request_bytes: int
+    response_bytes: int
+    p50: float
+    p95: float
+    p99: float
+    outcomes: dict[str, int] = field(default_factory=dict)
+    batch_methods: dict[str, int] = field(default_factory=dict)
@@ -4,3 +4,29 @@ from enum import Enum
 class TransactionTypeEnum(Enum):
     NATIVE = "native"
     SPL = "spl"
+
+
+class SyncRunnerTypeEnum(Enum):
+    ASYNC_TO_SYNC = "async_to_sync"
+    BACKGROUND_LOOP = "background_loop"
+
+
+class AtaCreationModeEnum(Enum):
+    # ATAs for every active SPL token when the one-time wallet is created
+    EAGER = "eager"
+    # ATA of a token created in the background after the customer selects it
+    ON_SELECT = "on_select"
+    # ATA created by the paying wallet together with its transfer
+    PAYER = "payer"
+
+
+class RpcPriorityEnum(Enum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class RpcCallOutcomeEnum(Enum):
+    OK = "ok"
+    TIMEOUT = "timeout"
+    RATE_LIMITED = "429"
+    ERROR = "error"
@@ -0,0 +1,138 @@
+import asyncio
+import atexit
+import contextvars
+import logging
+import os
+import threading
+
+solana_client_logger = logging.getLogger(__name__)
+
+
+class BackgroundEventLoopRunner:
+    """
+    Runs coroutines from sync code on one persistent event loop thread per process.
+
+    Unlike ``async_to_sync``, which sets up a new loop (and thread) for every call, the loop is
+    created once and reused, so pooled RPC clients bound to it keep their connections alive
+    between sync calls. The loop is recreated lazily after ``fork()`` (e.g. gunicorn workers).
+    """
+
+    def __init__(self, thread_name: str = "django-solana-payments-rpc-loop"):
+        self._thread_name = thread_name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._ensure_started()
+
+    def is_running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self.is_running():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            loop_started = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop_forever,
+                args=(loop, loop_started),
+                name=self._thread_name,
+                daemon=True,
+            )
+            thread.start()
+            loop_started.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            solana_client_logger.debug(
+                "Started background event loop thread %s", thread.name
+            )
+            return loop
+
+    @staticmethod
+    def _run_loop_forever(
+        loop: asyncio.AbstractEventLoop, loop_started: threading.Event
+    ):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(loop_started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    @staticmethod
+    async def _run_in_context(
+        context: contextvars.Context, async_callable, args, kwargs
+    ):
+        # Run the coroutine in the caller's context, like async_to_sync does,
+        # so context variables set by the caller are visible inside the call.
+        task = asyncio.get_running_loop().create_task(
+            async_callable(*args, **kwargs), context=context
+        )
+        return await task
+
+    def run(self, async_callable, *args, **kwargs):
+        """Submits ``async_callable(*args, **kwargs)`` to the loop thread and waits for the result."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "BackgroundEventLoopRunner.run() cannot be called from a running event loop - "
+                "await the async method directly instead."
+            )
+
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_in_context(
+                contextvars.copy_context(), async_callable, args, kwargs
+            ),
+            loop,
+        )
+        return future.result()
+
+    def shutdown(self, timeout: float | None = 5):
+        """Cancels pending tasks, stops the loop and joins its thread."""
+        with self._lock:
+            if not self.is_running():
+                self._loop = self._thread = self._pid = None
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+
+        async def cancel_pending_tasks():
+            current_task = asyncio.current_task()
+            pending_tasks = [
+                task for task in asyncio.all_tasks() if task is not current_task
+            ]
+            for task in pending_tasks:
+                task.cancel()
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending_tasks(), loop).result(
+                timeout=timeout
+            )
+        except Exception as e:
+            solana_client_logger.warning(
+                f"Failed to cancel background event loop tasks: {e}"
+            )
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+
+background_event_loop_runner = BackgroundEventLoopRunner()
+atexit.register(background_event_loop_runner.shutdown)
@@ -6,6 +6,7 @@ from solders.pubkey import Pubkey
 
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.utils import parse_token_account_amount
 
 
 class SolanaBalanceClient:
@@ -68,9 +69,23 @@ class SolanaBalanceClient:
             commitment=commitment,
         )
 
+    def lamports_to_sol(self, lamports: int) -> Decimal:
+        return Decimal(lamports) / Decimal(self.base_solana_client.LAMPORTS_PER_SOL)
+
     def get_balance_by_address(self, address: Pubkey) -> Decimal:
         balance = self.get_balance(address).value
-        return Decimal(balance) / Decimal(self.base_solana_client.LAMPORTS_PER_SOL)
+        return self.lamports_to_sol(balance)
+
+    def get_token_account_data_balance(self, account, decimals: int) -> Decimal:
+        """
+        Reads the balance of a token account from its ``getAccountInfo`` value, where the
+        raw amount is stored in bytes 64..72 of the SPL token account layout. A missing
+        account has no balance.
+        """
+        if account is None:
+            return Decimal("0")
+        amount = parse_token_account_amount(bytes(account.data))
+        return Decimal(amount) / Decimal(10**decimals)
 
     def get_spl_token_balance_by_address(
         self, address: Pubkey, token_mint_address: Pubkey
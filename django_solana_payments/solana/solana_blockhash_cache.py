@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Callable
+
+from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.dtos import BlockhashDTO
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.event_loop_runner import (
+    background_event_loop_runner,
+)
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
+
+solana_client_logger = logging.getLogger(__name__)
+
+FetchBlockhash = Callable[[str], Awaitable[BlockhashDTO]]
+
+
+class BlockhashCache:
+    """
+    Latest blockhash per commitment, shared by every transaction built with one client.
+
+    A cached blockhash is used for up to BLOCKHASH_CACHE_TTL seconds. Once it is older than
+    BLOCKHASH_REFRESH_AFTER seconds, callers still get it, while a new one is prefetched on the
+    background event loop thread, so the next transactions don't wait for getLatestBlockhash.
+    """
+
+    def __init__(
+        self, max_age: float | None = None, refresh_after: float | None = None
+    ):
+        self._max_age = max_age
+        self._refresh_after = refresh_after
+        self._entries: dict[str, tuple[float, BlockhashDTO]] = {}
+        self._refreshes: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_age(self) -> float:
+        if self._max_age is not None:
+            return self._max_age
+        return solana_payments_settings.BLOCKHASH_CACHE_TTL
+
+    @property
+    def refresh_after(self) -> float:
+        if self._refresh_after is not None:
+            return self._refresh_after
+        return solana_payments_settings.BLOCKHASH_REFRESH_AFTER
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age > 0
+
+    def get(self, commitment: str) -> BlockhashDTO | None:
+        """Returns the cached blockhash if it is fresh enough to be used without a refresh."""
+        with self._lock:
+            entry = self._entries.get(str(commitment))
+        if entry is None:
+            return None
+        fetched_at, blockhash = entry
+        if time.monotonic() - fetched_at >= min(self.refresh_after, self.max_age):
+            return None
+        return blockhash
+
+    async def aget(self, commitment: str, fetch: FetchBlockhash) -> BlockhashDTO:
+        """
+        Returns the cached blockhash for ``commitment``, calling ``fetch(commitment)``
+        when there is none or it is too old to be used.
+        """
+        if not self.enabled:
+            return await fetch(commitment)
+
+        key = str(commitment)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            fetched_at, blockhash = entry
+            age = time.monotonic() - fetched_at
+            if age < self.max_age:
+                if age >= self.refresh_after:
+                    self._schedule_refresh(key, fetch)
+                return blockhash
+
+        blockhash = await fetch(commitment)
+        self.set(commitment, blockhash)
+        return blockhash
+
+    def set(self, commitment: str, blockhash: BlockhashDTO):
+        with self._lock:
+            self._entries[str(commitment)] = (time.monotonic(), blockhash)
+
+    def invalidate(self):
+        """Drops cached blockhashes, e.g. after a ``BlockhashNotFound`` error."""
+        with self._lock:
+            self._entries.clear()
+
+    def _schedule_refresh(self, key: str, fetch: FetchBlockhash):
+        with self._lock:
+            refresh = self._refreshes.get(key)
+            if refresh is not None and not refresh.done():
+                return
+            # The background loop outlives short-lived async_to_sync loops,
+            # so the prefetch is not cancelled when the current call returns
+            self._refreshes[key] = asyncio.run_coroutine_threadsafe(
+                self._refresh(key, fetch), background_event_loop_runner.loop
+            )
+
+    async def _refresh(self, key: str, fetch: FetchBlockhash):
+        try:
+            with rpc_priority(RpcPriorityEnum.BACKGROUND):
+                blockhash = await fetch(key)
+        except Exception as e:
+            # The cached blockhash stays in use until it expires
+            solana_client_logger.warning(f"Failed to prefetch latest blockhash: {e}")
+            return
+        self.set(key, blockhash)
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from solders.pubkey import Pubkey
+
+from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.dtos import MintInfoDTO
+
+# Offset of the ``decimals`` byte in the SPL Token / Token-2022 mint account layout
+MINT_DECIMALS_OFFSET = 44
+
+
+def parse_mint_decimals(mint_account_data: bytes) -> int:
+    if len(mint_account_data) <= MINT_DECIMALS_OFFSET:
+        raise ValueError("Account data is too short for a mint account")
+    return mint_account_data[MINT_DECIMALS_OFFSET]
+
+
+class MintInfoCache:
+    """
+    Bounded LRU cache with TTL for mint token program and decimals.
+
+    Both values never change for a mint, so they are kept in process memory and, when
+    MINT_INFO_CACHE_ALIAS is set, in that Django cache to share them between processes.
+    Size, TTL and alias are read from settings on use unless passed explicitly.
+    """
+
+    KEY_PREFIX = "django-solana-payments:mint-info"
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl_seconds: float | None = None,
+        cache_alias: str | None = None,
+    ):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._cache_alias = cache_alias
+        self._entries: OrderedDict[str, tuple[float, MintInfoDTO]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or solana_payments_settings.MINT_INFO_CACHE_MAX_SIZE
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds or solana_payments_settings.MINT_INFO_CACHE_TTL
+
+    @property
+    def cache_alias(self) -> str | None:
+        return self._cache_alias or solana_payments_settings.MINT_INFO_CACHE_ALIAS
+
+    def _build_key(self, mint_address: str) -> str:
+        return f"{self.KEY_PREFIX}:{mint_address}"
+
+    def _get_local(self, mint_address: str) -> MintInfoDTO | None:
+        with self._lock:
+            entry = self._entries.get(mint_address)
+            if entry is None:
+                return None
+            expires_at, mint_info = entry
+            if expires_at <= time.monotonic():
+                del self._entries[mint_address]
+                return None
+            self._entries.move_to_end(mint_address)
+            return mint_info
+
+    def _set_local(self, mint_info: MintInfoDTO):
+        mint_address = str(mint_info.mint_address)
+        with self._lock:
+            self._entries[mint_address] = (
+                time.monotonic() + self.ttl_seconds,
+                mint_info,
+            )
+            self._entries.move_to_end(mint_address)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _to_shared_value(mint_info: MintInfoDTO) -> tuple[str, int]:
+        return str(mint_info.token_program_id), mint_info.decimals
+
+    @staticmethod
+    def _from_shared_value(mint_address: str, value) -> MintInfoDTO:
+        token_program_id, decimals = value
+        return MintInfoDTO(
+            mint_address=Pubkey.from_string(mint_address),
+            token_program_id=Pubkey.from_string(token_program_id),
+            decimals=decimals,
+        )
+
+    def get(self, mint_address: Pubkey) -> MintInfoDTO | None:
+        mint_address = str(mint_address)
+        mint_info = self._get_local(mint_address)
+        if mint_info is not None or self.cache_alias is None:
+            return mint_info
+
+        value = caches[self.cache_alias].get(self._build_key(mint_address))
+        if value is None:
+            return None
+        mint_info = self._from_shared_value(mint_address, value)
+        self._set_local(mint_info)
+        return mint_info
+
+    async def aget(self, mint_address: Pubkey) -> MintInfoDTO | None:
+        mint_address = str(mint_address)
+        mint_info = self._get_local(mint_address)
+        if mint_info is not None or self.cache_alias is None:
+            return mint_info
+
+        value = await caches[self.cache_alias].aget(self._build_key(mint_address))
+        if value is None:
+            return None
+        mint_info = self._from_shared_value(mint_address, value)
+        self._set_local(mint_info)
+        return mint_info
+
+    def set(self, mint_info: MintInfoDTO):
+        self._set_local(mint_info)
+        if self.cache_alias is not None:
+            caches[self.cache_alias].set(
+                self._build_key(str(mint_info.mint_address)),
+                self._to_shared_value(mint_info),
+                timeout=self.ttl_seconds,
+            )
+
+    async def aset(self, mint_info: MintInfoDTO):
+        self._set_local(mint_info)
+        if self.cache_alias is not None:
+            await caches[self.cache_alias].aset(
+                self._build_key(str(mint_info.mint_address)),
+                self._to_shared_value(mint_info),
+                timeout=self.ttl_seconds,
+            )
+
+    def clear(self):
+        """Clears the in-process entries. Entries in the Django cache expire on their own."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,313 @@
+import asyncio
+import json
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable
+
+from solana.rpc.commitment import Commitment
+from solana.rpc.core import RPCException
+from solana.rpc.models import TokenAccountOpts
+from solders.pubkey import Pubkey
+from solders.rpc.responses import (
+    GetAccountInfoResp,
+    GetBalanceResp,
+    GetSignaturesForAddressResp,
+    GetSignatureStatusesResp,
+    GetTokenAccountBalanceResp,
+    GetTokenAccountsByOwnerResp,
+    GetTransactionResp,
+    RPCError,
+)
+from solders.signature import Signature
+
+from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.exceptions import BaseSolanaClientException
+from django_solana_payments.utils import chunked
+
+if TYPE_CHECKING:
+    from solana.rpc.async_api import AsyncClient
+
+    from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+
+solana_client_logger = logging.getLogger(__name__)
+
+
+class SolanaRpcBatchError(BaseSolanaClientException):
+    pass
+
+
+class SolanaRpcBatchRequest:
+    """A single call queued on a ``SolanaRpcBatch``. Its result is available after the batch is executed."""
+
+    _NOT_SET = object()
+
+    def __init__(self, build_body: Callable[["AsyncClient"], Any], parser: type):
+        self.build_body = build_body
+        self.parser = parser
+        self._result = self._NOT_SET
+        self._error: Exception | None = None
+
+    def set_result(self, result):
+        self._result = result
+
+    def set_error(self, error: Exception):
+        self._error = error
+
+    def result(self):
+        if self._error is not None:
+            raise self._error
+        if self._result is self._NOT_SET:
+            raise SolanaRpcBatchError("RPC batch has not been executed yet")
+        return self._result
+
+
+class _BatchBody:
+    """
+    Adapter that lets the AsyncClient provider POST a prepared JSON-RPC batch array.
+
+    The request is reported to the RPC instrumentation as ``batch:<method>`` when all of
+    its calls share one method and as ``batch`` otherwise, with the calls per method.
+    """
+
+    def __init__(self, payload: str, batch_methods: dict[str, int]):
+        self._payload = payload
+        self.batch_methods = batch_methods
+        self.rpc_method = (
+            f"batch:{next(iter(batch_methods))}" if len(batch_methods) == 1 else "batch"
+        )
+
+    def to_json(self) -> str:
+        return self._payload
+
+
+class SolanaRpcBatch:
+    """
+    Collects read calls and sends them to the RPC node as one JSON-RPC batch POST.
+
+    Usage::
+
+        with base_solana_client.batch() as batch:
+            balance_request = batch.get_balance(address)
+            signatures_request = batch.get_signatures_for_address(address, limit=2)
+
+        balance = balance_request.result().value
+
+    ``async with`` / ``aexecute()`` are available for async code. A batch can be executed
+    once; errors returned for a single call are raised from that call's ``result()``.
+    """
+
+    def __init__(self, base_solana_client: "BaseSolanaClient"):
+        self.base_solana_client = base_solana_client
+        self._requests: list[SolanaRpcBatchRequest] = []
+        self._executed = False
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def __enter__(self) -> "SolanaRpcBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.execute()
+
+    async def __aenter__(self) -> "SolanaRpcBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.aexecute()
+
+    def _add(
+        self, build_body: Callable[["AsyncClient"], Any], parser: type
+    ) -> SolanaRpcBatchRequest:
+        if self._executed:
+            raise SolanaRpcBatchError("Cannot add calls to an executed RPC batch")
+        request = SolanaRpcBatchRequest(build_body=build_body, parser=parser)
+        self._requests.append(request)
+        return request
+
+    def get_balance(
+        self, address: Pubkey, commitment: Commitment | None = None
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_balance_body(address, commitment),
+            GetBalanceResp,
+        )
+
+    def get_account_info(
+        self, address: Pubkey, commitment: Commitment | None = None
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_account_info_body(
+                address, commitment, "base64", None
+            ),
+            GetAccountInfoResp,
+        )
+
+    def get_token_account_balance(
+        self, address: Pubkey, commitment: Commitment | None = None
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_token_account_balance_body(address, commitment),
+            GetTokenAccountBalanceResp,
+        )
+
+    def get_token_accounts_by_owner(
+        self,
+        address: Pubkey,
+        opts: TokenAccountOpts,
+        commitment: Commitment | None = None,
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_token_accounts_by_owner_body(
+                address, opts, commitment
+            ),
+            GetTokenAccountsByOwnerResp,
+        )
+
+    def get_signatures_for_address(
+        self,
+        address: Pubkey,
+        limit: int | None = None,
+        commitment: Commitment | None = None,
+        before: Signature | None = None,
+        until: Signature | None = None,
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_signatures_for_address_body(
+                address, before, until, limit, commitment
+            ),
+            GetSignaturesForAddressResp,
+        )
+
+    def get_signature_statuses(
+        self, signatures: list[Signature]
+    ) -> SolanaRpcBatchRequest:
+        return self._add(
+            lambda client: client._get_signature_statuses_body(
+                signatures, search_transaction_history=True
+            ),
+            GetSignatureStatusesResp,
+        )
+
+    def get_transaction(
+        self,
+        signature: Signature,
+        encoding: str = "jsonParsed",
+        commitment: Commitment | None = None,
+        max_supported_transaction_version: int = 0,
+    ) -> SolanaRpcBatchRequest:
+        commitment = commitment or solana_payments_settings.RPC_COMMITMENT
+        return self._add(
+            lambda client: client._get_transaction_body(
+                signature, encoding, commitment, max_supported_transaction_version
+            ),
+            GetTransactionResp,
+        )
+
+    def _build_payload(
+        self,
+        client: "AsyncClient",
+        requests: list[tuple[int, SolanaRpcBatchRequest]],
+    ) -> _BatchBody:
+        # Each call gets its position as JSON-RPC id, so responses can be matched
+        # even if the node returns them out of order.
+        payload = []
+        batch_methods = Counter()
+        for request_id, request in requests:
+            body = json.loads(request.build_body(client).to_json())
+            body["id"] = request_id
+            payload.append(body)
+            batch_methods[body["method"]] += 1
+        return _BatchBody(json.dumps(payload), dict(batch_methods))
+
+    def _set_results(
+        self, raw_response: str, requests: list[tuple[int, SolanaRpcBatchRequest]]
+    ):
+        response_items = json.loads(raw_response)
+        if not isinstance(response_items, list):
+            # Nodes answer with a single error object when the whole batch is rejected
+            error = SolanaRpcBatchError(
+                f"Unexpected RPC batch response: {raw_response}"
+            )
+            for _, request in requests:
+                request.set_error(error)
+            raise error
+
+        items_by_id = {item.get("id"): item for item in response_items}
+        for request_id, request in requests:
+            item = items_by_id.get(request_id)
+            if item is None:
+                request.set_error(
+                    SolanaRpcBatchError(
+                        f"No response for RPC batch call id={request_id}"
+                    )
+                )
+                continue
+
+            parsed = request.parser.from_json(json.dumps(item))
+            if isinstance(parsed, RPCError.__args__):
+                request.set_error(RPCException(parsed))
+            else:
+                request.set_result(parsed)
+
+    async def _asend(
+        self,
+        client: "AsyncClient",
+        requests: list[tuple[int, SolanaRpcBatchRequest]],
+        semaphore: asyncio.Semaphore,
+    ):
+        async with semaphore:
+            try:
+                batch_body = self._build_payload(client, requests)
+                solana_client_logger.debug(
+                    "Sending RPC batch with %d calls", len(requests)
+                )
+                raw_response = await client._provider.make_request_unparsed(batch_body)
+            except Exception as e:
+                for _, request in requests:
+                    request.set_error(e)
+                raise
+
+        self._set_results(raw_response, requests)
+
+    async def aexecute(self) -> list[SolanaRpcBatchRequest]:
+        """
+        Sends the queued calls. Batches larger than RPC_BATCH_MAX_SIZE are split into
+        several JSON-RPC batch requests, up to RPC_BATCH_CONCURRENCY of them in flight.
+
+        If a request fails, its calls raise the error from ``result()``, the calls of the
+        other requests keep their results, and the first error is raised.
+        """
+        if self._executed:
+            raise SolanaRpcBatchError("RPC batch has already been executed")
+        self._executed = True
+
+        if not self._requests:
+            return []
+
+        numbered_requests = list(enumerate(self._requests))
+        max_size = solana_payments_settings.RPC_BATCH_MAX_SIZE
+        semaphore = asyncio.Semaphore(solana_payments_settings.RPC_BATCH_CONCURRENCY)
+        async with self.base_solana_client.http_client() as client:
+            outcomes = await asyncio.gather(
+                *(
+                    self._asend(client, requests, semaphore)
+                    for requests in chunked(numbered_requests, max_size)
+                ),
+                return_exceptions=True,
+            )
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return self._requests
+
+    def execute(self) -> list[SolanaRpcBatchRequest]:
+        return self.base_solana_client.run_sync_from_async(self.aexecute)
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+solana_client_logger = logging.getLogger(__name__)
+
+# Smoothing factor for the rolling latency and error-rate averages
+SCORE_EWMA_ALPHA = 0.3
+# Seconds added to an endpoint's score when all of its recent requests failed
+ERROR_RATE_PENALTY_SECONDS = 5.0
+
+
+@dataclass
+class RpcEndpoint:
+    url: str
+    weight: float = 1.0
+    latency_ewma: float | None = None
+    error_rate_ewma: float = 0.0
+    consecutive_failures: int = 0
+    # Monotonic time until which the circuit breaker keeps the endpoint out of rotation
+    open_until: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """Lower is better: rolling latency plus an error penalty, divided by the weight."""
+        latency = self.latency_ewma or 0.0
+        return (
+            latency + self.error_rate_ewma * ERROR_RATE_PENALTY_SECONDS
+        ) / self.weight
+
+    def is_open(self, now: float) -> bool:
+        return self.open_until > now
+
+
+def parse_rpc_endpoints(entries: list[str | dict] | None) -> list[RpcEndpoint]:
+    """Parses RPC_URLS / RPC_WRITE_URLS entries: plain URLs or {"url": ..., "weight": ...} dicts."""
+    endpoints = []
+    for entry in entries or []:
+        if isinstance(entry, str):
+            endpoints.append(RpcEndpoint(url=entry))
+            continue
+
+        weight = float(entry.get("weight", 1.0))
+        if weight <= 0:
+            raise ValueError(f"RPC endpoint weight must be positive: {entry!r}")
+        endpoints.append(RpcEndpoint(url=entry["url"], weight=weight))
+    return endpoints
+
+
+class RpcEndpointPool:
+    """
+    Set of RPC endpoints ranked by rolling latency and error rate.
+
+    Every request tries endpoints best score first and fails over to the next one on
+    timeouts, 429 and 5xx responses. An endpoint that fails ``failure_threshold`` times in
+    a row is taken out of rotation for ``cooldown_seconds``; after that it gets one probe
+    request and goes straight back out if the probe fails.
+    Writes use ``write_endpoints`` when provided, otherwise the read endpoints.
+
+    The pool is shared by the AsyncClients of all event loops, so statistics are kept
+    per process.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[RpcEndpoint],
+        write_endpoints: list[RpcEndpoint] | None = None,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 30.0,
+    ):
+        if not endpoints:
+            raise ValueError("RpcEndpointPool requires at least one endpoint")
+        self.endpoints = endpoints
+        self.write_endpoints = write_endpoints or []
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+
+    def get_endpoints(self, write: bool = False) -> list[RpcEndpoint]:
+        """Returns endpoints in the order they should be tried."""
+        candidates = (
+            self.write_endpoints if write and self.write_endpoints else self.endpoints
+        )
+        now = time.monotonic()
+        with self._lock:
+            for endpoint in candidates:
+                if endpoint.open_until and not endpoint.is_open(now):
+                    # Cool-down is over: forget the stats so the endpoint is picked for a probe
+                    solana_client_logger.info(
+                        "Probing RPC endpoint %s after cool-down", endpoint.url
+                    )
+                    endpoint.open_until = 0.0
+                    endpoint.latency_ewma = None
+                    endpoint.error_rate_ewma = 0.0
+
+            available = sorted(
+                (endpoint for endpoint in candidates if not endpoint.is_open(now)),
+                key=lambda endpoint: (endpoint.score, -endpoint.weight),
+            )
+            # Open endpoints are kept as a last resort instead of failing the request outright
+            unavailable = sorted(
+                (endpoint for endpoint in candidates if endpoint.is_open(now)),
+                key=lambda endpoint: endpoint.open_until,
+            )
+        return available + unavailable
+
+    def record_success(self, endpoint: RpcEndpoint, latency: float):
+        with self._lock:
+            endpoint.consecutive_failures = 0
+            endpoint.open_until = 0.0
+            if endpoint.latency_ewma is None:
+                endpoint.latency_ewma = latency
+            else:
+                endpoint.latency_ewma += SCORE_EWMA_ALPHA * (
+                    latency - endpoint.latency_ewma
+                )
+            endpoint.error_rate_ewma -= SCORE_EWMA_ALPHA * endpoint.error_rate_ewma
+
+    def record_failure(self, endpoint: RpcEndpoint):
+        with self._lock:
+            endpoint.consecutive_failures += 1
+            endpoint.error_rate_ewma += SCORE_EWMA_ALPHA * (
+                1.0 - endpoint.error_rate_ewma
+            )
+            if endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.open_until = time.monotonic() + self.cooldown_seconds
+                solana_client_logger.warning(
+                    "RPC endpoint %s failed %d times in a row, "
+                    "removing it from rotation for %ss",
+                    endpoint.url,
+                    endpoint.consecutive_failures,
+                    self.cooldown_seconds,
+                )
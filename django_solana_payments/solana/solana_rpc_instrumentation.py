@@ -0,0 +1,155 @@
+import logging
+import math
+import threading
+from collections import Counter, defaultdict, deque
+from typing import Callable
+from urllib.parse import urlsplit
+
+from django.utils.module_loading import import_string
+
+from django_solana_payments.settings import solana_payments_settings
+from django_solana_payments.solana.dtos import RpcCallDTO, RpcMethodStatsDTO
+
+solana_client_logger = logging.getLogger(__name__)
+
+RpcCallHook = Callable[[RpcCallDTO], None]
+
+
+def redact_endpoint_url(url: str) -> str:
+    """Returns ``scheme://host[:port]`` of an RPC URL; paths and query strings often hold API keys."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if parts.port:
+        host = f"{host}:{parts.port}"
+    return f"{parts.scheme}://{host}"
+
+
+def _percentile(sorted_samples: list[float], percent: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(sorted_samples))
+    return sorted_samples[max(rank, 1) - 1]
+
+
+class RpcMetricsAggregator:
+    """
+    In-memory per-method RPC stats: call, retry and outcome counters, payload sizes and
+    p50/p95/p99 latency over the latest RPC_METRICS_MAX_SAMPLES calls of each method.
+    Batch requests also count the calls they contained per method.
+
+    Stats are kept per process.
+    """
+
+    def __init__(self, max_samples: int | None = None):
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def max_samples(self) -> int:
+        return self._max_samples or solana_payments_settings.RPC_METRICS_MAX_SAMPLES
+
+    def __call__(self, call: RpcCallDTO):
+        with self._lock:
+            durations = self._durations.get(call.method)
+            if durations is None or durations.maxlen != self.max_samples:
+                durations = deque(durations or (), maxlen=self.max_samples)
+                self._durations[call.method] = durations
+            durations.append(call.duration)
+            self._calls[call.method] += 1
+            self._retries[call.method] += call.retries
+            self._request_bytes[call.method] += call.request_size
+            self._response_bytes[call.method] += call.response_size
+            self._outcomes[call.method][call.outcome.value] += 1
+            self._batch_methods[call.method].update(call.batch_methods)
+
+    def get_stats(self) -> dict[str, RpcMethodStatsDTO]:
+        """Returns stats per RPC method, sorted by method name."""
+        with self._lock:
+            methods = sorted(self._calls)
+            snapshot = {
+                method: (
+                    sorted(self._durations[method]),
+                    self._calls[method],
+                    self._retries[method],
+                    self._request_bytes[method],
+                    self._response_bytes[method],
+                    dict(self._outcomes[method]),
+                    dict(self._batch_methods[method]),
+                )
+                for method in methods
+            }
+
+        return {
+            method: RpcMethodStatsDTO(
+                calls=calls,
+                retries=retries,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                p50=_percentile(durations, 50),
+                p95=_percentile(durations, 95),
+                p99=_percentile(durations, 99),
+                outcomes=outcomes,
+                batch_methods=batch_methods,
+            )
+            for method, (
+                durations,
+                calls,
+                retries,
+                request_bytes,
+                response_bytes,
+                outcomes,
+                batch_methods,
+            ) in snapshot.items()
+        }
+
+    def reset(self):
+        with self._lock:
+            self._durations: dict[str, deque] = {}
+            self._calls = Counter()
+            self._retries = Counter()
+            self._request_bytes = Counter()
+            self._response_bytes = Counter()
+            self._outcomes: dict[str, Counter] = defaultdict(Counter)
+            self._batch_methods: dict[str, Counter] = defaultdict(Counter)
+
+
+rpc_metrics = RpcMetricsAggregator()
+
+_registered_hooks: list[RpcCallHook] = []
+_settings_hooks: tuple[tuple[str, ...], list[RpcCallHook]] = ((), [])
+
+
+def register_rpc_call_hook(hook: RpcCallHook):
+    """Calls ``hook(call)`` with an ``RpcCallDTO`` after every RPC request of this process."""
+    if hook not in _registered_hooks:
+        _registered_hooks.append(hook)
+
+
+def unregister_rpc_call_hook(hook: RpcCallHook):
+    if hook in _registered_hooks:
+        _registered_hooks.remove(hook)
+
+
+def _get_settings_hooks() -> list[RpcCallHook]:
+    global _settings_hooks
+    hook_paths = tuple(solana_payments_settings.RPC_CALL_HOOKS)
+    cached_paths, hooks = _settings_hooks
+    if cached_paths != hook_paths:
+        hooks = [import_string(hook_path) for hook_path in hook_paths]
+        _settings_hooks = (hook_paths, hooks)
+    return hooks
+
+
+def record_rpc_call(call: RpcCallDTO):
+    """Passes a finished RPC call to the built-in aggregator and the configured hooks."""
+    hooks = [*_get_settings_hooks(), *_registered_hooks]
+    if solana_payments_settings.RPC_METRICS_ENABLED:
+        hooks.insert(0, rpc_metrics)
+
+    for hook in hooks:
+        try:
+            hook(call)
+        except Exception as e:
+            # Instrumentation must never break the RPC call it observes
+            solana_client_logger.warning(f"RPC call hook {hook!r} failed: {e}")
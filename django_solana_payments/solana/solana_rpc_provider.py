@@ -0,0 +1,215 @@
+import logging
+import sys
+import time
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.rpc.core import _ClientCore
+
+from django_solana_payments.solana.dtos import RpcCallDTO
+from django_solana_payments.solana.enums import RpcCallOutcomeEnum
+from django_solana_payments.solana.solana_rpc_endpoint_pool import RpcEndpointPool
+from django_solana_payments.solana.solana_rpc_instrumentation import (
+    record_rpc_call,
+    redact_endpoint_url,
+)
+from django_solana_payments.solana.solana_rpc_rate_limiter import (
+    SharedRpcRateLimiter,
+)
+from django_solana_payments.solana.solana_rpc_single_flight import RpcSingleFlight
+
+try:
+    from solana.rpc.async_http_provider import AsyncHTTPProvider
+except ImportError:  # solana < 0.41
+    from solana.rpc.providers.async_http import AsyncHTTPProvider
+
+solana_client_logger = logging.getLogger(__name__)
+
+WRITE_REQUEST_TYPES = ("RequestAirdrop",)
+
+
+def get_rpc_method_name(body) -> str:
+    """Returns the JSON-RPC method of a request body, e.g. ``getBalance`` for ``GetBalance``."""
+    rpc_method = getattr(body, "rpc_method", None)
+    if rpc_method:
+        return rpc_method
+    type_name = type(body).__name__
+    return type_name[:1].lower() + type_name[1:]
+
+
+class SolanaRpcProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that sends every request through an ``RpcEndpointPool``.
+
+    Requests go to the best ranked endpoint and fail over to the next one on timeouts,
+    transport errors, 429 and 5xx responses. Other HTTP errors are raised right away.
+    Every attempt takes a token from ``rate_limiter`` first, when one is configured.
+    Identical reads that are in flight at the same time share one request via ``single_flight``.
+    Each sent request is reported to ``record_rpc_call`` with its outcome and failovers.
+    """
+
+    def __init__(
+        self,
+        endpoint_pool: RpcEndpointPool,
+        rate_limiter: SharedRpcRateLimiter | None = None,
+        single_flight: RpcSingleFlight | None = None,
+        **provider_kwargs,
+    ):
+        super().__init__(endpoint_pool.endpoints[0].url, **provider_kwargs)
+        self.endpoint_pool = endpoint_pool
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        # solana-py switched HTTP libraries between releases; use the one its session comes from
+        http_module = sys.modules[type(self.session).__module__.split(".")[0]]
+        self._http_error = http_module.HTTPError
+        self._http_status_error = http_module.HTTPStatusError
+        self._http_timeout_error = http_module.TimeoutException
+
+    @staticmethod
+    def _is_write_request(body) -> bool:
+        # SendRawTransaction, SendVersionedTransaction, SendLegacyTransaction
+        type_name = type(body).__name__
+        return type_name.startswith("Send") or type_name in WRITE_REQUEST_TYPES
+
+    def _is_failover_error(self, exc: Exception) -> bool:
+        if isinstance(exc, self._http_status_error):
+            status_code = exc.response.status_code
+            return status_code == 429 or status_code >= 500
+        # Timeouts, connection and other transport errors
+        return True
+
+    def _get_error_outcome(self, exc: Exception) -> RpcCallOutcomeEnum:
+        if isinstance(exc, self._http_timeout_error):
+            return RpcCallOutcomeEnum.TIMEOUT
+        if isinstance(exc, self._http_status_error) and exc.response.status_code == 429:
+            return RpcCallOutcomeEnum.RATE_LIMITED
+        return RpcCallOutcomeEnum.ERROR
+
+    def _record_call(
+        self,
+        body,
+        content: str,
+        endpoint_url: str,
+        duration: float,
+        outcome: RpcCallOutcomeEnum,
+        retries: int,
+        response_text: str = "",
+    ):
+        record_rpc_call(
+            RpcCallDTO(
+                method=get_rpc_method_name(body),
+                endpoint=redact_endpoint_url(endpoint_url),
+                duration=duration,
+                request_size=len(content),
+                response_size=len(response_text),
+                outcome=outcome,
+                retries=retries,
+                batch_methods=dict(getattr(body, "batch_methods", {})),
+            )
+        )
+
+    async def _post(self, url: str, content: str, headers: dict[str, str]):
+        if self._limiter is not None:
+            async with self._limiter:
+                return await self.session.post(url, content=content, headers=headers)
+        return await self.session.post(url, content=content, headers=headers)
+
+    async def make_request_unparsed(self, body) -> str:
+        content = body.to_json()
+        is_write = self._is_write_request(body)
+        if self.single_flight is None or is_write:
+            return await self._send_request(body, content, is_write)
+
+        # The serialized body holds method, params and commitment, so it is the coalescing key
+        return await self.single_flight.do(
+            key=content,
+            method=get_rpc_method_name(body),
+            send_request=lambda: self._send_request(body, content, is_write),
+        )
+
+    async def _send_request(self, body, content: str, is_write: bool) -> str:
+        headers = {"Content-Type": "application/json"}
+        if self.extra_headers:
+            headers.update(self.extra_headers)
+
+        last_error = None
+        endpoint_url = self.endpoint_uri
+        attempts = 0
+        # Time spent waiting for rate limit tokens is not RPC latency
+        duration = 0.0
+        for endpoint in self.endpoint_pool.get_endpoints(write=is_write):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(endpoint.url)
+
+            endpoint_url = endpoint.url
+            attempts += 1
+            started_at = time.monotonic()
+            try:
+                response = await self._post(endpoint.url, content, headers)
+                response.raise_for_status()
+            except self._http_error as e:
+                latency = time.monotonic() - started_at
+                duration += latency
+                if not self._is_failover_error(e):
+                    self.endpoint_pool.record_success(endpoint, latency)
+                    self._record_call(
+                        body,
+                        content,
+                        endpoint_url,
+                        duration,
+                        self._get_error_outcome(e),
+                        retries=attempts - 1,
+                    )
+                    raise SolanaRpcException(
+                        e, self.make_request_unparsed, self, body
+                    ) from e
+
+                self.endpoint_pool.record_failure(endpoint)
+                solana_client_logger.warning(
+                    f"RPC request {type(body).__name__} to {endpoint.url} failed, "
+                    f"trying next endpoint: {e!r}"
+                )
+                last_error = e
+                continue
+
+            latency = time.monotonic() - started_at
+            duration += latency
+            self.endpoint_pool.record_success(endpoint, latency)
+            self._record_call(
+                body,
+                content,
+                endpoint_url,
+                duration,
+                RpcCallOutcomeEnum.OK,
+                retries=attempts - 1,
+                response_text=response.text,
+            )
+            return response.text
+
+        self._record_call(
+            body,
+            content,
+            endpoint_url,
+            duration,
+            (
+                self._get_error_outcome(last_error)
+                if last_error is not None
+                else RpcCallOutcomeEnum.ERROR
+            ),
+            retries=max(attempts - 1, 0),
+        )
+        raise SolanaRpcException(
+            last_error, self.make_request_unparsed, self, body
+        ) from last_error
+
+
+class SolanaRpcAsyncClient(AsyncClient):
+    """AsyncClient that sends its requests through a multi-endpoint ``SolanaRpcProvider``."""
+
+    def __init__(
+        self, provider: SolanaRpcProvider, commitment: Commitment | None = None
+    ):
+        # AsyncClient.__init__ only builds a single-endpoint provider, so it is skipped
+        _ClientCore.__init__(self, commitment)
+        self._provider = provider
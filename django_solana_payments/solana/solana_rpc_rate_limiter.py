@@ -0,0 +1,124 @@
+import asyncio
+import contextvars
+import hashlib
+import logging
+import random
+import time
+from contextlib import contextmanager
+
+from django.core.cache import caches
+
+from django_solana_payments.solana.enums import RpcPriorityEnum
+
+solana_client_logger = logging.getLogger(__name__)
+
+_rpc_priority = contextvars.ContextVar(
+    "solana_payments_rpc_priority", default=RpcPriorityEnum.INTERACTIVE
+)
+
+
+def get_rpc_priority() -> RpcPriorityEnum:
+    return _rpc_priority.get()
+
+
+@contextmanager
+def rpc_priority(priority: RpcPriorityEnum):
+    """
+    Runs the RPC calls made inside the block with the given priority class.
+
+    The priority is kept in a context variable, so it also applies to calls that the sync
+    wrappers run on another event loop or thread.
+    """
+    token = _rpc_priority.set(priority)
+    try:
+        yield
+    finally:
+        _rpc_priority.reset(token)
+
+
+class SharedRpcRateLimiter:
+    """
+    Per-endpoint RPC rate limiter shared by every process that uses the same Django cache.
+
+    Each endpoint gets ``rate_limit`` tokens per one-second window, taken with the cache's
+    ``add``/``incr``. Background calls only get a token while less than ``background_share``
+    of the window budget is used, so the rest stays available to interactive calls.
+    Calls that get no token wait for the next window.
+
+    Use a cache shared between processes (Redis, Memcached, database). With the local-memory
+    cache the limit only applies within one process.
+    """
+
+    WINDOW_SECONDS = 1
+
+    def __init__(
+        self,
+        rate_limit: float,
+        cache_alias: str = "default",
+        background_share: float = 0.5,
+        key_prefix: str = "django-solana-payments:rpc-rate-limit",
+    ):
+        if rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+        if not 0 < background_share <= 1:
+            raise ValueError("background_share must be in (0, 1]")
+        self.rate_limit = rate_limit
+        self.cache_alias = cache_alias
+        self.background_share = background_share
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_window_limit(self, priority: RpcPriorityEnum) -> int:
+        window_limit = self.rate_limit * self.WINDOW_SECONDS
+        if priority == RpcPriorityEnum.BACKGROUND:
+            window_limit *= self.background_share
+        return max(1, int(window_limit))
+
+    def _build_key(self, endpoint_url: str, window: int) -> str:
+        # Hash the URL: API keys in RPC URLs must not end up in cache keys
+        endpoint_hash = hashlib.sha256(endpoint_url.encode()).hexdigest()[:16]
+        return f"{self.key_prefix}:{endpoint_hash}:{window}"
+
+    async def _try_acquire(self, key: str, window_limit: int) -> bool:
+        cache = self.cache
+        await cache.aadd(key, 0, timeout=self.WINDOW_SECONDS * 2)
+        try:
+            used = await cache.aincr(key)
+        except ValueError:
+            # The window key was evicted between add and incr
+            return False
+
+        if used <= window_limit:
+            return True
+
+        # Give the token back so rejected calls don't eat into the interactive budget
+        try:
+            await cache.adecr(key)
+        except ValueError:
+            pass
+        return False
+
+    async def acquire(self, endpoint_url: str, priority: RpcPriorityEnum | None = None):
+        """Waits until a request to ``endpoint_url`` is allowed."""
+        priority = priority or get_rpc_priority()
+        window_limit = self.get_window_limit(priority)
+
+        while True:
+            now = time.time()
+            window = int(now // self.WINDOW_SECONDS)
+            if await self._try_acquire(
+                self._build_key(endpoint_url, window), window_limit
+            ):
+                return
+
+            # Jitter spreads waiting processes over the start of the next window
+            delay = (window + 1) * self.WINDOW_SECONDS - now + random.uniform(0, 0.05)
+            solana_client_logger.debug(
+                "Shared RPC rate limit reached for %s priority, waiting %.3fs",
+                priority.value,
+                delay,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Awaitable, Callable
+
+from django_solana_payments.solana.dtos import RpcCoalescingStatsDTO
+
+
+class RpcSingleFlight:
+    """
+    Coalesces identical in-flight RPC reads.
+
+    The first caller for a key sends the request; callers that arrive with the same key
+    while it is in flight wait for that request and get the same raw response (or error).
+    In-flight requests are tracked with thread-safe futures, so callers on other event
+    loops of the same process (e.g. concurrent sync wrappers) are coalesced as well.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._requests = Counter()
+        self._coalesced = Counter()
+
+    async def do(
+        self, key: str, method: str, send_request: Callable[[], Awaitable[str]]
+    ) -> str:
+        with self._lock:
+            self._requests[method] += 1
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                in_flight = Future()
+                self._in_flight[key] = in_flight
+                is_leader = True
+            else:
+                self._coalesced[method] += 1
+                is_leader = False
+
+        if not is_leader:
+            # Shield: a cancelled follower must not cancel the shared request
+            return await asyncio.shield(asyncio.wrap_future(in_flight))
+
+        try:
+            response = await send_request()
+        except BaseException as e:
+            self._finish(key)
+            in_flight.set_exception(e)
+            raise
+
+        self._finish(key)
+        in_flight.set_result(response)
+        return response
+
+    def _finish(self, key: str):
+        # Later callers must send a new request instead of reusing a finished one
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def get_stats(self) -> dict[str, RpcCoalescingStatsDTO]:
+        """Returns coalescing counters per RPC method, plus a ``"total"`` entry."""
+        with self._lock:
+            requests = dict(self._requests)
+            coalesced = dict(self._coalesced)
+
+        stats = {
+            method: RpcCoalescingStatsDTO(
+                requests=method_requests, coalesced=coalesced.get(method, 0)
+            )
+            for method, method_requests in sorted(requests.items())
+        }
+        stats["total"] = RpcCoalescingStatsDTO(
+            requests=sum(requests.values()), coalesced=sum(coalesced.values())
+        )
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._requests.clear()
+            self._coalesced.clear()
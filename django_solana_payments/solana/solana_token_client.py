@@ -14,18 +14,27 @@ from spl.token.constants import (
 )
 from spl.token.instructions import (
     close_account,
-    create_associated_token_account,
+    create_idempotent_associated_token_account,
 )
 from spl.token.models import CloseAccountParams
 
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.dtos import (
+    BlockhashDTO,
+    CreateAssociatedTokenAccountsDTO,
+    MintInfoDTO,
+)
+from django_solana_payments.solana.solana_mint_info_cache import parse_mint_decimals
 from django_solana_payments.solana.solana_transaction_sender_client import (
     SolanaTransactionSenderClient,
 )
 
 solana_client_logger = logging.getLogger(__name__)
 
+# Maximum size of a serialized transaction accepted by the cluster
+MAX_TRANSACTION_SIZE = 1232
+
 
 class SolanaTokenClient:
     def __init__(self, base_solana_client: BaseSolanaClient):
@@ -64,6 +73,36 @@ class SolanaTokenClient:
             commitment=commitment,
         )
 
+    async def aget_account_infos(
+        self, addresses: list[Pubkey], commitment: Commitment | None = None
+    ) -> list:
+        """
+        Reads several accounts with one batched RPC request. Missing accounts are
+        returned as ``None``.
+        """
+        if not addresses:
+            return []
+
+        async with self.base_solana_client.batch() as batch:
+            account_requests = [
+                batch.get_account_info(address, commitment=commitment)
+                for address in addresses
+            ]
+
+        return [account_request.result().value for account_request in account_requests]
+
+    def get_account_infos(
+        self, addresses: list[Pubkey], commitment: Commitment | None = None
+    ) -> list:
+        if not addresses:
+            return []
+
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_account_infos,
+            addresses,
+            commitment=commitment,
+        )
+
     async def aget_token_account_balance(
         self, address, commitment: Commitment | None = None
     ):
@@ -110,6 +149,40 @@ class SolanaTokenClient:
             commitment=commitment,
         )
 
+    async def _afetch_blockhash(self, commitment: Commitment) -> BlockhashDTO:
+        latest_blockhash = (
+            await self.aget_latest_blockhash(commitment=commitment)
+        ).value
+        return BlockhashDTO(
+            blockhash=latest_blockhash.blockhash,
+            last_valid_block_height=latest_blockhash.last_valid_block_height,
+        )
+
+    async def aget_recent_blockhash(
+        self, commitment: Commitment | None = None
+    ) -> BlockhashDTO:
+        """Returns a blockhash for new transactions, served from the blockhash cache when possible."""
+        if commitment is None:
+            commitment = solana_payments_settings.RPC_COMMITMENT
+        return await self.base_solana_client.blockhash_cache.aget(
+            commitment, self._afetch_blockhash
+        )
+
+    def get_recent_blockhash(
+        self, commitment: Commitment | None = None
+    ) -> BlockhashDTO:
+        if commitment is None:
+            commitment = solana_payments_settings.RPC_COMMITMENT
+        # Fresh cache hits don't need the sync-to-async bridge
+        blockhash = self.base_solana_client.blockhash_cache.get(commitment)
+        if blockhash is not None:
+            return blockhash
+
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_recent_blockhash,
+            commitment=commitment,
+        )
+
     async def aget_token_supply(self, address, commitment: Commitment | None = None):
         if commitment is None:
             commitment = solana_payments_settings.RPC_COMMITMENT
@@ -126,6 +199,84 @@ class SolanaTokenClient:
             commitment=commitment,
         )
 
+    def _build_mint_info(self, mint_address: Pubkey, mint_account) -> MintInfoDTO:
+        if not mint_account:
+            raise ValueError(f"Mint account {mint_address} does not exist")
+
+        return MintInfoDTO(
+            mint_address=mint_address,
+            token_program_id=mint_account.owner,  # owner program of the mint account
+            decimals=parse_mint_decimals(bytes(mint_account.data)),
+        )
+
+    async def aget_mint_info(
+        self, mint_address: Pubkey, commitment: Commitment | None = None
+    ) -> MintInfoDTO:
+        """Returns the mint token program and decimals, served from the mint info cache when possible."""
+        mint_info_cache = self.base_solana_client.mint_info_cache
+        mint_info = await mint_info_cache.aget(mint_address)
+        if mint_info is not None:
+            return mint_info
+
+        mint_account = (
+            await self.aget_account_info(mint_address, commitment=commitment)
+        ).value
+        mint_info = self._build_mint_info(mint_address, mint_account)
+        await mint_info_cache.aset(mint_info)
+        return mint_info
+
+    def get_mint_info(
+        self, mint_address: Pubkey, commitment: Commitment | None = None
+    ) -> MintInfoDTO:
+        # Cache hits don't need the sync-to-async bridge
+        mint_info = self.base_solana_client.mint_info_cache.get(mint_address)
+        if mint_info is not None:
+            return mint_info
+
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_mint_info,
+            mint_address,
+            commitment=commitment,
+        )
+
+    def warm_mint_info_cache(
+        self, mint_addresses: list[Pubkey], commitment: Commitment | None = None
+    ) -> int:
+        """
+        Loads mints missing from the mint info cache with one batched RPC request.
+        Returns the number of cached mints.
+        """
+        mint_info_cache = self.base_solana_client.mint_info_cache
+        missing_mints = [
+            mint_address
+            for mint_address in mint_addresses
+            if mint_info_cache.get(mint_address) is None
+        ]
+        if not missing_mints:
+            return len(mint_addresses)
+
+        with self.base_solana_client.batch() as batch:
+            account_requests = [
+                batch.get_account_info(mint_address, commitment=commitment)
+                for mint_address in missing_mints
+            ]
+
+        warmed_mints = len(mint_addresses) - len(missing_mints)
+        for mint_address, account_request in zip(missing_mints, account_requests):
+            try:
+                mint_info = self._build_mint_info(
+                    mint_address, account_request.result().value
+                )
+            except Exception as e:
+                solana_client_logger.warning(
+                    f"Could not load mint info for {mint_address}: {e}"
+                )
+                continue
+            mint_info_cache.set(mint_info)
+            warmed_mints += 1
+
+        return warmed_mints
+
     def get_or_create_associated_token_address(
         self, wallet_address: Pubkey, token_mint_address: Pubkey
     ) -> Pubkey:
@@ -147,15 +298,25 @@ class SolanaTokenClient:
         token_mint_address: Pubkey,
         commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
     ) -> Pubkey:
-        mint_info = self.get_account_info(token_mint_address, commitment=commitment)
-        if not mint_info.value:
-            raise ValueError(f"Mint account {token_mint_address} does not exist")
+        program_owner = self.get_mint_info(
+            token_mint_address, commitment=commitment
+        ).token_program_id
 
-        program_owner = mint_info.value.owner  # owner program of the mint account
+        return self.derive_associated_token_address(
+            wallet_address, token_mint_address, program_owner
+        )
 
+    @staticmethod
+    def derive_associated_token_address(
+        wallet_address: Pubkey, token_mint_address: Pubkey, token_program_id: Pubkey
+    ) -> Pubkey:
         # The order of seeds passed to find_program_address matters and
         # must match what the Associated Token program expects
-        seeds = [bytes(wallet_address), bytes(program_owner), bytes(token_mint_address)]
+        seeds = [
+            bytes(wallet_address),
+            bytes(token_program_id),
+            bytes(token_mint_address),
+        ]
 
         associated_token_address, _ = Pubkey.find_program_address(
             seeds, ASSOCIATED_TOKEN_PROGRAM_ID
@@ -173,26 +334,27 @@ class SolanaTokenClient:
         Creates and sends transactions to close all specified token accounts.
         """
 
-        latest_blockhash = self.get_latest_blockhash(commitment=commitment).value
+        recent_blockhash = self.get_recent_blockhash(commitment=commitment)
 
         instructions = []
 
         for mint in mints:
-            mint_info = self.get_account_info(mint, commitment=commitment).value
+            mint_info = self.get_mint_info(mint, commitment=commitment)
 
+            # Idempotent, so retrying after a confirmation timeout does not fail
             instructions.append(
-                create_associated_token_account(
+                create_idempotent_associated_token_account(
                     payer=self.base_solana_client.BASE_SENDER_KEYPAIR.pubkey(),
                     owner=recipient,
                     mint=mint,
-                    token_program_id=mint_info.owner,
+                    token_program_id=mint_info.token_program_id,
                 )
             )
 
         transaction = self._build_versioned_transaction(
             instructions=instructions,
             signers=[self.base_solana_client.BASE_SENDER_KEYPAIR],
-            recent_blockhash=latest_blockhash.blockhash,
+            recent_blockhash=recent_blockhash.blockhash,
         )
         sent_transaction_sig = (
             self.solana_transaction_sender_client.send_transaction_with_retry(
@@ -204,6 +366,125 @@ class SolanaTokenClient:
 
         return sent_transaction_sig
 
+    def pack_transactions(
+        self,
+        units: list[tuple[list[Instruction], list[Keypair]]],
+        recent_blockhash,
+        max_units_per_transaction: int | None = None,
+    ) -> list[tuple[VersionedTransaction, list[int]]]:
+        """
+        Packs units of (instructions, signers), in order, into as few transactions as fit
+        the transaction size limit, optionally with at most ``max_units_per_transaction``
+        units each. The instructions of a unit always share a transaction, and the fee
+        payer signs all of them. Returns each transaction with the indexes of the units
+        it carries.
+
+        The size limit also bounds the number of accounts a transaction can reference.
+        """
+        fee_payer = self.base_solana_client.BASE_SENDER_KEYPAIR
+
+        def build(unit_indexes: list[int]) -> VersionedTransaction:
+            signers = {fee_payer.pubkey(): fee_payer}
+            instructions = []
+            for unit_index in unit_indexes:
+                unit_instructions, unit_signers = units[unit_index]
+                instructions.extend(unit_instructions)
+                signers.update((signer.pubkey(), signer) for signer in unit_signers)
+            return self._build_versioned_transaction(
+                instructions=instructions,
+                signers=list(signers.values()),
+                recent_blockhash=recent_blockhash,
+            )
+
+        packed_transactions = []
+        current_indexes = []
+        current_transaction = None
+        for index in range(len(units)):
+            if (
+                max_units_per_transaction is None
+                or len(current_indexes) < max_units_per_transaction
+            ):
+                transaction = build(current_indexes + [index])
+                if len(bytes(transaction)) <= MAX_TRANSACTION_SIZE:
+                    current_indexes.append(index)
+                    current_transaction = transaction
+                    continue
+
+            if current_indexes:
+                packed_transactions.append((current_transaction, current_indexes))
+            current_indexes = [index]
+            current_transaction = build(current_indexes)
+            if len(bytes(current_transaction)) > MAX_TRANSACTION_SIZE:
+                raise ValueError("Instructions do not fit into a single transaction")
+
+        if current_indexes:
+            packed_transactions.append((current_transaction, current_indexes))
+        return packed_transactions
+
+    async def acreate_associated_token_accounts(
+        self,
+        accounts: list[tuple[Pubkey, Pubkey]],
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+    ) -> list[CreateAssociatedTokenAccountsDTO]:
+        """
+        Creates the associated token accounts of many (owner, mint) pairs.
+
+        The create instructions are packed into as few transactions as the size limit
+        allows, the transactions are sent concurrently and confirmed together with
+        batched ``getSignatureStatuses`` requests. The fee payer pays for and signs all
+        of them, the owners don't need to sign.
+        """
+        if not accounts:
+            return []
+
+        instructions = []
+        for owner, mint in accounts:
+            mint_info = await self.aget_mint_info(mint, commitment=commitment)
+            # Idempotent, so accounts that already exist don't fail the transaction
+            instructions.append(
+                create_idempotent_associated_token_account(
+                    payer=self.base_solana_client.BASE_SENDER_KEYPAIR.pubkey(),
+                    owner=owner,
+                    mint=mint,
+                    token_program_id=mint_info.token_program_id,
+                )
+            )
+
+        recent_blockhash = await self.aget_recent_blockhash(commitment=commitment)
+        packed_transactions = self.pack_transactions(
+            [([instruction], []) for instruction in instructions],
+            recent_blockhash=recent_blockhash.blockhash,
+        )
+
+        confirmations = (
+            await self.solana_transaction_sender_client.asend_and_confirm_transactions(
+                [transaction for transaction, _ in packed_transactions],
+                commitment=commitment,
+            )
+        )
+
+        return [
+            CreateAssociatedTokenAccountsDTO(
+                accounts=[accounts[index] for index in indexes],
+                tx_signature=confirmation.tx_signature if confirmation else None,
+                confirmation_status=(
+                    confirmation.confirmation_status if confirmation else None
+                ),
+            )
+            for (_, indexes), confirmation in zip(packed_transactions, confirmations)
+        ]
+
+    def create_associated_token_accounts(
+        self,
+        accounts: list[tuple[Pubkey, Pubkey]],
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+    ) -> list[CreateAssociatedTokenAccountsDTO]:
+        return self.base_solana_client.run_sync_from_async(
+            self.acreate_associated_token_accounts,
+            accounts,
+            commitment=commitment,
+        )
+
     async def aclose_associated_token_accounts_and_recover_rent(
         self,
         account_owner: Keypair,
@@ -244,14 +525,12 @@ class SolanaTokenClient:
         if not instructions:
             return False
 
-        latest_blockhash = (
-            await self.aget_latest_blockhash(commitment=commitment)
-        ).value
+        recent_blockhash = await self.aget_recent_blockhash(commitment=commitment)
 
         tx = self._build_versioned_transaction(
             instructions=instructions,
             signers=[account_owner, self.base_solana_client.BASE_SENDER_KEYPAIR],
-            recent_blockhash=latest_blockhash.blockhash,
+            recent_blockhash=recent_blockhash.blockhash,
         )
 
         try:
@@ -271,6 +550,79 @@ class SolanaTokenClient:
             solana_client_logger.warning(f"An error occurred: {e}")
             return False
 
+    async def aclose_token_accounts_of_owners(
+        self,
+        owner_token_accounts: list[tuple[Keypair, list[tuple[Pubkey, Pubkey]]]],
+        destination_pubkey: Pubkey,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+    ) -> list[bool]:
+        """
+        Closes empty token accounts of many owners and recovers their rent. Each owner
+        lists (address, token program) pairs of its accounts; the close instructions of
+        an owner share a transaction, and the owners are packed into as few transactions
+        as the size limit allows. Returns for each owner whether its accounts were closed.
+        """
+        owners_to_close = [
+            index
+            for index, (_, token_accounts) in enumerate(owner_token_accounts)
+            if token_accounts
+        ]
+        closed = [True] * len(owner_token_accounts)
+        if not owners_to_close:
+            return closed
+
+        units = []
+        for index in owners_to_close:
+            account_owner, token_accounts = owner_token_accounts[index]
+            units.append(
+                (
+                    [
+                        close_account(
+                            CloseAccountParams(
+                                account=token_account,
+                                dest=destination_pubkey,
+                                owner=account_owner.pubkey(),
+                                program_id=token_program_id,
+                            )
+                        )
+                        for token_account, token_program_id in token_accounts
+                    ],
+                    [account_owner],
+                )
+            )
+
+        recent_blockhash = await self.aget_recent_blockhash(commitment=commitment)
+        packed_transactions = self.pack_transactions(
+            units, recent_blockhash=recent_blockhash.blockhash
+        )
+        confirmations = (
+            await self.solana_transaction_sender_client.asend_and_confirm_transactions(
+                [transaction for transaction, _ in packed_transactions],
+                commitment=commitment,
+            )
+        )
+        for (_, unit_indexes), confirmation in zip(packed_transactions, confirmations):
+            is_confirmed = (
+                confirmation is not None
+                and confirmation.confirmation_status is not None
+            )
+            for unit_index in unit_indexes:
+                closed[owners_to_close[unit_index]] = is_confirmed
+        return closed
+
+    def close_token_accounts_of_owners(
+        self,
+        owner_token_accounts: list[tuple[Keypair, list[tuple[Pubkey, Pubkey]]]],
+        destination_pubkey: Pubkey,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+    ) -> list[bool]:
+        return self.base_solana_client.run_sync_from_async(
+            self.aclose_token_accounts_of_owners,
+            owner_token_accounts,
+            destination_pubkey,
+            commitment=commitment,
+        )
+
     def close_associated_token_accounts_and_recover_rent(
         self,
         account_owner: Keypair,
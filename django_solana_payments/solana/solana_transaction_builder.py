@@ -7,10 +7,13 @@ from solders.message import MessageV0
 from solders.pubkey import Pubkey
 from solders.system_program import TransferParams, transfer
 from solders.transaction import VersionedTransaction
+from spl.token.instructions import close_account
 from spl.token.instructions import transfer as spl_transfer
+from spl.token.models import CloseAccountParams
 from spl.token.models import TransferParams as SplTransferParams
 
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.dtos import MintInfoDTO
 
 if TYPE_CHECKING:
     from django_solana_payments.solana.solana_token_client import SolanaTokenClient
@@ -30,26 +33,66 @@ class SolanaTransactionBuilder:
         instructions: list[Instruction],
         signers: list[Keypair],
     ) -> VersionedTransaction:
-        latest_blockhash = self.solana_token_client.get_latest_blockhash().value
+        recent_blockhash = self.solana_token_client.get_recent_blockhash()
         message = MessageV0.try_compile(
             payer=self.base_solana_client.BASE_SENDER_KEYPAIR.pubkey(),
             instructions=instructions,
             address_lookup_table_accounts=[],
-            recent_blockhash=latest_blockhash.blockhash,
+            recent_blockhash=recent_blockhash.blockhash,
         )
         return VersionedTransaction(message, signers)
 
-    def create_native_transaction(
-        self, recipient: Pubkey, amount: Decimal, sender_keypair: Keypair
-    ) -> VersionedTransaction:
+    def create_native_transfer_instruction(
+        self, recipient: Pubkey, amount: Decimal, sender: Pubkey
+    ) -> Instruction:
         amount_lamports = round(self.base_solana_client.LAMPORTS_PER_SOL * amount)
-        transfer_ix = transfer(
+        return transfer(
             TransferParams(
-                from_pubkey=sender_keypair.pubkey(),
+                from_pubkey=sender,
                 to_pubkey=recipient,
                 lamports=amount_lamports,
             )
         )
+
+    def create_spl_token_transfer_instruction(
+        self,
+        source: Pubkey,
+        dest: Pubkey,
+        owner: Pubkey,
+        amount: Decimal,
+        mint_info: MintInfoDTO,
+    ) -> Instruction:
+        return spl_transfer(
+            SplTransferParams(
+                program_id=mint_info.token_program_id,
+                source=source,
+                dest=dest,
+                owner=owner,
+                amount=self._calculate_spl_transaction_amount(
+                    amount, mint_info.decimals
+                ),
+            )
+        )
+
+    def create_close_token_account_instruction(
+        self, account: Pubkey, owner: Pubkey, token_program_id: Pubkey
+    ) -> Instruction:
+        """Closes an empty token account, its rent goes to the fee payer."""
+        return close_account(
+            CloseAccountParams(
+                account=account,
+                dest=self.base_solana_client.BASE_SENDER_KEYPAIR.pubkey(),
+                owner=owner,
+                program_id=token_program_id,
+            )
+        )
+
+    def create_native_transaction(
+        self, recipient: Pubkey, amount: Decimal, sender_keypair: Keypair
+    ) -> VersionedTransaction:
+        transfer_ix = self.create_native_transfer_instruction(
+            recipient, amount, sender_keypair.pubkey()
+        )
         return self._build_versioned_transaction(
             instructions=[transfer_ix],
             signers=[sender_keypair, self.base_solana_client.BASE_SENDER_KEYPAIR],
@@ -76,31 +119,19 @@ class SolanaTransactionBuilder:
             )
         )
 
-        token_account_info = self.solana_token_client.get_account_info(
-            token_mint_address
-        )
-
-        if not token_account_info.value:
+        try:
+            mint_info = self.solana_token_client.get_mint_info(token_mint_address)
+        except ValueError:
             raise ValueError(
                 f"create_spl_token_transaction: Mint account {token_mint_address} not found or invalid"
             )
 
-        token_program_id = token_account_info.value.owner
-
-        decimals = self.solana_token_client.get_token_supply(
-            token_mint_address
-        ).value.decimals
-
-        tokens_to_send_amount = self._calculate_spl_transaction_amount(amount, decimals)
-
-        transfer_instruction = spl_transfer(
-            SplTransferParams(
-                program_id=token_program_id,
-                source=sender_associated_token_addr,
-                dest=recipient_associated_token_addr,
-                owner=sender_keypair.pubkey(),
-                amount=tokens_to_send_amount,
-            )
+        transfer_instruction = self.create_spl_token_transfer_instruction(
+            source=sender_associated_token_addr,
+            dest=recipient_associated_token_addr,
+            owner=sender_keypair.pubkey(),
+            amount=amount,
+            mint_info=mint_info,
         )
         return self._build_versioned_transaction(
             instructions=[transfer_instruction],
@@ -4,19 +4,26 @@ from typing import Optional
 
 from solana.exceptions import SolanaRpcException
 from solana.rpc.commitment import Commitment
+from solana.rpc.core import RPCException
 from solders.pubkey import Pubkey
+from solders.rpc.responses import RpcConfirmedTransactionStatusWithSignature
 from solders.signature import Signature
 from solders.solders import EncodedTransactionWithStatusMeta, GetTransactionResp
 from solders.transaction_status import TransactionStatus
 
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.dtos import SignatureCursorDTO
+from django_solana_payments.solana.solana_rpc_batch import SolanaRpcBatch
 
 logger = logging.getLogger(__name__)
 
 
 class SolanaTransactionQueryClient:
     WALLET_SETUP_INSTRUCTION_TYPES = {
+        # Associated token account program instructions that emit the ones below
+        "create",
+        "createIdempotent",
         "createAccount",
         "initializeImmutableOwner",
         "initializeAccount3",
@@ -43,12 +50,16 @@ class SolanaTransactionQueryClient:
         address,
         limit: int | None = None,
         commitment: Commitment | None = None,
+        before: Signature | None = None,
+        until: Signature | None = None,
     ):
         if commitment is None:
             commitment = solana_payments_settings.RPC_COMMITMENT
         async with self.base_solana_client.http_client() as client:
             return await client.get_signatures_for_address(
                 address,
+                before=before,
+                until=until,
                 limit=limit,
                 commitment=commitment,
             )
@@ -58,12 +69,16 @@ class SolanaTransactionQueryClient:
         address,
         limit: int | None = None,
         commitment: Commitment | None = None,
+        before: Signature | None = None,
+        until: Signature | None = None,
     ):
         return self.base_solana_client.run_sync_from_async(
             self.aget_signatures_for_address,
             address,
             limit=limit,
             commitment=commitment,
+            before=before,
+            until=until,
         )
 
     async def aget_transaction(
@@ -105,35 +120,211 @@ class SolanaTransactionQueryClient:
         response = self.get_signature_statuses(signatures)
         return response.value
 
-    def get_transactions_for_address(
+    async def aget_signatures_for_address_pages(
         self,
         address: Pubkey,
-        limit: Optional[int] = 2,
+        limit: Optional[int] = None,
         commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
-    ) -> list[GetTransactionResp]:
-        tx_signatures = self.get_signatures_for_address(
-            address, limit=limit, commitment=commitment
-        ).value
-        transactions: list[GetTransactionResp] = []
-        for tx in tx_signatures:
-            try:
-                transaction = self.get_transaction(
-                    tx.signature,
+        batch: SolanaRpcBatch | None = None,
+        until: Signature | None = None,
+    ) -> list[RpcConfirmedTransactionStatusWithSignature]:
+        """
+        Returns the signatures of ``address`` newer than ``until``, newest first.
+
+        Signatures are requested in pages of SIGNATURES_PAGE_SIZE and the next page is
+        requested with ``before=`` the oldest signature of a full page, up to ``limit``
+        signatures in total. Calls queued on ``batch`` are sent with the first page.
+        """
+        page_size = solana_payments_settings.SIGNATURES_PAGE_SIZE
+        signatures: list[RpcConfirmedTransactionStatusWithSignature] = []
+        signatures_batch = batch or self.base_solana_client.batch()
+        before = None
+        while True:
+            page_limit = page_size
+            if limit is not None:
+                page_limit = min(page_size, limit - len(signatures))
+            signatures_request = signatures_batch.get_signatures_for_address(
+                address,
+                limit=page_limit,
+                commitment=commitment,
+                before=before,
+                until=until,
+            )
+            await signatures_batch.aexecute()
+            page = signatures_request.result().value
+            signatures.extend(page)
+            if len(page) < page_limit or (
+                limit is not None and len(signatures) >= limit
+            ):
+                return signatures
+
+            before = page[-1].signature
+            signatures_batch = self.base_solana_client.batch()
+
+    def get_signatures_for_address_pages(
+        self,
+        address: Pubkey,
+        limit: Optional[int] = None,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+        batch: SolanaRpcBatch | None = None,
+        until: Signature | None = None,
+    ) -> list[RpcConfirmedTransactionStatusWithSignature]:
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_signatures_for_address_pages,
+            address,
+            limit=limit,
+            commitment=commitment,
+            batch=batch,
+            until=until,
+        )
+
+    async def _aget_transactions_for_signatures(
+        self,
+        address: Pubkey,
+        signatures: list[Signature],
+        commitment: Commitment,
+    ) -> list[GetTransactionResp | None]:
+        """
+        Fetches ``signatures`` concurrently in JSON-RPC batches (see ``SolanaRpcBatch.aexecute``).
+        Failed lookups are returned as ``None``.
+        """
+        transactions_batch = self.base_solana_client.batch()
+        transaction_requests = [
+            (
+                signature,
+                transactions_batch.get_transaction(
+                    signature,
                     encoding="jsonParsed",
                     commitment=commitment,
                     max_supported_transaction_version=0,
-                )
-            except SolanaRpcException as exc:
+                ),
+            )
+            for signature in signatures
+        ]
+        try:
+            await transactions_batch.aexecute()
+        except SolanaRpcException as exc:
+            logger.warning(
+                "Skipping transaction lookups for address=%s due to RPC error: %s",
+                address,
+                exc,
+            )
+
+        transactions: list[GetTransactionResp | None] = []
+        for signature, transaction_request in transaction_requests:
+            try:
+                transactions.append(transaction_request.result())
+            except SolanaRpcException:
+                # Already logged for the whole batch request
+                transactions.append(None)
+            except RPCException as exc:
                 logger.warning(
                     "Skipping transaction lookup for address=%s signature=%s due to RPC error: %s",
                     address,
-                    tx.signature,
+                    signature,
                     exc,
                 )
-                continue
-            transactions.append(transaction)
+                transactions.append(None)
         return transactions
 
+    async def aget_transactions_for_address(
+        self,
+        address: Pubkey,
+        limit: Optional[int] = 2,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+        batch: SolanaRpcBatch | None = None,
+        until: Signature | None = None,
+    ) -> list[GetTransactionResp]:
+        """
+        Fetches the latest ``limit`` transactions of ``address`` newer than ``until`` (pass
+        ``limit=None`` for all of them) with paginated ``getSignaturesForAddress`` calls, then ``getTransaction`` for every returned
+        signature in one JSON-RPC batch request, so verifying a wallet with several transfers
+        costs one roundtrip for the lookups instead of one per transaction.
+
+        Calls queued on ``batch`` by the caller are sent in the same request as
+        ``getSignaturesForAddress``, so their results are available once this method returns.
+        """
+        tx_signatures = await self.aget_signatures_for_address_pages(
+            address, limit=limit, commitment=commitment, batch=batch, until=until
+        )
+        if not tx_signatures:
+            return []
+
+        transactions = await self._aget_transactions_for_signatures(
+            address, [tx.signature for tx in tx_signatures], commitment
+        )
+        return [transaction for transaction in transactions if transaction]
+
+    def get_transactions_for_address(
+        self,
+        address: Pubkey,
+        limit: Optional[int] = 2,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+        batch: SolanaRpcBatch | None = None,
+        until: Signature | None = None,
+    ) -> list[GetTransactionResp]:
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_transactions_for_address,
+            address,
+            limit=limit,
+            commitment=commitment,
+            batch=batch,
+            until=until,
+        )
+
+    async def aget_new_transactions_for_address(
+        self,
+        address: Pubkey,
+        cursor: SignatureCursorDTO | None = None,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+        batch: SolanaRpcBatch | None = None,
+    ) -> tuple[list[GetTransactionResp], SignatureCursorDTO | None]:
+        """
+        Fetches the transactions of ``address`` newer than ``cursor``.
+
+        Returns the transactions (newest first) and the cursor to pass on the next poll once
+        they are processed. The cursor only moves past signatures whose transaction was
+        fetched, so failed lookups are retried on the next poll. Polling an address without
+        new activity costs one ``getSignaturesForAddress`` call and no ``getTransaction`` calls.
+        """
+        tx_signatures = await self.aget_signatures_for_address_pages(
+            address,
+            limit=None,
+            commitment=commitment,
+            batch=batch,
+            until=cursor.signature if cursor else None,
+        )
+        if not tx_signatures:
+            return [], cursor
+
+        transactions = await self._aget_transactions_for_signatures(
+            address, [tx.signature for tx in tx_signatures], commitment
+        )
+
+        next_cursor = cursor
+        # Walk from the oldest signature and stop at the first failed lookup
+        for tx, transaction in zip(reversed(tx_signatures), reversed(transactions)):
+            if transaction is None:
+                break
+            next_cursor = SignatureCursorDTO(signature=tx.signature, slot=tx.slot)
+
+        return [transaction for transaction in transactions if transaction], next_cursor
+
+    def get_new_transactions_for_address(
+        self,
+        address: Pubkey,
+        cursor: SignatureCursorDTO | None = None,
+        commitment: Commitment = solana_payments_settings.RPC_COMMITMENT,
+        batch: SolanaRpcBatch | None = None,
+    ) -> tuple[list[GetTransactionResp], SignatureCursorDTO | None]:
+        return self.base_solana_client.run_sync_from_async(
+            self.aget_new_transactions_for_address,
+            address,
+            cursor=cursor,
+            commitment=commitment,
+            batch=batch,
+        )
+
     def extract_fee_payer_from_transaction_details(
         self, transaction_details
     ) -> Pubkey | None:
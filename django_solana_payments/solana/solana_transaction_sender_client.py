@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
@@ -6,15 +8,23 @@ import httpx
 import stamina
 from solana.exceptions import SolanaRpcException
 from solana.rpc.commitment import Commitment
+from solders.hash import Hash
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.signature import Signature
 from solders.solders import VersionedTransaction
+from solders.transaction_status import TransactionConfirmationStatus
 
 from django_solana_payments.settings import solana_payments_settings
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
-from django_solana_payments.solana.dtos import ConfirmTransactionDTO
+from django_solana_payments.solana.dtos import (
+    ConfirmTransactionDTO,
+    MintInfoDTO,
+    TransferDTO,
+    TransferTransactionDTO,
+)
 from django_solana_payments.solana.enums import TransactionTypeEnum
+from django_solana_payments.utils import chunked
 
 if TYPE_CHECKING:
     from django_solana_payments.solana.solana_transaction_builder import (
@@ -23,6 +33,15 @@ if TYPE_CHECKING:
 
 solana_client_logger = logging.getLogger(__name__)
 
+# getSignatureStatuses accepts at most 256 signatures per call
+MAX_SIGNATURES_PER_STATUS_REQUEST = 256
+
+COMMITMENT_CONFIRMATION_STATUSES = {
+    "processed": TransactionConfirmationStatus.Processed,
+    "confirmed": TransactionConfirmationStatus.Confirmed,
+    "finalized": TransactionConfirmationStatus.Finalized,
+}
+
 
 class SolanaTransactionSenderClient:
     def __init__(
@@ -84,6 +103,100 @@ class SolanaTransactionSenderClient:
             commitment=commitment,
         )
 
+    async def aconfirm_transactions(
+        self,
+        tx_signatures: list[Signature],
+        commitment: Commitment | None = None,
+        sleep_seconds: float = 0.5,
+        timeout: float = 90,
+    ) -> list[ConfirmTransactionDTO]:
+        """
+        Waits until all transactions reach ``commitment``. Each round polls the status of
+        all pending signatures with one batched ``getSignatureStatuses`` request.
+
+        Failed transactions and transactions not confirmed within ``timeout`` seconds are
+        returned without a ``confirmation_status``. A failed status request is retried in
+        the next round.
+        """
+        if commitment is None:
+            commitment = solana_payments_settings.RPC_COMMITMENT
+        commitment_rank = int(COMMITMENT_CONFIRMATION_STATUSES[commitment])
+
+        confirmation_statuses: dict[Signature, TransactionConfirmationStatus] = {}
+        pending_signatures = list(tx_signatures)
+        deadline = time.monotonic() + timeout
+        while pending_signatures:
+            batch = self.base_solana_client.batch()
+            status_requests = [
+                (signatures, batch.get_signature_statuses(signatures))
+                for signatures in chunked(
+                    pending_signatures, MAX_SIGNATURES_PER_STATUS_REQUEST
+                )
+            ]
+            try:
+                await batch.aexecute()
+                signature_statuses = [
+                    (signatures, status_request.result().value)
+                    for signatures, status_request in status_requests
+                ]
+            except Exception as e:
+                # The transactions are already sent, keep polling until the deadline
+                solana_client_logger.warning(
+                    f"Could not read the status of {len(pending_signatures)} transactions: {e}"
+                )
+                signature_statuses = [
+                    (signatures, [None] * len(signatures))
+                    for signatures, _ in status_requests
+                ]
+
+            pending_signatures = []
+            for signatures, statuses in signature_statuses:
+                for tx_signature, status in zip(signatures, statuses):
+                    if status is not None and status.err is not None:
+                        solana_client_logger.error(
+                            f"Transaction with signature: {tx_signature} failed: {status.err}"
+                        )
+                    elif (
+                        status is not None
+                        and status.confirmation_status is not None
+                        and int(status.confirmation_status) >= commitment_rank
+                    ):
+                        confirmation_statuses[tx_signature] = status.confirmation_status
+                    else:
+                        pending_signatures.append(tx_signature)
+
+            if not pending_signatures or time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(sleep_seconds)
+
+        for tx_signature in pending_signatures:
+            solana_client_logger.error(
+                f"Transaction with signature: {tx_signature} was not confirmed"
+            )
+
+        return [
+            ConfirmTransactionDTO(
+                tx_signature=tx_signature,
+                confirmation_status=confirmation_statuses.get(tx_signature),
+            )
+            for tx_signature in tx_signatures
+        ]
+
+    def confirm_transactions(
+        self,
+        tx_signatures: list[Signature],
+        commitment: Commitment | None = None,
+        sleep_seconds: float = 0.5,
+        timeout: float = 90,
+    ) -> list[ConfirmTransactionDTO]:
+        return self.base_solana_client.run_sync_from_async(
+            self.aconfirm_transactions,
+            tx_signatures,
+            commitment=commitment,
+            sleep_seconds=sleep_seconds,
+            timeout=timeout,
+        )
+
     @stamina.retry(
         on=(SolanaRpcException, httpx.HTTPStatusError, httpx.RequestError),
         attempts=5,
@@ -134,6 +247,230 @@ class SolanaTransactionSenderClient:
             solana_client_logger.error(f"An unexpected error occurred: {e}")
             raise
 
+    async def asend_and_confirm_transactions(
+        self,
+        transactions: list[VersionedTransaction],
+        commitment: Commitment | None = None,
+    ) -> list[ConfirmTransactionDTO | None]:
+        """
+        Sends the transactions concurrently and confirms them together. Transactions that
+        could not be sent are returned as ``None``.
+        """
+        send_results = await asyncio.gather(
+            *(
+                self.asend_transaction_with_retry(transaction)
+                for transaction in transactions
+            ),
+            return_exceptions=True,
+        )
+        sent_signatures = []
+        for send_result in send_results:
+            if isinstance(send_result, Exception):
+                solana_client_logger.warning(
+                    f"Could not send transaction: {send_result}"
+                )
+            else:
+                sent_signatures.append(send_result)
+
+        confirmations = {
+            confirmation.tx_signature: confirmation
+            for confirmation in await self.aconfirm_transactions(
+                sent_signatures, commitment=commitment
+            )
+        }
+        return [
+            None if isinstance(send_result, Exception) else confirmations[send_result]
+            for send_result in send_results
+        ]
+
+    async def asend_batched_transfer_transactions(
+        self,
+        recipient: Pubkey,
+        transfers: list[TransferDTO],
+        max_transfers_per_transaction: int | None = None,
+    ) -> list[TransferTransactionDTO]:
+        """
+        Sends the funds of many senders to ``recipient`` with as few transactions as the
+        size limit allows. Native transfers and the SPL transfers of each mint are packed
+        into separate transactions, signed by their senders and the shared fee payer, and
+        the sender token accounts listed in a transfer are closed in the same transaction.
+
+        Missing associated token accounts of ``recipient`` are created first. The
+        transactions are sent concurrently and confirmed together.
+        """
+        if self.solana_transaction_builder is None:
+            raise ValueError(
+                "solana_transaction_builder is required for transfer transactions"
+            )
+        token_client = self.solana_transaction_builder.solana_token_client
+
+        transfer_groups: dict[Pubkey | None, list[TransferDTO]] = {}
+        for transfer in transfers:
+            if transfer.transaction_type == TransactionTypeEnum.SPL:
+                if not transfer.token_mint_address:
+                    raise ValueError(
+                        "token_mint_address is required for SPL token transfers"
+                    )
+                group_key = transfer.token_mint_address
+            else:
+                group_key = None
+            transfer_groups.setdefault(group_key, []).append(transfer)
+
+        mint_infos = {}
+        failed_mints = set()
+        for mint in transfer_groups:
+            if mint is None:
+                continue
+            try:
+                mint_infos[mint] = await token_client.aget_mint_info(mint)
+            except Exception as e:
+                solana_client_logger.error(f"Could not load mint {mint}: {e}")
+                failed_mints.add(mint)
+        recipient_atas = {
+            mint: token_client.derive_associated_token_address(
+                recipient, mint, mint_info.token_program_id
+            )
+            for mint, mint_info in mint_infos.items()
+        }
+        try:
+            missing_recipient_atas = [
+                (recipient, mint)
+                for (mint, ata), ata_info in zip(
+                    recipient_atas.items(),
+                    await token_client.aget_account_infos(
+                        list(recipient_atas.values())
+                    ),
+                )
+                if ata_info is None
+            ]
+            if missing_recipient_atas:
+                for created_ata in await token_client.acreate_associated_token_accounts(
+                    missing_recipient_atas
+                ):
+                    if not created_ata.confirmed:
+                        failed_mints.update(mint for _, mint in created_ata.accounts)
+        except Exception as e:
+            solana_client_logger.error(
+                f"Could not create the token accounts of {recipient}: {e}"
+            )
+            failed_mints.update(recipient_atas)
+
+        results = []
+        packed_transactions = []
+        recent_blockhash = await token_client.aget_recent_blockhash()
+        for mint, group in transfer_groups.items():
+            if mint in failed_mints:
+                solana_client_logger.error(
+                    f"Could not prepare the transfers of {recipient} for mint {mint}"
+                )
+                results.append(TransferTransactionDTO(transfers=group))
+                continue
+
+            try:
+                packed_transactions.extend(
+                    self._pack_transfer_group(
+                        recipient,
+                        group,
+                        mint=mint,
+                        mint_info=mint_infos.get(mint),
+                        recipient_ata=recipient_atas.get(mint),
+                        recent_blockhash=recent_blockhash.blockhash,
+                        max_transfers_per_transaction=max_transfers_per_transaction,
+                    )
+                )
+            except Exception as e:
+                # Only the transfers of this group fail, the other groups are still sent
+                solana_client_logger.error(
+                    f"Could not build the transfers of mint {mint}: {e}"
+                )
+                results.append(TransferTransactionDTO(transfers=group))
+
+        confirmations = await self.asend_and_confirm_transactions(
+            [transaction for transaction, _ in packed_transactions]
+        )
+        for (_, packed_transfers), confirmation in zip(
+            packed_transactions, confirmations
+        ):
+            if confirmation is None:
+                results.append(TransferTransactionDTO(transfers=packed_transfers))
+                continue
+            solana_client_logger.info(
+                f"Transaction {confirmation.tx_signature} sent funds of "
+                f"{len(packed_transfers)} wallets to the: {str(recipient)}"
+            )
+            results.append(
+                TransferTransactionDTO(
+                    transfers=packed_transfers,
+                    tx_signature=confirmation.tx_signature,
+                    confirmation_status=confirmation.confirmation_status,
+                )
+            )
+        return results
+
+    def _pack_transfer_group(
+        self,
+        recipient: Pubkey,
+        group: list[TransferDTO],
+        mint: Pubkey | None,
+        mint_info: MintInfoDTO | None,
+        recipient_ata: Pubkey | None,
+        recent_blockhash: Hash,
+        max_transfers_per_transaction: int | None,
+    ) -> list[tuple[VersionedTransaction, list[TransferDTO]]]:
+        builder = self.solana_transaction_builder
+        token_client = builder.solana_token_client
+
+        units = []
+        for transfer in group:
+            sender = transfer.sender_keypair.pubkey()
+            if mint is None:
+                instructions = [
+                    builder.create_native_transfer_instruction(
+                        recipient, transfer.amount, sender
+                    )
+                ]
+            else:
+                instructions = [
+                    builder.create_spl_token_transfer_instruction(
+                        source=token_client.derive_associated_token_address(
+                            sender, mint, mint_info.token_program_id
+                        ),
+                        dest=recipient_ata,
+                        owner=sender,
+                        amount=transfer.amount,
+                        mint_info=mint_info,
+                    )
+                ]
+            instructions.extend(
+                builder.create_close_token_account_instruction(
+                    account, sender, token_program_id
+                )
+                for account, token_program_id in transfer.token_accounts_to_close
+            )
+            units.append((instructions, [transfer.sender_keypair]))
+
+        return [
+            (transaction, [group[index] for index in indexes])
+            for transaction, indexes in token_client.pack_transactions(
+                units,
+                recent_blockhash=recent_blockhash,
+                max_units_per_transaction=max_transfers_per_transaction,
+            )
+        ]
+
+    def send_batched_transfer_transactions(
+        self,
+        recipient: Pubkey,
+        transfers: list[TransferDTO],
+        max_transfers_per_transaction: int | None = None,
+    ) -> list[TransferTransactionDTO]:
+        return self.base_solana_client.run_sync_from_async(
+            self.asend_batched_transfer_transactions,
+            recipient,
+            transfers,
+            max_transfers_per_transaction=max_transfers_per_transaction,
+        )
+
     def send_transfer_transaction(
         self,
         recipient: Pubkey,
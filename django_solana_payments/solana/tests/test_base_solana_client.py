@@ -1,7 +1,9 @@
+import asyncio
+import threading
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
-from asgiref.sync import async_to_sync
+from asgiref.sync import async_to_sync, sync_to_async
 from solana.rpc.commitment import Confirmed
 
 from django_solana_payments.solana.base_solana_client import BaseSolanaClient
@@ -14,6 +16,7 @@ def test_http_client_uses_configured_async_client_options(settings, test_setting
         "RPC_EXTRA_HEADERS": {"x-api-key": "secret"},
         "RPC_PROXY": "http://localhost:8899",
         "RPC_RATE_LIMIT": 25,
+        "RPC_CONNECTION_POOLING": False,
     }
     fake_client = SimpleNamespace(close=AsyncMock())
 
@@ -22,24 +25,39 @@ def test_http_client_uses_configured_async_client_options(settings, test_setting
         async with client_instance.http_client() as client:
             assert client is fake_client
 
-    with patch(
-        "django_solana_payments.solana.base_solana_client.AsyncClient",
-        return_value=fake_client,
-    ) as mock_async_client:
+    with (
+        patch(
+            "django_solana_payments.solana.base_solana_client.SolanaRpcProvider"
+        ) as mock_provider,
+        patch(
+            "django_solana_payments.solana.base_solana_client.SolanaRpcAsyncClient",
+            return_value=fake_client,
+        ) as mock_async_client,
+    ):
         async_to_sync(use_client)()
 
-    mock_async_client.assert_called_once_with(
-        endpoint=test_settings["RPC_URL"],
-        commitment=Confirmed,
+    mock_provider.assert_called_once_with(
+        endpoint_pool=ANY,
+        rate_limiter=None,
+        single_flight=ANY,
         timeout=12.5,
         extra_headers={"x-api-key": "secret"},
         proxy="http://localhost:8899",
         rate_limit=25,
     )
+    endpoint_pool = mock_provider.call_args.kwargs["endpoint_pool"]
+    assert [endpoint.url for endpoint in endpoint_pool.endpoints] == [
+        test_settings["RPC_URL"]
+    ]
+    mock_async_client.assert_called_once_with(
+        provider=mock_provider.return_value,
+        commitment=Confirmed,
+    )
     fake_client.close.assert_awaited_once()
 
 
-def test_http_client_uses_custom_client_factory():
+def test_http_client_uses_custom_client_factory(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings, "RPC_CONNECTION_POOLING": False}
     fake_client = SimpleNamespace(close=AsyncMock())
 
     def client_factory():
@@ -54,7 +72,7 @@ def test_http_client_uses_custom_client_factory():
             assert client is fake_client
 
     with patch(
-        "django_solana_payments.solana.base_solana_client.AsyncClient"
+        "django_solana_payments.solana.base_solana_client.SolanaRpcAsyncClient"
     ) as mock_async_client:
         async_to_sync(use_client)()
 
@@ -71,3 +89,115 @@ def test_run_sync_from_async_executes_async_callable():
     result = client.run_sync_from_async(add_numbers, 2, 3)
 
     assert result == 5
+
+
+def test_http_client_passes_configured_pool_limits(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_MAX_CONNECTIONS": 50,
+        "RPC_MAX_KEEPALIVE_CONNECTIONS": 10,
+        "RPC_KEEPALIVE_EXPIRY": 30.0,
+    }
+
+    with patch(
+        "django_solana_payments.solana.base_solana_client.SolanaRpcProvider"
+    ) as mock_provider:
+        BaseSolanaClient()._default_client_factory()
+
+    call_kwargs = mock_provider.call_args.kwargs
+    assert call_kwargs["max_connections"] == 50
+    assert call_kwargs["max_keepalive_connections"] == 10
+    assert call_kwargs["keepalive_expiry"] == 30.0
+
+
+def test_http_client_reuses_pooled_client_on_same_event_loop():
+    fake_client = SimpleNamespace(close=AsyncMock())
+    client_factory = MagicMock(return_value=fake_client)
+    client_instance = BaseSolanaClient(
+        rpc_url="https://rpc.example.com",
+        client_factory=client_factory,
+    )
+
+    async def use_client_twice():
+        async with client_instance.http_client() as first_client:
+            pass
+        async with client_instance.http_client() as second_client:
+            pass
+        assert first_client is second_client is fake_client
+        fake_client.close.assert_not_awaited()
+
+        await client_instance.aclose()
+
+    async_to_sync(use_client_twice)()
+
+    client_factory.assert_called_once_with()
+    fake_client.close.assert_awaited_once()
+
+
+def test_run_sync_from_async_closes_client_opened_on_short_lived_loop(
+    settings, test_settings
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "RPC_SYNC_RUNNER": "async_to_sync"}
+    fake_client = SimpleNamespace(close=AsyncMock())
+    client_factory = MagicMock(return_value=fake_client)
+    client_instance = BaseSolanaClient(
+        rpc_url="https://rpc.example.com",
+        client_factory=client_factory,
+    )
+
+    async def use_client_twice():
+        async with client_instance.http_client():
+            pass
+        async with client_instance.http_client():
+            pass
+
+    client_instance.run_sync_from_async(use_client_twice)
+
+    client_factory.assert_called_once_with()
+    fake_client.close.assert_awaited_once()
+
+
+def test_run_sync_in_caller_thread_keeps_client_of_concurrent_call_on_shared_loop():
+    client_instance = BaseSolanaClient(
+        rpc_url="https://rpc.example.com",
+        client_factory=lambda: SimpleNamespace(close=AsyncMock()),
+    )
+    first_call_entered = threading.Event()
+    second_call_entered = threading.Event()
+    first_call_done = threading.Event()
+    clients = []
+
+    async def wait_for(event):
+        await asyncio.get_running_loop().run_in_executor(None, event.wait, 5)
+
+    async def first_call():
+        # Opens the loop's client and finishes while the second call still uses it
+        async with client_instance.http_client() as client:
+            clients.append(client)
+            first_call_entered.set()
+            await wait_for(second_call_entered)
+
+    async def second_call():
+        await wait_for(first_call_entered)
+        async with client_instance.http_client() as client:
+            clients.append(client)
+            second_call_entered.set()
+            await wait_for(first_call_done)
+            return client.close.await_count
+
+    def run_first_call():
+        client_instance.run_sync_in_caller_thread(first_call)
+        first_call_done.set()
+
+    async def run_on_shared_loop():
+        # Like under ASGI, both sync callers run async_to_sync on the outer event loop
+        return await asyncio.gather(
+            sync_to_async(run_first_call, thread_sensitive=False)(),
+            sync_to_async(client_instance.run_sync_in_caller_thread)(second_call),
+        )
+
+    _, close_count_while_in_use = async_to_sync(run_on_shared_loop)()
+
+    assert close_count_while_in_use == 0
+    assert clients[0] is clients[1]
+    clients[0].close.assert_awaited_once()
@@ -0,0 +1,111 @@
+import asyncio
+import contextvars
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+
+from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.event_loop_runner import BackgroundEventLoopRunner
+
+request_priority = contextvars.ContextVar("request_priority", default=None)
+
+
+@pytest.fixture
+def runner():
+    loop_runner = BackgroundEventLoopRunner(thread_name="test-rpc-loop")
+    yield loop_runner
+    loop_runner.shutdown()
+
+
+def test_run_returns_result_from_persistent_loop_thread(runner):
+    async def get_loop_and_thread():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    first_loop, first_thread_name = runner.run(get_loop_and_thread)
+    second_loop, second_thread_name = runner.run(get_loop_and_thread)
+
+    assert first_loop is second_loop
+    assert first_thread_name == second_thread_name == "test-rpc-loop"
+
+
+def test_run_propagates_exceptions(runner):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        runner.run(fail)
+
+
+def test_run_uses_caller_context_variables(runner):
+    async def read_priority():
+        return request_priority.get()
+
+    token = request_priority.set("interactive")
+    try:
+        assert runner.run(read_priority) == "interactive"
+    finally:
+        request_priority.reset(token)
+
+
+def test_run_refuses_to_block_running_event_loop(runner):
+    async def nested_call():
+        return runner.run(asyncio.sleep, 0)
+
+    with pytest.raises(RuntimeError):
+        async_to_sync(nested_call)()
+
+
+def test_shutdown_stops_loop_and_next_run_starts_new_one(runner):
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    first_loop = runner.run(get_loop)
+    runner.shutdown()
+
+    assert first_loop.is_closed()
+    assert runner.run(get_loop) is not first_loop
+
+
+@pytest.mark.parametrize(
+    "sync_runner_setting", [{}, {"RPC_SYNC_RUNNER": "background_loop"}]
+)
+def test_background_loop_runner_keeps_pooled_client_between_sync_calls(
+    settings, test_settings, sync_runner_setting
+):
+    # background_loop is the default RPC_SYNC_RUNNER
+    settings.SOLANA_PAYMENTS = {**test_settings, **sync_runner_setting}
+    fake_client = SimpleNamespace(
+        get_balance=AsyncMock(return_value="balance"), close=AsyncMock()
+    )
+    client_factory = MagicMock(return_value=fake_client)
+    base_client = BaseSolanaClient(
+        rpc_url="https://rpc.example.com", client_factory=client_factory
+    )
+
+    async def get_balance():
+        async with base_client.http_client() as client:
+            return await client.get_balance("address")
+
+    assert base_client.run_sync_from_async(get_balance) == "balance"
+    assert base_client.run_sync_from_async(get_balance) == "balance"
+
+    client_factory.assert_called_once_with()
+    fake_client.close.assert_not_awaited()
+
+    base_client.close()
+    fake_client.close.assert_awaited_once()
+
+
+def test_run_sync_from_async_rejects_unknown_sync_runner(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings, "RPC_SYNC_RUNNER": "threads"}
+    base_client = BaseSolanaClient(rpc_url="https://rpc.example.com")
+
+    async def noop():
+        return None
+
+    with pytest.raises(ImproperlyConfigured):
+        base_client.run_sync_from_async(noop)
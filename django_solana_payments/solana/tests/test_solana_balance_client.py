@@ -74,3 +74,13 @@ def test_get_spl_token_balance_by_address_uses_first_token_account_and_decimals(
     assert result == Decimal("1.234567")
     mock_get_accounts.assert_called_once()
     mock_get_token_balance.assert_called_once_with(Pubkey(token_account.__bytes__()))
+
+
+def test_get_token_account_data_balance_reads_amount_from_account_data():
+    client = SolanaBalanceClient(base_solana_client=MagicMock())
+    data = bytes(64) + (2_500_000).to_bytes(8, "little") + bytes(93)
+
+    assert client.get_token_account_data_balance(
+        SimpleNamespace(data=data), decimals=6
+    ) == Decimal("2.5")
+    assert client.get_token_account_data_balance(None, decimals=6) == Decimal("0")
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from asgiref.sync import async_to_sync
+from solders.hash import Hash
+
+from django_solana_payments.solana.dtos import BlockhashDTO
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_blockhash_cache import BlockhashCache
+from django_solana_payments.solana.solana_rpc_rate_limiter import get_rpc_priority
+
+COMMITMENT = "confirmed"
+
+
+def _blockhash(seed: int) -> BlockhashDTO:
+    return BlockhashDTO(
+        blockhash=Hash(bytes([seed] * 32)), last_valid_block_height=1000 + seed
+    )
+
+
+def _patch_monotonic(now: float):
+    # Patch the module's clock only: the event loops keep using the real one
+    return patch(
+        "django_solana_payments.solana.solana_blockhash_cache.time",
+        SimpleNamespace(monotonic=lambda: now),
+    )
+
+
+def test_fresh_blockhash_is_served_from_cache():
+    blockhash_cache = BlockhashCache(max_age=30, refresh_after=10)
+    fetch = AsyncMock(return_value=_blockhash(1))
+
+    with _patch_monotonic(100):
+        first_blockhash = async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+    with _patch_monotonic(105):
+        second_blockhash = async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+        assert blockhash_cache.get(COMMITMENT) == first_blockhash
+
+    assert first_blockhash == second_blockhash == _blockhash(1)
+    fetch.assert_awaited_once_with(COMMITMENT)
+
+
+def test_stale_blockhash_is_refreshed_in_background():
+    blockhash_cache = BlockhashCache(max_age=30, refresh_after=10)
+    priorities = []
+
+    async def fetch(commitment):
+        priorities.append(get_rpc_priority())
+        return _blockhash(len(priorities))
+
+    with _patch_monotonic(100):
+        async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+    with _patch_monotonic(115):
+        # Still valid: returned right away while the new blockhash is prefetched
+        stale_blockhash = async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+        blockhash_cache._refreshes[COMMITMENT].result(timeout=5)
+        refreshed_blockhash = async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+
+    assert stale_blockhash == _blockhash(1)
+    assert refreshed_blockhash == _blockhash(2)
+    assert priorities == [RpcPriorityEnum.INTERACTIVE, RpcPriorityEnum.BACKGROUND]
+
+
+def test_expired_blockhash_is_fetched_inline():
+    blockhash_cache = BlockhashCache(max_age=30, refresh_after=10)
+    fetch = AsyncMock(side_effect=[_blockhash(1), _blockhash(2)])
+
+    with _patch_monotonic(100):
+        async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+    with _patch_monotonic(131):
+        assert blockhash_cache.get(COMMITMENT) is None
+        blockhash = async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch)
+
+    assert blockhash == _blockhash(2)
+    assert fetch.await_count == 2
+    assert blockhash_cache._refreshes == {}
+
+
+def test_blockhash_cache_can_be_disabled_and_invalidated():
+    fetch = AsyncMock(side_effect=[_blockhash(1), _blockhash(2), _blockhash(3)])
+    disabled_cache = BlockhashCache(max_age=0)
+
+    async_to_sync(disabled_cache.aget)(COMMITMENT, fetch)
+    async_to_sync(disabled_cache.aget)(COMMITMENT, fetch)
+    assert fetch.await_count == 2
+
+    blockhash_cache = BlockhashCache(max_age=30, refresh_after=10)
+    blockhash_cache.set(COMMITMENT, _blockhash(9))
+    blockhash_cache.invalidate()
+
+    assert async_to_sync(blockhash_cache.aget)(COMMITMENT, fetch) == _blockhash(3)
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import caches
+from solders.pubkey import Pubkey
+from spl.token.constants import TOKEN_2022_PROGRAM_ID, TOKEN_PROGRAM_ID
+
+from django_solana_payments.solana.dtos import MintInfoDTO
+from django_solana_payments.solana.solana_mint_info_cache import (
+    MintInfoCache,
+    parse_mint_decimals,
+)
+
+
+def _mint_info(seed: int, decimals: int = 6) -> MintInfoDTO:
+    return MintInfoDTO(
+        mint_address=Pubkey.from_bytes(bytes([seed] * 32)),
+        token_program_id=TOKEN_PROGRAM_ID,
+        decimals=decimals,
+    )
+
+
+def test_parse_mint_decimals_reads_decimals_byte():
+    data = bytearray(82)
+    data[44] = 9
+
+    assert parse_mint_decimals(bytes(data)) == 9
+
+    with pytest.raises(ValueError):
+        parse_mint_decimals(bytes(10))
+
+
+def test_mint_info_cache_evicts_least_recently_used_mint():
+    mint_info_cache = MintInfoCache(max_size=2, ttl_seconds=60)
+    first, second, third = _mint_info(1), _mint_info(2), _mint_info(3)
+
+    mint_info_cache.set(first)
+    mint_info_cache.set(second)
+    assert mint_info_cache.get(first.mint_address) == first
+    mint_info_cache.set(third)
+
+    assert mint_info_cache.get(first.mint_address) == first
+    assert mint_info_cache.get(second.mint_address) is None
+    assert mint_info_cache.get(third.mint_address) == third
+
+
+def test_mint_info_cache_expires_entries_after_ttl():
+    mint_info_cache = MintInfoCache(max_size=10, ttl_seconds=60)
+    mint_info = _mint_info(1)
+
+    with patch(
+        "django_solana_payments.solana.solana_mint_info_cache.time",
+        SimpleNamespace(monotonic=lambda: 1_000),
+    ):
+        mint_info_cache.set(mint_info)
+
+    with patch(
+        "django_solana_payments.solana.solana_mint_info_cache.time",
+        SimpleNamespace(monotonic=lambda: 1_061),
+    ):
+        assert mint_info_cache.get(mint_info.mint_address) is None
+
+
+def test_mint_info_cache_shares_entries_through_django_cache():
+    mint_info = MintInfoDTO(
+        mint_address=Pubkey.from_bytes(bytes([7] * 32)),
+        token_program_id=TOKEN_2022_PROGRAM_ID,
+        decimals=2,
+    )
+    caches["default"].delete(f"{MintInfoCache.KEY_PREFIX}:{mint_info.mint_address}")
+    # Two instances stand in for two worker processes
+    first_worker_cache = MintInfoCache(cache_alias="default")
+    second_worker_cache = MintInfoCache(cache_alias="default")
+
+    assert second_worker_cache.get(mint_info.mint_address) is None
+    first_worker_cache.set(mint_info)
+
+    assert second_worker_cache.get(mint_info.mint_address) == mint_info
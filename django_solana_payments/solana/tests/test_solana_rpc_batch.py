@@ -0,0 +1,187 @@
+import json
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from solana.rpc.core import RPCException
+from solders.pubkey import Pubkey
+
+from django_solana_payments.solana.base_solana_client import base_solana_client
+from django_solana_payments.solana.solana_rpc_batch import SolanaRpcBatchError
+from django_solana_payments.solana.solana_rpc_instrumentation import (
+    register_rpc_call_hook,
+    unregister_rpc_call_hook,
+)
+
+
+def _balance_responder(payload):
+    return [
+        {
+            "jsonrpc": "2.0",
+            "id": call["id"],
+            "result": {"context": {"slot": 1}, "value": 1000 + call["id"]},
+        }
+        for call in payload
+    ]
+
+
+def test_batch_sends_all_calls_in_one_request(json_rpc_base_client):
+    base_client, mock_post = json_rpc_base_client(_balance_responder)
+    first_address = Pubkey.from_bytes(bytes([1] * 32))
+    second_address = Pubkey.from_bytes(bytes([2] * 32))
+
+    with base_client.batch() as batch:
+        first_request = batch.get_balance(first_address)
+        second_request = batch.get_balance(second_address)
+
+    assert first_request.result().value == 1000
+    assert second_request.result().value == 1001
+    mock_post.assert_awaited_once()
+    payload = json.loads(mock_post.await_args.args[0].to_json())
+    assert [call["id"] for call in payload] == [0, 1]
+    assert [call["params"][0] for call in payload] == [
+        str(first_address),
+        str(second_address),
+    ]
+    assert payload[0]["params"][1]["commitment"] == "confirmed"
+
+
+def test_batch_raises_rpc_error_only_for_failed_call(json_rpc_base_client):
+    def responder(payload):
+        return [
+            {"jsonrpc": "2.0", "id": 0, "result": {"context": {"slot": 1}, "value": 7}},
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32602, "message": "Invalid param"},
+            },
+        ]
+
+    base_client, _ = json_rpc_base_client(responder)
+    batch = base_client.batch()
+    ok_request = batch.get_balance(Pubkey.from_bytes(bytes([3] * 32)))
+    failed_request = batch.get_account_info(Pubkey.from_bytes(bytes([4] * 32)))
+    batch.execute()
+
+    assert ok_request.result().value == 7
+    with pytest.raises(RPCException):
+        failed_request.result()
+
+
+def test_batch_result_is_not_available_before_execute(json_rpc_base_client):
+    base_client, mock_post = json_rpc_base_client(_balance_responder)
+    batch = base_client.batch()
+    request = batch.get_balance(Pubkey.from_bytes(bytes([5] * 32)))
+
+    with pytest.raises(SolanaRpcBatchError):
+        request.result()
+    mock_post.assert_not_awaited()
+
+
+def test_batch_cannot_be_extended_after_execute(json_rpc_base_client):
+    base_client, _ = json_rpc_base_client(_balance_responder)
+    batch = base_client.batch()
+    batch.get_balance(Pubkey.from_bytes(bytes([6] * 32)))
+    batch.execute()
+
+    with pytest.raises(SolanaRpcBatchError):
+        batch.get_balance(Pubkey.from_bytes(bytes([7] * 32)))
+
+
+def test_empty_batch_does_not_send_request(json_rpc_base_client):
+    base_client, mock_post = json_rpc_base_client(_balance_responder)
+
+    with base_client.batch():
+        pass
+
+    mock_post.assert_not_awaited()
+
+
+def test_batch_rejected_as_a_whole_sets_error_on_every_call(json_rpc_base_client):
+    def responder(payload):
+        return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "x"}}
+
+    base_client, _ = json_rpc_base_client(responder)
+    batch = base_client.batch()
+    request = batch.get_balance(Pubkey.from_bytes(bytes([8] * 32)))
+
+    with pytest.raises(SolanaRpcBatchError):
+        batch.execute()
+    with pytest.raises(SolanaRpcBatchError):
+        request.result()
+
+
+def test_async_batch_context_executes_on_exit(json_rpc_base_client):
+    def responder(payload):
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": 0,
+                "result": {
+                    "context": {"slot": 1},
+                    "value": {
+                        "amount": "1500000",
+                        "decimals": 6,
+                        "uiAmount": 1.5,
+                        "uiAmountString": "1.5",
+                    },
+                },
+            }
+        ]
+
+    base_client, mock_post = json_rpc_base_client(responder)
+
+    async def run_batch():
+        async with base_client.batch() as batch:
+            request = batch.get_token_account_balance(
+                Pubkey.from_bytes(bytes([9] * 32))
+            )
+        return request
+
+    request = async_to_sync(run_batch)()
+
+    assert request.result().value.amount == "1500000"
+    mock_post.assert_awaited_once()
+
+
+def test_large_batch_is_split_into_concurrent_requests(settings, fake_solana_rpc):
+    settings.SOLANA_PAYMENTS = {
+        **settings.SOLANA_PAYMENTS,
+        "RPC_BATCH_MAX_SIZE": 2,
+        "RPC_BATCH_CONCURRENCY": 4,
+    }
+    addresses = [Pubkey.from_bytes(bytes([10 + i] * 32)) for i in range(8)]
+    for lamports, address in enumerate(addresses, start=1):
+        fake_solana_rpc.airdrop(address, lamports)
+    fake_solana_rpc.latency = 0.2
+
+    started = time.perf_counter()
+    with base_solana_client.batch() as batch:
+        requests = [batch.get_balance(address) for address in addresses]
+    elapsed = time.perf_counter() - started
+
+    assert [request.result().value for request in requests] == list(range(1, 9))
+    assert fake_solana_rpc.http_requests == 4
+    # Four sequential requests would take at least 0.8 seconds
+    assert elapsed < 0.6
+
+
+def test_batch_is_recorded_with_its_method_composition(fake_solana_rpc):
+    rpc_calls = []
+    addresses = [Pubkey.from_bytes(bytes([10 + i] * 32)) for i in range(2)]
+
+    register_rpc_call_hook(rpc_calls.append)
+    try:
+        with base_solana_client.batch() as batch:
+            for address in addresses:
+                batch.get_balance(address)
+        with base_solana_client.batch() as batch:
+            batch.get_balance(addresses[0])
+            batch.get_signatures_for_address(addresses[0], limit=2)
+    finally:
+        unregister_rpc_call_hook(rpc_calls.append)
+
+    assert [(call.method, call.batch_methods) for call in rpc_calls] == [
+        ("batch:getBalance", {"getBalance": 2}),
+        ("batch", {"getBalance": 1, "getSignaturesForAddress": 1}),
+    ]
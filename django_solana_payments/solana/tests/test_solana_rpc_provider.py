@@ -0,0 +1,332 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from solana.exceptions import SolanaRpcException
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.enums import RpcCallOutcomeEnum
+from django_solana_payments.solana.solana_rpc_endpoint_pool import (
+    RpcEndpoint,
+    RpcEndpointPool,
+    parse_rpc_endpoints,
+)
+from django_solana_payments.solana.solana_rpc_instrumentation import (
+    register_rpc_call_hook,
+    unregister_rpc_call_hook,
+)
+from django_solana_payments.solana.solana_rpc_provider import SolanaRpcAsyncClient
+from django_solana_payments.solana.solana_rpc_rate_limiter import (
+    SharedRpcRateLimiter,
+)
+
+
+class StubRpcServer:
+    """Local JSON-RPC endpoint answering every call with ``result`` after ``delay`` seconds."""
+
+    def __init__(self, status: int = 200, delay: float = 0, result=None):
+        self.status = status
+        self.delay = delay
+        self.result = result
+        self.methods: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                stub.methods.append(payload["method"])
+                time.sleep(stub.delay)
+                body = json.dumps(
+                    {"jsonrpc": "2.0", "id": payload["id"], "result": stub.result}
+                ).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+BALANCE_RESULT = {"context": {"slot": 1}, "value": 5000}
+
+
+@pytest.fixture
+def stub_rpc_server():
+    servers = []
+
+    def start(**kwargs) -> StubRpcServer:
+        server = StubRpcServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+
+
+def _get_balance(base_client: BaseSolanaClient):
+    async def get_balance():
+        async with base_client.http_client() as client:
+            return await client.get_balance(Pubkey.from_bytes(bytes([1] * 32)))
+
+    return base_client.run_sync_from_async(get_balance).value
+
+
+def test_rpc_urls_fail_over_to_next_endpoint_on_5xx(
+    settings, test_settings, stub_rpc_server
+):
+    failing = stub_rpc_server(status=503)
+    healthy = stub_rpc_server(result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [failing.url, healthy.url],
+    }
+    base_client = BaseSolanaClient()
+
+    assert _get_balance(base_client) == 5000
+    assert failing.methods == ["getBalance"]
+    assert healthy.methods == ["getBalance"]
+
+
+def test_rpc_urls_remove_timed_out_endpoint_from_rotation(
+    settings, test_settings, stub_rpc_server
+):
+    slow = stub_rpc_server(delay=1, result=BALANCE_RESULT)
+    healthy = stub_rpc_server(result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [{"url": slow.url, "weight": 2}, healthy.url],
+        "RPC_TIMEOUT": 0.2,
+        "RPC_ENDPOINT_FAILURE_THRESHOLD": 1,
+    }
+    base_client = BaseSolanaClient()
+
+    assert _get_balance(base_client) == 5000
+    assert _get_balance(base_client) == 5000
+    assert slow.methods == ["getBalance"]
+    assert healthy.methods == ["getBalance", "getBalance"]
+
+
+def test_rpc_provider_takes_rate_limit_token_for_each_attempt(
+    settings, test_settings, stub_rpc_server
+):
+    failing = stub_rpc_server(status=429)
+    healthy = stub_rpc_server(result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [failing.url, healthy.url],
+        "RPC_SHARED_RATE_LIMIT": 100,
+    }
+    base_client = BaseSolanaClient()
+
+    with patch.object(SharedRpcRateLimiter, "acquire", autospec=True) as mock_acquire:
+        assert _get_balance(base_client) == 5000
+
+    assert [call.args[1] for call in mock_acquire.await_args_list] == [
+        failing.url,
+        healthy.url,
+    ]
+
+
+def test_rpc_urls_do_not_fail_over_on_client_errors(
+    settings, test_settings, stub_rpc_server
+):
+    rejecting = stub_rpc_server(status=400)
+    healthy = stub_rpc_server(result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [rejecting.url, healthy.url],
+    }
+    base_client = BaseSolanaClient()
+
+    with pytest.raises(SolanaRpcException):
+        _get_balance(base_client)
+
+    assert rejecting.methods == ["getBalance"]
+    assert healthy.methods == []
+
+
+def test_rpc_write_urls_receive_send_transaction_requests(
+    settings, test_settings, stub_rpc_server
+):
+    signature = Signature.from_bytes(bytes([3] * 64))
+    reader = stub_rpc_server(result=BALANCE_RESULT)
+    writer = stub_rpc_server(result=str(signature))
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [reader.url],
+        "RPC_WRITE_URLS": [writer.url],
+    }
+    base_client = BaseSolanaClient()
+
+    async def send_transaction():
+        async with base_client.http_client() as client:
+            assert isinstance(client, SolanaRpcAsyncClient)
+            return await client.send_raw_transaction(b"\x01")
+
+    result = base_client.run_sync_from_async(send_transaction)
+
+    assert result.value == signature
+    assert _get_balance(base_client) == 5000
+    assert writer.methods == ["sendTransaction"]
+    assert reader.methods == ["getBalance"]
+
+
+@pytest.mark.parametrize(
+    ("coalescing_enabled", "expected_requests"), [(True, 1), (False, 3)]
+)
+def test_concurrent_identical_reads_are_coalesced(
+    settings, test_settings, stub_rpc_server, coalescing_enabled, expected_requests
+):
+    server = stub_rpc_server(delay=0.1, result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URL": server.url,
+        "RPC_REQUEST_COALESCING": coalescing_enabled,
+    }
+    base_client = BaseSolanaClient()
+    address = Pubkey.from_bytes(bytes([1] * 32))
+
+    async def get_balances():
+        async with base_client.http_client() as client:
+            return await asyncio.gather(
+                *(client.get_balance(address) for _ in range(3))
+            )
+
+    responses = base_client.run_sync_from_async(get_balances)
+
+    assert [response.value for response in responses] == [5000, 5000, 5000]
+    assert server.methods == ["getBalance"] * expected_requests
+
+
+def test_explicit_rpc_url_ignores_rpc_urls(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": ["http://127.0.0.1:1"],
+    }
+
+    pinned_pool = BaseSolanaClient(
+        rpc_url="https://rpc.example.com"
+    )._get_endpoint_pool()
+    settings_pool = BaseSolanaClient()._get_endpoint_pool()
+
+    assert [endpoint.url for endpoint in pinned_pool.endpoints] == [
+        "https://rpc.example.com"
+    ]
+    assert [endpoint.url for endpoint in settings_pool.endpoints] == [
+        "http://127.0.0.1:1"
+    ]
+
+
+@pytest.fixture
+def recorded_rpc_calls():
+    rpc_calls = []
+    register_rpc_call_hook(rpc_calls.append)
+    yield rpc_calls
+    unregister_rpc_call_hook(rpc_calls.append)
+
+
+def test_rpc_calls_are_recorded_with_outcome_and_failovers(
+    settings, test_settings, stub_rpc_server, recorded_rpc_calls
+):
+    rate_limited = stub_rpc_server(status=429)
+    healthy = stub_rpc_server(result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URLS": [rate_limited.url, healthy.url],
+        "RPC_ENDPOINT_FAILURE_THRESHOLD": 1,
+    }
+    base_client = BaseSolanaClient()
+
+    assert _get_balance(base_client) == 5000
+    with pytest.raises(SolanaRpcException):
+        _get_balance(BaseSolanaClient(rpc_url=rate_limited.url))
+
+    first_call, rate_limited_call = recorded_rpc_calls
+    assert first_call.method == "getBalance"
+    assert first_call.endpoint == healthy.url
+    assert first_call.outcome == RpcCallOutcomeEnum.OK
+    assert first_call.retries == 1
+    assert first_call.request_size > 0
+    assert first_call.response_size > 0
+    assert rate_limited_call.outcome == RpcCallOutcomeEnum.RATE_LIMITED
+    assert rate_limited_call.retries == 0
+
+
+def test_rpc_timeouts_are_recorded_as_timeout(
+    settings, test_settings, stub_rpc_server, recorded_rpc_calls
+):
+    slow = stub_rpc_server(delay=1, result=BALANCE_RESULT)
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_URL": slow.url,
+        "RPC_TIMEOUT": 0.2,
+    }
+
+    with pytest.raises(SolanaRpcException):
+        _get_balance(BaseSolanaClient())
+
+    assert [call.outcome for call in recorded_rpc_calls] == [RpcCallOutcomeEnum.TIMEOUT]
+
+
+def test_endpoint_pool_orders_endpoints_by_weighted_latency():
+    fast, slow, preferred = parse_rpc_endpoints(
+        ["https://fast", "https://slow", {"url": "https://preferred", "weight": 4}]
+    )
+    pool = RpcEndpointPool(endpoints=[fast, slow, preferred])
+
+    pool.record_success(fast, latency=0.1)
+    pool.record_success(slow, latency=0.5)
+    pool.record_success(preferred, latency=0.3)
+
+    assert pool.get_endpoints() == [preferred, fast, slow]
+
+
+def test_endpoint_pool_probes_endpoint_after_cooldown():
+    flaky = RpcEndpoint(url="https://flaky")
+    stable = RpcEndpoint(url="https://stable")
+    pool = RpcEndpointPool(
+        endpoints=[flaky, stable], failure_threshold=2, cooldown_seconds=60
+    )
+    pool.record_success(stable, latency=0.2)
+
+    pool.record_failure(flaky)
+    pool.record_failure(flaky)
+
+    assert pool.get_endpoints() == [stable, flaky]
+
+    flaky.open_until = time.monotonic() - 1
+
+    assert pool.get_endpoints() == [flaky, stable]
+    # A failed probe takes the endpoint out of rotation again right away
+    pool.record_failure(flaky)
+    assert flaky.is_open(time.monotonic())
+
+
+def test_endpoint_pool_uses_write_endpoints_for_writes():
+    reader = RpcEndpoint(url="https://reader")
+    writer = RpcEndpoint(url="https://writer")
+    pool = RpcEndpointPool(endpoints=[reader], write_endpoints=[writer])
+
+    assert pool.get_endpoints() == [reader]
+    assert pool.get_endpoints(write=True) == [writer]
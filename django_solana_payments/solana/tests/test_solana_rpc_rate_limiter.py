@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import (
+    SharedRpcRateLimiter,
+    get_rpc_priority,
+    rpc_priority,
+)
+
+ENDPOINT_URL = "https://rpc.example.com/?api-key=secret"
+
+
+class FakeClock:
+    """Wall clock that only moves when the limiter sleeps."""
+
+    def __init__(self, now: float = 1_000.25):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_clock():
+    clock = FakeClock()
+    with (
+        patch(
+            "django_solana_payments.solana.solana_rpc_rate_limiter.time",
+            SimpleNamespace(time=clock.time),
+        ),
+        patch(
+            "django_solana_payments.solana.solana_rpc_rate_limiter.asyncio",
+            SimpleNamespace(sleep=clock.sleep),
+        ),
+    ):
+        yield clock
+
+
+@pytest.fixture
+def build_rate_limiter(request):
+    key_prefix = f"test-rpc-rate-limit:{request.node.name}"
+
+    def build(**kwargs) -> SharedRpcRateLimiter:
+        return SharedRpcRateLimiter(key_prefix=key_prefix, **kwargs)
+
+    return build
+
+
+def test_window_limit_reserves_budget_for_interactive_calls(build_rate_limiter):
+    rate_limiter = build_rate_limiter(rate_limit=10, background_share=0.3)
+
+    assert rate_limiter.get_window_limit(RpcPriorityEnum.INTERACTIVE) == 10
+    assert rate_limiter.get_window_limit(RpcPriorityEnum.BACKGROUND) == 3
+
+
+def test_acquire_waits_for_next_window_when_budget_is_shared_and_used(
+    build_rate_limiter, fake_clock
+):
+    # Two limiters on the same cache stand in for two worker processes
+    first_worker = build_rate_limiter(rate_limit=2)
+    second_worker = build_rate_limiter(rate_limit=2)
+
+    async def acquire_three():
+        await first_worker.acquire(ENDPOINT_URL)
+        await second_worker.acquire(ENDPOINT_URL)
+        await first_worker.acquire(ENDPOINT_URL)
+
+    async_to_sync(acquire_three)()
+
+    assert len(fake_clock.sleeps) == 1
+    assert 0.75 <= fake_clock.sleeps[0] <= 0.8
+
+
+def test_background_calls_wait_while_interactive_calls_proceed(
+    build_rate_limiter, fake_clock
+):
+    rate_limiter = build_rate_limiter(rate_limit=4, background_share=0.5)
+
+    async def acquire_calls():
+        await rate_limiter.acquire(ENDPOINT_URL, RpcPriorityEnum.BACKGROUND)
+        await rate_limiter.acquire(ENDPOINT_URL, RpcPriorityEnum.BACKGROUND)
+        await rate_limiter.acquire(ENDPOINT_URL, RpcPriorityEnum.INTERACTIVE)
+        await rate_limiter.acquire(ENDPOINT_URL, RpcPriorityEnum.INTERACTIVE)
+        interactive_sleeps = len(fake_clock.sleeps)
+        await rate_limiter.acquire(ENDPOINT_URL, RpcPriorityEnum.BACKGROUND)
+        return interactive_sleeps
+
+    interactive_sleeps = async_to_sync(acquire_calls)()
+
+    assert interactive_sleeps == 0
+    assert len(fake_clock.sleeps) == 1
+
+
+def test_build_key_does_not_contain_endpoint_url(build_rate_limiter):
+    rate_limiter = build_rate_limiter(rate_limit=1)
+
+    assert "secret" not in rate_limiter._build_key(ENDPOINT_URL, window=1)
+
+
+def test_rpc_priority_is_visible_inside_sync_wrapped_calls():
+    base_client = BaseSolanaClient(rpc_url="https://rpc.example.com")
+
+    async def read_priority():
+        return get_rpc_priority()
+
+    with rpc_priority(RpcPriorityEnum.BACKGROUND):
+        background_priority = base_client.run_sync_from_async(read_priority)
+
+    assert background_priority == RpcPriorityEnum.BACKGROUND
+    assert base_client.run_sync_from_async(read_priority) == (
+        RpcPriorityEnum.INTERACTIVE
+    )
+
+
+def test_base_client_builds_rate_limiter_from_settings(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings}
+    base_client = BaseSolanaClient()
+
+    assert base_client._get_rate_limiter() is None
+
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "RPC_SHARED_RATE_LIMIT": 40,
+        "RPC_SHARED_RATE_LIMIT_BACKGROUND_SHARE": 0.25,
+    }
+    rate_limiter = base_client._get_rate_limiter()
+
+    assert rate_limiter.rate_limit == 40
+    assert rate_limiter.get_window_limit(RpcPriorityEnum.BACKGROUND) == 10
+    assert base_client._get_rate_limiter() is rate_limiter
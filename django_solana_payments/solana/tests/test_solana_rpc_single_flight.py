@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django_solana_payments.solana.solana_rpc_single_flight import RpcSingleFlight
+
+
+def test_concurrent_identical_reads_share_one_request():
+    single_flight = RpcSingleFlight()
+    sent_requests = []
+
+    async def send_request():
+        sent_requests.append("getBalance")
+        await asyncio.sleep(0.01)
+        return "response"
+
+    async def read_concurrently():
+        return await asyncio.gather(
+            *(
+                single_flight.do("balance-key", "getBalance", send_request)
+                for _ in range(3)
+            )
+        )
+
+    results = async_to_sync(read_concurrently)()
+
+    assert results == ["response", "response", "response"]
+    assert sent_requests == ["getBalance"]
+    stats = single_flight.get_stats()
+    assert stats["getBalance"].requests == 3
+    assert stats["getBalance"].coalesced == 2
+    assert stats["total"].hit_rate == pytest.approx(2 / 3)
+
+
+def test_different_keys_and_finished_requests_are_not_coalesced():
+    single_flight = RpcSingleFlight()
+    sent_keys = []
+
+    def build_send_request(key):
+        async def send_request():
+            sent_keys.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        return send_request
+
+    async def read():
+        await asyncio.gather(
+            single_flight.do("first", "getBalance", build_send_request("first")),
+            single_flight.do("second", "getBalance", build_send_request("second")),
+        )
+        await single_flight.do("first", "getBalance", build_send_request("first"))
+
+    async_to_sync(read)()
+
+    assert sent_keys == ["first", "second", "first"]
+    assert single_flight.get_stats()["total"].coalesced == 0
+
+
+def test_followers_receive_leader_error():
+    single_flight = RpcSingleFlight()
+
+    async def send_request():
+        await asyncio.sleep(0.01)
+        raise ValueError("rpc failed")
+
+    async def read_concurrently():
+        return await asyncio.gather(
+            single_flight.do("key", "getBalance", send_request),
+            single_flight.do("key", "getBalance", send_request),
+            return_exceptions=True,
+        )
+
+    results = async_to_sync(read_concurrently)()
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert single_flight.get_stats()["total"].coalesced == 1
+
+
+def test_reads_from_another_event_loop_thread_are_coalesced():
+    single_flight = RpcSingleFlight()
+    request_started = threading.Event()
+    release_request = threading.Event()
+    sent_requests = []
+    leader_result = []
+
+    async def send_request():
+        sent_requests.append("getSignaturesForAddress")
+        request_started.set()
+        while not release_request.is_set():
+            await asyncio.sleep(0.005)
+        return "signatures"
+
+    def lead():
+        leader_result.append(
+            asyncio.run(
+                single_flight.do("key", "getSignaturesForAddress", send_request)
+            )
+        )
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    assert request_started.wait(timeout=5)
+
+    async def follow():
+        follower = asyncio.ensure_future(
+            single_flight.do("key", "getSignaturesForAddress", send_request)
+        )
+        await asyncio.sleep(0.01)
+        release_request.set()
+        return await follower
+
+    follower_result = asyncio.run(follow())
+    leader.join(timeout=5)
+
+    assert follower_result == leader_result[0] == "signatures"
+    assert sent_requests == ["getSignaturesForAddress"]
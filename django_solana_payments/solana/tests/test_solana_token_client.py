@@ -1,6 +1,9 @@
+import base64
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from asgiref.sync import async_to_sync
 from solders.hash import Hash
 from solders.keypair import Keypair
@@ -8,6 +11,9 @@ from solders.pubkey import Pubkey
 from solders.signature import Signature
 from spl.token.constants import TOKEN_PROGRAM_ID
 
+from django_solana_payments.solana.base_solana_client import BaseSolanaClient
+from django_solana_payments.solana.dtos import BlockhashDTO, MintInfoDTO
+from django_solana_payments.solana.solana_blockhash_cache import BlockhashCache
 from django_solana_payments.solana.solana_token_client import SolanaTokenClient
 
 
@@ -22,11 +28,17 @@ def make_latest_blockhash(blockhash: bytes | None = None):
         hb = Hash(blockhash)
     else:
         hb = Hash(bytes(str(blockhash), "utf-8").ljust(32, b"\0")[:32])
-    return make_rpc_resp(SimpleNamespace(blockhash=hb))
+    return make_rpc_resp(SimpleNamespace(blockhash=hb, last_valid_block_height=1000))
 
 
-def make_account_info(owner_pubkey: Pubkey):
-    return make_rpc_resp(SimpleNamespace(owner=owner_pubkey))
+def make_account_info(owner_pubkey: Pubkey, data: bytes = b""):
+    return make_rpc_resp(SimpleNamespace(owner=owner_pubkey, data=data))
+
+
+def make_mint_account_data(decimals: int) -> bytes:
+    data = bytearray(82)
+    data[44] = decimals
+    return bytes(data)
 
 
 def make_send_tx_response(sig_bytes=None):
@@ -54,13 +66,18 @@ def test_create_associated_token_addresses_for_mints_calls_send_and_confirm():
     with (
         patch.object(
             client,
-            "get_latest_blockhash",
-            return_value=make_latest_blockhash("HB1"),
+            "get_recent_blockhash",
+            return_value=BlockhashDTO(
+                blockhash=make_latest_blockhash("HB1").value.blockhash,
+                last_valid_block_height=1000,
+            ),
         ),
         patch.object(
             client,
-            "get_account_info",
-            return_value=make_account_info(owner_pubkey=TOKEN_PROGRAM_ID),
+            "get_mint_info",
+            return_value=MintInfoDTO(
+                mint_address=mints[0], token_program_id=TOKEN_PROGRAM_ID, decimals=6
+            ),
         ),
         patch(
             "django_solana_payments.solana.solana_token_client.MessageV0.try_compile",
@@ -101,6 +118,8 @@ def test_close_associated_token_accounts_and_recover_rent_sends_transaction():
     real_fee_payer = Keypair()
     fake_base.BASE_SENDER_KEYPAIR = real_fee_payer
 
+    fake_base.blockhash_cache = BlockhashCache(max_age=30, refresh_after=10)
+
     dummy_owner = Keypair()
 
     account_to_close = Pubkey.from_bytes(bytes([5] * 32))
@@ -149,3 +168,98 @@ def test_close_associated_token_accounts_and_recover_rent_sends_transaction():
         "versioned_tx"
     )
     client.solana_transaction_sender_client.aconfirm_transaction.assert_called()
+
+
+def test_get_mint_info_reads_mint_account_once_and_caches_it():
+    mint = Pubkey.from_bytes(bytes([2] * 32))
+    client = SolanaTokenClient(
+        base_solana_client=BaseSolanaClient(rpc_url="https://rpc.example.com")
+    )
+    mock_get_account_info = AsyncMock(
+        return_value=make_account_info(
+            owner_pubkey=TOKEN_PROGRAM_ID, data=make_mint_account_data(6)
+        )
+    )
+
+    with patch.object(client, "aget_account_info", mock_get_account_info):
+        first_mint_info = client.get_mint_info(mint)
+        second_mint_info = client.get_mint_info(mint)
+
+    assert first_mint_info == MintInfoDTO(
+        mint_address=mint, token_program_id=TOKEN_PROGRAM_ID, decimals=6
+    )
+    assert second_mint_info == first_mint_info
+    mock_get_account_info.assert_awaited_once()
+
+
+def test_get_mint_info_raises_when_mint_does_not_exist():
+    client = SolanaTokenClient(
+        base_solana_client=BaseSolanaClient(rpc_url="https://rpc.example.com")
+    )
+
+    with (
+        patch.object(
+            client, "aget_account_info", AsyncMock(return_value=make_rpc_resp(None))
+        ),
+        pytest.raises(ValueError, match="does not exist"),
+    ):
+        client.get_mint_info(Pubkey.from_bytes(bytes([4] * 32)))
+
+
+def test_warm_mint_info_cache_loads_missing_mints_in_one_batch(json_rpc_base_client):
+    existing_mint = Pubkey.from_bytes(bytes([5] * 32))
+    missing_mint = Pubkey.from_bytes(bytes([6] * 32))
+    encoded_mint_data = base64.b64encode(make_mint_account_data(9)).decode()
+
+    def responder(payload):
+        responses = []
+        for call in payload:
+            value = None
+            if call["params"][0] == str(existing_mint):
+                value = {
+                    "data": [encoded_mint_data, "base64"],
+                    "executable": False,
+                    "lamports": 1461600,
+                    "owner": str(TOKEN_PROGRAM_ID),
+                    "rentEpoch": 0,
+                    "space": 82,
+                }
+            responses.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": call["id"],
+                    "result": {"context": {"slot": 1}, "value": value},
+                }
+            )
+        return responses
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTokenClient(base_solana_client=base_client)
+
+    warmed_mints = client.warm_mint_info_cache([existing_mint, missing_mint])
+
+    assert warmed_mints == 1
+    mock_post.assert_awaited_once()
+    assert [
+        call["method"] for call in json.loads(mock_post.await_args.args[0].to_json())
+    ] == ["getAccountInfo", "getAccountInfo"]
+    assert base_client.mint_info_cache.get(existing_mint).decimals == 9
+    assert base_client.mint_info_cache.get(missing_mint) is None
+
+
+def test_get_recent_blockhash_reuses_cached_blockhash_for_new_transactions():
+    client = SolanaTokenClient(
+        base_solana_client=BaseSolanaClient(rpc_url="https://rpc.example.com")
+    )
+    mock_get_latest_blockhash = AsyncMock(return_value=make_latest_blockhash("HB3"))
+
+    with patch.object(client, "aget_latest_blockhash", mock_get_latest_blockhash):
+        first_blockhash = client.get_recent_blockhash()
+        second_blockhash = client.get_recent_blockhash()
+
+    assert first_blockhash == BlockhashDTO(
+        blockhash=make_latest_blockhash("HB3").value.blockhash,
+        last_valid_block_height=1000,
+    )
+    assert second_blockhash == first_blockhash
+    mock_get_latest_blockhash.assert_awaited_once()
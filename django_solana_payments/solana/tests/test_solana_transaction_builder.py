@@ -1,19 +1,20 @@
 from decimal import Decimal
-from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 from solders.hash import Hash
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
+from spl.token.constants import TOKEN_PROGRAM_ID
 
+from django_solana_payments.solana.dtos import BlockhashDTO, MintInfoDTO
 from django_solana_payments.solana.solana_transaction_builder import (
     SolanaTransactionBuilder,
 )
 
 
-def _latest_blockhash_response() -> SimpleNamespace:
-    return SimpleNamespace(value=SimpleNamespace(blockhash=Hash(bytes([8] * 32))))
+def _recent_blockhash() -> BlockhashDTO:
+    return BlockhashDTO(blockhash=Hash(bytes([8] * 32)), last_valid_block_height=1000)
 
 
 def test_calculate_spl_transaction_amount():
@@ -30,7 +31,7 @@ def test_create_native_transaction_builds_message_and_transaction():
     fake_base.LAMPORTS_PER_SOL = 1_000_000_000
     fake_base.BASE_SENDER_KEYPAIR = Keypair()
     fake_token_client = MagicMock()
-    fake_token_client.get_latest_blockhash.return_value = _latest_blockhash_response()
+    fake_token_client.get_recent_blockhash.return_value = _recent_blockhash()
 
     sender_keypair = Keypair()
     recipient = Pubkey.from_bytes(bytes([4] * 32))
@@ -75,7 +76,7 @@ def test_create_native_transaction_builds_message_and_transaction():
         payer=fake_base.BASE_SENDER_KEYPAIR.pubkey(),
         instructions=["transfer_ix"],
         address_lookup_table_accounts=[],
-        recent_blockhash=fake_token_client.get_latest_blockhash.return_value.value.blockhash,
+        recent_blockhash=fake_token_client.get_recent_blockhash.return_value.blockhash,
     )
     mock_versioned_transaction.assert_called_once_with(
         "message_obj",
@@ -90,17 +91,13 @@ def test_create_spl_token_transaction_builds_instruction_and_transaction():
 
     token_program_id = Pubkey.from_bytes(bytes([1] * 32))
     fake_token_client = MagicMock()
-    fake_token_client.get_latest_blockhash.return_value = _latest_blockhash_response()
-    fake_token_client.get_account_info.return_value = SimpleNamespace(
-        value=SimpleNamespace(owner=token_program_id)
-    )
-    fake_token_client.get_token_supply.return_value = SimpleNamespace(
-        value=SimpleNamespace(decimals=6)
-    )
-
+    fake_token_client.get_recent_blockhash.return_value = _recent_blockhash()
     sender_keypair = Keypair()
     recipient = Pubkey.from_bytes(bytes([2] * 32))
     token_mint = Pubkey.from_bytes(bytes([3] * 32))
+    fake_token_client.get_mint_info.return_value = MintInfoDTO(
+        mint_address=token_mint, token_program_id=token_program_id, decimals=6
+    )
     sender_ata = Pubkey.from_bytes(bytes([5] * 32))
     recipient_ata = Pubkey.from_bytes(bytes([6] * 32))
     fake_token_client.get_or_create_associated_token_address.side_effect = [
@@ -157,7 +154,7 @@ def test_create_spl_token_transaction_builds_instruction_and_transaction():
         payer=fake_base.BASE_SENDER_KEYPAIR.pubkey(),
         instructions=["spl_ix"],
         address_lookup_table_accounts=[],
-        recent_blockhash=fake_token_client.get_latest_blockhash.return_value.value.blockhash,
+        recent_blockhash=fake_token_client.get_recent_blockhash.return_value.blockhash,
     )
     mock_versioned_transaction.assert_called_once_with(
         "message_obj",
@@ -171,7 +168,9 @@ def test_create_spl_token_transaction_raises_when_mint_not_found():
     fake_base.BASE_SENDER_KEYPAIR = Keypair()
 
     fake_token_client = MagicMock()
-    fake_token_client.get_account_info.return_value = SimpleNamespace(value=None)
+    fake_token_client.get_mint_info.side_effect = ValueError(
+        "Mint account does not exist"
+    )
     fake_token_client.get_or_create_associated_token_address.side_effect = [
         Pubkey.from_bytes(bytes([5] * 32)),
         Pubkey.from_bytes(bytes([6] * 32)),
@@ -195,3 +194,41 @@ def test_create_spl_token_transaction_raises_when_mint_not_found():
         )
 
     fake_token_client.get_token_supply.assert_not_called()
+
+
+def test_create_spl_token_transaction_uses_mint_info_instead_of_mint_rpc_calls():
+    fake_base = MagicMock()
+    fake_base.BASE_SENDER_KEYPAIR = Keypair()
+    token_mint = Pubkey.from_bytes(bytes([3] * 32))
+    fake_token_client = MagicMock()
+    fake_token_client.get_recent_blockhash.return_value = _recent_blockhash()
+    fake_token_client.get_mint_info.return_value = MintInfoDTO(
+        mint_address=token_mint, token_program_id=TOKEN_PROGRAM_ID, decimals=9
+    )
+    fake_token_client.get_or_create_associated_token_address.side_effect = [
+        Pubkey.from_bytes(bytes([5] * 32)),
+        Pubkey.from_bytes(bytes([6] * 32)),
+    ]
+    builder = SolanaTransactionBuilder(
+        base_solana_client=fake_base,
+        solana_token_client=fake_token_client,
+    )
+
+    with (
+        patch(
+            "django_solana_payments.solana.solana_transaction_builder.MessageV0.try_compile"
+        ),
+        patch(
+            "django_solana_payments.solana.solana_transaction_builder.VersionedTransaction"
+        ),
+    ):
+        builder.create_spl_token_transaction(
+            recipient=Pubkey.from_bytes(bytes([2] * 32)),
+            amount=Decimal("1"),
+            sender_keypair=Keypair(),
+            token_mint_address=token_mint,
+        )
+
+    fake_token_client.get_mint_info.assert_called_once_with(token_mint)
+    fake_token_client.get_account_info.assert_not_called()
+    fake_token_client.get_token_supply.assert_not_called()
@@ -1,3 +1,4 @@
+import json
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -5,6 +6,7 @@ from solana.exceptions import SolanaRpcException
 from solders.pubkey import Pubkey
 from solders.signature import Signature
 
+from django_solana_payments.solana.dtos import SignatureCursorDTO
 from django_solana_payments.solana.solana_transaction_query_client import (
     SolanaTransactionQueryClient,
 )
@@ -40,6 +42,20 @@ def test_is_one_time_wallet_setup_transaction_returns_true_for_setup_only_transa
     assert result is True
 
 
+def test_is_one_time_wallet_setup_transaction_returns_true_for_ata_creation():
+    client = SolanaTransactionQueryClient(base_solana_client=MagicMock())
+    transaction_details = _build_transaction_details(
+        "createIdempotent",
+        "createAccount",
+        "initializeImmutableOwner",
+        "initializeAccount3",
+    )
+
+    result = client.is_one_time_wallet_setup_transaction(transaction_details)
+
+    assert result is True
+
+
 def test_is_one_time_wallet_setup_transaction_returns_false_for_setup_plus_transfer():
     client = SolanaTransactionQueryClient(base_solana_client=MagicMock())
     transaction_details = _build_transaction_details(
@@ -53,85 +69,277 @@ def test_is_one_time_wallet_setup_transaction_returns_false_for_setup_plus_trans
     assert result is False
 
 
-def test_get_transactions_for_address_returns_transactions_for_valid_signatures():
-    fake_base = MagicMock()
+def _signature_entry(signature: Signature) -> dict:
+    return {
+        "signature": str(signature),
+        "slot": 1,
+        "err": None,
+        "memo": None,
+        "blockTime": None,
+        "confirmationStatus": "finalized",
+    }
+
+
+def test_get_transactions_for_address_fetches_transactions_in_one_batch(
+    json_rpc_base_client,
+):
     address = Pubkey.from_bytes(bytes([1] * 32))
     signature_one = Signature.from_bytes(bytes([2] * 64))
     signature_two = Signature.from_bytes(bytes([3] * 64))
-    transaction_one = MagicMock()
-    transaction_two = MagicMock()
-
-    client = SolanaTransactionQueryClient(base_solana_client=fake_base)
-
-    with (
-        patch.object(
-            client,
-            "get_signatures_for_address",
-            return_value=SimpleNamespace(
-                value=[
-                    SimpleNamespace(signature=signature_one),
-                    SimpleNamespace(signature=signature_two),
-                ]
-            ),
-        ) as mock_get_signatures,
-        patch.object(
-            client,
-            "get_transaction",
-            side_effect=[transaction_one, transaction_two],
-        ) as mock_get_transaction,
-    ):
-        result = client.get_transactions_for_address(address=address, limit=2)
-
-    assert result == [transaction_one, transaction_two]
-    mock_get_signatures.assert_called_once()
-    mock_get_transaction.assert_any_call(
-        signature_one,
-        encoding="jsonParsed",
-        commitment="confirmed",
-        max_supported_transaction_version=0,
-    )
-    mock_get_transaction.assert_any_call(
-        signature_two,
-        encoding="jsonParsed",
-        commitment="confirmed",
-        max_supported_transaction_version=0,
-    )
 
+    def responder(payload):
+        if payload[0]["method"] == "getSignaturesForAddress":
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload[0]["id"],
+                    "result": [
+                        _signature_entry(signature_one),
+                        _signature_entry(signature_two),
+                    ],
+                }
+            ]
+        # Answer out of order: results are matched back by JSON-RPC id
+        return [
+            {"jsonrpc": "2.0", "id": call["id"], "result": None}
+            for call in reversed(payload)
+        ]
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
 
-def test_get_transactions_for_address_skips_signatures_with_rpc_errors():
-    fake_base = MagicMock()
+    result = client.get_transactions_for_address(address=address, limit=2)
+
+    assert len(result) == 2
+    assert mock_post.await_count == 2
+    signatures_payload = json.loads(mock_post.await_args_list[0].args[0].to_json())
+    assert signatures_payload[0]["params"][0] == str(address)
+    assert signatures_payload[0]["params"][1]["limit"] == 2
+    transactions_payload = json.loads(mock_post.await_args_list[1].args[0].to_json())
+    assert [call["method"] for call in transactions_payload] == [
+        "getTransaction",
+        "getTransaction",
+    ]
+    assert [call["params"][0] for call in transactions_payload] == [
+        str(signature_one),
+        str(signature_two),
+    ]
+    assert transactions_payload[0]["params"][1]["encoding"] == "jsonParsed"
+    assert transactions_payload[0]["params"][1]["maxSupportedTransactionVersion"] == 0
+
+
+def test_get_transactions_for_address_skips_signatures_with_rpc_errors(
+    json_rpc_base_client,
+):
     address = Pubkey.from_bytes(bytes([4] * 32))
     signature_one = Signature.from_bytes(bytes([5] * 64))
     signature_two = Signature.from_bytes(bytes([6] * 64))
-    transaction_two = MagicMock()
-
-    client = SolanaTransactionQueryClient(base_solana_client=fake_base)
-
-    with (
-        patch.object(
-            client,
-            "get_signatures_for_address",
-            return_value=SimpleNamespace(
-                value=[
-                    SimpleNamespace(signature=signature_one),
-                    SimpleNamespace(signature=signature_two),
-                ]
-            ),
-        ),
-        patch.object(
-            client,
-            "get_transaction",
-            side_effect=[
-                SolanaRpcException(
-                    Exception("boom"),
-                    lambda *_args, **_kwargs: None,
-                    None,
-                    SimpleNamespace(),
-                ),
-                transaction_two,
-            ],
-        ),
-    ):
-        result = client.get_transactions_for_address(address=address, limit=2)
 
-    assert result == [transaction_two]
+    def responder(payload):
+        if payload[0]["method"] == "getSignaturesForAddress":
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload[0]["id"],
+                    "result": [
+                        _signature_entry(signature_one),
+                        _signature_entry(signature_two),
+                    ],
+                }
+            ]
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": payload[0]["id"],
+                "error": {"code": -32602, "message": "boom"},
+            },
+            {"jsonrpc": "2.0", "id": payload[1]["id"], "result": None},
+        ]
+
+    base_client, _ = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    result = client.get_transactions_for_address(address=address, limit=2)
+
+    assert len(result) == 1
+
+
+def test_get_transactions_for_address_returns_empty_list_when_batch_transport_fails(
+    json_rpc_base_client,
+):
+    address = Pubkey.from_bytes(bytes([7] * 32))
+
+    def responder(payload):
+        if payload[0]["method"] == "getSignaturesForAddress":
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload[0]["id"],
+                    "result": [_signature_entry(Signature.from_bytes(bytes([8] * 64)))],
+                }
+            ]
+        raise SolanaRpcException(
+            Exception("boom"),
+            lambda *_args, **_kwargs: None,
+            None,
+            SimpleNamespace(),
+        )
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    result = client.get_transactions_for_address(address=address, limit=2)
+
+    assert result == []
+    assert mock_post.await_count == 2
+
+
+def test_get_transactions_for_address_sends_caller_calls_with_signatures_lookup(
+    json_rpc_base_client,
+):
+    address = Pubkey.from_bytes(bytes([9] * 32))
+
+    def responder(payload):
+        responses = []
+        for call in payload:
+            if call["method"] == "getBalance":
+                result = {"context": {"slot": 1}, "value": 5000}
+            else:
+                result = []
+            responses.append({"jsonrpc": "2.0", "id": call["id"], "result": result})
+        return responses
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+    batch = base_client.batch()
+    balance_request = batch.get_balance(address)
+
+    result = client.get_transactions_for_address(address=address, batch=batch)
+
+    assert result == []
+    assert balance_request.result().value == 5000
+    mock_post.assert_awaited_once()
+
+
+def test_get_transactions_for_address_defaults_to_two_latest_signatures(
+    json_rpc_base_client,
+):
+    address = Pubkey.from_bytes(bytes([40] * 32))
+
+    def responder(payload):
+        return [{"jsonrpc": "2.0", "id": call["id"], "result": []} for call in payload]
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    assert client.get_transactions_for_address(address=address) == []
+    config = json.loads(mock_post.await_args.args[0].to_json())[0]["params"][1]
+    assert config["limit"] == 2
+
+
+def test_get_transactions_for_address_paginates_with_before(
+    settings, test_settings, json_rpc_base_client
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "SIGNATURES_PAGE_SIZE": 2}
+    address = Pubkey.from_bytes(bytes([10] * 32))
+    until = Signature.from_bytes(bytes([11] * 64))
+    signatures = [Signature.from_bytes(bytes([12 + i] * 64)) for i in range(3)]
+    pages = [signatures[:2], signatures[2:]]
+
+    def responder(payload):
+        responses = []
+        for call in payload:
+            if call["method"] == "getSignaturesForAddress":
+                result = [_signature_entry(signature) for signature in pages.pop(0)]
+            else:
+                result = None
+            responses.append({"jsonrpc": "2.0", "id": call["id"], "result": result})
+        return responses
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    result = client.get_transactions_for_address(
+        address=address, limit=None, until=until
+    )
+
+    assert len(result) == 3
+    page_configs = [
+        json.loads(call.args[0].to_json())[0]["params"][1]
+        for call in mock_post.await_args_list[:2]
+    ]
+    assert [config.get("before") for config in page_configs] == [
+        None,
+        str(signatures[1]),
+    ]
+    assert {config["until"] for config in page_configs} == {str(until)}
+    assert {config["limit"] for config in page_configs} == {2}
+
+
+def test_get_new_transactions_for_address_keeps_cursor_before_failed_lookup(
+    json_rpc_base_client,
+):
+    address = Pubkey.from_bytes(bytes([20] * 32))
+    newest, failed, oldest = (
+        Signature.from_bytes(bytes([21 + i] * 64)) for i in range(3)
+    )
+
+    def responder(payload):
+        if payload[0]["method"] == "getSignaturesForAddress":
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": payload[0]["id"],
+                    "result": [
+                        {**_signature_entry(signature), "slot": slot}
+                        for signature, slot in ((newest, 3), (failed, 2), (oldest, 1))
+                    ],
+                }
+            ]
+        return [
+            (
+                {
+                    "jsonrpc": "2.0",
+                    "id": call["id"],
+                    "error": {"code": -32602, "message": "boom"},
+                }
+                if call["params"][0] == str(failed)
+                else {"jsonrpc": "2.0", "id": call["id"], "result": None}
+            )
+            for call in payload
+        ]
+
+    base_client, _ = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    transactions, cursor = client.get_new_transactions_for_address(address=address)
+
+    assert len(transactions) == 2
+    assert cursor == SignatureCursorDTO(signature=oldest, slot=1)
+
+
+def test_get_transactions_for_address_runs_in_one_sync_bridge_call(
+    json_rpc_base_client,
+):
+    address = Pubkey.from_bytes(bytes([30] * 32))
+    signatures = [Signature.from_bytes(bytes([31 + i] * 64)) for i in range(3)]
+
+    def responder(payload):
+        if payload[0]["method"] == "getSignaturesForAddress":
+            result = [_signature_entry(signature) for signature in signatures]
+            return [{"jsonrpc": "2.0", "id": payload[0]["id"], "result": result}]
+        return [
+            {"jsonrpc": "2.0", "id": call["id"], "result": None} for call in payload
+        ]
+
+    base_client, mock_post = json_rpc_base_client(responder)
+    client = SolanaTransactionQueryClient(base_solana_client=base_client)
+
+    with patch.object(
+        base_client, "run_sync_from_async", wraps=base_client.run_sync_from_async
+    ) as run_sync_from_async:
+        result = client.get_transactions_for_address(address=address, limit=None)
+
+    assert len(result) == 3
+    run_sync_from_async.assert_called_once()
+    assert mock_post.await_count == 2
@@ -31,7 +31,9 @@ def test_asend_transaction_uses_http_client_context():
     )
     client = SolanaTransactionSenderClient(base_solana_client=base_client)
 
-    result = async_to_sync(client.asend_transaction)(transaction)
+    result = base_client.run_sync_in_caller_thread(
+        client.asend_transaction, transaction
+    )
 
     assert result == "send-response"
     fake_client.send_transaction.assert_awaited_once_with(transaction)
@@ -71,7 +73,9 @@ def test_aconfirm_transaction_returns_confirmed_dto():
     )
     client = SolanaTransactionSenderClient(base_solana_client=base_client)
 
-    result = async_to_sync(client.aconfirm_transaction)(signature)
+    result = base_client.run_sync_in_caller_thread(
+        client.aconfirm_transaction, signature
+    )
 
     assert result.tx_signature == signature
     assert result.confirmation_status == TransactionConfirmationStatus.Confirmed
@@ -94,7 +98,9 @@ def test_aconfirm_transaction_returns_unconfirmed_dto_when_no_data():
     )
     client = SolanaTransactionSenderClient(base_solana_client=base_client)
 
-    result = async_to_sync(client.aconfirm_transaction)(signature)
+    result = base_client.run_sync_in_caller_thread(
+        client.aconfirm_transaction, signature
+    )
 
     assert result.tx_signature == signature
     assert result.confirmation_status is None
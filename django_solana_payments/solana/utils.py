@@ -5,6 +5,9 @@ from typing import Any
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 
+# The raw token amount is a little-endian u64 after the mint and owner of a token account
+TOKEN_ACCOUNT_AMOUNT_OFFSET = 64
+
 
 def parse_keypair(keypair_data: Any) -> Keypair:
     """
@@ -88,3 +91,15 @@ def derive_pubkey_string_from_keypair(keypair_data: Any) -> str:
             pass
 
     raise ValueError("Unable to derive pubkey string from provided keypair input")
+
+
+def parse_token_account_amount(token_account_data: bytes) -> int:
+    """
+    Returns the raw token amount stored in SPL token account data.
+    """
+    amount_end = TOKEN_ACCOUNT_AMOUNT_OFFSET + 8
+    if len(token_account_data) < amount_end:
+        raise ValueError("Account data is too short for a token account")
+    return int.from_bytes(
+        token_account_data[TOKEN_ACCOUNT_AMOUNT_OFFSET:amount_end], "little"
+    )
@@ -0,0 +1,22 @@
+from django_solana_payments.services.sweep_job_service import process_sweep_job
+from django_solana_payments.solana.enums import RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_rate_limiter import rpc_priority
+
+try:
+    from django.tasks import task
+except ImportError:  # Django < 6.0
+    try:
+        from django_tasks import task
+    except ImportError:
+        task = None
+
+
+if task is not None:
+
+    @task()
+    def process_sweep_job_task(sweep_job_id: int) -> bool:
+        with rpc_priority(RpcPriorityEnum.BACKGROUND):
+            return process_sweep_job(sweep_job_id)
+
+else:
+    process_sweep_job_task = None
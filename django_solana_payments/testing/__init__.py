@@ -0,0 +1,3 @@
+from django_solana_payments.testing.fake_solana_rpc import FakeSolanaRpc
+
+__all__ = ["FakeSolanaRpc"]
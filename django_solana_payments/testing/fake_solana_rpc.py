@@ -0,0 +1,788 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from spl.token.constants import (
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    TOKEN_2022_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+)
+
+SYSTEM_PROGRAM_ID = Pubkey.from_string("11111111111111111111111111111111")
+TOKEN_PROGRAM_IDS = (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID)
+
+SIGNATURE_FEE_LAMPORTS = 5000
+TOKEN_ACCOUNT_RENT_LAMPORTS = 2039280
+MINT_ACCOUNT_SIZE = 82
+TOKEN_ACCOUNT_SIZE = 165
+BLOCKHASH_VALID_SLOTS = 150
+GENESIS_BLOCK_TIME = 1_700_000_000
+
+# JSON-RPC error codes used by Solana validators
+INVALID_PARAMS_ERROR = -32602
+METHOD_NOT_FOUND_ERROR = -32601
+SEND_TRANSACTION_PREFLIGHT_ERROR = -32002
+
+
+class FakeRpcError(Exception):
+    def __init__(self, message: str, code: int = INVALID_PARAMS_ERROR, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class FakeInstructionError(Exception):
+    """Instruction failure; ``error`` is the ``InstructionError`` variant, e.g. ``{"Custom": 1}``."""
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
+
+
+def _preflight_error(message: str, transaction_error) -> FakeRpcError:
+    return FakeRpcError(
+        f"Transaction simulation failed: {message}",
+        SEND_TRANSACTION_PREFLIGHT_ERROR,
+        data={
+            "err": transaction_error,
+            "logs": [],
+            "accounts": None,
+            "unitsConsumed": 0,
+            "returnData": None,
+        },
+    )
+
+
+@dataclass
+class FakeMint:
+    decimals: int
+    supply: int = 0
+    program_id: Pubkey = TOKEN_PROGRAM_ID
+
+
+@dataclass
+class FakeTokenAccount:
+    mint: Pubkey
+    owner: Pubkey
+    amount: int = 0
+
+
+@dataclass
+class FakeTransaction:
+    signature: str
+    slot: int
+    result: dict
+    err: dict | None = None
+
+
+@dataclass
+class FakeLedger:
+    """In-memory chain state: lamport balances, mints, token accounts and transactions."""
+
+    slot: int = 1
+    lamports: Counter = field(default_factory=Counter)
+    mints: dict[Pubkey, FakeMint] = field(default_factory=dict)
+    token_accounts: dict[Pubkey, FakeTokenAccount] = field(default_factory=dict)
+    transactions: dict[str, FakeTransaction] = field(default_factory=dict)
+    # Newest signature first, like getSignaturesForAddress
+    address_signatures: dict[Pubkey, list[str]] = field(default_factory=dict)
+
+    @property
+    def block_time(self) -> int:
+        return GENESIS_BLOCK_TIME + self.slot * 4 // 10
+
+    @property
+    def blockhash(self) -> Hash:
+        return Hash(hashlib.sha256(f"fake-blockhash-{self.slot}".encode()).digest())
+
+
+def _ui_amount(amount: int, decimals: int) -> dict:
+    ui_amount = Decimal(amount) / Decimal(10**decimals)
+    return {
+        "amount": str(amount),
+        "decimals": decimals,
+        "uiAmount": float(ui_amount),
+        "uiAmountString": f"{ui_amount:f}".rstrip("0").rstrip(".") or "0",
+    }
+
+
+def _parsed_instruction(program: str, program_id: Pubkey, type_: str, info: dict):
+    return {
+        "program": program,
+        "programId": str(program_id),
+        "parsed": {"type": type_, "info": info},
+        "stackHeight": None,
+    }
+
+
+class FakeSolanaRpc:
+    """
+    In-repo stand-in for a Solana JSON-RPC node, served as an ASGI app.
+
+    It keeps a deterministic in-memory ledger and answers the RPC methods this package
+    calls, including JSON-RPC batches. ``sendTransaction`` executes system transfers,
+    SPL token transfers, ATA creation and token account closing, so payments can be
+    created, verified and swept end to end without a validator.
+
+    ``latency`` delays every HTTP request and ``rate_limit_every`` answers every n-th
+    HTTP request with 429, to simulate slow or throttling RPC providers.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0,
+        rate_limit_every: int = 0,
+        confirmation_status: str = "finalized",
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.confirmation_status = confirmation_status
+        self.ledger = FakeLedger()
+        self.http_requests = 0
+        self.rate_limited_requests = 0
+        self.method_calls = Counter()
+        self._lock = threading.Lock()
+
+    # Ledger setup
+
+    def airdrop(self, address: Pubkey, lamports: int):
+        with self._lock:
+            self.ledger.lamports[address] += lamports
+
+    def create_mint(
+        self, mint: Pubkey, decimals: int, program_id: Pubkey = TOKEN_PROGRAM_ID
+    ):
+        with self._lock:
+            self.ledger.mints[mint] = FakeMint(decimals=decimals, program_id=program_id)
+            self.ledger.lamports[mint] += TOKEN_ACCOUNT_RENT_LAMPORTS
+
+    def get_associated_token_address(self, owner: Pubkey, mint: Pubkey) -> Pubkey:
+        program_id = self.ledger.mints[mint].program_id
+        address, _ = Pubkey.find_program_address(
+            [bytes(owner), bytes(program_id), bytes(mint)], ASSOCIATED_TOKEN_PROGRAM_ID
+        )
+        return address
+
+    def mint_to(self, owner: Pubkey, mint: Pubkey, amount: int) -> Pubkey:
+        """Credits ``amount`` base units to the owner's ATA, creating it if needed."""
+        with self._lock:
+            token_address = self.get_associated_token_address(owner, mint)
+            token_account = self.ledger.token_accounts.get(token_address)
+            if token_account is None:
+                token_account = FakeTokenAccount(mint=mint, owner=owner)
+                self.ledger.token_accounts[token_address] = token_account
+                self.ledger.lamports[token_address] += TOKEN_ACCOUNT_RENT_LAMPORTS
+            token_account.amount += amount
+            self.ledger.mints[mint].supply += amount
+            return token_address
+
+    def send_transaction(self, transaction: VersionedTransaction) -> Signature:
+        """Executes a signed transaction directly on the ledger, e.g. a customer payment."""
+        with self._lock:
+            return Signature.from_string(self._execute_transaction(transaction))
+
+    @property
+    def latest_blockhash(self) -> Hash:
+        return self.ledger.blockhash
+
+    def get_lamports(self, address: Pubkey) -> int:
+        return self.ledger.lamports[address]
+
+    def get_token_amount(self, token_address: Pubkey) -> int | None:
+        token_account = self.ledger.token_accounts.get(token_address)
+        return token_account.amount if token_account else None
+
+    # ASGI
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        with self._lock:
+            self.http_requests += 1
+            rate_limited = (
+                self.rate_limit_every
+                and self.http_requests % self.rate_limit_every == 0
+            )
+            if rate_limited:
+                self.rate_limited_requests += 1
+
+        if rate_limited:
+            status, response_body = 429, b'{"error": "Too Many Requests"}'
+        else:
+            status, response_body = 200, json.dumps(self.handle(json.loads(body)))
+            response_body = response_body.encode()
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(response_body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response_body})
+
+    def build_http_client(self, http_module=None, **client_kwargs):
+        """Returns an ``AsyncClient`` of ``http_module`` (httpx by default) mounted on this app."""
+        if http_module is None:
+            import httpx as http_module
+
+        return http_module.AsyncClient(
+            transport=http_module.ASGITransport(app=self), **client_kwargs
+        )
+
+    @contextmanager
+    def mount(self, base_solana_client):
+        """
+        Routes every RPC call of ``base_solana_client`` to this fake while the block runs.
+
+        The clients keep their provider (endpoint pool, rate limiter, coalescing and
+        instrumentation); only the HTTP transport is replaced.
+        """
+        default_client_factory = base_solana_client._client_factory
+
+        def client_factory():
+            client = default_client_factory()
+            provider = client._provider
+            # solana-py switched HTTP libraries between releases; use the one its session comes from
+            http_module = sys.modules[type(provider.session).__module__.split(".")[0]]
+            provider.session = self.build_http_client(
+                http_module, timeout=provider.session.timeout
+            )
+            return client
+
+        base_solana_client.close()
+        base_solana_client._client_factory = client_factory
+        try:
+            yield self
+        finally:
+            base_solana_client.close()
+            base_solana_client._client_factory = default_client_factory
+
+    # JSON-RPC
+
+    def handle(self, payload):
+        if isinstance(payload, list):
+            return [self._handle_call(call) for call in payload]
+        return self._handle_call(payload)
+
+    def _handle_call(self, call: dict) -> dict:
+        method = call.get("method")
+        handler = getattr(self, f"_rpc_{method}", None)
+        with self._lock:
+            self.method_calls[method] += 1
+            try:
+                if handler is None:
+                    raise FakeRpcError(
+                        f"Method not found: {method}", METHOD_NOT_FOUND_ERROR
+                    )
+                result = handler(*call.get("params", []))
+            except FakeRpcError as e:
+                error = {"code": e.code, "message": str(e)}
+                if e.data is not None:
+                    error["data"] = e.data
+                return {"jsonrpc": "2.0", "id": call.get("id"), "error": error}
+        return {"jsonrpc": "2.0", "id": call.get("id"), "result": result}
+
+    def _context(self, value) -> dict:
+        return {"context": {"slot": self.ledger.slot}, "value": value}
+
+    @staticmethod
+    def _pubkey(value: str) -> Pubkey:
+        try:
+            return Pubkey.from_string(value)
+        except ValueError:
+            raise FakeRpcError(f"Invalid param: {value}", INVALID_PARAMS_ERROR)
+
+    def _account_info(self, address: Pubkey) -> dict | None:
+        ledger = self.ledger
+        if address in ledger.mints:
+            mint = ledger.mints[address]
+            data = bytearray(MINT_ACCOUNT_SIZE)
+            struct.pack_into("<Q", data, 36, mint.supply)
+            data[44] = mint.decimals
+            data[45] = 1  # is_initialized
+            owner = mint.program_id
+        elif address in ledger.token_accounts:
+            token_account = ledger.token_accounts[address]
+            data = bytearray(TOKEN_ACCOUNT_SIZE)
+            data[0:32] = bytes(token_account.mint)
+            data[32:64] = bytes(token_account.owner)
+            struct.pack_into("<Q", data, 64, token_account.amount)
+            data[108] = 1  # initialized
+            owner = ledger.mints[token_account.mint].program_id
+        elif ledger.lamports[address] > 0:
+            data = bytearray()
+            owner = SYSTEM_PROGRAM_ID
+        else:
+            return None
+
+        return {
+            "data": [base64.b64encode(bytes(data)).decode(), "base64"],
+            "executable": False,
+            "lamports": ledger.lamports[address],
+            "owner": str(owner),
+            "rentEpoch": 0,
+            "space": len(data),
+        }
+
+    def _token_amount(self, token_address: Pubkey) -> dict:
+        token_account = self.ledger.token_accounts.get(token_address)
+        if token_account is None:
+            raise FakeRpcError(
+                "Invalid param: could not find account", INVALID_PARAMS_ERROR
+            )
+        decimals = self.ledger.mints[token_account.mint].decimals
+        return _ui_amount(token_account.amount, decimals)
+
+    def _rpc_getHealth(self, *params):
+        return "ok"
+
+    def _rpc_getSlot(self, *params):
+        return self.ledger.slot
+
+    def _rpc_getBlockHeight(self, *params):
+        return self.ledger.slot
+
+    def _rpc_getBalance(self, address, *params):
+        return self._context(self.ledger.lamports[self._pubkey(address)])
+
+    def _rpc_getAccountInfo(self, address, *params):
+        return self._context(self._account_info(self._pubkey(address)))
+
+    def _rpc_getLatestBlockhash(self, *params):
+        return self._context(
+            {
+                "blockhash": str(self.ledger.blockhash),
+                "lastValidBlockHeight": self.ledger.slot + BLOCKHASH_VALID_SLOTS,
+            }
+        )
+
+    def _rpc_getTokenSupply(self, mint_address, *params):
+        mint = self.ledger.mints.get(self._pubkey(mint_address))
+        if mint is None:
+            raise FakeRpcError("Invalid param: not a Token mint", INVALID_PARAMS_ERROR)
+        return self._context(_ui_amount(mint.supply, mint.decimals))
+
+    def _rpc_getTokenAccountBalance(self, token_address, *params):
+        return self._context(self._token_amount(self._pubkey(token_address)))
+
+    def _rpc_getTokenAccountsByOwner(self, owner, account_filter, *params):
+        owner = self._pubkey(owner)
+        mint = account_filter.get("mint")
+        program_id = account_filter.get("programId")
+        token_accounts = []
+        for token_address, token_account in self.ledger.token_accounts.items():
+            if token_account.owner != owner:
+                continue
+            if mint and str(token_account.mint) != mint:
+                continue
+            if (
+                program_id
+                and str(self.ledger.mints[token_account.mint].program_id) != program_id
+            ):
+                continue
+            token_accounts.append(
+                {
+                    "pubkey": str(token_address),
+                    "account": self._account_info(token_address),
+                }
+            )
+        return self._context(token_accounts)
+
+    def _rpc_getSignaturesForAddress(self, address, config=None, *params):
+        config = config or {}
+        signatures = self.ledger.address_signatures.get(self._pubkey(address), [])
+        if config.get("before") in signatures:
+            signatures = signatures[signatures.index(config["before"]) + 1 :]
+        if config.get("until") in signatures:
+            signatures = signatures[: signatures.index(config["until"])]
+        signatures = signatures[: config.get("limit") or 1000]
+
+        return [
+            {
+                "signature": signature,
+                "slot": self.ledger.transactions[signature].slot,
+                "err": self.ledger.transactions[signature].err,
+                "memo": None,
+                "blockTime": self.ledger.transactions[signature].result["blockTime"],
+                "confirmationStatus": self.confirmation_status,
+            }
+            for signature in signatures
+        ]
+
+    def _rpc_getSignatureStatuses(self, signatures, *params):
+        statuses = []
+        for signature in signatures:
+            transaction = self.ledger.transactions.get(signature)
+            if transaction is None:
+                statuses.append(None)
+                continue
+            statuses.append(
+                {
+                    "slot": transaction.slot,
+                    "confirmations": (
+                        None if self.confirmation_status == "finalized" else 1
+                    ),
+                    "err": transaction.err,
+                    "status": (
+                        {"Ok": None} if transaction.err is None else transaction.err
+                    ),
+                    "confirmationStatus": self.confirmation_status,
+                }
+            )
+        return self._context(statuses)
+
+    def _rpc_getTransaction(self, signature, *params):
+        transaction = self.ledger.transactions.get(signature)
+        return transaction.result if transaction else None
+
+    def _rpc_sendTransaction(self, encoded_transaction, config=None, *params):
+        encoding = (config or {}).get("encoding", "base58")
+        if encoding != "base64":
+            raise FakeRpcError(
+                f"Unsupported encoding: {encoding}", INVALID_PARAMS_ERROR
+            )
+        transaction = VersionedTransaction.from_bytes(
+            base64.b64decode(encoded_transaction)
+        )
+        return self._execute_transaction(transaction)
+
+    # Transaction execution
+
+    def _execute_transaction(self, transaction: VersionedTransaction) -> str:
+        message = transaction.message
+        account_keys = list(message.account_keys)
+        signature = str(transaction.signatures[0])
+        if signature in self.ledger.transactions:
+            # Resending an already processed transaction is a no-op, like on chain
+            return signature
+        if not all(transaction.verify_with_results()):
+            raise _preflight_error("signature verification failure", "SignatureFailure")
+
+        ledger = self.ledger
+        lamports = ledger.lamports.copy()
+        token_accounts = {
+            address: FakeTokenAccount(
+                mint=token_account.mint,
+                owner=token_account.owner,
+                amount=token_account.amount,
+            )
+            for address, token_account in ledger.token_accounts.items()
+        }
+        pre_balances = [lamports[key] for key in account_keys]
+        pre_token_balances = self._token_balances(account_keys, token_accounts)
+
+        fee_payer = account_keys[0]
+        fee = SIGNATURE_FEE_LAMPORTS * len(transaction.signatures)
+        if lamports[fee_payer] < fee:
+            raise _preflight_error(
+                "Attempt to debit an account but found no record of a prior credit.",
+                "AccountNotFound",
+            )
+        lamports[fee_payer] -= fee
+
+        instructions, inner_instructions = [], []
+        for index, instruction in enumerate(message.instructions):
+            program_id = account_keys[instruction.program_id_index]
+            accounts = [account_keys[i] for i in instruction.accounts]
+            try:
+                parsed, inner = self._execute_instruction(
+                    program_id,
+                    accounts,
+                    bytes(instruction.data),
+                    lamports,
+                    token_accounts,
+                )
+            except FakeInstructionError as e:
+                raise _preflight_error(
+                    f"Error processing Instruction {index}: {e.error}",
+                    {"InstructionError": [index, e.error]},
+                )
+            instructions.append(parsed)
+            if inner:
+                inner_instructions.append({"index": index, "instructions": inner})
+
+        ledger.slot += 1
+        ledger.lamports = lamports
+        ledger.token_accounts = token_accounts
+
+        result = {
+            "slot": ledger.slot,
+            "blockTime": ledger.block_time,
+            "version": 0,
+            "meta": {
+                "err": None,
+                "status": {"Ok": None},
+                "fee": fee,
+                "preBalances": pre_balances,
+                "postBalances": [lamports[key] for key in account_keys],
+                "innerInstructions": inner_instructions,
+                "logMessages": [],
+                "preTokenBalances": pre_token_balances,
+                "postTokenBalances": self._token_balances(account_keys, token_accounts),
+                "rewards": [],
+                "computeUnitsConsumed": 0,
+            },
+            "transaction": {
+                "signatures": [str(sig) for sig in transaction.signatures],
+                "message": {
+                    "accountKeys": [
+                        {
+                            "pubkey": str(key),
+                            "signer": message.is_signer(i),
+                            "writable": message.is_maybe_writable(i),
+                            "source": "transaction",
+                        }
+                        for i, key in enumerate(account_keys)
+                    ],
+                    "recentBlockhash": str(message.recent_blockhash),
+                    "instructions": instructions,
+                    "addressTableLookups": [],
+                },
+            },
+        }
+        ledger.transactions[signature] = FakeTransaction(
+            signature=signature, slot=ledger.slot, result=result
+        )
+        for key in dict.fromkeys(account_keys):
+            ledger.address_signatures.setdefault(key, []).insert(0, signature)
+        return signature
+
+    def _token_balances(
+        self, account_keys: list[Pubkey], token_accounts: dict
+    ) -> list[dict]:
+        token_balances = []
+        for index, key in enumerate(account_keys):
+            token_account = token_accounts.get(key)
+            if token_account is None:
+                continue
+            mint = self.ledger.mints[token_account.mint]
+            token_balances.append(
+                {
+                    "accountIndex": index,
+                    "mint": str(token_account.mint),
+                    "owner": str(token_account.owner),
+                    "programId": str(mint.program_id),
+                    "uiTokenAmount": _ui_amount(token_account.amount, mint.decimals),
+                }
+            )
+        return token_balances
+
+    def _execute_instruction(
+        self,
+        program_id: Pubkey,
+        accounts: list[Pubkey],
+        data: bytes,
+        lamports: Counter,
+        token_accounts: dict,
+    ) -> tuple[dict, list[dict]]:
+        if program_id == SYSTEM_PROGRAM_ID:
+            return self._execute_system_instruction(accounts, data, lamports), []
+        if program_id == ASSOCIATED_TOKEN_PROGRAM_ID:
+            return self._execute_create_associated_token_account(
+                accounts, data, lamports, token_accounts
+            )
+        if program_id in TOKEN_PROGRAM_IDS:
+            return (
+                self._execute_token_instruction(
+                    program_id, accounts, data, lamports, token_accounts
+                ),
+                [],
+            )
+        raise FakeInstructionError("UnsupportedProgramId")
+
+    def _execute_system_instruction(
+        self, accounts: list[Pubkey], data: bytes, lamports: Counter
+    ) -> dict:
+        instruction_type, amount = struct.unpack_from("<IQ", data)
+        if instruction_type != 2:
+            raise FakeInstructionError("InvalidInstructionData")
+        source, destination = accounts[0], accounts[1]
+        if lamports[source] < amount:
+            raise FakeInstructionError({"Custom": 1})
+        lamports[source] -= amount
+        lamports[destination] += amount
+        return _parsed_instruction(
+            "system",
+            SYSTEM_PROGRAM_ID,
+            "transfer",
+            {
+                "source": str(source),
+                "destination": str(destination),
+                "lamports": amount,
+            },
+        )
+
+    def _execute_create_associated_token_account(
+        self,
+        accounts: list[Pubkey],
+        data: bytes,
+        lamports: Counter,
+        token_accounts: dict,
+    ) -> tuple[dict, list[dict]]:
+        payer, token_address, owner, mint, _system_program, token_program = accounts[:6]
+        idempotent = data[:1] == b"\x01"
+        instruction_type = "createIdempotent" if idempotent else "create"
+        parsed = _parsed_instruction(
+            "spl-associated-token-account",
+            ASSOCIATED_TOKEN_PROGRAM_ID,
+            instruction_type,
+            {
+                "source": str(payer),
+                "account": str(token_address),
+                "wallet": str(owner),
+                "mint": str(mint),
+                "systemProgram": str(SYSTEM_PROGRAM_ID),
+                "tokenProgram": str(token_program),
+            },
+        )
+        if token_address in token_accounts:
+            if idempotent:
+                return parsed, []
+            raise FakeInstructionError("IllegalOwner")
+        if mint not in self.ledger.mints:
+            raise FakeInstructionError("InvalidAccountData")
+        if lamports[payer] < TOKEN_ACCOUNT_RENT_LAMPORTS:
+            raise FakeInstructionError({"Custom": 1})
+
+        lamports[payer] -= TOKEN_ACCOUNT_RENT_LAMPORTS
+        lamports[token_address] += TOKEN_ACCOUNT_RENT_LAMPORTS
+        token_accounts[token_address] = FakeTokenAccount(mint=mint, owner=owner)
+        # The inner instructions a real ATA program emits
+        inner_instructions = [
+            _parsed_instruction(
+                "system",
+                SYSTEM_PROGRAM_ID,
+                "createAccount",
+                {
+                    "source": str(payer),
+                    "newAccount": str(token_address),
+                    "lamports": TOKEN_ACCOUNT_RENT_LAMPORTS,
+                    "space": TOKEN_ACCOUNT_SIZE,
+                    "owner": str(token_program),
+                },
+            ),
+            _parsed_instruction(
+                "spl-token",
+                token_program,
+                "initializeImmutableOwner",
+                {"account": str(token_address)},
+            ),
+            _parsed_instruction(
+                "spl-token",
+                token_program,
+                "initializeAccount3",
+                {
+                    "account": str(token_address),
+                    "mint": str(mint),
+                    "owner": str(owner),
+                },
+            ),
+        ]
+        return parsed, inner_instructions
+
+    def _execute_token_instruction(
+        self,
+        program_id: Pubkey,
+        accounts: list[Pubkey],
+        data: bytes,
+        lamports: Counter,
+        token_accounts: dict,
+    ) -> dict:
+        instruction_type = data[0]
+        if instruction_type == 3:  # Transfer
+            (amount,) = struct.unpack_from("<Q", data, 1)
+            source, destination, authority = accounts[:3]
+            self._move_tokens(token_accounts, source, destination, authority, amount)
+            return _parsed_instruction(
+                "spl-token",
+                program_id,
+                "transfer",
+                {
+                    "source": str(source),
+                    "destination": str(destination),
+                    "authority": str(authority),
+                    "amount": str(amount),
+                },
+            )
+        if instruction_type == 12:  # TransferChecked
+            amount, decimals = struct.unpack_from("<QB", data, 1)
+            source, mint, destination, authority = accounts[:4]
+            self._move_tokens(token_accounts, source, destination, authority, amount)
+            return _parsed_instruction(
+                "spl-token",
+                program_id,
+                "transferChecked",
+                {
+                    "source": str(source),
+                    "mint": str(mint),
+                    "destination": str(destination),
+                    "authority": str(authority),
+                    "tokenAmount": _ui_amount(amount, decimals),
+                },
+            )
+        if instruction_type == 9:  # CloseAccount
+            account, destination, owner = accounts[:3]
+            token_account = token_accounts.get(account)
+            if token_account is None or token_account.owner != owner:
+                raise FakeInstructionError("InvalidAccountData")
+            if token_account.amount:
+                raise FakeInstructionError({"Custom": 11})
+            lamports[destination] += lamports.pop(account, 0)
+            del token_accounts[account]
+            return _parsed_instruction(
+                "spl-token",
+                program_id,
+                "closeAccount",
+                {
+                    "account": str(account),
+                    "destination": str(destination),
+                    "owner": str(owner),
+                },
+            )
+        raise FakeInstructionError("InvalidInstructionData")
+
+    @staticmethod
+    def _move_tokens(
+        token_accounts: dict,
+        source: Pubkey,
+        destination: Pubkey,
+        authority: Pubkey,
+        amount: int,
+    ):
+        source_account = token_accounts.get(source)
+        destination_account = token_accounts.get(destination)
+        if source_account is None or destination_account is None:
+            raise FakeInstructionError("InvalidAccountData")
+        if source_account.owner != authority:
+            raise FakeInstructionError({"Custom": 4})
+        if source_account.amount < amount:
+            raise FakeInstructionError({"Custom": 1})
+        source_account.amount -= amount
+        destination_account.amount += amount
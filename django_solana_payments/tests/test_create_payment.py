@@ -36,3 +36,11 @@ def test_create_payment_guest_user(payment_token):
     payment = SolanaPaymentsService().create_payment(payment_data)
 
     assert payment.user is None
+
+
+def test_payment_address_is_indexed_without_unique_constraint():
+    payment_address_field = SolanaPayment._meta.get_field("payment_address")
+
+    # A unique constraint would fail to migrate tables that hold duplicate addresses
+    assert payment_address_field.db_index is True
+    assert payment_address_field.unique is False
@@ -0,0 +1,702 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from solana.exceptions import SolanaRpcException
+from solana.rpc.core import RPCException
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from django_solana_payments.choices import (
+    OneTimeWalletStateTypes,
+    SolanaPaymentStatusTypes,
+    SweepJobStatusTypes,
+)
+from django_solana_payments.helpers import get_solana_payment_model
+from django_solana_payments.models import (
+    AddressSignatureCursor,
+    OneTimePaymentWallet,
+    OneTimeWalletTokenAccount,
+    SweepJob,
+)
+from django_solana_payments.services.one_time_wallet_service import (
+    OneTimeWalletService,
+    one_time_wallet_service,
+)
+from django_solana_payments.services.solana_payments_service import (
+    SolanaPaymentsService,
+)
+from django_solana_payments.services.sweep_job_service import (
+    process_pending_sweep_jobs,
+)
+from django_solana_payments.services.verify_transaction_service import (
+    VerifyTransactionService,
+)
+from django_solana_payments.solana.base_solana_client import base_solana_client
+from django_solana_payments.solana.dtos import ConfirmTransactionDTO
+from django_solana_payments.solana.enums import RpcCallOutcomeEnum
+from django_solana_payments.solana.solana_balance_client import SolanaBalanceClient
+from django_solana_payments.solana.solana_rpc_instrumentation import (
+    register_rpc_call_hook,
+    unregister_rpc_call_hook,
+)
+from django_solana_payments.solana.solana_token_client import SolanaTokenClient
+from django_solana_payments.solana.solana_transaction_builder import (
+    SolanaTransactionBuilder,
+)
+from django_solana_payments.solana.solana_transaction_query_client import (
+    SolanaTransactionQueryClient,
+)
+from django_solana_payments.solana.solana_transaction_sender_client import (
+    SolanaTransactionSenderClient,
+)
+from django_solana_payments.testing.fake_solana_rpc import FakeRpcError
+
+MINT = Pubkey.from_bytes(bytes([9] * 32))
+
+SolanaPayment = get_solana_payment_model()
+
+
+@pytest.fixture
+def token_client():
+    return SolanaTokenClient(base_solana_client=base_solana_client)
+
+
+def test_native_transfer_is_executed_and_queryable(fake_solana_rpc, token_client):
+    sender = Keypair()
+    recipient = Keypair().pubkey()
+    fake_solana_rpc.airdrop(sender.pubkey(), 2 * 10**9)
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+
+    transaction = builder.create_native_transaction(
+        recipient, Decimal("0.5"), sender_keypair=sender
+    )
+    signature = SolanaTransactionSenderClient(
+        base_solana_client=base_solana_client
+    ).send_transaction_with_retry(transaction)
+
+    assert SolanaBalanceClient(base_solana_client).get_balance_by_address(
+        recipient
+    ) == Decimal("0.5")
+    query_client = SolanaTransactionQueryClient(base_solana_client=base_solana_client)
+    (paid_transaction,) = query_client.get_transactions_for_address(recipient)
+    assert paid_transaction.value.transaction.transaction.signatures[0] == signature
+    assert query_client.extract_instruction_types_from_transaction_details(
+        paid_transaction
+    ) == {"transfer"}
+    assert query_client.get_signatures_statuses([signature])[0].err is None
+
+
+def test_spl_transfer_updates_token_accounts(fake_solana_rpc, token_client):
+    customer = Keypair()
+    one_time_wallet = Keypair().pubkey()
+    fake_solana_rpc.create_mint(MINT, decimals=6)
+    fake_solana_rpc.mint_to(customer.pubkey(), MINT, 5_000_000)
+    fake_solana_rpc.airdrop(customer.pubkey(), 10**9)
+
+    token_client.create_associated_token_addresses_for_mints(
+        recipient=one_time_wallet, mints=[MINT]
+    )
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    transaction = builder.create_spl_token_transaction(
+        one_time_wallet, Decimal("1.5"), customer, MINT
+    )
+    fake_solana_rpc.send_transaction(transaction)
+
+    assert SolanaBalanceClient(base_solana_client).get_spl_token_balance_by_address(
+        one_time_wallet, MINT
+    ) == Decimal("1.5")
+    assert token_client.get_mint_info(MINT).decimals == 6
+    assert (
+        fake_solana_rpc.get_token_amount(
+            fake_solana_rpc.get_associated_token_address(customer.pubkey(), MINT)
+        )
+        == 3_500_000
+    )
+
+
+def test_batch_requests_are_answered_in_one_http_request(fake_solana_rpc):
+    addresses = [Keypair().pubkey() for _ in range(3)]
+    for lamports, address in enumerate(addresses, start=1):
+        fake_solana_rpc.airdrop(address, lamports)
+
+    with base_solana_client.batch() as batch:
+        balance_requests = [batch.get_balance(address) for address in addresses]
+
+    assert [request.result().value for request in balance_requests] == [1, 2, 3]
+    assert fake_solana_rpc.http_requests == 1
+    assert fake_solana_rpc.method_calls["getBalance"] == 3
+
+
+def test_rate_limit_injection_answers_with_429(fake_solana_rpc):
+    fake_solana_rpc.rate_limit_every = 2
+    address = Keypair().pubkey()
+    balance_client = SolanaBalanceClient(base_solana_client)
+    rpc_calls = []
+    register_rpc_call_hook(rpc_calls.append)
+    try:
+        assert balance_client.get_balance(address).value == 0
+        with pytest.raises(SolanaRpcException):
+            balance_client.get_balance(address)
+    finally:
+        unregister_rpc_call_hook(rpc_calls.append)
+
+    assert fake_solana_rpc.rate_limited_requests == 1
+    assert [call.outcome for call in rpc_calls] == [
+        RpcCallOutcomeEnum.OK,
+        RpcCallOutcomeEnum.RATE_LIMITED,
+    ]
+
+
+def test_failed_transaction_does_not_change_ledger(fake_solana_rpc, token_client):
+    sender = Keypair()
+    fake_solana_rpc.airdrop(sender.pubkey(), 10_000)
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    transaction = builder.create_native_transaction(
+        Keypair().pubkey(), Decimal("1"), sender_keypair=sender
+    )
+
+    with pytest.raises(RPCException):
+        SolanaTransactionSenderClient(
+            base_solana_client=base_solana_client
+        ).send_transaction(transaction)
+
+    assert fake_solana_rpc.get_lamports(sender.pubkey()) == 10_000
+    assert fake_solana_rpc.ledger.transactions == {}
+
+
+@pytest.mark.django_db
+def test_native_payment_is_created_paid_and_verified_end_to_end(
+    fake_solana_rpc, token_client, payment_token
+):
+    customer = Keypair()
+    fake_solana_rpc.airdrop(customer.pubkey(), 10**9)
+    payment = SolanaPaymentsService().create_payment({"user": None, "meta_data": {}})
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    fake_solana_rpc.send_transaction(
+        builder.create_native_transaction(
+            Pubkey.from_string(payment.payment_address),
+            payment_token.payment_crypto_price,
+            sender_keypair=customer,
+        )
+    )
+
+    status = VerifyTransactionService().verify_transaction_and_process_payment(
+        payment.payment_address, payment_token, send_payment_accepted_signal=False
+    )
+
+    assert status == SolanaPaymentStatusTypes.CONFIRMED
+    payment_address = Pubkey.from_string(payment.payment_address)
+    # Verification only queues the transfer to RECEIVER_ADDRESS
+    assert fake_solana_rpc.get_lamports(payment_address) == 10**8
+    sweep_job = SweepJob.objects.get(
+        one_time_payment_wallet=payment.one_time_payment_wallet
+    )
+    assert sweep_job.status == SweepJobStatusTypes.PENDING
+
+    assert process_pending_sweep_jobs() == {
+        "processed": 1,
+        "succeeded": 1,
+        "failed": 0,
+        "requeued": 0,
+    }
+
+    assert fake_solana_rpc.get_lamports(payment_address) < 10**8
+    sweep_job.refresh_from_db()
+    assert sweep_job.status == SweepJobStatusTypes.SUCCEEDED
+
+
+@pytest.mark.django_db
+def test_repeated_polls_of_unpaid_payment_only_fetch_new_signatures(
+    fake_solana_rpc, token_client, payment_token, spl_token
+):
+    fake_solana_rpc.create_mint(Pubkey.from_string(spl_token.mint_address), decimals=6)
+    payment = SolanaPaymentsService().create_payment({"user": None, "meta_data": {}})
+    verify_service = VerifyTransactionService()
+
+    def poll():
+        fake_solana_rpc.http_requests = 0
+        fake_solana_rpc.method_calls.clear()
+        return verify_service.verify_transaction_and_process_payment(
+            payment.payment_address, payment_token, send_payment_accepted_signal=False
+        )
+
+    # The first poll reads the ATA setup transaction once and stores the cursor
+    assert poll() == SolanaPaymentStatusTypes.INITIATED
+    assert fake_solana_rpc.method_calls["getTransaction"] == 1
+    assert AddressSignatureCursor.objects.filter(
+        address=payment.payment_address
+    ).exists()
+
+    for _ in range(2):
+        assert poll() == SolanaPaymentStatusTypes.INITIATED
+        assert fake_solana_rpc.http_requests == 1
+        assert fake_solana_rpc.method_calls["getTransaction"] == 0
+
+    customer = Keypair()
+    fake_solana_rpc.airdrop(customer.pubkey(), 10**9)
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    fake_solana_rpc.send_transaction(
+        builder.create_native_transaction(
+            Pubkey.from_string(payment.payment_address),
+            payment_token.payment_crypto_price,
+            sender_keypair=customer,
+        )
+    )
+
+    assert poll() == SolanaPaymentStatusTypes.CONFIRMED
+    assert fake_solana_rpc.method_calls["getTransaction"] == 1
+
+
+@pytest.mark.django_db
+def test_unpaid_spl_poll_reads_stored_ata_balance_and_signatures_in_one_request(
+    fake_solana_rpc, token_client, payment_token, spl_token
+):
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    payment = SolanaPaymentsService().create_payment({"user": None, "meta_data": {}})
+    assert OneTimeWalletTokenAccount.objects.filter(
+        one_time_payment_wallet=payment.one_time_payment_wallet,
+        mint_address=spl_token.mint_address,
+        decimals=6,
+    ).exists()
+    # The stored token account replaces the mint lookup for the ATA derivation
+    base_solana_client.mint_info_cache.clear()
+    verify_service = VerifyTransactionService()
+
+    def poll():
+        fake_solana_rpc.http_requests = 0
+        fake_solana_rpc.method_calls.clear()
+        return verify_service.verify_transaction_and_process_payment(
+            payment.payment_address, spl_token, send_payment_accepted_signal=False
+        )
+
+    assert poll() == SolanaPaymentStatusTypes.INITIATED
+    assert fake_solana_rpc.method_calls["getAccountInfo"] == 1
+    assert poll() == SolanaPaymentStatusTypes.INITIATED
+    assert fake_solana_rpc.http_requests == 1
+    assert dict(fake_solana_rpc.method_calls) == {
+        "getAccountInfo": 1,
+        "getSignaturesForAddress": 1,
+    }
+
+    customer = Keypair()
+    fake_solana_rpc.airdrop(customer.pubkey(), 10**9)
+    fake_solana_rpc.mint_to(customer.pubkey(), mint, 200_000_000)
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    fake_solana_rpc.send_transaction(
+        builder.create_spl_token_transaction(
+            Pubkey.from_string(payment.payment_address),
+            spl_token.payment_crypto_price,
+            customer,
+            mint,
+        )
+    )
+
+    assert poll() == SolanaPaymentStatusTypes.CONFIRMED
+
+
+@pytest.mark.django_db
+def test_on_select_ata_is_created_in_the_background_after_first_verification(
+    settings, fake_solana_rpc, token_client, payment_token, spl_token
+):
+    settings.SOLANA_PAYMENTS = {
+        **settings.SOLANA_PAYMENTS,
+        "ATA_CREATION_MODE": "on_select",
+    }
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    payment = SolanaPaymentsService().create_payment({"user": None, "meta_data": {}})
+    payment_address = Pubkey.from_string(payment.payment_address)
+    ata = fake_solana_rpc.get_associated_token_address(payment_address, mint)
+    assert "sendTransaction" not in fake_solana_rpc.method_calls
+    assert fake_solana_rpc.get_token_amount(ata) is None
+
+    verify_service = VerifyTransactionService()
+    assert (
+        verify_service.verify_transaction_and_process_payment(
+            payment.payment_address, spl_token, send_payment_accepted_signal=False
+        )
+        == SolanaPaymentStatusTypes.INITIATED
+    )
+    # Verification only records the account, the ATA is created in the background
+    assert "sendTransaction" not in fake_solana_rpc.method_calls
+    assert fake_solana_rpc.get_token_amount(ata) is None
+    assert OneTimeWalletTokenAccount.objects.filter(
+        one_time_payment_wallet=payment.one_time_payment_wallet,
+        address=str(ata),
+        pending_creation=True,
+    ).exists()
+
+    assert one_time_wallet_service.create_pending_one_time_wallet_token_accounts() == {
+        "created": 1,
+        "pending": 0,
+    }
+    assert fake_solana_rpc.get_token_amount(ata) == 0
+    assert not OneTimeWalletTokenAccount.objects.filter(pending_creation=True).exists()
+
+    customer = Keypair()
+    fake_solana_rpc.airdrop(customer.pubkey(), 10**9)
+    fake_solana_rpc.mint_to(customer.pubkey(), mint, 200_000_000)
+    builder = SolanaTransactionBuilder(
+        base_solana_client=base_solana_client, solana_token_client=token_client
+    )
+    fake_solana_rpc.send_transaction(
+        builder.create_spl_token_transaction(
+            payment_address, spl_token.payment_crypto_price, customer, mint
+        )
+    )
+
+    assert (
+        verify_service.verify_transaction_and_process_payment(
+            payment.payment_address, spl_token, send_payment_accepted_signal=False
+        )
+        == SolanaPaymentStatusTypes.CONFIRMED
+    )
+    assert process_pending_sweep_jobs()["succeeded"] == 1
+    # The swept ATA was the only one created and is closed again
+    assert fake_solana_rpc.get_token_amount(ata) is None
+
+
+def test_associated_token_accounts_of_many_wallets_are_created_in_packed_transactions(
+    fake_solana_rpc, token_client
+):
+    fake_solana_rpc.create_mint(MINT, decimals=6)
+    owners = [Keypair().pubkey() for _ in range(20)]
+
+    created_atas = token_client.create_associated_token_accounts(
+        [(owner, MINT) for owner in owners]
+    )
+
+    # Far fewer transactions than wallets, all confirmed with one status request
+    assert 1 < len(created_atas) < len(owners)
+    assert fake_solana_rpc.method_calls["sendTransaction"] == len(created_atas)
+    assert fake_solana_rpc.method_calls["getSignatureStatuses"] == 1
+    assert all(created_ata.confirmed for created_ata in created_atas)
+    assert [
+        owner for created_ata in created_atas for owner, _ in created_ata.accounts
+    ] == owners
+    for owner in owners:
+        ata = fake_solana_rpc.get_associated_token_address(owner, MINT)
+        assert fake_solana_rpc.get_token_amount(ata) == 0
+
+
+def test_wallet_pool_refill_creates_atas_of_all_wallets_together(
+    fake_solana_rpc, spl_token
+):
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    service = OneTimeWalletService()
+
+    summary = service.refill_one_time_wallet_pool(low_watermark=0, high_watermark=5)
+
+    assert summary == {"added": 5, "pooled": 5}
+    assert fake_solana_rpc.method_calls["sendTransaction"] == 1
+    for wallet in OneTimePaymentWallet.objects.all():
+        owner = service.load_keypair(wallet.keypair_json).pubkey()
+        ata = fake_solana_rpc.get_associated_token_address(owner, mint)
+        assert fake_solana_rpc.get_token_amount(ata) == 0
+        assert wallet.token_accounts.get().address == str(ata)
+
+
+@pytest.mark.django_db
+def test_batched_sweep_packs_wallets_into_one_transaction_per_token(
+    settings, fake_solana_rpc, payment_token, spl_token
+):
+    receiver = Keypair().pubkey()
+    settings.SOLANA_PAYMENTS = {
+        **settings.SOLANA_PAYMENTS,
+        "RECEIVER_ADDRESS": str(receiver),
+    }
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    payments_service = SolanaPaymentsService()
+    native_payments = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(3)
+    ]
+    spl_payments = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(2)
+    ]
+    for payment in native_payments:
+        fake_solana_rpc.airdrop(Pubkey.from_string(payment.payment_address), 10**8)
+    for payment in spl_payments:
+        fake_solana_rpc.mint_to(
+            Pubkey.from_string(payment.payment_address), mint, 120_000_000
+        )
+    SolanaPayment.objects.filter(
+        id__in=[payment.id for payment in native_payments]
+    ).update(paid_token=payment_token)
+    SolanaPayment.objects.filter(
+        id__in=[payment.id for payment in spl_payments]
+    ).update(paid_token=spl_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    fake_solana_rpc.method_calls.clear()
+
+    payments_service.send_solana_payments_from_one_time_wallets(batch_size=10)
+
+    # The receiver's ATA, then one native and one SPL sweep transaction
+    assert fake_solana_rpc.method_calls["sendTransaction"] == 3
+    assert fake_solana_rpc.get_lamports(receiver) == 3 * 10**8
+    receiver_ata = fake_solana_rpc.get_associated_token_address(receiver, mint)
+    assert fake_solana_rpc.get_token_amount(receiver_ata) == 2 * 120_000_000
+    # The emptied token accounts of all wallets are closed in the sweep transactions
+    for payment in native_payments + spl_payments:
+        ata = fake_solana_rpc.get_associated_token_address(
+            Pubkey.from_string(payment.payment_address), mint
+        )
+        assert fake_solana_rpc.get_token_amount(ata) is None
+    assert set(OneTimePaymentWallet.objects.values_list("state", flat=True)) == {
+        OneTimeWalletStateTypes.SENT_FUNDS
+    }
+
+
+@pytest.mark.django_db
+def test_batched_sweep_marks_wallets_failed_when_transaction_is_not_confirmed(
+    fake_solana_rpc, payment_token
+):
+    payments_service = SolanaPaymentsService()
+    payments = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(2)
+    ]
+    for payment in payments:
+        fake_solana_rpc.airdrop(Pubkey.from_string(payment.payment_address), 10**8)
+    SolanaPayment.objects.update(paid_token=payment_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+
+    async def confirm_transactions(tx_signatures, commitment=None):
+        return [
+            ConfirmTransactionDTO(tx_signature=tx_signature)
+            for tx_signature in tx_signatures
+        ]
+
+    with patch.object(
+        SolanaTransactionSenderClient,
+        "aconfirm_transactions",
+        side_effect=confirm_transactions,
+    ):
+        payments_service.send_solana_payments_from_one_time_wallets(batch_size=10)
+
+    assert set(OneTimePaymentWallet.objects.values_list("state", flat=True)) == {
+        OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
+    }
+
+
+def _create_paid_batched_sweep_payments(fake_solana_rpc, payment_token, spl_token):
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    payments_service = SolanaPaymentsService()
+    native_payment, spl_payment = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(2)
+    ]
+    fake_solana_rpc.airdrop(Pubkey.from_string(native_payment.payment_address), 10**8)
+    fake_solana_rpc.mint_to(
+        Pubkey.from_string(spl_payment.payment_address), mint, 120_000_000
+    )
+    SolanaPayment.objects.filter(id=native_payment.id).update(paid_token=payment_token)
+    SolanaPayment.objects.filter(id=spl_payment.id).update(paid_token=spl_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    return native_payment, spl_payment
+
+
+def _wallet_state(payment):
+    return OneTimePaymentWallet.objects.get(id=payment.one_time_payment_wallet_id).state
+
+
+@pytest.mark.django_db
+def test_batched_sweep_marks_only_wallets_of_failed_transfers_as_failed(
+    fake_solana_rpc, payment_token, spl_token
+):
+    native_payment, spl_payment = _create_paid_batched_sweep_payments(
+        fake_solana_rpc, payment_token, spl_token
+    )
+    pack_transfer_group = SolanaTransactionSenderClient._pack_transfer_group
+
+    def pack_native_transfers_only(self, recipient, group, mint, **kwargs):
+        if mint is not None:
+            raise ValueError("transfer does not fit in a transaction")
+        return pack_transfer_group(self, recipient, group, mint, **kwargs)
+
+    with patch.object(
+        SolanaTransactionSenderClient,
+        "_pack_transfer_group",
+        autospec=True,
+        side_effect=pack_native_transfers_only,
+    ):
+        SolanaPaymentsService().send_solana_payments_from_one_time_wallets(
+            batch_size=10
+        )
+
+    assert _wallet_state(native_payment) == OneTimeWalletStateTypes.SENT_FUNDS
+    assert _wallet_state(spl_payment) == OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS
+
+
+@pytest.mark.django_db
+def test_batched_sweep_keeps_polling_when_a_status_request_fails(
+    fake_solana_rpc, payment_token, spl_token
+):
+    payments = _create_paid_batched_sweep_payments(
+        fake_solana_rpc, payment_token, spl_token
+    )
+    get_signature_statuses = fake_solana_rpc._rpc_getSignatureStatuses
+    status_errors = [FakeRpcError("Node is behind")]
+
+    def flaky_get_signature_statuses(*params):
+        if status_errors:
+            raise status_errors.pop()
+        return get_signature_statuses(*params)
+
+    with patch.object(
+        fake_solana_rpc,
+        "_rpc_getSignatureStatuses",
+        side_effect=flaky_get_signature_statuses,
+    ):
+        SolanaPaymentsService().send_solana_payments_from_one_time_wallets(
+            batch_size=10
+        )
+
+    # The transfers landed, so the wallets are not swept again
+    assert [_wallet_state(payment) for payment in payments] == [
+        OneTimeWalletStateTypes.SENT_FUNDS,
+        OneTimeWalletStateTypes.SENT_FUNDS,
+    ]
+
+
+@pytest.mark.django_db
+def test_batched_sweep_skips_wallets_whose_state_changed_since_loaded(
+    fake_solana_rpc, payment_token, spl_token
+):
+    native_payment, spl_payment = _create_paid_batched_sweep_payments(
+        fake_solana_rpc, payment_token, spl_token
+    )
+    send_batched = (
+        SolanaPaymentsService._send_batched_solana_payments_from_one_time_wallets
+    )
+
+    def sweep_after_other_run_swept_native_wallet(self, wallets, batch_size):
+        OneTimePaymentWallet.objects.filter(
+            id=native_payment.one_time_payment_wallet_id
+        ).update(state=OneTimeWalletStateTypes.SENT_FUNDS)
+        fake_solana_rpc.method_calls.clear()
+        return send_batched(self, wallets, batch_size)
+
+    with patch.object(
+        SolanaPaymentsService,
+        "_send_batched_solana_payments_from_one_time_wallets",
+        autospec=True,
+        side_effect=sweep_after_other_run_swept_native_wallet,
+    ):
+        SolanaPaymentsService().send_solana_payments_from_one_time_wallets(
+            batch_size=10
+        )
+
+    # Only the SPL wallet's transfer is sent, after creating the receiver's ATA
+    assert fake_solana_rpc.method_calls["sendTransaction"] == 2
+    assert (
+        fake_solana_rpc.get_lamports(Pubkey.from_string(native_payment.payment_address))
+        == 10**8
+    )
+    assert _wallet_state(native_payment) == OneTimeWalletStateTypes.SENT_FUNDS
+    assert _wallet_state(spl_payment) == OneTimeWalletStateTypes.SENT_FUNDS
+
+
+@pytest.mark.django_db
+def test_concurrent_sweep_sends_each_wallet_in_its_own_transaction(
+    settings, fake_solana_rpc, payment_token
+):
+    receiver = Keypair().pubkey()
+    settings.SOLANA_PAYMENTS = {
+        **settings.SOLANA_PAYMENTS,
+        "RECEIVER_ADDRESS": str(receiver),
+    }
+    payments_service = SolanaPaymentsService()
+    payments = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(4)
+    ]
+    for payment in payments[:3]:
+        fake_solana_rpc.airdrop(Pubkey.from_string(payment.payment_address), 10**8)
+    SolanaPayment.objects.update(paid_token=payment_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+
+    payments_service.send_solana_payments_from_one_time_wallets(concurrency=3)
+
+    assert fake_solana_rpc.method_calls["sendTransaction"] == 3
+    assert fake_solana_rpc.get_lamports(receiver) == 3 * 10**8
+    states = dict(
+        OneTimePaymentWallet.objects.values_list("id", "state").order_by("id")
+    )
+    assert [states[payment.one_time_payment_wallet_id] for payment in payments] == [
+        OneTimeWalletStateTypes.SENT_FUNDS,
+        OneTimeWalletStateTypes.SENT_FUNDS,
+        OneTimeWalletStateTypes.SENT_FUNDS,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED,
+    ]
+
+
+@pytest.mark.django_db
+def test_sweep_closes_only_swept_wallets_without_balance_in_one_transaction(
+    fake_solana_rpc, payment_token, spl_token
+):
+    mint = Pubkey.from_string(spl_token.mint_address)
+    fake_solana_rpc.create_mint(mint, decimals=6)
+    payments_service = SolanaPaymentsService()
+    payments = [
+        payments_service.create_payment({"user": None, "meta_data": {}})
+        for _ in range(4)
+    ]
+    SolanaPayment.objects.update(paid_token=payment_token)
+    OneTimePaymentWallet.objects.update(
+        state=OneTimeWalletStateTypes.PROCESSING_PAYMENT
+    )
+    # Left for the close command, the sweep must not touch it
+    OneTimePaymentWallet.objects.filter(
+        id=payments[-1].one_time_payment_wallet_id
+    ).update(state=OneTimeWalletStateTypes.PAYMENT_EXPIRED)
+    fake_solana_rpc.method_calls.clear()
+
+    payments_service.send_solana_payments_from_one_time_wallets()
+
+    assert fake_solana_rpc.method_calls["sendTransaction"] == 1
+    atas = [
+        fake_solana_rpc.get_associated_token_address(
+            Pubkey.from_string(payment.payment_address), mint
+        )
+        for payment in payments
+    ]
+    assert [fake_solana_rpc.get_token_amount(ata) for ata in atas] == [
+        None,
+        None,
+        None,
+        0,
+    ]
+    states = dict(OneTimePaymentWallet.objects.values_list("id", "state"))
+    assert [states[payment.one_time_payment_wallet_id] for payment in payments] == [
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED,
+    ]
@@ -1,8 +1,15 @@
+import json
+from io import StringIO
 from unittest.mock import patch
 
 import pytest
 from django.core.management import call_command
 
+from django_solana_payments.solana.dtos import RpcCallDTO
+from django_solana_payments.solana.enums import RpcCallOutcomeEnum, RpcPriorityEnum
+from django_solana_payments.solana.solana_rpc_instrumentation import rpc_metrics
+from django_solana_payments.solana.solana_rpc_rate_limiter import get_rpc_priority
+
 pytestmark = pytest.mark.django_db
 
 
@@ -44,9 +51,19 @@ def test_close_expired_solana_payments_with_wallets_command_calls_service(
 def test_send_solana_payments_from_one_time_wallets_command_calls_service(
     mock_send_funds,
 ):
-    call_command("send_solana_payments_from_one_time_wallets", "--sleep", "0.4")
+    call_command(
+        "send_solana_payments_from_one_time_wallets",
+        "--sleep",
+        "0.4",
+        "--batch-size",
+        "8",
+        "--concurrency",
+        "4",
+    )
 
-    mock_send_funds.assert_called_once_with(sleep_interval_seconds=0.4)
+    mock_send_funds.assert_called_once_with(
+        sleep_interval_seconds=0.4, batch_size=8, concurrency=4
+    )
 
 
 @patch(
@@ -58,3 +75,89 @@ def test_close_expired_one_time_wallets_and_reclaim_funds_command_calls_service(
     call_command("close_expired_one_time_wallets_and_reclaim_funds", "--sleep", "0.5")
 
     mock_close_wallets.assert_called_once_with(sleep_interval_seconds=0.5)
+
+
+@patch(
+    "django_solana_payments.management.commands.send_solana_payments_from_one_time_wallets.SolanaPaymentsService.send_solana_payments_from_one_time_wallets"
+)
+def test_management_commands_run_rpc_calls_with_background_priority(
+    mock_send_funds,
+):
+    priorities = []
+    mock_send_funds.side_effect = lambda **_kwargs: priorities.append(
+        get_rpc_priority()
+    )
+
+    call_command("send_solana_payments_from_one_time_wallets")
+
+    assert priorities == [RpcPriorityEnum.BACKGROUND]
+    assert get_rpc_priority() == RpcPriorityEnum.INTERACTIVE
+
+
+def test_solana_rpc_metrics_command_runs_command_and_dumps_its_rpc_metrics():
+    def run_command_with_rpc_calls(*args, **kwargs):
+        rpc_metrics(
+            RpcCallDTO(
+                method="getBalance",
+                endpoint="https://rpc.example.com",
+                duration=0.25,
+                request_size=120,
+                response_size=80,
+                outcome=RpcCallOutcomeEnum.OK,
+            )
+        )
+
+    rpc_metrics.reset()
+    stdout = StringIO()
+    with patch(
+        "django_solana_payments.management.commands.send_solana_payments_from_one_time_wallets.Command.handle",
+        side_effect=run_command_with_rpc_calls,
+    ) as mock_handle:
+        call_command(
+            "solana_rpc_metrics",
+            "--json",
+            "send_solana_payments_from_one_time_wallets",
+            "--sleep",
+            "0.4",
+            stdout=stdout,
+        )
+
+    assert mock_handle.call_args.kwargs["sleep"] == 0.4
+    metrics = json.loads(stdout.getvalue())
+    assert metrics["getBalance"]["calls"] == 1
+    assert metrics["getBalance"]["p99"] == 0.25
+    assert metrics["getBalance"]["outcomes"] == {"ok": 1}
+    rpc_metrics.reset()
+
+
+@patch(
+    "django_solana_payments.management.commands.refill_one_time_wallet_pool.OneTimeWalletService.refill_one_time_wallet_pool"
+)
+def test_refill_one_time_wallet_pool_command_calls_service(mock_refill):
+    mock_refill.return_value = {"added": 3, "pooled": 5}
+    out = StringIO()
+
+    call_command(
+        "refill_one_time_wallet_pool",
+        "--low-watermark",
+        "2",
+        "--high-watermark",
+        "5",
+        stdout=out,
+    )
+
+    mock_refill.assert_called_once_with(low_watermark=2, high_watermark=5)
+    assert "added=3, pooled=5" in out.getvalue()
+
+
+@patch(
+    "django_solana_payments.management.commands.create_pending_token_accounts.OneTimeWalletService.create_pending_one_time_wallet_token_accounts"
+)
+def test_create_pending_token_accounts_command_calls_service(mock_create):
+    mock_create.return_value = {"created": 4, "pending": 1}
+    out = StringIO()
+
+    call_command("create_pending_token_accounts", "--limit", "10", stdout=out)
+
+    mock_create.assert_called_once_with(limit=10)
+    assert "created=4, pending=1" in out.getvalue()
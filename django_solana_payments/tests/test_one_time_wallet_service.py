@@ -3,7 +3,10 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
-from solders.solders import Keypair, Pubkey
+from django.core.exceptions import ImproperlyConfigured
+from solders.solders import Keypair, Pubkey, Signature
+from solders.transaction_status import TransactionConfirmationStatus
+from spl.token.constants import TOKEN_PROGRAM_ID
 
 from django_solana_payments.choices import OneTimeWalletStateTypes, TokenTypes
 from django_solana_payments.helpers import (
@@ -12,9 +15,14 @@ from django_solana_payments.helpers import (
 )
 from django_solana_payments.models import (
     OneTimePaymentWallet,
+    OneTimeWalletTokenAccount,
     SolanaPayPaymentCryptoPrice,
 )
 from django_solana_payments.services.one_time_wallet_service import OneTimeWalletService
+from django_solana_payments.solana.dtos import (
+    CreateAssociatedTokenAccountsDTO,
+    MintInfoDTO,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -63,6 +71,228 @@ def test_create_one_time_wallet_creates_atas_when_enabled(settings, test_setting
     mock_create_atas.assert_called_once_with(wallet)
 
 
+def _token_account_info(owner: Pubkey, amount: int):
+    data = bytes(64) + amount.to_bytes(8, "little") + bytes(93)
+    return SimpleNamespace(owner=owner, data=data)
+
+
+def _create_pooled_wallet(*mint_addresses):
+    keypair = Keypair()
+    wallet = OneTimePaymentWallet.objects.create(
+        keypair_json=keypair.to_json(), state=OneTimeWalletStateTypes.POOLED
+    )
+    for mint_address in mint_addresses:
+        OneTimeWalletTokenAccount.objects.create(
+            one_time_payment_wallet=wallet,
+            mint_address=mint_address,
+            address=str(Keypair().pubkey()),
+            decimals=6,
+        )
+    return keypair, wallet
+
+
+def test_create_one_time_wallet_claims_pooled_wallet(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings, "WALLET_POOL_HIGH_WATERMARK": 5}
+    service = OneTimeWalletService()
+    usdc = _create_active_spl_token("USDC", str(Keypair().pubkey()))
+    pooled_keypair, pooled_wallet = _create_pooled_wallet(usdc.mint_address)
+
+    with patch.object(service, "create_atas_for_one_time_wallet") as mock_create_atas:
+        keypair, payment_address, wallet = service.create_one_time_wallet()
+
+    assert wallet == pooled_wallet
+    assert payment_address == str(pooled_keypair.pubkey())
+    assert keypair.pubkey() == pooled_keypair.pubkey()
+    mock_create_atas.assert_not_called()
+    wallet.refresh_from_db()
+    assert wallet.state == OneTimeWalletStateTypes.CREATED
+
+
+def test_claimed_pooled_wallet_gets_atas_of_newly_active_tokens(
+    settings, test_settings
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "WALLET_POOL_HIGH_WATERMARK": 5}
+    service = OneTimeWalletService()
+    usdc = _create_active_spl_token("USDC", str(Keypair().pubkey()))
+    pyusd = _create_active_spl_token("PYUSD", str(Keypair().pubkey()))
+    _keypair, pooled_wallet = _create_pooled_wallet(usdc.mint_address)
+
+    with patch.object(service, "create_atas_for_one_time_wallet") as mock_create_atas:
+        service.create_one_time_wallet()
+
+    mock_create_atas.assert_called_once_with(
+        pooled_wallet, [Pubkey.from_string(pyusd.mint_address)]
+    )
+
+
+def test_create_one_time_wallet_falls_back_when_pool_is_empty(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings, "WALLET_POOL_HIGH_WATERMARK": 5}
+    service = OneTimeWalletService()
+
+    with patch.object(
+        service, "create_atas_for_one_time_wallet_from_active_tokens"
+    ) as mock_create_atas:
+        _keypair, _payment_address, wallet = service.create_one_time_wallet()
+
+    mock_create_atas.assert_called_once_with(wallet)
+    assert wallet.state == OneTimeWalletStateTypes.CREATED
+
+
+def _patch_pool_token_client(service, confirmed=lambda owner: True):
+    """
+    Patches the token client calls of a pool refill. ``confirmed`` decides per wallet
+    whether its ATA transaction is confirmed.
+    """
+
+    def create_associated_token_accounts(accounts):
+        return [
+            CreateAssociatedTokenAccountsDTO(
+                accounts=[(owner, mint)],
+                tx_signature=Signature.default(),
+                confirmation_status=(
+                    TransactionConfirmationStatus.Confirmed
+                    if confirmed(owner)
+                    else None
+                ),
+            )
+            for owner, mint in accounts
+        ]
+
+    token_client = service.solana_token_client
+    return (
+        patch.object(token_client, "warm_mint_info_cache"),
+        patch.object(
+            token_client,
+            "create_associated_token_accounts",
+            side_effect=create_associated_token_accounts,
+        ),
+        patch.object(
+            token_client,
+            "get_mint_info",
+            side_effect=lambda mint: MintInfoDTO(
+                mint_address=mint, token_program_id=TOKEN_PROGRAM_ID, decimals=6
+            ),
+        ),
+        patch.object(
+            token_client,
+            "get_associated_token_address",
+            side_effect=lambda owner, mint: Keypair().pubkey(),
+        ),
+    )
+
+
+def test_refill_one_time_wallet_pool_tops_up_to_high_watermark(settings, test_settings):
+    settings.SOLANA_PAYMENTS = test_settings
+    service = OneTimeWalletService()
+    usdc = _create_active_spl_token("USDC", str(Keypair().pubkey()))
+    _create_pooled_wallet()
+
+    patch_warm, patch_create, patch_mint_info, patch_ata = _patch_pool_token_client(
+        service
+    )
+    with patch_warm, patch_create as mock_create_atas, patch_mint_info, patch_ata:
+        summary = service.refill_one_time_wallet_pool(low_watermark=1, high_watermark=3)
+
+    assert summary == {"added": 2, "pooled": 3}
+    # The ATAs of both new wallets are created with one call
+    mock_create_atas.assert_called_once()
+    accounts = mock_create_atas.call_args.args[0]
+    assert [mint for _, mint in accounts] == [Pubkey.from_string(usdc.mint_address)] * 2
+    assert (
+        OneTimePaymentWallet.objects.filter(
+            state=OneTimeWalletStateTypes.POOLED
+        ).count()
+        == 3
+    )
+    assert OneTimeWalletTokenAccount.objects.count() == 2
+
+
+def test_refill_one_time_wallet_pool_waits_for_low_watermark(settings, test_settings):
+    settings.SOLANA_PAYMENTS = test_settings
+    service = OneTimeWalletService()
+    _create_pooled_wallet()
+    _create_pooled_wallet()
+
+    with patch.object(
+        service.solana_token_client, "create_associated_token_accounts"
+    ) as mock_create_atas:
+        summary = service.refill_one_time_wallet_pool(low_watermark=1, high_watermark=3)
+
+    assert summary == {"added": 0, "pooled": 2}
+    mock_create_atas.assert_not_called()
+
+
+def test_refill_one_time_wallet_pool_keeps_wallets_pending_when_atas_fail(
+    settings, test_settings
+):
+    settings.SOLANA_PAYMENTS = test_settings
+    service = OneTimeWalletService()
+    _create_active_spl_token("USDC", str(Keypair().pubkey()))
+    failed_owners = []
+    rpc_recovered = False
+
+    def confirmed(owner):
+        # The ATA transaction of the first wallet is not confirmed
+        if not failed_owners:
+            failed_owners.append(owner)
+        return rpc_recovered or owner not in failed_owners
+
+    patch_warm, patch_create, patch_mint_info, patch_ata = _patch_pool_token_client(
+        service, confirmed=confirmed
+    )
+    with patch_warm, patch_create as mock_create_atas, patch_mint_info, patch_ata:
+        summary = service.refill_one_time_wallet_pool(low_watermark=0, high_watermark=3)
+
+        # The key of the failed wallet is kept, it is not claimable yet
+        assert summary == {"added": 2, "pooled": 2}
+        pending_wallet = OneTimePaymentWallet.objects.get(
+            state=OneTimeWalletStateTypes.POOL_PENDING
+        )
+        assert (
+            service.load_keypair(pending_wallet.keypair_json).pubkey()
+            == failed_owners[0]
+        )
+
+        rpc_recovered = True
+        summary = service.refill_one_time_wallet_pool(low_watermark=0, high_watermark=3)
+
+    assert summary == {"added": 1, "pooled": 3}
+    # Only the ATAs of the pending wallet are created again
+    assert [owner for owner, _ in mock_create_atas.call_args.args[0]] == [
+        failed_owners[0]
+    ]
+    pending_wallet.refresh_from_db()
+    assert pending_wallet.state == OneTimeWalletStateTypes.POOLED
+
+
+def test_refill_one_time_wallet_pool_keeps_keys_when_rpc_fails(settings, test_settings):
+    settings.SOLANA_PAYMENTS = test_settings
+    service = OneTimeWalletService()
+    _create_active_spl_token("USDC", str(Keypair().pubkey()))
+
+    patch_warm, _, patch_mint_info, patch_ata = _patch_pool_token_client(service)
+    with (
+        patch_warm,
+        patch_mint_info,
+        patch_ata,
+        patch.object(
+            service.solana_token_client,
+            "create_associated_token_accounts",
+            side_effect=RuntimeError("rpc down"),
+        ),
+    ):
+        summary = service.refill_one_time_wallet_pool(low_watermark=0, high_watermark=3)
+        # Pending wallets count towards the high watermark
+        service.refill_one_time_wallet_pool(low_watermark=0, high_watermark=3)
+
+    assert summary == {"added": 0, "pooled": 0}
+    assert set(OneTimePaymentWallet.objects.values_list("state", flat=True)) == {
+        OneTimeWalletStateTypes.POOL_PENDING
+    }
+    assert OneTimePaymentWallet.objects.count() == 3
+    assert OneTimeWalletTokenAccount.objects.count() == 3
+
+
 def test_create_atas_for_one_time_wallet_uses_only_active_spl_tokens_and_chunks(
     settings, test_settings
 ):
@@ -77,8 +307,8 @@ def test_create_atas_for_one_time_wallet_uses_only_active_spl_tokens_and_chunks(
         is_active=True,
         payment_crypto_price=Decimal("0.1"),
     )
-    _create_active_spl_token("USDC", str(Keypair().pubkey()))
-    _create_active_spl_token("PYUSD", str(Keypair().pubkey()))
+    usdc = _create_active_spl_token("USDC", str(Keypair().pubkey()))
+    pyusd = _create_active_spl_token("PYUSD", str(Keypair().pubkey()))
     PaymentCryptoToken.objects.create(
         name="Inactive SPL",
         symbol="INACTIVE",
@@ -92,6 +322,14 @@ def test_create_atas_for_one_time_wallet_uses_only_active_spl_tokens_and_chunks(
 
     with (
         patch.object(service, "load_keypair", return_value=sender),
+        patch.object(
+            service.solana_token_client, "warm_mint_info_cache"
+        ) as mock_warm_mint_info_cache,
+        patch.object(
+            service.solana_token_client,
+            "get_mint_info",
+            side_effect=lambda mint, **kwargs: MintInfoDTO(mint, TOKEN_PROGRAM_ID, 6),
+        ),
         patch(
             "django_solana_payments.services.one_time_wallet_service.SolanaTokenClient.create_associated_token_addresses_for_mints"
         ) as mock_create_atas,
@@ -100,11 +338,21 @@ def test_create_atas_for_one_time_wallet_uses_only_active_spl_tokens_and_chunks(
             wallet, max_atas_per_tx=1
         )
 
+    mock_warm_mint_info_cache.assert_called_once()
+    assert len(mock_warm_mint_info_cache.call_args.args[0]) == 2
+
     assert mock_create_atas.call_count == 2
     for call in mock_create_atas.call_args_list:
         assert call.kwargs["recipient"] == sender.pubkey()
         assert len(call.kwargs["mints"]) == 1
 
+    token_accounts = OneTimeWalletTokenAccount.objects.filter(
+        one_time_payment_wallet=wallet
+    )
+    assert sorted(token_accounts.values_list("mint_address", "decimals")) == sorted(
+        [(usdc.mint_address, 6), (pyusd.mint_address, 6)]
+    )
+
 
 def test_close_one_time_wallet_atas_returns_true_when_no_related_spl_tokens(
     settings, test_settings, solana_payment, payment_token
@@ -165,18 +413,10 @@ def test_close_one_time_wallet_atas_closes_only_zero_balance_accounts(
         ),
         patch.object(
             service.solana_token_client,
-            "get_account_info",
-            side_effect=[
-                SimpleNamespace(value=SimpleNamespace(owner=owner)),
-                SimpleNamespace(value=SimpleNamespace(owner=owner)),
-            ],
-        ),
-        patch.object(
-            service.solana_token_client,
-            "get_token_account_balance",
-            side_effect=[
-                SimpleNamespace(value=SimpleNamespace(amount="0")),
-                SimpleNamespace(value=SimpleNamespace(amount="9")),
+            "get_account_infos",
+            return_value=[
+                _token_account_info(owner, amount=0),
+                _token_account_info(owner, amount=9),
             ],
         ),
         patch.object(
@@ -222,9 +462,7 @@ def test_close_one_time_wallet_atas_returns_true_when_no_ata_is_eligible(
             return_value=Keypair().pubkey(),
         ),
         patch.object(
-            service.solana_token_client,
-            "get_account_info",
-            return_value=SimpleNamespace(value=None),
+            service.solana_token_client, "get_account_infos", return_value=[None]
         ),
         patch.object(
             service.solana_token_client,
@@ -271,3 +509,217 @@ def test_close_expired_one_time_wallets_updates_only_successfully_closed_wallets
     assert wallet_2.state == OneTimeWalletStateTypes.PAYMENT_EXPIRED
     assert wallet_3.state == OneTimeWalletStateTypes.CREATED
     assert mock_close.call_count == 2
+
+
+def test_close_one_time_wallet_atas_reads_only_stored_token_accounts(
+    settings, test_settings, one_time_wallet
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "ATA_CREATION_MODE": "on_select"}
+    service = OneTimeWalletService()
+    ata = Keypair().pubkey()
+    OneTimeWalletTokenAccount.objects.create(
+        one_time_payment_wallet=one_time_wallet,
+        mint_address=str(Keypair().pubkey()),
+        address=str(ata),
+        decimals=6,
+    )
+    receiver = Pubkey.from_string(test_settings["FEE_PAYER_ADDRESS"])
+
+    with (
+        patch.object(service, "load_keypair", return_value=Keypair()),
+        patch.object(
+            service.solana_token_client,
+            "get_account_infos",
+            return_value=[_token_account_info(TOKEN_PROGRAM_ID, amount=0)],
+        ) as mock_get_account_infos,
+        patch.object(
+            service.solana_token_client, "get_associated_token_address"
+        ) as mock_get_ata,
+        patch.object(
+            service.solana_token_client,
+            "close_associated_token_accounts_and_recover_rent",
+            return_value=True,
+        ) as mock_close,
+    ):
+        assert service.close_one_time_wallet_atas(one_time_wallet, receiver) is True
+
+    mock_get_account_infos.assert_called_once_with([ata])
+    mock_get_ata.assert_not_called()
+    assert mock_close.call_args.kwargs["accounts_to_close"] == [ata]
+
+
+def test_close_one_time_wallet_atas_skips_rpc_when_no_ata_was_created(
+    settings, test_settings, solana_payment
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "ATA_CREATION_MODE": "payer"}
+    service = OneTimeWalletService()
+    token = _create_active_spl_token("USDCL", str(Keypair().pubkey()))
+    solana_payment.crypto_prices.add(
+        SolanaPayPaymentCryptoPrice.objects.create(
+            token=token, amount_in_crypto=Decimal("1")
+        )
+    )
+    receiver = Pubkey.from_string(test_settings["FEE_PAYER_ADDRESS"])
+
+    with (
+        patch.object(service, "load_keypair", return_value=Keypair()),
+        patch.object(
+            service.solana_token_client, "get_account_infos"
+        ) as mock_get_account_infos,
+    ):
+        result = service.close_one_time_wallet_atas(
+            solana_payment.one_time_payment_wallet, receiver
+        )
+
+    assert result is True
+    mock_get_account_infos.assert_not_called()
+
+
+@pytest.mark.parametrize("ata_creation_mode", ["on_select", "payer"])
+def test_create_one_time_wallet_skips_atas_in_lazy_modes(
+    settings, test_settings, ata_creation_mode
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "ATA_CREATION_MODE": ata_creation_mode,
+    }
+    service = OneTimeWalletService()
+
+    with patch.object(
+        service, "create_atas_for_one_time_wallet_from_active_tokens"
+    ) as mock_create_atas:
+        service.create_one_time_wallet()
+
+    mock_create_atas.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "ata_creation_mode, pending_creation", [("on_select", True), ("payer", False)]
+)
+def test_create_one_time_wallet_token_account_records_selected_token(
+    settings, test_settings, one_time_wallet, ata_creation_mode, pending_creation
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "ATA_CREATION_MODE": ata_creation_mode,
+    }
+    service = OneTimeWalletService()
+    owner = Keypair().pubkey()
+    mint = Keypair().pubkey()
+    ata = Keypair().pubkey()
+
+    with (
+        patch.object(
+            service.solana_token_client,
+            "get_mint_info",
+            return_value=MintInfoDTO(mint, TOKEN_PROGRAM_ID, 6),
+        ),
+        patch.object(
+            service.solana_token_client,
+            "get_associated_token_address",
+            return_value=ata,
+        ),
+        patch.object(
+            service.solana_token_client,
+            "create_associated_token_addresses_for_mints",
+        ) as mock_create_atas,
+    ):
+        token_account = service.create_one_time_wallet_token_account(
+            one_time_wallet, owner, mint
+        )
+
+    assert token_account.address == str(ata)
+    assert token_account.decimals == 6
+    assert OneTimeWalletTokenAccount.objects.filter(
+        one_time_payment_wallet=one_time_wallet,
+        mint_address=str(mint),
+        pending_creation=pending_creation,
+    ).exists()
+    # The verification path never sends a transaction
+    mock_create_atas.assert_not_called()
+
+
+def test_create_pending_one_time_wallet_token_accounts_keeps_unconfirmed_pending(
+    settings, test_settings
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "ATA_CREATION_MODE": "on_select"}
+    service = OneTimeWalletService()
+    mint_address = str(Keypair().pubkey())
+    token_accounts = {}
+    for state in [
+        OneTimeWalletStateTypes.CREATED,
+        OneTimeWalletStateTypes.PROCESSING_PAYMENT,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED,
+    ]:
+        keypair, wallet = _create_pooled_wallet(mint_address)
+        OneTimePaymentWallet.objects.filter(id=wallet.id).update(state=state)
+        wallet.token_accounts.update(pending_creation=True)
+        token_accounts[state] = (keypair.pubkey(), wallet.token_accounts.get())
+    unconfirmed_owner = token_accounts[OneTimeWalletStateTypes.CREATED][0]
+
+    patch_warm, patch_create, _, _ = _patch_pool_token_client(
+        service, confirmed=lambda owner: owner != unconfirmed_owner
+    )
+    with patch_warm, patch_create as mock_create:
+        summary = service.create_pending_one_time_wallet_token_accounts()
+
+    assert summary == {"created": 1, "pending": 1}
+    # ATAs of wallets whose payment ended are not created
+    assert {owner for owner, _ in mock_create.call_args.args[0]} == {
+        token_accounts[OneTimeWalletStateTypes.CREATED][0],
+        token_accounts[OneTimeWalletStateTypes.PROCESSING_PAYMENT][0],
+    }
+    pending = {
+        state: OneTimeWalletTokenAccount.objects.get(
+            id=token_account.id
+        ).pending_creation
+        for state, (_, token_account) in token_accounts.items()
+    }
+    assert pending == {
+        OneTimeWalletStateTypes.CREATED: True,
+        OneTimeWalletStateTypes.PROCESSING_PAYMENT: False,
+        OneTimeWalletStateTypes.PAYMENT_EXPIRED: True,
+    }
+
+
+def test_unsupported_ata_creation_mode_raises(settings, test_settings):
+    settings.SOLANA_PAYMENTS = {**test_settings, "ATA_CREATION_MODE": "lazy"}
+
+    with pytest.raises(ImproperlyConfigured):
+        OneTimeWalletService.get_ata_creation_mode()
+
+
+def test_close_one_time_wallets_atas_skips_wallet_with_unreadable_account(
+    settings, test_settings
+):
+    settings.SOLANA_PAYMENTS = test_settings
+    service = OneTimeWalletService()
+    (_, first_wallet), (second_keypair, second_wallet) = [
+        _create_pooled_wallet(str(Keypair().pubkey())) for _ in range(2)
+    ]
+    receiver = Pubkey.from_string(test_settings["FEE_PAYER_ADDRESS"])
+
+    with (
+        patch.object(
+            service.solana_token_client,
+            "get_account_infos",
+            return_value=[
+                SimpleNamespace(owner=TOKEN_PROGRAM_ID, data=b"malformed"),
+                _token_account_info(TOKEN_PROGRAM_ID, amount=0),
+            ],
+        ),
+        patch.object(
+            service.solana_token_client,
+            "close_token_accounts_of_owners",
+            return_value=[True],
+        ) as mock_close,
+    ):
+        closed_ids = service.close_one_time_wallets_atas(
+            [first_wallet, second_wallet], receiver
+        )
+
+    assert closed_ids == [second_wallet.id]
+    ((owner_keypair, token_accounts),) = mock_close.call_args.args[0]
+    assert owner_keypair.pubkey() == second_keypair.pubkey()
+    ata = Pubkey.from_string(second_wallet.token_accounts.get().address)
+    assert token_accounts == [(ata, TOKEN_PROGRAM_ID)]
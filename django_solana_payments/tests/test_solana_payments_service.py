@@ -1,5 +1,7 @@
+import asyncio
 from datetime import timedelta
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -221,6 +223,40 @@ def test_send_solana_payments_returns_early_when_no_wallets_to_process(
     mock_send_transaction.assert_not_called()
 
 
+@pytest.mark.django_db
+def test_concurrent_sweep_keeps_at_most_concurrency_wallets_in_flight(one_time_wallet):
+    sweeps = [SimpleNamespace(wallet=one_time_wallet) for _ in range(6)]
+    in_flight = []
+    max_in_flight = []
+
+    async def sweep_one_time_wallet(sweep, solana_transaction_sender_client):
+        in_flight.append(sweep)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(sweep)
+        return sweep is not sweeps[0]
+
+    service = SolanaPaymentsService()
+    with (
+        patch.object(service, "_prepare_one_time_wallet_sweeps", return_value=sweeps),
+        patch.object(
+            service, "_asweep_one_time_wallet", side_effect=sweep_one_time_wallet
+        ),
+        patch.object(
+            service, "_close_one_time_wallets_without_balance"
+        ) as mock_close_wallets,
+    ):
+        service._send_concurrent_solana_payments_from_one_time_wallets(
+            [one_time_wallet], concurrency=2
+        )
+
+    assert max(max_in_flight) == 2
+    assert len(max_in_flight) == 6
+    # Wallets without balance are closed after the concurrent sweep
+    mock_close_wallets.assert_called_once()
+    assert mock_close_wallets.call_args.args[0] == [one_time_wallet]
+
+
 @pytest.mark.django_db
 @patch(
     "django_solana_payments.services.solana_payments_service.VerifyTransactionService.verify_transaction_and_process_payment"
@@ -409,6 +445,9 @@ def test_send_solana_payments_from_one_time_wallets_sends_spl_balance(
 @patch(
     "django_solana_payments.services.solana_payments_service.one_time_wallet_service.close_expired_one_time_wallets"
 )
+@patch(
+    "django_solana_payments.services.solana_payments_service.one_time_wallet_service.close_one_time_wallets_atas"
+)
 @patch(
     "django_solana_payments.services.solana_payments_service.one_time_wallet_service.load_keypair"
 )
@@ -416,6 +455,7 @@ def test_send_solana_payments_from_one_time_wallets_sends_spl_balance(
 def test_send_solana_payments_from_one_time_wallets_marks_wallet_expired_when_no_balance(
     mock_balance_client_cls,
     mock_load_keypair,
+    mock_close_wallets_atas,
     mock_close_expired_wallets,
     mock_send_transaction,
     solana_payment,
@@ -429,10 +469,14 @@ def test_send_solana_payments_from_one_time_wallets_marks_wallet_expired_when_no
     mock_load_keypair.return_value = Keypair()
     mock_balance_client = mock_balance_client_cls.return_value
     mock_balance_client.get_balance_by_address.return_value = Decimal("0")
+    mock_close_wallets_atas.return_value = [wallet.id]
 
     SolanaPaymentsService().send_solana_payments_from_one_time_wallets()
 
     mock_send_transaction.assert_not_called()
-    mock_close_expired_wallets.assert_called_once_with(sleep_interval_seconds=0.2)
+    # Only the swept wallet is closed, not every payment expired wallet
+    mock_close_expired_wallets.assert_not_called()
+    mock_close_wallets_atas.assert_called_once()
+    assert mock_close_wallets_atas.call_args.args[0] == [wallet]
     wallet.refresh_from_db()
     assert wallet.state == OneTimeWalletStateTypes.PAYMENT_EXPIRED_AND_WALLET_CLOSED
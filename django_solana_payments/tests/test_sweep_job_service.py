@@ -0,0 +1,287 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.utils import timezone
+
+from django_solana_payments.choices import (
+    OneTimeWalletStateTypes,
+    SweepJobStatusTypes,
+)
+from django_solana_payments.models import OneTimePaymentWallet, SweepJob
+from django_solana_payments.services.solana_payments_service import (
+    SolanaPaymentsService,
+)
+from django_solana_payments.services.sweep_job_service import (
+    DjangoTasksSweepJobBackend,
+    enqueue_sweep_job,
+    fail_sweep_job_attempt,
+    process_pending_sweep_jobs,
+    process_sweep_job,
+    requeue_stale_sweep_jobs,
+)
+from django_solana_payments.solana.enums import TransactionTypeEnum
+
+pytestmark = pytest.mark.django_db
+
+RECIPIENT = "11111111111111111111111111111111"
+
+
+def _enqueue(wallet, **kwargs):
+    return enqueue_sweep_job(
+        RECIPIENT, wallet, Decimal("0.1"), TransactionTypeEnum.NATIVE, **kwargs
+    )
+
+
+def test_enqueue_sweep_job_hands_job_to_backend_after_commit(
+    settings, test_settings, one_time_wallet, django_capture_on_commit_callbacks
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "SWEEP_JOB_BACKEND": "django_solana_payments.services.sweep_job_service.ImmediateSweepJobBackend",
+    }
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        return_value=OneTimeWalletStateTypes.SENT_FUNDS,
+    ) as mock_send:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            sweep_job = _enqueue(one_time_wallet)
+
+        one_time_wallet.refresh_from_db()
+        assert one_time_wallet.state == OneTimeWalletStateTypes.PROCESSING_FUNDS
+        mock_send.assert_not_called()
+
+        callbacks[0]()
+
+    mock_send.assert_called_once()
+    assert mock_send.call_args.kwargs["amount"] == Decimal("0.1")
+    sweep_job.refresh_from_db()
+    assert sweep_job.status == SweepJobStatusTypes.SUCCEEDED
+    assert sweep_job.attempts == 1
+
+
+def test_enqueue_sweep_job_requires_mint_for_spl(one_time_wallet):
+    with pytest.raises(ValueError):
+        enqueue_sweep_job(
+            RECIPIENT, one_time_wallet, Decimal("1"), TransactionTypeEnum.SPL
+        )
+
+    assert not SweepJob.objects.exists()
+
+
+def test_enqueue_sweep_job_reuses_queued_job_of_wallet(one_time_wallet):
+    sweep_job = _enqueue(one_time_wallet)
+
+    assert _enqueue(one_time_wallet) == sweep_job
+    assert SweepJob.objects.count() == 1
+
+
+def test_sweep_job_is_processed_once(one_time_wallet):
+    sweep_job = _enqueue(one_time_wallet)
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        return_value=OneTimeWalletStateTypes.SENT_FUNDS,
+    ) as mock_send:
+        assert process_sweep_job(sweep_job.id) is True
+        assert process_sweep_job(sweep_job.id) is False
+
+    mock_send.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "send_result",
+    [OneTimeWalletStateTypes.FAILED_TO_SEND_FUNDS, RuntimeError("rpc down")],
+)
+def test_failed_sweep_job_is_marked_failed(
+    settings, test_settings, one_time_wallet, send_result
+):
+    settings.SOLANA_PAYMENTS = {**test_settings, "SWEEP_JOB_MAX_ATTEMPTS": 1}
+    other_wallet = OneTimePaymentWallet.objects.create(
+        keypair_json=one_time_wallet.keypair_json
+    )
+    first_job = _enqueue(one_time_wallet)
+    second_job = _enqueue(other_wallet)
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        side_effect=[send_result, OneTimeWalletStateTypes.SENT_FUNDS],
+    ):
+        summary = process_pending_sweep_jobs()
+
+    assert summary == {"processed": 2, "succeeded": 1, "failed": 1, "requeued": 0}
+    first_job.refresh_from_db()
+    second_job.refresh_from_db()
+    assert first_job.status == SweepJobStatusTypes.FAILED
+    assert first_job.last_error
+    assert second_job.status == SweepJobStatusTypes.SUCCEEDED
+
+
+def test_failed_sweep_job_attempt_is_retried_with_backoff(
+    settings, test_settings, one_time_wallet
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "SWEEP_JOB_MAX_ATTEMPTS": 3,
+        "SWEEP_JOB_RETRY_BACKOFF": 60,
+    }
+    sweep_job = _enqueue(one_time_wallet)
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        side_effect=[RuntimeError("rpc down"), OneTimeWalletStateTypes.SENT_FUNDS],
+    ) as mock_send:
+        assert process_pending_sweep_jobs()["failed"] == 1
+        sweep_job.refresh_from_db()
+        assert sweep_job.status == SweepJobStatusTypes.PENDING
+        assert sweep_job.last_error == "rpc down"
+        assert sweep_job.next_attempt_at > timezone.now() + timedelta(seconds=50)
+
+        # Not retried before its backoff has passed
+        assert process_pending_sweep_jobs()["processed"] == 0
+
+        SweepJob.objects.filter(id=sweep_job.id).update(next_attempt_at=timezone.now())
+        assert process_pending_sweep_jobs()["succeeded"] == 1
+
+    assert mock_send.call_count == 2
+    sweep_job.refresh_from_db()
+    assert sweep_job.status == SweepJobStatusTypes.SUCCEEDED
+    assert sweep_job.attempts == 2
+
+
+@pytest.mark.parametrize(
+    "attempts, status",
+    [(1, SweepJobStatusTypes.PENDING), (3, SweepJobStatusTypes.FAILED)],
+)
+def test_stale_running_sweep_job_is_requeued_until_attempts_cap(
+    settings, test_settings, one_time_wallet, attempts, status
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "SWEEP_JOB_TIMEOUT": 600,
+        "SWEEP_JOB_MAX_ATTEMPTS": 3,
+    }
+    stale_job = _enqueue(one_time_wallet)
+    running_job = _enqueue(
+        OneTimePaymentWallet.objects.create(keypair_json=one_time_wallet.keypair_json)
+    )
+    SweepJob.objects.filter(id=stale_job.id).update(
+        status=SweepJobStatusTypes.RUNNING,
+        attempts=attempts,
+        started_at=timezone.now() - timedelta(seconds=601),
+    )
+    SweepJob.objects.filter(id=running_job.id).update(
+        status=SweepJobStatusTypes.RUNNING, attempts=1, started_at=timezone.now()
+    )
+
+    assert process_pending_sweep_jobs() == {
+        "processed": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "requeued": 1,
+    }
+
+    stale_job.refresh_from_db()
+    running_job.refresh_from_db()
+    assert stale_job.status == status
+    assert stale_job.last_error == "Timed out while running"
+    assert running_job.status == SweepJobStatusTypes.RUNNING
+
+
+@pytest.mark.parametrize(
+    "send_result",
+    [OneTimeWalletStateTypes.SENT_FUNDS, RuntimeError("Transaction not confirmed")],
+)
+def test_slow_sweep_job_attempt_keeps_state_of_requeued_job(
+    one_time_wallet, send_result
+):
+    sweep_job = _enqueue(one_time_wallet)
+
+    def requeue_and_finish(**kwargs):
+        SweepJob.objects.filter(id=sweep_job.id).update(
+            started_at=timezone.now() - timedelta(seconds=601)
+        )
+        assert requeue_stale_sweep_jobs() == 1
+        if isinstance(send_result, Exception):
+            raise send_result
+        return send_result
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        side_effect=requeue_and_finish,
+    ):
+        process_sweep_job(sweep_job.id)
+
+    sweep_job.refresh_from_db()
+    assert sweep_job.status == SweepJobStatusTypes.PENDING
+    assert sweep_job.last_error == "Timed out while running"
+
+
+def test_fail_sweep_job_attempt_skips_job_finished_since_read(one_time_wallet):
+    sweep_job = _enqueue(one_time_wallet)
+    SweepJob.objects.filter(id=sweep_job.id).update(
+        status=SweepJobStatusTypes.RUNNING, attempts=1, started_at=timezone.now()
+    )
+    running_job = SweepJob.objects.get(id=sweep_job.id)
+    SweepJob.objects.filter(id=sweep_job.id).update(
+        status=SweepJobStatusTypes.SUCCEEDED
+    )
+
+    assert fail_sweep_job_attempt(running_job, "Timed out while running") is False
+
+    sweep_job.refresh_from_db()
+    assert sweep_job.status == SweepJobStatusTypes.SUCCEEDED
+    assert sweep_job.last_error == ""
+
+
+def test_django_tasks_backend_enqueues_task(one_time_wallet):
+    sweep_job = _enqueue(one_time_wallet)
+    task = MagicMock()
+
+    with patch("django_solana_payments.tasks.process_sweep_job_task", task):
+        DjangoTasksSweepJobBackend().enqueue(sweep_job)
+
+    task.enqueue.assert_called_once_with(sweep_job.id)
+
+
+def test_django_tasks_backend_requires_tasks_framework(one_time_wallet):
+    sweep_job = _enqueue(one_time_wallet)
+
+    with patch("django_solana_payments.tasks.process_sweep_job_task", None):
+        with pytest.raises(ImproperlyConfigured):
+            DjangoTasksSweepJobBackend().enqueue(sweep_job)
+
+
+def test_process_sweep_jobs_command_reports_summary(one_time_wallet):
+    _enqueue(one_time_wallet)
+    out = StringIO()
+
+    with patch(
+        "django_solana_payments.services.sweep_job_service.send_transaction_and_update_one_time_wallet",
+        return_value=OneTimeWalletStateTypes.SENT_FUNDS,
+    ):
+        call_command("process_sweep_jobs", stdout=out)
+
+    assert "processed=1, succeeded=1, failed=0, requeued=0" in out.getvalue()
+
+
+def test_send_from_one_time_wallets_skips_wallets_with_queued_sweep_job(
+    one_time_wallet,
+):
+    _enqueue(one_time_wallet)
+
+    with patch(
+        "django_solana_payments.services.solana_payments_service.SolanaBalanceClient"
+    ) as mock_balance_client_class:
+        SolanaPaymentsService().send_solana_payments_from_one_time_wallets()
+
+    mock_balance_client_class.assert_not_called()
+    assert (
+        OneTimePaymentWallet.objects.get(id=one_time_wallet.id).state
+        == OneTimeWalletStateTypes.PROCESSING_FUNDS
+    )
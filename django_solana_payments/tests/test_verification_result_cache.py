@@ -0,0 +1,177 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from solders.signature import Signature
+
+from django_solana_payments.choices import SolanaPaymentStatusTypes
+from django_solana_payments.exceptions import (
+    InvalidPaymentAmountError,
+    PaymentError,
+    PaymentNotConfirmedError,
+)
+from django_solana_payments.services import verification_result_cache as cache_module
+from django_solana_payments.services.verification_result_cache import (
+    verification_result_cache,
+)
+from django_solana_payments.services.verify_transaction_service import (
+    VerifyTransactionService,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class ReferencedPaymentError(PaymentError):
+    def __init__(self, reference: str):
+        super().__init__(f"Payment {reference} failed")
+        self.reference = reference
+        self.detail = {"reference": reference}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _verify(solana_payment, payment_token):
+    return VerifyTransactionService().verify_transaction_and_process_payment(
+        solana_payment.payment_address,
+        payment_token,
+        send_payment_accepted_signal=False,
+        use_result_cache=True,
+    )
+
+
+def test_poll_burst_runs_one_chain_verification(
+    solana_payment, payment_token, payment_crypto_price
+):
+    with patch.object(
+        VerifyTransactionService,
+        "validate_transfer_amount",
+        return_value=([], Decimal("0")),
+    ) as validate_transfer_amount:
+        statuses = [_verify(solana_payment, payment_token) for _ in range(3)]
+
+    assert statuses == [SolanaPaymentStatusTypes.INITIATED] * 3
+    validate_transfer_amount.assert_called_once()
+
+
+def test_negative_result_expires_after_negative_ttl(
+    settings, test_settings, solana_payment, payment_token, payment_crypto_price
+):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "VERIFICATION_CACHE_TTL": 60,
+        "VERIFICATION_CACHE_NEGATIVE_TTL": 2,
+    }
+    now = 1000.0
+    with (
+        patch.object(cache_module, "time", SimpleNamespace(time=lambda: now)),
+        patch.object(
+            VerifyTransactionService,
+            "validate_transfer_amount",
+            return_value=([], Decimal("0")),
+        ) as validate_transfer_amount,
+    ):
+        _verify(solana_payment, payment_token)
+        now += 1
+        _verify(solana_payment, payment_token)
+        now += 2
+        _verify(solana_payment, payment_token)
+
+    assert validate_transfer_amount.call_count == 2
+
+
+def test_verification_errors_are_cached_and_raised_again(
+    solana_payment, payment_token, payment_crypto_price
+):
+    with patch.object(
+        VerifyTransactionService,
+        "validate_transfer_amount",
+        side_effect=InvalidPaymentAmountError(expected=Decimal("1"), actual=0),
+    ) as validate_transfer_amount:
+        for _ in range(2):
+            with pytest.raises(InvalidPaymentAmountError) as exc_info:
+                _verify(solana_payment, payment_token)
+
+    validate_transfer_amount.assert_called_once()
+    assert exc_info.value.expected == Decimal("1")
+    assert "expected=1" in str(exc_info.value)
+
+
+def test_payment_state_change_invalidates_cached_results(
+    solana_payment, payment_token, spl_token
+):
+    address = solana_payment.payment_address
+    verification_result_cache.set_status(
+        address, payment_token.pk, SolanaPaymentStatusTypes.INITIATED
+    )
+    verification_result_cache.set_status(
+        address, spl_token.pk, SolanaPaymentStatusTypes.INITIATED
+    )
+
+    # PROCESSED is stored first, then reported as not confirmed yet
+    with pytest.raises(PaymentNotConfirmedError):
+        VerifyTransactionService().update_solana_payment(
+            solana_payment,
+            SolanaPaymentStatusTypes.PROCESSED,
+            Signature.default(),
+            payment_token,
+        )
+
+    assert verification_result_cache.get(address, payment_token.pk) is None
+    assert verification_result_cache.get(address, spl_token.pk) is None
+
+
+def test_zero_ttl_disables_the_cache(settings, test_settings, solana_payment):
+    settings.SOLANA_PAYMENTS = {
+        **test_settings,
+        "VERIFICATION_CACHE_TTL": 0,
+        "VERIFICATION_CACHE_NEGATIVE_TTL": 0,
+    }
+
+    verification_result_cache.set_status(
+        solana_payment.payment_address, 1, SolanaPaymentStatusTypes.CONFIRMED
+    )
+
+    assert verification_result_cache.get(solana_payment.payment_address, 1) is None
+
+
+def test_cached_errors_are_rebuilt_with_their_constructor(solana_payment):
+    address = solana_payment.payment_address
+    verification_result_cache.set_error(address, 1, ReferencedPaymentError("abc"))
+    verification_result_cache.set_error(address, 2, PaymentNotConfirmedError())
+
+    with pytest.raises(ReferencedPaymentError) as exc_info:
+        verification_result_cache.get(address, 1)
+    with pytest.raises(PaymentNotConfirmedError):
+        verification_result_cache.get(address, 2)
+
+    # Attributes set in __init__ survive the cache round trip
+    assert exc_info.value.detail == {"reference": "abc"}
+    assert str(exc_info.value) == "Payment abc failed"
+
+
+def test_result_computed_before_invalidation_is_not_cached(
+    solana_payment, payment_token
+):
+    address = solana_payment.payment_address
+    generation = verification_result_cache.get_generation(address)
+    verification_result_cache.set_status(
+        address, payment_token.pk, SolanaPaymentStatusTypes.CONFIRMED
+    )
+
+    # The payment changes state while another verification is still running
+    verification_result_cache.invalidate(address)
+    verification_result_cache.set_status(
+        address,
+        payment_token.pk,
+        SolanaPaymentStatusTypes.INITIATED,
+        generation=generation,
+    )
+
+    assert verification_result_cache.get(address, payment_token.pk) is None
@@ -23,6 +23,9 @@ from django_solana_payments.helpers import (
 from django_solana_payments.models import (
     OneTimePaymentWallet,
 )
+from django_solana_payments.services.verification_result_cache import (
+    verification_result_cache,
+)
 from django_solana_payments.services.verify_transaction_service import (
     VerifyTransactionService,
 )
@@ -148,11 +151,11 @@ class TestVerifyTransactionAndProcessPayment:
         """Test when no transactions are found for the payment address."""
         # Setup mocks
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
-        mock_query_client.get_transactions_for_address.return_value = []
+        mock_query_client.get_new_transactions_for_address.return_value = ([], None)
         mock_query_client_class.return_value = mock_query_client
 
         service = VerifyTransactionService()
@@ -166,7 +169,7 @@ class TestVerifyTransactionAndProcessPayment:
 
     @pytest.mark.django_db
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -178,7 +181,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        mock_send_to_main,
+        mock_enqueue_sweep_job,
         solana_payment,
         payment_token,
         payment_crypto_price,
@@ -191,7 +194,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Setup balance client mock
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         # Setup transaction query client mock
@@ -208,7 +211,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
 
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
 
         # Mock fee payer to not be sender address
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
@@ -239,8 +245,8 @@ class TestVerifyTransactionAndProcessPayment:
         ]
         assert solana_payment.paid_token == payment_token
 
-        # Verify send to main wallet was called
-        mock_send_to_main.assert_called_once()
+        # Verify the transfer to the main wallet was queued
+        mock_enqueue_sweep_job.assert_called_once()
 
     @pytest.mark.django_db
     @patch(
@@ -265,7 +271,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Setup balance client mock - balance less than expected
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal(
+        mock_balance_client.lamports_to_sol.return_value = Decimal(
             "0.05"
         )  # Less than expected 0.1
         mock_balance_client_class.return_value = mock_balance_client
@@ -275,7 +281,10 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Create mock transaction
         mock_transaction = MagicMock(spec=GetTransactionResp)
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
 
         # Mock fee payer to not be sender address
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
@@ -300,9 +309,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Mock to prevent actual transaction verification
         with patch.object(
-            service,
-            "validate_solana_payment",
-            return_value=SolanaPaymentStatusTypes.CONFIRMED,
+            service, "validate_transfer_amount", return_value=([], Decimal("0"))
         ):
             service.verify_transaction_and_process_payment(
                 payment_address=solana_payment.payment_address,
@@ -316,12 +323,39 @@ class TestVerifyTransactionAndProcessPayment:
             == OneTimeWalletStateTypes.PROCESSING_PAYMENT
         )
 
+    @pytest.mark.django_db
+    def test_poll_of_accepted_payment_keeps_wallet_state(
+        self, solana_payment, payment_token
+    ):
+        """A poll after acceptance does not move a wallet whose funds are being swept."""
+        SolanaPayment.objects.filter(id=solana_payment.id).update(
+            status=SolanaPaymentStatusTypes.CONFIRMED
+        )
+        OneTimePaymentWallet.objects.filter(
+            id=solana_payment.one_time_payment_wallet.id
+        ).update(state=OneTimeWalletStateTypes.PROCESSING_FUNDS)
+        service = VerifyTransactionService()
+
+        with patch.object(service, "validate_transfer_amount") as mock_validate:
+            result = service.verify_transaction_and_process_payment(
+                payment_address=solana_payment.payment_address,
+                payment_crypto_token=payment_token,
+            )
+
+        assert result == SolanaPaymentStatusTypes.CONFIRMED
+        mock_validate.assert_not_called()
+        solana_payment.one_time_payment_wallet.refresh_from_db()
+        assert (
+            solana_payment.one_time_payment_wallet.state
+            == OneTimeWalletStateTypes.PROCESSING_FUNDS
+        )
+
     @pytest.mark.django_db
     @patch(
         "django_solana_payments.services.verify_transaction_service.solana_payment_accepted"
     )
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -333,7 +367,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        mock_send_to_main,
+        mock_enqueue_sweep_job,
         mock_signal,
         solana_payment,
         payment_token,
@@ -347,7 +381,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Setup mocks
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
@@ -359,7 +393,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status = MagicMock()
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
         mock_query_client_class.return_value = mock_query_client
         mock_signal.send_robust.return_value = []
@@ -391,7 +428,7 @@ class TestVerifyTransactionAndProcessPayment:
         "django_solana_payments.services.verify_transaction_service.solana_payment_accepted"
     )
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -403,7 +440,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        _mock_send_to_main,
+        _mock_enqueue_sweep_job,
         mock_signal,
         solana_payment,
         payment_token,
@@ -414,7 +451,7 @@ class TestVerifyTransactionAndProcessPayment:
         settings.SOLANA_PAYMENTS = test_settings
 
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
@@ -425,7 +462,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status = MagicMock()
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
         mock_query_client_class.return_value = mock_query_client
 
@@ -452,7 +492,7 @@ class TestVerifyTransactionAndProcessPayment:
         "django_solana_payments.services.verify_transaction_service.solana_payment_accepted"
     )
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -464,7 +504,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        mock_send_to_main,
+        mock_enqueue_sweep_job,
         mock_signal,
         solana_payment,
         payment_token,
@@ -478,7 +518,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Setup mocks
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
@@ -490,7 +530,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status = MagicMock()
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
         mock_query_client_class.return_value = mock_query_client
         mock_signal.send_robust.return_value = []
@@ -522,7 +565,7 @@ class TestVerifyTransactionAndProcessPayment:
 
     @pytest.mark.django_db
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -534,7 +577,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        mock_send_to_main,
+        mock_enqueue_sweep_job,
         solana_payment,
         payment_token,
         payment_crypto_price,
@@ -547,7 +590,7 @@ class TestVerifyTransactionAndProcessPayment:
 
         # Setup mocks
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
@@ -559,7 +602,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status = MagicMock()
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
         mock_query_client_class.return_value = mock_query_client
 
@@ -585,7 +631,7 @@ class TestVerifyTransactionAndProcessPayment:
         "django_solana_payments.services.verify_transaction_service.solana_payment_accepted"
     )
     @patch(
-        "django_solana_payments.services.verify_transaction_service.send_solana_transaction_to_main_wallet"
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
     )
     @patch(
         "django_solana_payments.services.verify_transaction_service.SolanaBalanceClient"
@@ -597,7 +643,7 @@ class TestVerifyTransactionAndProcessPayment:
         self,
         mock_query_client_class,
         mock_balance_client_class,
-        _mock_send_to_main,
+        _mock_enqueue_sweep_job,
         mock_signal,
         solana_payment,
         payment_token,
@@ -611,7 +657,7 @@ class TestVerifyTransactionAndProcessPayment:
         solana_payment.save(update_fields=["meta_data", "updated"])
 
         mock_balance_client = MagicMock()
-        mock_balance_client.get_balance_by_address.return_value = Decimal("0.1")
+        mock_balance_client.lamports_to_sol.return_value = Decimal("0.1")
         mock_balance_client_class.return_value = mock_balance_client
 
         mock_query_client = MagicMock()
@@ -622,7 +668,10 @@ class TestVerifyTransactionAndProcessPayment:
         mock_tx_status = MagicMock()
         mock_tx_status.confirmation_status = TransactionConfirmationStatus.Confirmed
         mock_query_client.get_signatures_statuses.return_value = [mock_tx_status]
-        mock_query_client.get_transactions_for_address.return_value = [mock_transaction]
+        mock_query_client.get_new_transactions_for_address.return_value = (
+            [mock_transaction],
+            None,
+        )
         mock_query_client.is_one_time_wallet_setup_transaction.return_value = False
         mock_query_client_class.return_value = mock_query_client
         mock_signal.send_robust.return_value = []
@@ -640,3 +689,140 @@ class TestVerifyTransactionAndProcessPayment:
 
         solana_payment.refresh_from_db()
         assert solana_payment.meta_data["simulate_hook_failures"] == ["analytics"]
+
+    @pytest.mark.django_db
+    @patch(
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
+    )
+    def test_rpc_reads_run_before_the_payment_is_locked(
+        self, mock_enqueue_sweep_job, solana_payment, payment_token
+    ):
+        """The payment row is only locked after the RPC reads, to re-check and write it."""
+        service = VerifyTransactionService()
+        paid_transaction = MagicMock(spec=GetTransactionResp)
+        paid_transaction.value.transaction.transaction.signatures = [
+            Signature.from_string("5" * 88)
+        ]
+
+        with (
+            patch.object(
+                service, "claim_solana_payment", wraps=service.claim_solana_payment
+            ) as mock_claim,
+            patch.object(
+                service,
+                "validate_transfer_amount",
+                side_effect=lambda *args: (
+                    mock_claim.assert_not_called()
+                    or ([paid_transaction], Decimal("0.1"))
+                ),
+            ),
+            patch.object(
+                service,
+                "_is_transaction_confirmed",
+                side_effect=lambda tx: mock_claim.assert_not_called() or True,
+            ),
+        ):
+            result = service.verify_transaction_and_process_payment(
+                payment_address=solana_payment.payment_address,
+                payment_crypto_token=payment_token,
+                send_payment_accepted_signal=False,
+            )
+
+        assert result == SolanaPaymentStatusTypes.CONFIRMED
+        mock_claim.assert_called_once_with(solana_payment.payment_address)
+        mock_enqueue_sweep_job.assert_called_once()
+
+    @pytest.mark.django_db
+    @patch(
+        "django_solana_payments.services.verify_transaction_service.enqueue_sweep_job"
+    )
+    def test_payment_accepted_during_rpc_reads_is_not_accepted_again(
+        self, mock_enqueue_sweep_job, solana_payment, payment_token
+    ):
+        """A payment accepted by a concurrent verification keeps its status and signature."""
+        service = VerifyTransactionService()
+        paid_transaction = MagicMock(spec=GetTransactionResp)
+        paid_transaction.value.transaction.transaction.signatures = [
+            Signature.from_string("5" * 88)
+        ]
+
+        def accept_concurrently(*args):
+            SolanaPayment.objects.filter(id=solana_payment.id).update(
+                status=SolanaPaymentStatusTypes.FINALIZED, signature="4" * 88
+            )
+            return [paid_transaction], Decimal("0.1")
+
+        with (
+            patch.object(
+                service, "validate_transfer_amount", side_effect=accept_concurrently
+            ),
+            patch.object(service, "_is_transaction_confirmed", return_value=True),
+        ):
+            result = service.verify_transaction_and_process_payment(
+                payment_address=solana_payment.payment_address,
+                payment_crypto_token=payment_token,
+            )
+
+        assert result == SolanaPaymentStatusTypes.FINALIZED
+        mock_enqueue_sweep_job.assert_not_called()
+        solana_payment.refresh_from_db()
+        assert solana_payment.status == SolanaPaymentStatusTypes.FINALIZED
+        assert solana_payment.signature == "4" * 88
+
+    @pytest.mark.django_db
+    def test_payment_verified_by_another_caller_skips_rpc_reads(
+        self, solana_payment, payment_token
+    ):
+        """A concurrent poll returns the current status instead of repeating the RPC reads."""
+        service = VerifyTransactionService()
+        claim_token = verification_result_cache.claim(solana_payment.payment_address)
+        assert claim_token
+
+        try:
+            with patch.object(service, "validate_transfer_amount") as mock_validate:
+                result = service.verify_transaction_and_process_payment(
+                    payment_address=solana_payment.payment_address,
+                    payment_crypto_token=payment_token,
+                )
+        finally:
+            verification_result_cache.release(
+                solana_payment.payment_address, claim_token
+            )
+
+        assert result == SolanaPaymentStatusTypes.INITIATED
+        mock_validate.assert_not_called()
+        solana_payment.one_time_payment_wallet.refresh_from_db()
+        assert (
+            solana_payment.one_time_payment_wallet.state
+            == OneTimeWalletStateTypes.CREATED
+        )
+
+    @pytest.mark.django_db
+    def test_verification_releases_its_claim(self, solana_payment, payment_token):
+        service = VerifyTransactionService()
+
+        with patch.object(
+            service, "validate_transfer_amount", side_effect=RuntimeError("rpc down")
+        ):
+            with pytest.raises(RuntimeError):
+                service.verify_transaction_and_process_payment(
+                    payment_address=solana_payment.payment_address,
+                    payment_crypto_token=payment_token,
+                )
+
+        claim_token = verification_result_cache.claim(solana_payment.payment_address)
+        assert claim_token
+        verification_result_cache.release(solana_payment.payment_address, claim_token)
+
+    @pytest.mark.django_db
+    def test_claim_solana_payment_skips_locked_rows(self, solana_payment):
+        manager = SolanaPayment.objects
+        with patch.object(
+            manager, "select_for_update", wraps=manager.select_for_update
+        ) as mock_select_for_update:
+            claimed_payment = VerifyTransactionService().claim_solana_payment(
+                solana_payment.payment_address
+            )
+
+        assert claimed_payment == solana_payment
+        mock_select_for_update.assert_called_once_with(skip_locked=True)
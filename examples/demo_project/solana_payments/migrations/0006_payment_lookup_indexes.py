@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("solana_payments", "0005_customsolanapayment_checkout_fields"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customsolanapayment",
+            name="payment_address",
+            field=models.CharField(db_index=True, max_length=60),
+        ),
+        migrations.AlterField(
+            model_name="customsolanapayment",
+            name="signature",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=255, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customsolanapayment",
+            index=models.Index(
+                fields=["status", "expiration_date"],
+                name="solana_paym_status_80d021_idx",
+            ),
+        ),
+    ]